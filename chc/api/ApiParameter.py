@@ -48,6 +48,8 @@ class ApiParameter(InterfaceDictionaryRecord):
         ixval (IndexedTableValue): The backing record of the value
     """
 
+    __slots__ = ()
+
     def __init__(
         self, cd: "InterfaceDictionary", ixval: IT.IndexedTableValue
     ) -> None:
@@ -72,6 +74,8 @@ class APFormal(ApiParameter):
     * args[0]: parameter index (starting at 1)
     """
 
+    __slots__ = ()
+
     def __init__(
         self, cd: "InterfaceDictionary", ixval: IT.IndexedTableValue
     ) -> None:
@@ -93,6 +97,8 @@ class APFormal(ApiParameter):
 class APGlobal(ApiParameter):
     """Global variable used in a function; treated as a formal parameter."""
 
+    __slots__ = ()
+
     def __init__(
         self, cd: "InterfaceDictionary", ixval: IT.IndexedTableValue
     ) -> None:
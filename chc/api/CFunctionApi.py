@@ -53,7 +53,8 @@ memory_free_functions = ["free", "realloc"]
 class CFunctionApi:
 
     def __init__(self, cfun: "CFunction", xnode: ET.Element) -> None:
-        self.xnode = xnode     # api node in api file
+        # api node in api file, released when all its sections are decoded
+        self.xnode: Optional[ET.Element] = xnode
         self._cfun = cfun
         # self.parameters = {}  # nr -> (vid,vname)
         self._api_assumptions: Optional[Dict[int, ApiAssumption]] = None
@@ -73,6 +74,26 @@ class CFunctionApi:
     def cfun(self) -> "CFunction":
         return self._cfun
 
+    def _section(self, tag: str) -> Optional[ET.Element]:
+        """Detaches and returns the api section with the given tag."""
+
+        if self.xnode is None:
+            return None
+        xsection = self.xnode.find(tag)
+        if xsection is not None:
+            self.xnode.remove(xsection)
+        if all(d is not None for d in [
+                self._api_assumptions,
+                self._contract_assumptions,
+                self._global_assumption_requests,
+                self._postcondition_requests,
+                self._postcondition_guarantees,
+                self._library_calls,
+                self._contract_condition_failures,
+                self._missing_summaries]):
+            self.xnode = None
+        return xsection
+
     @property
     def cfile(self) -> "CFile":
         return self.cfun.cfile
@@ -94,7 +115,7 @@ class CFunctionApi:
     def missing_summaries(self) -> List[str]:
         if self._missing_summaries is None:
             self._missing_summaries = []
-            xmsnode = self.xnode.find("missing-summaries")
+            xmsnode = self._section("missing-summaries")
             if xmsnode is not None:
                 for x in xmsnode.findall("ms"):
                     msname = x.get("n")
@@ -119,7 +140,7 @@ class CFunctionApi:
     def api_assumptions(self) -> Dict[int, ApiAssumption]:
         if self._api_assumptions is None:
             self._api_assumptions = {}
-            xass = self.xnode.find("api-assumptions")
+            xass = self._section("api-assumptions")
             if xass is not None:
                 for x in xass.findall("aa"):
                     p = self.cfile.predicatedictionary.read_xml_predicate(x)
@@ -137,7 +158,7 @@ class CFunctionApi:
     def contract_assumptions(self) -> Dict[Tuple[int, int], ContractAssumption]:
         if self._contract_assumptions is None:
             self._contract_assumptions = {}
-            xcass = self.xnode.find("contract-assumptions")
+            xcass = self._section("contract-assumptions")
             if xcass is not None:
                 for x in xcass.findall("ca"):
                     p = self.cfile.interfacedictionary.read_xml_postcondition(x)
@@ -153,7 +174,7 @@ class CFunctionApi:
     def postcondition_requests(self) -> Dict[int, PostConditionRequest]:
         if self._postcondition_requests is None:
             self._postcondition_requests = {}
-            xprs = self.xnode.find("postcondition-requests")
+            xprs = self._section("postcondition-requests")
             if xprs is not None:
                 for x in xprs.findall("rr"):
                     pc = self.interfacedictionary.read_xml_postrequest(x)
@@ -167,7 +188,7 @@ class CFunctionApi:
     def postcondition_guarantees(self) -> Dict[int, "XPredicate"]:
         if self._postcondition_guarantees is None:
             self._postcondition_guarantees = {}
-            xpgs = self.xnode.find("postcondition-guarantees")
+            xpgs = self._section("postcondition-guarantees")
             if xpgs is not None:
                 for x in xpgs.findall("gg"):
                     p = self.interfacedictionary.read_xml_postcondition(x)
@@ -178,7 +199,7 @@ class CFunctionApi:
     def global_assumption_requests(self) -> Dict[int, GlobalAssumption]:
         if self._global_assumption_requests is None:
             self._global_assumption_requests = {}
-            xgar = self.xnode.find("global-assumption-requests")
+            xgar = self._section("global-assumption-requests")
             if xgar is not None:
                 for x in xgar.findall("hh"):
                     xid = x.get("ipr")
@@ -198,7 +219,7 @@ class CFunctionApi:
     def library_calls(self) -> Dict[Tuple[str, str], int]:
         if self._library_calls is None:
             self._library_calls = {}
-            xlcs = self.xnode.find("library-calls")
+            xlcs = self._section("library-calls")
             if xlcs is not None:
                 for x in xlcs.findall("lc"):
                     header = x.get("h")
@@ -215,7 +236,7 @@ class CFunctionApi:
     def contract_condition_failures(self) -> List[Tuple[str, str]]:
         if self._contract_condition_failures is None:
             self._contract_condition_failures = []
-            xfcs = self.xnode.find("contract-condition-failures")
+            xfcs = self._section("contract-condition-failures")
             if xfcs is not None:
                 for x in xfcs.findall("failure"):
                     cfname = x.get("name")
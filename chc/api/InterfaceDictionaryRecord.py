@@ -42,6 +42,8 @@ if TYPE_CHECKING:
 class InterfaceDictionaryRecord(IT.IndexedTableValue):
     """Base class for all objects kept in the InterfaceDictionary."""
 
+    __slots__ = ("_ifd",)
+
     def __init__(
         self,
         dictionary: "InterfaceDictionary",
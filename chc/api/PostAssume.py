@@ -47,6 +47,8 @@ class PostAssume(InterfaceDictionaryRecord):
     * args[1]: index of predicate in interface dictionary
     """
 
+    __slots__ = ()
+
     def __init__(
             self, ifd: "InterfaceDictionary", ixval: IT.IndexedTableValue
     ) -> None:
@@ -45,6 +45,8 @@ if TYPE_CHECKING:
 class SOffset(InterfaceDictionaryRecord):
     """Base class for s_term offset."""
 
+    __slots__ = ()
+
     def __init__(
         self, ifd: "InterfaceDictionary", ixval: IT.IndexedTableValue
     ) -> None:
@@ -73,6 +75,8 @@ class SOffset(InterfaceDictionaryRecord):
 class STArgNoOffset(SOffset):
     """No Offset."""
 
+    __slots__ = ()
+
     def __init__(
         self, ifd: "InterfaceDictionary", ixval: IT.IndexedTableValue
     ) -> None:
@@ -97,6 +101,8 @@ class STArgFieldOffset(SOffset):
     args[0]: index of sub-offset in interface dictionary
     """
 
+    __slots__ = ()
+
     def __init__(
         self, ifd: "InterfaceDictionary", ixval: IT.IndexedTableValue
     ) -> None:
@@ -134,6 +140,8 @@ class STArgIndexOffset(SOffset):
     args[0]: index of sub-offset in interface dictionary
     """
 
+    __slots__ = ()
+
     def __init__(
         self, cd: "InterfaceDictionary", ixval: IT.IndexedTableValue
     ) -> None:
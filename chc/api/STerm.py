@@ -70,6 +70,8 @@ def get_printop(s: str) -> str:
 
 
 class STerm(InterfaceDictionaryRecord):
+    __slots__ = ()
+
     def __init__(
         self, ifd: "InterfaceDictionary", ixval: IT.IndexedTableValue
     ) -> None:
@@ -161,6 +163,8 @@ class STArgValue(STerm):
     * args[1]: index of s_term offset in interface dictionary
     """
 
+    __slots__ = ()
+
     def __init__(
         self, cd: "InterfaceDictionary", ixval: IT.IndexedTableValue
     ) -> None:
@@ -193,6 +197,8 @@ class STLocalVariable(STerm):
     * tags[1]: name
 """
 
+    __slots__ = ()
+
     def __init__(
         self, ifd: "InterfaceDictionary", ixval: IT.IndexedTableValue
     ) -> None:
@@ -214,6 +220,8 @@ class STLocalVariable(STerm):
 class STReturnValue(STerm):
     """Return value, as used in post conditions."""
 
+    __slots__ = ()
+
     def __init__(
         self, ifd: "InterfaceDictionary", ixval: IT.IndexedTableValue
     ) -> None:
@@ -237,6 +245,8 @@ class STNamedConstant(STerm):
     * tags[1]: name
     """
 
+    __slots__ = ()
+
     def __init__(
         self, ifd: "InterfaceDictionary", ixval: IT.IndexedTableValue
     ) -> None:
@@ -263,6 +273,8 @@ class STNamedConstant(STerm):
 class STNumConstant(STerm):
     """Constant with given numerical value."""
 
+    __slots__ = ()
+
     def __init__(
         self, ifd: "InterfaceDictionary", ixval: IT.IndexedTableValue
     ) -> None:
@@ -300,6 +312,8 @@ class STIndexSize(STerm):
     * args[0]: index of term in interface dictionary
     """
 
+    __slots__ = ()
+
     def __init__(
         self, ifd: "InterfaceDictionary", ixval: IT.IndexedTableValue
     ) -> None:
@@ -331,6 +345,8 @@ class STByteSize(STerm):
     * args[0]: index of term in interface dictionary
     """
 
+    __slots__ = ()
+
     def __init__(
         self, ifd: "InterfaceDictionary", ixval: IT.IndexedTableValue
     ) -> None:
@@ -389,6 +405,8 @@ class STArgAddressedValue(STerm):
     * args[1]: index of term offset in interface dictionary
     """
 
+    __slots__ = ()
+
     def __init__(
         self, ifd: "InterfaceDictionary", ixval: IT.IndexedTableValue
     ) -> None:
@@ -432,6 +450,8 @@ class STArgNullTerminatorPos(STerm):
     * args[0]: index of term in interface dictionary
     """
 
+    __slots__ = ()
+
     def __init__(
         self, ifd: "InterfaceDictionary", ixval: IT.IndexedTableValue
     ) -> None:
@@ -463,6 +483,8 @@ class STArgSizeOfType(STerm):
     * args[0]: index of term in interface dictionary
     """
 
+    __slots__ = ()
+
     def __init__(
         self, ifd: "InterfaceDictionary", ixval: IT.IndexedTableValue
     ) -> None:
@@ -496,6 +518,8 @@ class STArithmeticExpr(STerm):
     * args[1]: index of second term in interface dictionary
     """
 
+    __slots__ = ()
+
     def __init__(
         self, ifd: "InterfaceDictionary", ixval: IT.IndexedTableValue
     ) -> None:
@@ -555,6 +579,8 @@ class STFormattedOutputSize(STerm):
     * args[0]: index of term in interface dictionary
     """
 
+    __slots__ = ()
+
     def __init__(
         self, ifd: "InterfaceDictionary", ixval: IT.IndexedTableValue
     ) -> None:
@@ -586,6 +612,8 @@ class STRegion(STerm):
     * args[0]: index of term in interface dictionary
     """
 
+    __slots__ = ()
+
     def __init__(
         self, ifd: "InterfaceDictionary", ixval: IT.IndexedTableValue
     ) -> None:
@@ -614,6 +642,8 @@ class STRegion(STerm):
 class STRuntimeValue(STerm):
     """A value that is determined at runtime."""
 
+    __slots__ = ()
+
     def __init__(
         self, ifd: "InterfaceDictionary", ixval: IT.IndexedTableValue
     ) -> None:
@@ -638,6 +668,8 @@ class STChoiceValue(STerm):
     * args[1]: index of optional upper bound in interface dictionary
     """
 
+    __slots__ = ()
+
     def __init__(
         self, ifd: "InterfaceDictionary", ixval: IT.IndexedTableValue
     ) -> None:
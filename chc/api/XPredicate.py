@@ -61,6 +61,8 @@ def get_printop(s: str) -> str:
 class XPredicate(InterfaceDictionaryRecord):
     """Base class of external predicate."""
 
+    __slots__ = ()
+
     def __init__(
             self, ifd: "InterfaceDictionary", ixval: IT.IndexedTableValue
     ) -> None:
@@ -241,6 +243,9 @@ class XAllocationBase(XPredicate):
 
     * args[0]: index of term in interface dictionary
     """
+
+    __slots__ = ()
+
     def __init__(
             self, ifd: "InterfaceDictionary", ixval: IT.IndexedTableValue
     ) -> None:
@@ -266,6 +271,8 @@ class XBlockWrite(XPredicate):
     * args[1]: index of length term in interface dictionary
     """
 
+    __slots__ = ()
+
     def __init__(
             self, ifd: "InterfaceDictionary", ixval: IT.IndexedTableValue
     ) -> None:
@@ -295,6 +302,8 @@ class XBuffer(XPredicate):
     * args[1]: index of size term in interface dictionary
     """
 
+    __slots__ = ()
+
     def __init__(
             self, ifd: "InterfaceDictionary", ixval: IT.IndexedTableValue
     ) -> None:
@@ -324,6 +333,8 @@ class XRevBuffer(XPredicate):
     args[1]: index of length term in interface dictionary
     """
 
+    __slots__ = ()
+
     def __init__(
             self, ifd: "InterfaceDictionary", ixval: IT.IndexedTableValue
     ) -> None:
@@ -355,6 +366,8 @@ class XControlledResource(XPredicate):
     * args[0]: index of term in interface dictionary
     """
 
+    __slots__ = ()
+
     def __init__(
             self, ifd: "InterfaceDictionary", ixval: IT.IndexedTableValue
     ) -> None:
@@ -389,6 +402,8 @@ class XConfined(XPredicate):
     args[0]: index of pointer term in interface dictionary
     """
 
+    __slots__ = ()
+
     def __init__(
             self, ifd: "InterfaceDictionary", ixval: IT.IndexedTableValue
     ) -> None:
@@ -413,6 +428,8 @@ class XConstTerm(XPredicate):
     args[0]: index of pointed-to term in interface dictionary
     """
 
+    __slots__ = ()
+
     def __init__(
             self, ifd: "InterfaceDictionary", ixval: IT.IndexedTableValue
     ) -> None:
@@ -434,6 +451,8 @@ class XConstTerm(XPredicate):
 class XFalse(XPredicate):
     """Property is always false."""
 
+    __slots__ = ()
+
     def __init__(
             self, ifd: "InterfaceDictionary", ixval: IT.IndexedTableValue
     ) -> None:
@@ -460,6 +479,8 @@ class XFormattedInput(XPredicate):
     * args[0]: index of term in interface dictionary
     """
 
+    __slots__ = ()
+
     def __init__(
             self, ifd: "InterfaceDictionary", ixval: IT.IndexedTableValue
     ) -> None:
@@ -483,6 +504,9 @@ class XFreed(XPredicate):
 
     * args[0]: index of term in interface dictionary.
     """
+
+    __slots__ = ()
+
     def __init__(
             self, ifd: "InterfaceDictionary", ixval: IT.IndexedTableValue
     ) -> None:
@@ -504,6 +528,8 @@ class XFreed(XPredicate):
 class XFunctional(XPredicate):
     """Function has no observable side-effects."""
 
+    __slots__ = ()
+
     def __init__(
             self, ifd: "InterfaceDictionary", ixval: IT.IndexedTableValue
     ) -> None:
@@ -524,6 +550,8 @@ class XInitialized(XPredicate):
     args[0]: index of lval term in interface dictionary
     """
 
+    __slots__ = ()
+
     def __init__(
             self, ifd: "InterfaceDictionary", ixval: IT.IndexedTableValue
     ) -> None:
@@ -556,6 +584,8 @@ class XInitializedRange(XPredicate):
     * args[1]: index of length term in interface dictionary
     """
 
+    __slots__ = ()
+
     def __init__(
             self, ifd: "InterfaceDictionary", ixval: IT.IndexedTableValue
     ) -> None:
@@ -586,6 +616,8 @@ class XInputFormatString(XPredicate):
     * args[0]: index of format-string term in interface dictionary.
     """
 
+    __slots__ = ()
+
     def __init__(
             self, ifd: "InterfaceDictionary", ixval: IT.IndexedTableValue
     ) -> None:
@@ -610,6 +642,8 @@ class XInvalidated(XPredicate):
     * args[0]: index of pointed-to term in interface dictionary
     """
 
+    __slots__ = ()
+
     def __init__(
             self, ifd: "InterfaceDictionary", ixval: IT.IndexedTableValue
     ) -> None:
@@ -636,6 +670,8 @@ class XNewMemory(XPredicate):
     * args[0]: index of term pointing to new memory in interface dictionary
     """
 
+    __slots__ = ()
+
     def __init__(
             self, ifd: "InterfaceDictionary", ixval: IT.IndexedTableValue
     ) -> None:
@@ -660,6 +696,8 @@ class XGlobalAddress(XPredicate):
     * args[0]: index of term in interface dictionary
     """
 
+    __slots__ = ()
+
     def __init__(
             self, ifd: "InterfaceDictionary", ixval: IT.IndexedTableValue
     ) -> None:
@@ -684,6 +722,8 @@ class XHeapAddress(XPredicate):
     * args[0]: index of term in interface dictionary
     """
 
+    __slots__ = ()
+
     def __init__(
             self, ifd: "InterfaceDictionary", ixval: IT.IndexedTableValue
     ) -> None:
@@ -708,6 +748,8 @@ class XStackAddress(XPredicate):
     args[0]: index of term in interface dictionary
     """
 
+    __slots__ = ()
+
     def __init__(
             self, ifd: "InterfaceDictionary", ixval: IT.IndexedTableValue
     ) -> None:
@@ -733,6 +775,8 @@ class XNoOverlap(XPredicate):
     args[1]: index of second term in interface dictionary
     """
 
+    __slots__ = ()
+
     def __init__(
             self, ifd: "InterfaceDictionary", ixval: IT.IndexedTableValue
     ) -> None:
@@ -761,6 +805,8 @@ class XNotNull(XPredicate):
     * args[0]: index of term in interface dictionary
     """
 
+    __slots__ = ()
+
     def __init__(
             self, ifd: "InterfaceDictionary", ixval: IT.IndexedTableValue
     ) -> None:
@@ -792,6 +838,8 @@ class XNonNegative(XPredicate):
     * args[0]: index of term in interface dictionary
     """
 
+    __slots__ = ()
+
     def __init__(
             self, ifd: "InterfaceDictionary", ixval: IT.IndexedTableValue
     ) -> None:
@@ -823,6 +871,8 @@ class XNotZero(XPredicate):
     * args[0]: index of term in interface dictionary
     """
 
+    __slots__ = ()
+
     def __init__(
             self, ifd: "InterfaceDictionary", ixval: IT.IndexedTableValue
     ) -> None:
@@ -854,6 +904,8 @@ class XNull(XPredicate):
     args[0]: index of term in interface dictionary
     """
 
+    __slots__ = ()
+
     def __init__(
             self, ifd: "InterfaceDictionary", ixval: IT.IndexedTableValue
     ) -> None:
@@ -878,6 +930,8 @@ class XNullTerminated(XPredicate):
     * args[0]: index of interface dictionary
     """
 
+    __slots__ = ()
+
     def __init__(
             self, ifd: "InterfaceDictionary", ixval: IT.IndexedTableValue
     ) -> None:
@@ -902,6 +956,8 @@ class XOutputFormatString(XPredicate):
     * args[0]: index of term in interface dictionary
     """
 
+    __slots__ = ()
+
     def __init__(
             self, ifd: "InterfaceDictionary", ixval: IT.IndexedTableValue
     ) -> None:
@@ -923,6 +979,8 @@ class XOutputFormatString(XPredicate):
 class XPreservesAllMemory(XPredicate):
     """Function does not free any external memory."""
 
+    __slots__ = ()
+
     def __init__(
             self, ifd: "InterfaceDictionary", ixval: IT.IndexedTableValue
     ) -> None:
@@ -943,6 +1001,8 @@ class XPreservesAllMemoryX(XPredicate):
     * args[0..]: indices of terms in interface dictionary
     """
 
+    __slots__ = ()
+
     def __init__(
             self, ifd: "InterfaceDictionary", ixval: IT.IndexedTableValue
     ) -> None:
@@ -971,6 +1031,8 @@ class XPreservesMemory(XPredicate):
     * args[0]: index of term in interface dictionary
     """
 
+    __slots__ = ()
+
     def __init__(
             self, ifd: "InterfaceDictionary", ixval: IT.IndexedTableValue
     ) -> None:
@@ -995,6 +1057,8 @@ class XPreservesNullTermination(XPredicate):
     * args[0]: index of term in interface dictionary
     """
 
+    __slots__ = ()
+
     def __init__(
             self, ifd: "InterfaceDictionary", ixval: IT.IndexedTableValue
     ) -> None:
@@ -1019,6 +1083,8 @@ class XPreservesValidity(XPredicate):
     * args[0]: index of term in interface dictionary
     """
 
+    __slots__ = ()
+
     def __init__(
             self, ifd: "InterfaceDictionary", ixval: IT.IndexedTableValue
     ) -> None:
@@ -1043,6 +1109,8 @@ class XPreservesValue(XPredicate):
     * args[0]: index of term in interface dictionary
     """
 
+    __slots__ = ()
+
     def __init__(
             self, ifd: "InterfaceDictionary", ixval: IT.IndexedTableValue
     ) -> None:
@@ -1069,6 +1137,8 @@ class XRelationalExpr(XPredicate):
     * args[1]: index of second term in interface dictionary
     """
 
+    __slots__ = ()
+
     def __init__(
             self, ifd: "InterfaceDictionary", ixval: IT.IndexedTableValue
     ) -> None:
@@ -1126,6 +1196,8 @@ class XRepositioned(XPredicate):
     * args[0]: index of term in interface dictionary
     """
 
+    __slots__ = ()
+
     def __init__(
             self, ifd: "InterfaceDictionary", ixval: IT.IndexedTableValue
     ) -> None:
@@ -1152,6 +1224,8 @@ class XTainted(XPredicate):
     * args[2]: index of upper bound in interface dictionary (optional)
     """
 
+    __slots__ = ()
+
     def __init__(
             self, ifd: "InterfaceDictionary", ixval: IT.IndexedTableValue
     ) -> None:
@@ -1192,6 +1266,8 @@ class XUniquePointer(XPredicate):
     * args[0]: index of term in interface dictionary
     """
 
+    __slots__ = ()
+
     def __init__(
             self, ifd: "InterfaceDictionary", ixval: IT.IndexedTableValue
     ) -> None:
@@ -1216,6 +1292,8 @@ class XValidMem(XPredicate):
     * args[0]: index of term in interface dictionary
     """
 
+    __slots__ = ()
+
     def __init__(
             self, ifd: "InterfaceDictionary", ixval: IT.IndexedTableValue
     ) -> None:
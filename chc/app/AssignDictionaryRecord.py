@@ -42,6 +42,8 @@ if TYPE_CHECKING:
 class AssignDictionaryRecord(IT.IndexedTableValue):
     """Base class for all objects kept in the CFileAssignmentDictionary."""
 
+    __slots__ = ("_ad",)
+
     def __init__(
             self,
             ad: "CFileAssignmentDictionary",
@@ -31,11 +31,15 @@
 """
 
 from typing import (
-    Any, Callable, Dict, Iterable, List, Optional, Tuple, TYPE_CHECKING)
+    Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple,
+    TYPE_CHECKING)
 import os
 import multiprocessing
 import sys
 
+from collections import OrderedDict
+from contextlib import contextmanager
+
 from chc.api.CGlobalContract import CGlobalContract
 
 from chc.app.CCompInfo import CCompInfo
@@ -45,10 +49,15 @@ from chc.app.IndexManager import IndexManager, FileVarReference, FileKeyReferenc
 from chc.app.CGlobalDeclarations import CGlobalDeclarations
 from chc.app.CGlobalDictionary import CGlobalDictionary
 
+from chc.proof.CFunctionCallsiteSPOs import CalleeApi
+
 from chc.source.CSrcFile import CSrcFile
 
 import chc.util.fileutil as UF
+import chc.util.IndexedTable as IT
+import chc.util.graphutil as UG
 from chc.util.loggingutil import chklogger
+from chc.util.tracingutil import chktracer
 
 
 if TYPE_CHECKING:
@@ -114,6 +123,14 @@ class CApplication(object):
         self._revcallgraph: Optional[
             Dict[Tuple[int, int],
                  List[Tuple[Tuple[int, int], "CFunctionCallsiteSPOs"]]]] = None
+        self._filecallgraph: Optional[Dict[int, Set[int]]] = None
+        # (file index, vid) of a call target or of a function definition
+        self._calleeapis: Dict[Tuple[int, int], Optional[CalleeApi]] = {}
+        self._caching_callee_apis = False
+        # bounded working set: file-index -> CFile, least recently used first
+        self._maxloadedfiles: Optional[int] = None
+        self._loadedfiles: "OrderedDict[int, CFile]" = OrderedDict()
+        self._pinnedfiles: Set[int] = set([])
 
     @property
     def projectpath(self) -> str:
@@ -285,15 +302,82 @@ class CApplication(object):
             return self.revcallgraph[(fid, vid)]
         return []
 
+    @contextmanager
+    def bounded_working_set(self, maxfiles: int) -> Iterator[None]:
+        """Keeps the analysis artifacts of at most maxfiles files loaded.
+
+        Within this context iter_files (and iter_functions) release the
+        artifacts of a file as soon as it has been processed, and files
+        loaded on demand through cross-file lookups (e.g., callee api's in
+        update_spos) are kept in a least-recently-used set of at most
+        maxfiles files; released files are read again when accessed.
+
+        Only use this for operations that save the changes they make to a
+        file before moving on to the next file.
+        """
+        previous = self._maxloadedfiles
+        self._maxloadedfiles = max(1, maxfiles)
+        try:
+            yield
+        finally:
+            self._maxloadedfiles = previous
+            if previous is None:
+                self._loadedfiles.clear()
+                # strings of the files released within the working set
+                IT.stringpool.clear()
+
+    def touch_file(self, cfile: CFile) -> None:
+        """Records access to cfile in the bounded working set, if active.
+
+        Evicts the least recently used files that are not currently being
+        processed if the working set exceeds its bound.
+        """
+        if self._maxloadedfiles is None:
+            return
+        self._loadedfiles[cfile.index] = cfile
+        self._loadedfiles.move_to_end(cfile.index)
+        for index in list(self._loadedfiles):
+            if len(self._loadedfiles) <= self._maxloadedfiles:
+                break
+            if index not in self._pinnedfiles:
+                self.evict_file(self._loadedfiles[index])
+
+    def evict_file(self, cfile: CFile) -> None:
+        """Releases the analysis artifacts of cfile."""
+
+        self._loadedfiles.pop(cfile.index, None)
+        for (key, calleeapi) in list(self._calleeapis.items()):
+            if calleeapi is not None and calleeapi.calleefun.cfile is cfile:
+                self._calleeapis.pop(key)
+        cfile.reset_caches()
+
     def iter_files(self, f: Callable[[CFile], None]) -> None:
         chklogger.logger.info(
             "Iter files over %d cfiles", len(list(self.cfiles)))
         for file in list(self.cfiles):
-            f(file)
+            if self._maxloadedfiles is None:
+                with chktracer.span(file.name, cat="file"):
+                    f(file)
+                continue
+            self._pinnedfiles.add(file.index)
+            self.touch_file(file)
+            try:
+                with chktracer.span(file.name, cat="file"):
+                    f(file)
+            finally:
+                self._pinnedfiles.discard(file.index)
+                self.evict_file(file)
 
     def iter_files_parallel(
-            self, f: Callable[[CFile], None], processes: int) -> None:
-        for cfile in self.cfiles:
+            self,
+            f: Callable[[CFile], None],
+            processes: int,
+            cfiles: Optional[Iterable[CFile]] = None) -> None:
+        """Apply f to cfiles (default: all files) in at most processes processes."""
+
+        if cfiles is None:
+            cfiles = self.cfiles
+        for cfile in cfiles:
             while len(multiprocessing.active_children()) >= processes:
                 pass
 
@@ -360,6 +444,7 @@ class CApplication(object):
         if defvar is not None:
             if defvar.fid in self.files:
                 deffile = self.files[defvar.fid]
+                self.touch_file(deffile)
                 if deffile.has_function_by_index(defvar.vid):
                     return deffile.get_function_by_index(defvar.vid)
                 else:
@@ -466,31 +551,80 @@ class CApplication(object):
         self.iter_files(f)
         return (sum(linecounts), sum(clinecounts), sum(cfuncounts))
 
+    def get_callee_api(self, filevar: FileVarReference) -> Optional[CalleeApi]:
+        """Returns the api data of the function called via filevar.
+
+        The result is cached for the duration of the current round of
+        update_spos; outside update_spos it is recomputed on every call.
+        Returns None if the function definition cannot be found.
+        """
+        key = (filevar.fid, filevar.vid)
+        if key in self._calleeapis:
+            calleeapi = self._calleeapis[key]
+            if calleeapi is not None:
+                self.touch_file(calleeapi.calleefun.cfile)
+            return calleeapi
+        calleefun = self.resolve_vid_function(filevar)
+        if calleefun is None:
+            result = None
+        else:
+            # call sites in different files share the callee's entry
+            funkey = (calleefun.cfile.index, calleefun.svar.vid)
+            if funkey in self._calleeapis:
+                result = self._calleeapis[funkey]
+            else:
+                result = CalleeApi(calleefun)
+                if self._caching_callee_apis:
+                    self._calleeapis[funkey] = result
+        if self._caching_callee_apis:
+            self._calleeapis[key] = result
+        return result
+
+    @chktracer.traced("update-spos")
     def update_spos(self) -> None:
         """Create supporting proof obligations for all call sites."""
 
-        def f(fn: "CFunction") -> None:
-            fn.update_spos()
-            fn.save_spos()
-            fn.save_pod()
+        self._calleeapis = {}
+        self._caching_callee_apis = True
+        try:
+            self.iter_files(self.update_file_spos)
+        finally:
+            self._calleeapis = {}
+            self._caching_callee_apis = False
 
-        def h(cfile: CFile) -> None:
-            cfile.iter_functions(f)
-            cfile.save_predicate_dictionary()
-            cfile.save_interface_dictionary()
-            cfile.save_declarations()
+    def update_file_spos(self, cfile: CFile) -> None:
+        """Create supporting proof obligations for the call sites in cfile."""
 
-        self.iter_files(h)
+        def f(fn: "CFunction") -> None:
+            with chktracer.span(fn.name, cat="function"):
+                fn.update_spos()
+                fn.save_spos()
+                fn.save_pod()
 
+        cfile.iter_functions(f)
+        cfile.save_predicate_dictionary()
+        cfile.save_interface_dictionary()
+        cfile.save_declarations()
+
+    @chktracer.traced("collect-post-assumes")
     def collect_post_assumes(self) -> None:
         """Collect postconditions from callee's contracts and add as assume."""
 
         for fi in self.cfiles:
             fi.collect_post_assumes()
 
+    @chktracer.traced("distribute-post-guarantees")
     def distribute_post_guarantees(self) -> None:
         """add callee postcondition guarantees to call sites as assumptions"""
 
+        if self.contractpath is None:
+            return  # no contracts provided
+
+        self.iter_files(self.distribute_file_post_guarantees)
+
+    def distribute_file_post_guarantees(self, cfile: CFile) -> None:
+        """add callee postcondition guarantees to the call sites in cfile"""
+
         if self.contractpath is None:
             return  # no contracts provided
 
@@ -499,14 +633,12 @@ class CApplication(object):
             fn.save_spos()
             fn.save_pod()
 
-        def h(cfile: CFile) -> None:
-            cfile.iter_functions(f)
-            cfile.save_predicate_dictionary()
-            cfile.save_interface_dictionary()
-            cfile.save_declarations()
-
-        self.iter_files(h)
+        cfile.iter_functions(f)
+        cfile.save_predicate_dictionary()
+        cfile.save_interface_dictionary()
+        cfile.save_declarations()
 
+    @chktracer.traced("reinitialize-tables")
     def reinitialize_tables(self) -> None:
 
         def f(fi: CFile) -> None:
@@ -541,6 +673,23 @@ class CApplication(object):
         self.iter_functions(f)
         return result
 
+    def get_po_status_counts(self) -> Dict[str, int]:
+        """Returns the number of proof obligations per kind and status."""
+
+        result: Dict[str, int] = {}
+
+        def add(kind: str, pos: List["CFunctionPO"]) -> None:
+            for po in pos:
+                key = kind + ":" + po.status
+                result[key] = result.get(key, 0) + 1
+
+        def f(fn: "CFunction") -> None:
+            add("ppo", fn.get_ppos())
+            add("spo", fn.get_spos())
+
+        self.iter_functions(f)
+        return result
+
     def get_ppos(self) -> List["CFunctionPO"]:
         result: List["CFunctionPO"] = []
 
@@ -625,6 +774,23 @@ class CApplication(object):
         else:
             chklogger.logger.error("c_file could not be extracted %s", fname)
 
+    def reload_file(self, index: int) -> CFile:
+        """Replaces the file with index by a fresh, not yet loaded, CFile.
+
+        Artifacts of the file are read again from disk when accessed. The
+        cross references of the file are kept, as they change only when the
+        project is parsed again.
+        """
+        cfile = self.get_file_by_index(index)
+        newcfile = CFile(self, index, cfile.cfilename, cfile.cfilepath)
+        self.files[index] = newcfile
+        self._callgraph = None
+        self._revcallgraph = None
+        self._filecallgraph = None
+        IT.stringpool.clear()
+        chklogger.logger.info("reloaded cfile %s", cfile.name)
+        return newcfile
+
     def _initialize_file(self, index: int, fname: str) -> CFile:
         xcfilepath = os.path.dirname(fname)
         cfilename = os.path.basename(fname)
@@ -668,3 +834,27 @@ class CApplication(object):
                     self._revcallgraph.setdefault(t, [])
                     self._revcallgraph[t].append((s, cs))
         return self._revcallgraph
+
+    @property
+    def file_callgraph(self) -> Dict[int, Set[int]]:
+        """Returns a map from file-index to the indices of the files it calls.
+
+        Only calls to functions defined in other application files are
+        included; every file of the application is present as a key.
+        """
+        if self._filecallgraph is None:
+            self._filecallgraph = {fid: set([]) for fid in self.files}
+            for ((fid, _), callees) in self.callgraph.items():
+                for ((tgtfid, _), _) in callees:
+                    if tgtfid != fid and tgtfid in self._filecallgraph:
+                        self._filecallgraph[fid].add(tgtfid)
+        return self._filecallgraph
+
+    def bottomup_file_schedule(self) -> List[List[List[int]]]:
+        """Returns the file indices grouped in strongly connected components
+        by level of the file callgraph, callees first.
+
+        Files in the same component call each other (directly or indirectly);
+        components in the same level are independent of each other.
+        """
+        return UG.bottom_up_levels(self.file_callgraph)
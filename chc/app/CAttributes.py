@@ -46,6 +46,8 @@ if TYPE_CHECKING:
 class CAttr(CDictionaryRecord):
     """Attribute that comes with a C type."""
 
+    __slots__ = ()
+
     def __init__(self, cd: "CDictionary", ixval: IT.IndexedTableValue) -> None:
         CDictionaryRecord.__init__(self, cd, ixval)
 
@@ -127,6 +129,8 @@ class CAttrInt(CAttr):
     args[0]: integer value
     """
 
+    __slots__ = ()
+
     def __init__(self, cd: "CDictionary", ixval: IT.IndexedTableValue) -> None:
         CAttr.__init__(self, cd, ixval)
 
@@ -152,6 +156,8 @@ class CAttrStr(CAttr):
     * args[0]: index in string table of string attribute
     """
 
+    __slots__ = ()
+
     def __init__(self, cd: "CDictionary", ixval: IT.IndexedTableValue) -> None:
         CAttr.__init__(self, cd, ixval)
 
@@ -178,6 +184,8 @@ class CAttrCons(CAttr):
     * args[0..]: indices of attribute parameters in cdictionary.
     """
 
+    __slots__ = ()
+
     def __init__(self, cd: "CDictionary", ixval: IT.IndexedTableValue) -> None:
         CAttr.__init__(self, cd, ixval)
 
@@ -207,6 +215,8 @@ class CAttrSizeOf(CAttr):
     * args[0]: index of target type in cdictionary
     """
 
+    __slots__ = ()
+
     def __init__(self, cd: "CDictionary", ixval: IT.IndexedTableValue) -> None:
         CAttr.__init__(self, cd, ixval)
 
@@ -232,6 +242,8 @@ class CAttrSizeOfE(CAttr):
     * args[0]: index of argument parameter in cdictionary
     """
 
+    __slots__ = ()
+
     def __init__(self, cd: "CDictionary", ixval: IT.IndexedTableValue) -> None:
         CAttr.__init__(self, cd, ixval)
 
@@ -257,6 +269,8 @@ class CAttrSizeOfS(CAttr):
     * args[0]: index of target typsig in cdictionary
     """
 
+    __slots__ = ()
+
     def __init__(self, cd: "CDictionary", ixval: IT.IndexedTableValue) -> None:
         CAttr.__init__(self, cd, ixval)
 
@@ -282,6 +296,8 @@ class CAttrAlignOf(CAttr):
     * args[0]: index of target type in cdictionary
     """
 
+    __slots__ = ()
+
     def __init__(self, cd: "CDictionary", ixval: IT.IndexedTableValue) -> None:
         CAttr.__init__(self, cd, ixval)
 
@@ -307,6 +323,8 @@ class CAttrAlignOfE(CAttr):
     * args[0]: index of attribute parameter in cdictionary
     """
 
+    __slots__ = ()
+
     def __init__(self, cd: "CDictionary", ixval: IT.IndexedTableValue) -> None:
         CAttr.__init__(self, cd, ixval)
 
@@ -332,6 +350,8 @@ class CAttrAlignOfS(CAttr):
     * args[0]: target type signature
     """
 
+    __slots__ = ()
+
     def __init__(self, cd: "CDictionary", ixval: IT.IndexedTableValue) -> None:
         CAttr.__init__(self, cd, ixval)
 
@@ -358,6 +378,8 @@ class CAttrUnOp(CAttr):
     * args[0]: index of attribute parameter in cdictionary
     """
 
+    __slots__ = ()
+
     def __init__(self, cd: "CDictionary", ixval: IT.IndexedTableValue) -> None:
         CAttr.__init__(self, cd, ixval)
 
@@ -389,6 +411,8 @@ class CAttrBinOp(CAttr):
     * args[1]: index of second attribute parameter in cdictionary
     """
 
+    __slots__ = ()
+
     def __init__(self, cd: "CDictionary", ixval: IT.IndexedTableValue) -> None:
         CAttr.__init__(self, cd, ixval)
 
@@ -431,6 +455,8 @@ class CAttrDot(CAttr):
     * args[0]: index of attribute parameter in cdictionary
     """
 
+    __slots__ = ()
+
     def __init__(self, cd: "CDictionary", ixval: IT.IndexedTableValue) -> None:
         CAttr.__init__(self, cd, ixval)
 
@@ -460,6 +486,8 @@ class CAttrStar(CAttr):
     * args[0]: index of attribute parameter in cdictionary
     """
 
+    __slots__ = ()
+
     def __init__(self, cd: "CDictionary", ixval: IT.IndexedTableValue) -> None:
         CAttr.__init__(self, cd, ixval)
 
@@ -492,6 +520,8 @@ class CAttrAddrOf(CAttr):
     * args[0]: index of attribute parameter in cdictionary
     """
 
+    __slots__ = ()
+
     def __init__(self, cd: "CDictionary", ixval: IT.IndexedTableValue) -> None:
         CAttr.__init__(self, cd, ixval)
 
@@ -518,6 +548,8 @@ class CAttrIndex(CAttr):
     * args[1]: index of second attribute parameter in cdictionary
     """
 
+    __slots__ = ()
+
     def __init__(self, cd: "CDictionary", ixval: IT.IndexedTableValue) -> None:
         CAttr.__init__(self, cd, ixval)
 
@@ -549,6 +581,8 @@ class CAttrQuestion(CAttr):
     * args[2]: index of third attribute parameter in cdictionary
     """
 
+    __slots__ = ()
+
     def __init__(self, cd: "CDictionary", ixval: IT.IndexedTableValue) -> None:
         CAttr.__init__(self, cd, ixval)
 
@@ -581,6 +615,8 @@ class CAttrQuestion(CAttr):
 
 class CAttribute(CDictionaryRecord):
 
+    __slots__ = ()
+
     def __init__(self, cd: "CDictionary", ixval: IT.IndexedTableValue) -> None:
         CDictionaryRecord.__init__(self, cd, ixval)
 
@@ -601,6 +637,8 @@ class CAttribute(CDictionaryRecord):
 
 class CAttributes(CDictionaryRecord):
 
+    __slots__ = ()
+
     def __init__(self, cd: "CDictionary", ixval: IT.IndexedTableValue) -> None:
         CDictionaryRecord.__init__(self, cd, ixval)
 
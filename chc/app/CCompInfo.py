@@ -53,6 +53,8 @@ class CCompInfo(CDeclarationsRecord):
     * args[3..]: field indices
     """
 
+    __slots__ = ()
+
     def __init__(
         self, decls: "CDeclarations", ixval: IT.IndexedTableValue
     ) -> None:
@@ -42,6 +42,8 @@ if TYPE_CHECKING:
 class CConst(CDictionaryRecord):
     """Constant expression."""
 
+    __slots__ = ()
+
     def __init__(self, cd: "CDictionary", ixval: IT.IndexedTableValue) -> None:
         CDictionaryRecord.__init__(self, cd, ixval)
 
@@ -88,6 +90,8 @@ class CConstInt(CConst):
     - tags[2]: ikind
     """
 
+    __slots__ = ()
+
     def __init__(self, cd: "CDictionary", ixval: IT.IndexedTableValue) -> None:
         CConst.__init__(self, cd, ixval)
 
@@ -115,6 +119,8 @@ class CConstStr(CConst):
     - args[0]: string index
     """
 
+    __slots__ = ()
+
     def __init__(self, cd: "CDictionary", ixval: IT.IndexedTableValue) -> None:
         CConst.__init__(self, cd, ixval)
 
@@ -144,6 +150,8 @@ class CConstWStr(CConst):
     - tags[1..]: string representation of int64 integers
     """
 
+    __slots__ = ()
+
     def __init__(self, cd: "CDictionary", ixval: IT.IndexedTableValue) -> None:
         CConst.__init__(self, cd, ixval)
 
@@ -167,6 +175,8 @@ class CConstChr(CConst):
     - args[0]: char code
     """
 
+    __slots__ = ()
+
     def __init__(self, cd: "CDictionary", ixval: IT.IndexedTableValue) -> None:
         CConst.__init__(self, cd, ixval)
 
@@ -191,6 +201,8 @@ class CConstReal(CConst):
     - tags[2]: fkind
     """
 
+    __slots__ = ()
+
     def __init__(self, cd: "CDictionary", ixval: IT.IndexedTableValue) -> None:
         CConst.__init__(self, cd, ixval)
 
@@ -221,6 +233,8 @@ class CConstEnum(CConst):
     - args[0]: exp
     """
 
+    __slots__ = ()
+
     def __init__(self, cd: "CDictionary", ixval: IT.IndexedTableValue) -> None:
         CConst.__init__(self, cd, ixval)
 
@@ -253,6 +267,8 @@ class CStringConstant(CDictionaryRecord):
     - args[0] length of original string
     """
 
+    __slots__ = ()
+
     def __init__(self, cd: "CDictionary", ixval: IT.IndexedTableValue) -> None:
         CDictionaryRecord.__init__(self, cd, ixval)
 
@@ -42,6 +42,8 @@ if TYPE_CHECKING:
 
 class CContextDictionaryRecord(IndexedTableValue):
 
+    __slots__ = ("_cxd",)
+
     def __init__(
             self, cxd: "CContextDictionary", ixval: IndexedTableValue
     ) -> None:
@@ -64,6 +66,8 @@ class CContextNode(CContextDictionaryRecord):
     - args[0]: stmt.id for statements, instr sequence number for instructions
     """
 
+    __slots__ = ()
+
     def __init__(
             self, cxd: "CContextDictionary", ixval: IndexedTableValue
     ) -> None:
@@ -106,6 +110,8 @@ class CfgContext(CContextDictionaryRecord):
       context last
     """
 
+    __slots__ = ()
+
     def __init__(
             self, cxd: "CContextDictionary", ixval: IndexedTableValue
     ) -> None:
@@ -130,6 +136,8 @@ class ExpContext(CContextDictionaryRecord):
       context last
     """
 
+    __slots__ = ()
+
     def __init__(
             self, cxd: "CContextDictionary", ixval: IndexedTableValue
     ) -> None:
@@ -150,6 +158,8 @@ class ProgramContext(CContextDictionaryRecord):
     args[1]: index of exp context in context dictionary
     """
 
+    __slots__ = ()
+
     def __init__(
             self, cxd: "CContextDictionary", ixval: IndexedTableValue
     ) -> None:
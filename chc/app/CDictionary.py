@@ -28,6 +28,7 @@
 # ------------------------------------------------------------------------------
 """Abstract superclass for CGlobalDictionary and CFileDictionary."""
 
+import weakref
 import xml.etree.ElementTree as ET
 
 from abc import ABC, abstractmethod
@@ -35,13 +36,28 @@ from typing import (
     cast, Any, Callable, Dict, List, Mapping, Optional, Tuple, TYPE_CHECKING)
 
 from chc.app.CAttributes import CAttr, CAttribute, CAttributes
+from chc.app.CAttributes import CAttrInt, CAttrStr, CAttrCons
+from chc.app.CAttributes import CAttrSizeOf, CAttrSizeOfE, CAttrSizeOfS
+from chc.app.CAttributes import CAttrAlignOf, CAttrAlignOfE, CAttrAlignOfS
+from chc.app.CAttributes import CAttrUnOp, CAttrBinOp
+from chc.app.CAttributes import CAttrDot, CAttrStar, CAttrAddrOf
+from chc.app.CAttributes import CAttrIndex, CAttrQuestion
 from chc.app.CConst import CConst
 from chc.app.CDictionaryRecord import CDictionaryRecord, cdregistry
 from chc.app.CExp import CExp
+from chc.app.CExp import CExpConst, CExpUnOp, CExpBinOp, CExpQuestion
+from chc.app.CExp import CExpCastE, CExpLval
+from chc.app.CExp import CExpAddrOf, CExpStartOf
+from chc.app.CExp import CExpAlignOf, CExpAlignOfE
+from chc.app.CExp import CExpSizeOf, CExpSizeOfE, CExpSizeOfStr
+from chc.app.CExp import CExpFnApp, CExpCnApp
 from chc.app.CLHost import CLHost
 from chc.app.CLval import CLval
 from chc.app.COffset import COffset
 from chc.app.CTyp import CTyp, CFunArg, CFunArgs
+from chc.app.CTyp import CTypVoid, CTypInt, CTypFloat, CTypNamed, CTypEnum
+from chc.app.CTyp import CTypBuiltinVaargs
+from chc.app.CTyp import CTypPtr, CTypComp, CTypArray, CTypFun
 from chc.app.CTypsig import CTypsig, CTypsigList
 
 import chc.util.fileutil as UF
@@ -52,26 +68,13 @@ from chc.util.StringIndexedTable import StringIndexedTable
 if TYPE_CHECKING:
     from chc.api.ApiParameter import APGlobal
     from chc.api.STerm import STerm, STNumConstant, STArgValue
-    from chc.app.CAttributes import CAttrInt, CAttrStr, CAttrCons
-    from chc.app.CAttributes import CAttrSizeOf, CAttrSizeOfE, CAttrSizeOfS
-    from chc.app.CAttributes import CAttrAlignOf, CAttrAlignOfE, CAttrAlignOfS
-    from chc.app.CAttributes import CAttrUnOp, CAttrBinOp
-    from chc.app.CAttributes import CAttrDot, CAttrStar, CAttrAddrOf
-    from chc.app.CAttributes import CAttrIndex, CAttrQuestion
     from chc.app.CCompInfo import CCompInfo
     from chc.app.CConst import CConstStr, CConstEnum
     from chc.app.CDeclarations import CDeclarations
-    from chc.app.CExp import CExpConst, CExpUnOp, CExpBinOp, CExpQuestion
-    from chc.app.CExp import CExpCastE, CExpLval
-    from chc.app.CExp import CExpAddrOf, CExpStartOf
-    from chc.app.CExp import CExpAlignOf, CExpAlignOfE
-    from chc.app.CExp import CExpSizeOf, CExpSizeOfE, CExpSizeOfStr
-    from chc.app.CExp import CExpFnApp, CExpCnApp
     from chc.app.CFile import CFile
     from chc.app.CFileDictionary import CFileDictionary
     from chc.app.CLHost import CLHostVar, CLHostMem
     from chc.app.COffset import CFieldOffset, CIndexOffset
-    from chc.app.CTyp import CTypPtr, CTypComp, CTypArray, CTypFun
     from chc.app.CVarInfo import CVarInfo
 
 
@@ -128,6 +131,57 @@ class CDictionary(ABC):
             "typ": self.get_typ_map,
             "typsig": self.get_typsig_map,
             "typsiglist": self.get_typsig_list_map}
+        # dispatch tables: record class -> routine that indexes its arguments
+        self._attrparam_indexers: Dict[
+            type, Callable[[Any], List[int]]] = {
+            CAttrInt: self._attrparam_args_int,
+            CAttrStr: self._attrparam_args_str,
+            CAttrCons: self._attrparam_args_cons,
+            CAttrSizeOf: self._attrparam_args_typ,
+            CAttrSizeOfE: self._attrparam_args_param,
+            CAttrSizeOfS: self._attrparam_args_typsig,
+            CAttrAlignOf: self._attrparam_args_typ,
+            CAttrAlignOfE: self._attrparam_args_param,
+            CAttrAlignOfS: self._attrparam_args_typsig,
+            CAttrUnOp: self._attrparam_args_param,
+            CAttrBinOp: self._attrparam_args_param2,
+            CAttrDot: self._attrparam_args_param,
+            CAttrStar: self._attrparam_args_star,
+            CAttrAddrOf: self._attrparam_args_param,
+            CAttrIndex: self._attrparam_args_param2,
+            CAttrQuestion: self._attrparam_args_param3}
+        self._exp_indexers: Dict[
+            type, Callable[[Any, Dict[int, CExp], int], List[int]]] = {
+            CExpConst: self._exp_args_const,
+            CExpSizeOf: self._exp_args_typ,
+            CExpSizeOfE: self._exp_args_exp,
+            CExpSizeOfStr: self._exp_args_sizeofstr,
+            CExpUnOp: self._exp_args_unop,
+            CExpBinOp: self._exp_args_binop,
+            CExpQuestion: self._exp_args_question,
+            CExpCastE: self._exp_args_caste,
+            CExpAlignOf: self._exp_args_typ,
+            CExpAlignOfE: self._exp_args_exp,
+            CExpAddrOf: self._exp_args_lval,
+            CExpStartOf: self._exp_args_lval,
+            CExpLval: self._exp_args_lval,
+            CExpFnApp: self._exp_args_fnapp,
+            CExpCnApp: self._exp_args_cnapp}
+        self._typ_indexers: Dict[type, Callable[[Any], List[int]]] = {
+            CTypVoid: self._typ_args_attributes,
+            CTypInt: self._typ_args_attributes,
+            CTypFloat: self._typ_args_attributes,
+            CTypNamed: self._typ_args_attributes,
+            CTypEnum: self._typ_args_attributes,
+            CTypBuiltinVaargs: self._typ_args_attributes,
+            CTypPtr: self._typ_args_ptr,
+            CTypComp: self._typ_args_comp,
+            CTypArray: self._typ_args_array,
+            CTypFun: self._typ_args_fun}
+        # translation memo: source dictionary ->
+        #   (table, source index, fid, substitution) -> index in this dictionary
+        self._translations: weakref.WeakKeyDictionary[
+            "CDictionary", Dict[Tuple[Any, ...], int]] = weakref.WeakKeyDictionary()
         # self.string_table = StringIndexedTable("string-table")
 
     @property
@@ -315,96 +369,43 @@ class CDictionary(ABC):
         return self.attrparam_table.add_tags_args(tags, args, f)
 
     def index_attrparam(self, a: CAttr) -> int:
-        args: List[int]
+        indexer = self._attrparam_indexers.get(type(a))
+        if indexer is None:
+            raise Exception("Unknown attrparam type")
+        return self.mk_attrparam(a.tags, indexer(a))
 
-        if a.is_int:
-            return self.mk_attrparam(a.tags, a.args)
-
-        if a.is_str:
-            args = [self.index_string(cast("CAttrStr", a).stringvalue)]
-            return self.mk_attrparam(a.tags, args)
-
-        if a.is_cons:
-            a = cast("CAttrCons", a)
-            args = [self.index_attrparam(p) for p in a.params]
-            return self.mk_attrparam(a.tags, args)
-
-        if a.is_sizeof:
-            a = cast("CAttrSizeOf", a)
-            args = [self.index_typ(a.typ)]
-            return self.mk_attrparam(a.tags, args)
-
-        if a.is_sizeofe:
-            a = cast("CAttrSizeOfE", a)
-            args = [self.index_attrparam(a.param)]
-            return self.mk_attrparam(a.tags, args)
-
-        if a.is_sizeofs:
-            a = cast("CAttrSizeOfS", a)
-            args = [self.index_typsig(a.typsig)]
-            return self.mk_attrparam(a.tags, args)
-
-        if a.is_alignof:
-            a = cast("CAttrAlignOf", a)
-            args = [self.index_typ(a.typ)]
-            return self.mk_attrparam(a.tags, args)
-
-        if a.is_alignofe:
-            a = cast("CAttrAlignOfE", a)
-            args = [self.index_attrparam(a.param)]
-            return self.mk_attrparam(a.tags, args)
-
-        if a.is_alignofs:
-            a = cast("CAttrAlignOfS", a)
-            args = [self.index_typsig(a.typsig)]
-            return self.mk_attrparam(a.tags, args)
-
-        if a.is_unop:
-            a = cast("CAttrUnOp", a)
-            args = [self.index_attrparam(a.param)]
-            return self.mk_attrparam(a.tags, args)
-
-        if a.is_binop:
-            a = cast("CAttrBinOp", a)
-            args = [
-                self.index_attrparam(a.param1), self.index_attrparam(a.param2)]
-            return self.mk_attrparam(a.tags, args)
-
-        if a.is_dot:
-            a = cast("CAttrDot", a)
-            args = [self.index_attrparam(a.param)]
-            return self.mk_attrparam(a.tags, args)
-
-        if a.is_star:
-            a = cast("CAttrStar", a)
-            if a.index == a.param.index:
-                args = [a.index]
-                chklogger.logger.info("Index self-referential attribute")
-                return self.mk_attrparam(a.tags, args)
-            args = [self.index_attrparam(a.param)]
-            return self.mk_attrparam(a.tags, args)
-
-        if a.is_addrof:
-            a = cast("CAttrAddrOf", a)
-            args = [self.index_attrparam(a.param)]
-            return self.mk_attrparam(a.tags, args)
-
-        if a.is_index:
-            a = cast("CAttrIndex", a)
-            args = [
-                self.index_attrparam(a.param1), self.index_attrparam(a.param2)]
-            return self.mk_attrparam(a.tags, args)
+    def _attrparam_args_int(self, a: CAttrInt) -> List[int]:
+        return a.args
 
-        if a.is_question:
-            a = cast("CAttrQuestion", a)
-            args = [
-                self.index_attrparam(a.param1),
-                self.index_attrparam(a.param2),
-                self.index_attrparam(a.param3)]
-            return self.mk_attrparam(a.tags, args)
+    def _attrparam_args_str(self, a: CAttrStr) -> List[int]:
+        return [self.index_string(a.stringvalue)]
 
-        else:
-            raise Exception("Unknown attrparam type")
+    def _attrparam_args_cons(self, a: CAttrCons) -> List[int]:
+        return [self.index_attrparam(p) for p in a.params]
+
+    def _attrparam_args_typ(self, a: Any) -> List[int]:
+        return [self.index_typ(a.typ)]
+
+    def _attrparam_args_typsig(self, a: Any) -> List[int]:
+        return [self.index_typsig(a.typsig)]
+
+    def _attrparam_args_param(self, a: Any) -> List[int]:
+        return [self.index_attrparam(a.param)]
+
+    def _attrparam_args_param2(self, a: Any) -> List[int]:
+        return [self.index_attrparam(a.param1), self.index_attrparam(a.param2)]
+
+    def _attrparam_args_param3(self, a: CAttrQuestion) -> List[int]:
+        return [
+            self.index_attrparam(a.param1),
+            self.index_attrparam(a.param2),
+            self.index_attrparam(a.param3)]
+
+    def _attrparam_args_star(self, a: CAttrStar) -> List[int]:
+        if a.index == a.param.index:
+            chklogger.logger.info("Index self-referential attribute")
+            return [a.index]
+        return [self.index_attrparam(a.param)]
 
     def index_attribute(self, a: CAttribute) -> int:
 
@@ -568,112 +569,136 @@ class CDictionary(ABC):
         else:
             return self.index_exp(e, subst=subst, fid=fid)
 
+    # ---------------------- memoized translation ------------------------------
+
+    def clear_translations(self) -> None:
+        self._translations.clear()
+
+    def _subst_key(
+            self, subst: Dict[Any, CExp]) -> Optional[Tuple[Any, ...]]:
+        """Returns a key for subst that does not refer to its expressions."""
+        key: List[Tuple[Any, "weakref.ref[CDictionary]", int]] = []
+        for (v, e) in subst.items():
+            if e.index < 0:
+                return None
+            key.append((v, weakref.ref(e.cd), e.index))
+        return tuple(key)
+
+    def _translate(
+            self,
+            r: CDictionaryRecord,
+            table: str,
+            subst: Dict[Any, CExp],
+            fid: int,
+            f: Callable[[], int]) -> int:
+        """Returns the index of r in this dictionary, translating it only once.
+
+        Translations are memoized per source dictionary on (table, index in
+        the source dictionary, fid, substitution). Records are created anew
+        on every lookup in their dictionary, so the expressions in the
+        substitution are identified by their dictionary (held by weak
+        reference) and their index in that dictionary, rather than by the
+        record objects themselves. Translations with a substitution that
+        includes an expression not in a dictionary are not memoized.
+        Entries for a source dictionary disappear when that dictionary is
+        released; all entries are dropped when this dictionary is reset or
+        reinitialized.
+        """
+        if r.index < 0:
+            return f()
+        substkey = self._subst_key(subst)
+        if substkey is None:
+            return f()
+        memo = self._translations.get(r.cd)
+        if memo is None:
+            memo = {}
+            self._translations[r.cd] = memo
+        key = (table, r.index, fid, substkey)
+        result = memo.get(key)
+        if result is None:
+            result = f()
+            memo[key] = result
+        return result
+
     def index_exp(
             self,
             e: CExp,
             subst: Dict[int, CExp] = {},
             fid: int = -1) -> int:
+        return self._translate(
+            e, "exp", subst, fid, lambda: self._index_exp(e, subst, fid))
 
-        args: List[int]
-
-        if e.is_constant:
-            e = cast("CExpConst", e)
-            args = [self.index_constant(e.constant)]
-            return self.mk_exp_index(e.tags, args)
-
-        if e.is_sizeof:
-            e = cast("CExpSizeOf", e)
-            args = [self.index_typ(e.typ)]
-            return self.mk_exp_index(e.tags, args)
-
-        if e.is_sizeofe:
-            e = cast("CExpSizeOfE", e)
-            args = [self.index_exp(e.exp, subst=subst, fid=fid)]
-            return self.mk_exp_index(e.tags, args)
-
-        if e.is_sizeofstr:
-            e = cast("CExpSizeOfStr", e)
-            args = [self.index_string(e.stringvalue)]
-            return self.mk_exp_index(e.tags, args)
-
-        if e.is_unop:
-            e = cast("CExpUnOp", e)
-            args = [
-                self.index_exp(e.exp, subst=subst, fid=fid),
-                self.index_typ(e.typ)]
-            return self.mk_exp_index(e.tags, args)
-
-        if e.is_binop:
-            e = cast("CExpBinOp", e)
-            args = [
-                self.index_exp(e.exp1, subst=subst, fid=fid),
-                self.index_exp(e.exp2, subst=subst, fid=fid),
-                self.index_typ(e.typ)]
-            return self.mk_exp_index(e.tags, args)
-
-        if e.is_question:
-            e = cast("CExpQuestion", e)
-            args = [
-                self.index_exp(e.condition, subst=subst, fid=fid),
-                self.index_exp(e.true_exp, subst=subst, fid=fid),
-                self.index_exp(e.false_exp, subst=subst, fid=fid)]
-            return self.mk_exp_index(e.tags, args)
-
-        if e.is_caste:
-            e = cast("CExpCastE", e)
-            args = [
-                self.index_typ(e.typ),
-                self.index_exp(e.exp, subst=subst, fid=fid)]
-            return self.mk_exp_index(e.tags, args)
-
-        if e.is_alignof:
-            e = cast("CExpAlignOf", e)
-            args = [self.index_typ(e.typ)]
-            return self.mk_exp_index(e.tags, args)
-
-        if e.is_alignofe:
-            e = cast("CExpAlignOfE", e)
-            args = [self.index_exp(e.exp, subst=subst, fid=fid)]
-            return self.mk_exp_index(e.tags, args)
-
-        if e.is_addrof:
-            e = cast("CExpAddrOf", e)
-            args = [self.index_lval(e.lval, subst=subst, fid=fid)]
-            return self.mk_exp_index(e.tags, args)
-
-        if e.is_startof:
-            e = cast("CExpStartOf", e)
-            args = [self.index_lval(e.lval, subst=subst, fid=fid)]
-            return self.mk_exp_index(e.tags, args)
-
-        if e.is_lval:
-            e = cast("CExpLval", e)
-            args = [self.index_lval(e.lval, subst=subst, fid=fid)]
-            return self.mk_exp_index(e.tags, args)
-
-        if e.is_fn_app:
-            e = cast("CExpFnApp", e)
-            args = [
-                e.args[0],   # line number
-                e.args[1],   # byte number
-                self.index_exp(e.exp, subst=subst, fid=fid)]
-            args = (
-                args
-                + [self.index_opt_exp(optx, subst=subst, fid=fid)
-                   for optx in e.arguments])
-            return self.mk_exp_index(e.tags, args)
-
-        if e.is_cn_app:
-            e = cast("CExpCnApp", e)
-            args = [self.index_typ(e.typ)]
-            args = (
-                args
-                + [self.index_opt_exp(optx, subst=subst, fid=fid)
-                   for optx in e.arguments])
-            return self.mk_exp_index(e.tags, args)
-
-        else:
+    def _index_exp(
+            self,
+            e: CExp,
+            subst: Dict[int, CExp] = {},
+            fid: int = -1) -> int:
+        indexer = self._exp_indexers.get(type(e))
+        if indexer is None:
             raise Exception("cdict:no case yet for exp " + str(e))
+        return self.mk_exp_index(e.tags, indexer(e, subst, fid))
+
+    def _exp_args_const(
+            self, e: CExpConst, subst: Dict[int, CExp], fid: int) -> List[int]:
+        return [self.index_constant(e.constant)]
+
+    def _exp_args_typ(
+            self, e: Any, subst: Dict[int, CExp], fid: int) -> List[int]:
+        return [self.index_typ(e.typ)]
+
+    def _exp_args_exp(
+            self, e: Any, subst: Dict[int, CExp], fid: int) -> List[int]:
+        return [self.index_exp(e.exp, subst=subst, fid=fid)]
+
+    def _exp_args_sizeofstr(
+            self, e: CExpSizeOfStr, subst: Dict[int, CExp], fid: int) -> List[int]:
+        return [self.index_string(e.stringvalue)]
+
+    def _exp_args_unop(
+            self, e: CExpUnOp, subst: Dict[int, CExp], fid: int) -> List[int]:
+        return [
+            self.index_exp(e.exp, subst=subst, fid=fid),
+            self.index_typ(e.typ)]
+
+    def _exp_args_binop(
+            self, e: CExpBinOp, subst: Dict[int, CExp], fid: int) -> List[int]:
+        return [
+            self.index_exp(e.exp1, subst=subst, fid=fid),
+            self.index_exp(e.exp2, subst=subst, fid=fid),
+            self.index_typ(e.typ)]
+
+    def _exp_args_question(
+            self, e: CExpQuestion, subst: Dict[int, CExp], fid: int) -> List[int]:
+        return [
+            self.index_exp(e.condition, subst=subst, fid=fid),
+            self.index_exp(e.true_exp, subst=subst, fid=fid),
+            self.index_exp(e.false_exp, subst=subst, fid=fid)]
+
+    def _exp_args_caste(
+            self, e: CExpCastE, subst: Dict[int, CExp], fid: int) -> List[int]:
+        return [
+            self.index_typ(e.typ),
+            self.index_exp(e.exp, subst=subst, fid=fid)]
+
+    def _exp_args_lval(
+            self, e: Any, subst: Dict[int, CExp], fid: int) -> List[int]:
+        return [self.index_lval(e.lval, subst=subst, fid=fid)]
+
+    def _exp_args_fnapp(
+            self, e: CExpFnApp, subst: Dict[int, CExp], fid: int) -> List[int]:
+        return (
+            [e.args[0],   # line number
+             e.args[1],   # byte number
+             self.index_exp(e.exp, subst=subst, fid=fid)]
+            + [self.index_opt_exp(optx, subst=subst, fid=fid)
+               for optx in e.arguments])
+
+    def _exp_args_cnapp(
+            self, e: CExpCnApp, subst: Dict[int, CExp], fid: int) -> List[int]:
+        return (
+            [self.index_typ(e.typ)]
+            + [self.index_opt_exp(optx, subst=subst, fid=fid)
+               for optx in e.arguments])
 
     def index_funarg(self, funarg: CFunArg) -> int:
         args: List[int] = [self.index_typ(funarg.typ)]
@@ -716,12 +741,22 @@ class CDictionary(ABC):
 
     def index_lval(
             self, lval: CLval, subst: Dict[int, CExp] = {}, fid: int = -1) -> int:
+        return self._translate(
+            lval, "lval", subst, fid,
+            lambda: self._index_lval(lval, subst, fid))
+
+    def _index_lval(
+            self, lval: CLval, subst: Dict[int, CExp] = {}, fid: int = -1) -> int:
         args: List[int] = [
             self.index_lhost(lval.lhost, subst=subst, fid=fid),
             self.index_offset(lval.offset, fid=fid)]
         return self.mk_lval_index(lval.tags, args)
 
     def index_offset(self, o: COffset, fid: int = -1) -> int:
+        return self._translate(
+            o, "offset", {}, fid, lambda: self._index_offset(o, fid))
+
+    def _index_offset(self, o: COffset, fid: int = -1) -> int:
 
         args: List[int]
 
@@ -743,69 +778,48 @@ class CDictionary(ABC):
 
         raise UF.CHError("cdict: no case yet for " + str(o))
 
-    def index_typ(self, t: CTyp) -> int:  # TBF
-
-        # omit attributes argument if there are no attributes
-        def ia(attrs: CAttributes) -> List[int]:
-            if len(attrs.attributes) == 0:
-                return []
-            else:
-                return [self.index_attributes(attrs)]
-
-        args: List[int] = ia(t.attributes)
+    def index_typ(self, t: CTyp) -> int:
+        return self._translate(t, "typ", {}, -1, lambda: self._index_typ(t))
 
-        if t.is_void:
-            return self.mk_typ_index(t.tags, args)
-
-        if t.is_int:
-            return self.mk_typ_index(t.tags, args)
-
-        elif t.is_float:
-            return self.mk_typ_index(t.tags, args)
-
-        if t.is_pointer:
-            t = cast("CTypPtr", t)
-            args = [self.index_typ(t.pointedto_type)] + args
-            return self.mk_typ_index(t.tags, args)
-
-        if t.is_named_type:
-            return self.mk_typ_index(t.tags, args)
-
-        if t.is_comp:
-            t = cast("CTypComp", t)
-            fid = cast(Any, t.cd).cfile.index
-            ckey = self.index_compinfo_key(t.compinfo, fid)
-            args = [ckey] + args
-            return self.mk_typ_index(t.tags, args)
-
-        if t.is_enum:
-            return self.mk_typ_index(t.tags, args)
-
-        if t.is_array:
-            t = cast("CTypArray", t)
-            if t.has_array_size_expr():
-                ixsize = self.index_exp(t.array_size_expr)
-            else:
-                ixsize = -1
-            args = (
-                [self.index_typ(t.array_basetype), ixsize] + args)
-            return self.mk_typ_index(t.tags, args)
-
-        if t.is_function:
-            t = cast("CTypFun", t)
-            index_funargs_opt = self.index_funargs_opt(t.funargs)
-            args = ([
-                self.index_typ(t.return_type),
-                index_funargs_opt,
-                (1 if t.is_vararg else 0)] + args)
-            return self.mk_typ_index(t.tags, args)
-
-        if t.is_builtin_vaargs:
-            return self.mk_typ_index(t.tags, args)
-
-        else:
+    def _index_typ(self, t: CTyp) -> int:  # TBF
+        indexer = self._typ_indexers.get(type(t))
+        if indexer is None:
             print("cdict: no case yet for " + str(t))
             exit(1)
+        return self.mk_typ_index(t.tags, indexer(t))
+
+    def _typ_args_attributes(self, t: CTyp) -> List[int]:
+        # omit attributes argument if there are no attributes
+        if len(t.attributes.attributes) == 0:
+            return []
+        else:
+            return [self.index_attributes(t.attributes)]
+
+    def _typ_args_ptr(self, t: CTypPtr) -> List[int]:
+        attrs = self._typ_args_attributes(t)
+        return [self.index_typ(t.pointedto_type)] + attrs
+
+    def _typ_args_comp(self, t: CTypComp) -> List[int]:
+        attrs = self._typ_args_attributes(t)
+        fid = cast(Any, t.cd).cfile.index
+        ckey = self.index_compinfo_key(t.compinfo, fid)
+        return [ckey] + attrs
+
+    def _typ_args_array(self, t: CTypArray) -> List[int]:
+        attrs = self._typ_args_attributes(t)
+        if t.has_array_size_expr():
+            ixsize = self.index_exp(t.array_size_expr)
+        else:
+            ixsize = -1
+        return [self.index_typ(t.array_basetype), ixsize] + attrs
+
+    def _typ_args_fun(self, t: CTypFun) -> List[int]:
+        attrs = self._typ_args_attributes(t)
+        index_funargs_opt = self.index_funargs_opt(t.funargs)
+        return ([
+            self.index_typ(t.return_type),
+            index_funargs_opt,
+            (1 if t.is_vararg else 0)] + attrs)
 
     def index_typsig(self, t: CTypsig) -> int:
         return -1  # TBD
@@ -860,6 +874,7 @@ class CDictionary(ABC):
     # -------------------------- initialization --------------------------------
 
     def initialize(self, xnode: ET.Element, force: bool = False) -> None:
+        self.clear_translations()
         for t in self.tables:
             t.reset()
             xtable = xnode.find(t.name)
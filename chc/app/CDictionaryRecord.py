@@ -44,6 +44,8 @@ if TYPE_CHECKING:
 class CDictionaryRecord(IT.IndexedTableValue):
     """Base class for all objects kept in the CDictionary."""
 
+    __slots__ = ("_cd",)
+
     def __init__(
         self,
         cd: "CDictionary",
@@ -64,6 +66,8 @@ class CDictionaryRecord(IT.IndexedTableValue):
 class CDeclarationsRecord(IT.IndexedTableValue):
     """Base class for all objects kept in the CFileDeclarations."""
 
+    __slots__ = ("_decls",)
+
     def __init__(
         self,
         decls: "CDeclarations",
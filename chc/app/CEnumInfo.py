@@ -43,6 +43,8 @@ if TYPE_CHECKING:
 class CEnumInfo(CDeclarationsRecord):
     """Global enum definition."""
 
+    __slots__ = ()
+
     def __init__(self, decls: "CFileDeclarations", ixval: IT.IndexedTableValue):
         CDeclarationsRecord.__init__(self, decls, ixval)
 
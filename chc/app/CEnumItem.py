@@ -47,6 +47,9 @@ class CEnumItem(CDeclarationsRecord):
     * args[0]: index of expression associated with the item in cdictionary
     * args[1]: index of definition location in the declarations
     """
+
+    __slots__ = ()
+
     def __init__(self, decls: "CFileDeclarations", ixval: IT.IndexedTableValue):
         CDeclarationsRecord.__init__(self, decls, ixval)
 
@@ -74,6 +74,8 @@ unoperatorstrings = {"neg": "-", "bnot": "~", "lnot": "!"}
 class CExp(CDictionaryRecord):
     """Base class for all expressions."""
 
+    __slots__ = ()
+
     def __init__(self, cd: "CDictionary", ixval: IT.IndexedTableValue) -> None:
         CDictionaryRecord.__init__(self, cd, ixval)
 
@@ -170,6 +172,8 @@ class CExpConst(CExp):
     - args[0]: constant
     """
 
+    __slots__ = ()
+
     def __init__(self, cd: "CDictionary", ixval: IT.IndexedTableValue) -> None:
         CExp.__init__(self, cd, ixval)
 
@@ -201,6 +205,8 @@ class CExpLval(CExp):
     - args[0]: index of lval in cdictionary
     """
 
+    __slots__ = ()
+
     def __init__(self, cd: "CDictionary", ixval: IT.IndexedTableValue) -> None:
         CExp.__init__(self, cd, ixval)
 
@@ -238,6 +244,8 @@ class CExpSizeOf(CExp):
     - args[0]: index of target type in cdictionary
     """
 
+    __slots__ = ()
+
     def __init__(self, cd: "CDictionary", ixval: IT.IndexedTableValue) -> None:
         CExp.__init__(self, cd, ixval)
 
@@ -266,6 +274,8 @@ class CExpSizeOfE(CExp):
     - args[0]: exp
     """
 
+    __slots__ = ()
+
     def __init__(self, cd: "CDictionary", ixval: IT.IndexedTableValue) -> None:
         CExp.__init__(self, cd, ixval)
 
@@ -300,6 +310,8 @@ class CExpSizeOfStr(CExp):
     - args[0]:index of  string in the string table
     """
 
+    __slots__ = ()
+
     def __init__(self, cd: "CDictionary", ixval: IT.IndexedTableValue) -> None:
         CExp.__init__(self, cd, ixval)
 
@@ -331,6 +343,8 @@ class CExpAlignOf(CExp):
     - args[0]: index of type in cdictionary
     """
 
+    __slots__ = ()
+
     def __init__(self, cd: "CDictionary", ixval: IT.IndexedTableValue) -> None:
         CExp.__init__(self, cd, ixval)
 
@@ -359,6 +373,8 @@ class CExpAlignOfE(CExp):
     - args[0]: index of expression in cdictionary
     """
 
+    __slots__ = ()
+
     def __init__(self, cd: "CDictionary", ixval: IT.IndexedTableValue) -> None:
         CExp.__init__(self, cd, ixval)
 
@@ -399,6 +415,8 @@ class CExpUnOp(CExp):
     - args[1]: index of result type in cdictionary
     """
 
+    __slots__ = ()
+
     def __init__(self, cd: "CDictionary", ixval: IT.IndexedTableValue) -> None:
         CExp.__init__(self, cd, ixval)
 
@@ -447,6 +465,8 @@ class CExpBinOp(CExp):
     - args[2]: index of typ in cdictionary
     """
 
+    __slots__ = ()
+
     def __init__(self, cd: "CDictionary", ixval: IT.IndexedTableValue) -> None:
         CExp.__init__(self, cd, ixval)
 
@@ -523,6 +543,8 @@ class CExpQuestion(CExp):
     - args[3]: index of result type in cdictionary
     """
 
+    __slots__ = ()
+
     def __init__(self, cd: "CDictionary", ixval: IT.IndexedTableValue) -> None:
         CExp.__init__(self, cd, ixval)
 
@@ -597,6 +619,8 @@ class CExpCastE(CExp):
     - args[1]: index of expression to be cast in cdictionary
     """
 
+    __slots__ = ()
+
     def __init__(self, cd: "CDictionary", ixval: IT.IndexedTableValue) -> None:
         CExp.__init__(self, cd, ixval)
 
@@ -642,6 +666,8 @@ class CExpAddrOf(CExp):
     - args[0]: index of lval in cdictionary
     """
 
+    __slots__ = ()
+
     def __init__(self, cd: "CDictionary", ixval: IT.IndexedTableValue) -> None:
         CExp.__init__(self, cd, ixval)
 
@@ -679,6 +705,8 @@ class CExpAddrOfLabel(CExp):
     - args[0]: statement sid
     """
 
+    __slots__ = ()
+
     def __init__(self, cd: "CDictionary", ixval: IT.IndexedTableValue) -> None:
         CExp.__init__(self, cd, ixval)
 
@@ -703,6 +731,8 @@ class CExpStartOf(CExp):
     - args[0]: index of lval in cdictionary
     """
 
+    __slots__ = ()
+
     def __init__(self, cd: "CDictionary", ixval: IT.IndexedTableValue) -> None:
         CExp.__init__(self, cd, ixval)
 
@@ -744,6 +774,8 @@ class CExpFnApp(CExp):
     - args[3..]: indices of arguments (optional) in cdictionary
     """
 
+    __slots__ = ()
+
     def __init__(self, cd: "CDictionary", ixval: IT.IndexedTableValue) -> None:
         CExp.__init__(self, cd, ixval)
 
@@ -783,6 +815,8 @@ class CExpCnApp(CExp):
     - args[1..]: indices of arguments (optional) in cdictionary
     """
 
+    __slots__ = ()
+
     def __init__(self, cd: "CDictionary", ixval: IT.IndexedTableValue) -> None:
         CExp.__init__(self, cd, ixval)
 
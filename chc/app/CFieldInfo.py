@@ -55,6 +55,8 @@ class CFieldInfo(CDeclarationsRecord):
     * args[4]: floc        (-1 for global structs)
     """
 
+    __slots__ = ()
+
     def __init__(
             self, cdecls: "CDeclarations", ixval: IT.IndexedTableValue) -> None:
         CDeclarationsRecord.__init__(self, cdecls, ixval)
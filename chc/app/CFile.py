@@ -60,6 +60,7 @@ from chc.proof.CFunctionPPO import CFunctionPPO
 from chc.source.CSrcFile import CSrcFile
 
 import chc.util.fileutil as UF
+from chc.util.IndexedTable import RecordPool
 from chc.util.loggingutil import chklogger
 import chc.util.xmlutil as UX
 
@@ -122,6 +123,10 @@ class CFile(object):
 
         self._cfileglobals: Optional[CFileGlobals] = None
 
+        # records of the function variable and expression dictionaries,
+        # shared by all functions in the file; append-only
+        self._invariant_record_pool = RecordPool(cfilename + "-invariants")
+
     @property
     def index(self) -> int:
         return self._index
@@ -339,9 +344,51 @@ class CFile(object):
             srcpath = UF.get_savedsource_path(self.targetpath, self.projectname)
             srcfile = os.path.join(srcpath, self.name + ".c")
             chklogger.logger.info("Source file: %s", srcfile)
-            self._sourcefile = CSrcFile(self.capp, srcfile)
+            self._sourcefile = CSrcFile(
+                self.capp, srcfile, cachelineindex=True)
         return self._sourcefile
 
+    @property
+    def is_loaded(self) -> bool:
+        """Returns true if any of the analysis artifacts have been read."""
+
+        return (
+            self._functions is not None
+            or self._dictionary is not None
+            or self._declarations is not None
+            or self._contextdictionary is not None
+            or self._predicatedictionary is not None
+            or self._interfacedictionary is not None
+            or self._assigndictionary is not None
+            or self._cfileglobals is not None)
+
+    @property
+    def invariant_record_pool(self) -> RecordPool:
+        return self._invariant_record_pool
+
+    def loaded_dictionaries(self) -> Dict[str, Any]:
+        """Returns the dictionaries of this file that have been read, by name.
+
+        No dictionaries are read by this method.
+        """
+        result: Dict[str, Any] = {}
+        for (name, d) in [
+                ("dictionary", self._dictionary),
+                ("declarations", self._declarations),
+                ("contextdictionary", self._contextdictionary),
+                ("predicatedictionary", self._predicatedictionary),
+                ("interfacedictionary", self._interfacedictionary)]:
+            if d is not None:
+                result[name] = d
+        return result
+
+    def loaded_functions(self) -> List[CFunction]:
+        """Returns the functions of this file if they have been read."""
+
+        if self._functions is None:
+            return []
+        return list(self._functions.values())
+
     @property
     def dictionary(self) -> CFileDictionary:
         if self._dictionary is None:
@@ -359,6 +406,8 @@ class CFile(object):
         return self._dictionary
 
     def reset_dictionary(self) -> None:
+        if self._dictionary is not None:
+            self._dictionary.clear_translations()
         self._dictionary = None
 
     @property
@@ -492,6 +541,29 @@ class CFile(object):
         self.reset_interfacedictionary()
         for fn in self.get_functions():
             fn.reinitialize_tables()
+        # the variable and expression dictionaries of the functions are read
+        # again, into a new pool
+        self._invariant_record_pool = RecordPool(self.cfilename + "-invariants")
+
+    def reset_caches(self) -> None:
+        """Releases all analysis artifacts of this file that were read.
+
+        This includes the dictionaries, the declarations, the globals, and
+        the functions with their proofs, invariants, and api. They are read
+        again from the analysis results directory when accessed, so any
+        changes made in memory must have been saved before.
+        """
+        chklogger.logger.info("Reset caches: %s", self.name)
+        self.reset_dictionary()
+        self.reset_contextdictionary()
+        self.reset_declarations()
+        self.reset_predicatedictionary()
+        self.reset_interfacedictionary()
+        self._assigndictionary = None
+        self._cfileglobals = None
+        self._functions = None
+        self._sourcefile = None
+        self._invariant_record_pool = RecordPool(self.cfilename + "-invariants")
 
     def has_function_by_name(self, fnname: str) -> bool:
         return fnname in self.functionxref
@@ -647,8 +719,7 @@ class CFile(object):
         self.predicatedictionary.write_xml(xnode)
         filename = UF.get_cfile_predicate_dictionaryname(
             self.targetpath, self.projectname, self.cfilepath, self.cfilename)
-        with open(filename, "w") as fp:
-            fp.write(UX.doc_to_pretty(ET.ElementTree(xroot)))
+        UF.write_xml_file(filename, xroot)
         chklogger.logger.info("Saved predicate dictionary: %s", filename)
 
     def save_interface_dictionary(self) -> None:
@@ -658,8 +729,7 @@ class CFile(object):
         self.interfacedictionary.write_xml(xnode)
         filename = UF.get_cfile_interface_dictionaryname(
             self.targetpath, self.projectname, self.cfilepath, self.cfilename)
-        with open(filename, "w") as fp:
-            fp.write(UX.doc_to_pretty(ET.ElementTree(xroot)))
+        UF.write_xml_file(filename, xroot)
         chklogger.logger.info("Saved interface dictionary: %s", filename)
 
     def save_declarations(self) -> None:
@@ -669,8 +739,7 @@ class CFile(object):
         self.declarations.write_xml(xnode)
         filename = UF.get_cfile_dictionaryname(
             self.targetpath, self.projectname, self.cfilepath, self.cfilename)
-        with open(filename, "w") as fp:
-            fp.write(UX.doc_to_pretty(ET.ElementTree(xroot)))
+        UF.write_xml_file(filename, xroot)
         chklogger.logger.info("Saved file declarations: %s", filename)
 
     def save_user_assumptions(self, userdata, assumptions):
@@ -680,8 +749,7 @@ class CFile(object):
         xroot.append(xnode)
         userdata.write_xml(xnode, assumptions)
         filename = UF.get_cfile_usr_filename(path, self.name)
-        with open(filename, "w") as fp:
-            fp.write(UX.doc_to_pretty(ET.ElementTree(xroot)))
+        UF.write_xml_file(filename, xroot)
         chklogger.logger.info("Saved user assumptions: %s", filename)
 
     def create_contract(
@@ -47,6 +47,8 @@ if TYPE_CHECKING:
 class CFileAssignment(AssignDictionaryRecord):
     """Base class for all assignment objects."""
 
+    __slots__ = ()
+
     def __init__(
             self, ad: "CFileAssignmentDictionary", ixval: IT.IndexedTableValue
     ) -> None:
@@ -83,6 +85,8 @@ class CFileAssignment(AssignDictionaryRecord):
 
 class GlobalAssignmentFunctionName(AssignDictionaryRecord):
 
+    __slots__ = ()
+
     def __init__(
             self, ad: "CFileAssignmentDictionary", ixval: IT.IndexedTableValue
     ) -> None:
@@ -105,6 +109,8 @@ class InitAssignment(CFileAssignment):
     - args[1]: index of init_info in cdeclarations dictionary
     """
 
+    __slots__ = ()
+
     def __init__(
             self, ad: "CFileAssignmentDictionary", ixval: IT.IndexedTableValue
     ) -> None:
@@ -148,6 +154,8 @@ class GlobalAssignment(CFileAssignment):
     - args[4]: index of context in context table
     """
 
+    __slots__ = ()
+
     def __init__(
             self, ad: "CFileAssignmentDictionary", ixval: IT.IndexedTableValue
     ) -> None:
@@ -194,6 +202,8 @@ class GlobalIndexAssignment(CFileAssignment):
     - args[5]: index of context in context table
     """
 
+    __slots__ = ()
+
     def __init__(
             self, ad: "CFileAssignmentDictionary", ixval: IT.IndexedTableValue
     ) -> None:
@@ -247,6 +257,8 @@ class StaticAssignment(CFileAssignment):
     - args[4]: index of context in context table
     """
 
+    __slots__ = ()
+
     def __init__(
             self, ad: "CFileAssignmentDictionary", ixval: IT.IndexedTableValue
     ) -> None:
@@ -293,6 +305,8 @@ class StaticIndexAssignment(CFileAssignment):
     - args[5]: index of context in context table
     """
 
+    __slots__ = ()
+
     def __init__(
             self, ad: "CFileAssignmentDictionary", ixval: IT.IndexedTableValue
     ) -> None:
@@ -351,6 +365,8 @@ class FieldAssignment(CFileAssignment):
     - args[5]: index of context in context table
     """
 
+    __slots__ = ()
+
     def __init__(
             self, ad: "CFileAssignmentDictionary", ixval: IT.IndexedTableValue
     ) -> None:
@@ -391,6 +407,8 @@ class UnknownAssignment(CFileAssignment):
     - args[4]: index of context in context table
     """
 
+    __slots__ = ()
+
     def __init__(
             self, ad: "CFileAssignmentDictionary", ixval: IT.IndexedTableValue
     ) -> None:
@@ -99,6 +99,8 @@ def xget_int_attr_o(node: ET.Element, tag: str) -> Optional[int]:
 
 class CFilename(CDeclarationsRecord):
 
+    __slots__ = ()
+
     def __init__(self, decls: CDeclarations, ixval: IndexedTableValue):
         CDeclarationsRecord.__init__(self, decls, ixval)
 
@@ -262,15 +264,19 @@ class CFileDeclarations(CDeclarations):
             self, xnode: ET.Element, tag: str = "ivinfo") -> CVarInfo:
         return self.get_varinfo(xget_int_attr(xnode, tag))
 
-    def read_xml_location(
-            self, xnode: ET.Element, tag: str = "iloc") -> CLocation:
-        index = xget_int_attr(xnode, tag)
+    def get_location_or_unknown(self, index: int) -> CLocation:
+        """Returns the location with index, or the unknown location if -1."""
+
         if index == -1:
             args = [-1, -1, -1]
             itv = IndexedTableValue(-1, [], args)
             return CLocation(self, itv)
         return self.get_location(index)
 
+    def read_xml_location(
+            self, xnode: ET.Element, tag: str = "iloc") -> CLocation:
+        return self.get_location_or_unknown(xget_int_attr(xnode, tag))
+
     def read_xml_location_o(
             self, xnode: ET.Element, tag: str = "iloc") -> Optional[CLocation]:
         index = xget_int_attr_o(xnode, tag)
@@ -155,21 +155,21 @@ class CFileDictionary(CDictionary):
 
         return self.exp_table.add(IT.get_key(tags, args), f)
 
-    def index_exp(
+    def _index_exp(
             self, e: CExp, subst: Dict[int, CExp] = {}, fid: int = -1) -> int:
 
         if not e.is_lval:
-            return CDictionary.index_exp(self, e, subst, fid)
+            return CDictionary._index_exp(self, e, subst, fid)
 
         e = cast(CExpLval, e)
         lhost = e.lval.lhost
 
         if not lhost.is_var:
-            return CDictionary.index_exp(self, e, subst, fid)
+            return CDictionary._index_exp(self, e, subst, fid)
 
         lhost = cast(CLHostVar, lhost)
         if lhost.vid not in subst:
-            return CDictionary.index_exp(self, e, subst, fid)
+            return CDictionary._index_exp(self, e, subst, fid)
 
         # if lhost.is_var and lhost.vid in subst:
         if e.lval.offset.has_offset():
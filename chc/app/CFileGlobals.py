@@ -170,7 +170,7 @@ class CFileGlobals:
 
     def __init__(self, cfile: "CFile", xnode: ET.Element) -> None:
         self._cfile = cfile
-        self._xnode = xnode
+        self._xnode: Optional[ET.Element] = xnode
 
         self._gcomptagdefs: Optional[Dict[int, CGCompTag]] = None
         self._gcomptagdecls: Optional[Dict[int, CGCompTag]] = None
@@ -189,6 +189,31 @@ class CFileGlobals:
     def cfile(self) -> "CFile":
         return self._cfile
 
+    def _section(self, tag: str) -> Optional[ET.Element]:
+        """Returns the section element with the given tag and detaches it.
+
+        Each section is decoded only once, so its element is not kept after
+        it is decoded; the globals element itself is released when all
+        sections are decoded.
+        """
+
+        if self._xnode is None:
+            return None
+        xsection = self._xnode.find(tag)
+        if xsection is not None:
+            self._xnode.remove(xsection)
+        if all(d is not None for d in [
+                self._gcomptagdefs,
+                self._gcomptagdecls,
+                self._genumtagdecls,
+                self._genumtagdefs,
+                self._gfunctions,
+                self._gtypes,
+                self._gvardecls,
+                self._gvardefs]):
+            self._xnode = None
+        return xsection
+
     @property
     def keep_system_includes(self) -> bool:
         return self.cfile.keep_system_includes
@@ -211,7 +236,7 @@ class CFileGlobals:
     def gcomptagdecls(self) -> Dict[int, CGCompTag]:
         if self._gcomptagdecls is None:
             self._gcomptagdecls = {}
-            xgc = self._xnode.find("global-comptag-declarations")
+            xgc = self._section("global-comptag-declarations")
             if xgc is not None:
                 for xc in xgc.findall("gcomptagdecl"):
                     xicinfo = xc.get("icinfo")
@@ -231,7 +256,7 @@ class CFileGlobals:
     def gcomptagdefs(self) -> Dict[int, CGCompTag]:
         if self._gcomptagdefs is None:
             self._gcomptagdefs = {}
-            xgc = self._xnode.find("global-comptag-definitions")
+            xgc = self._section("global-comptag-definitions")
             if xgc is not None:
                 for xc in xgc.findall("gcomptag"):
                     xicinfo = xc.get("icinfo")
@@ -251,7 +276,7 @@ class CFileGlobals:
     def genumtagdecls(self) -> Dict[str, CGEnumTag]:
         if self._genumtagdecls is None:
             self._genumtagdecls = {}
-            xge = self._xnode.find("global-enumtag-declarations")
+            xge = self._section("global-enumtag-declarations")
             if xge is not None:
                 for xe in xge.findall("genumtagdecl"):
                     xieinfo = xe.get("ieinfo")
@@ -271,7 +296,7 @@ class CFileGlobals:
     def genumtagdefs(self) -> Dict[str, CGEnumTag]:
         if self._genumtagdefs is None:
             self._genumtagdefs = {}
-            xge = self._xnode.find("global-enumtag-definitions")
+            xge = self._section("global-enumtag-definitions")
             if xge is not None:
                 for xe in xge.findall("genumtag"):
                     xieinfo = xe.get("ieinfo")
@@ -291,7 +316,7 @@ class CFileGlobals:
     def gfunctions(self) -> Dict[int, CGFunction]:
         if self._gfunctions is None:
             self._gfunctions = {}
-            xgf = self._xnode.find("functions")
+            xgf = self._section("functions")
             if xgf is not None:
                 for xf in xgf.findall("gfun"):
                     xivinfo = xf.get("ivinfo")
@@ -321,7 +346,7 @@ class CFileGlobals:
     def gtypes(self) -> Dict[str, CGType]:
         if self._gtypes is None:
             self._gtypes = {}
-            xgt = self._xnode.find("global-type-definitions")
+            xgt = self._section("global-type-definitions")
             if xgt is not None:
                 for xt in xgt.findall("gtype"):
                     xitinfo = xt.get("itinfo")
@@ -341,7 +366,7 @@ class CFileGlobals:
     def gvardecls(self) -> Dict[int, CGVarDecl]:
         if self._gvardecls is None:
             self._gvardecls = {}
-            xgv = self._xnode.find("global-var-declarations")
+            xgv = self._section("global-var-declarations")
             if xgv is not None:
                 for xv in xgv.findall("gvardecl"):
                     xivinfo = xv.get("ivinfo")
@@ -361,7 +386,7 @@ class CFileGlobals:
     def gvardefs(self) -> Dict[int, CGVarDef]:
         if self._gvardefs is None:
             self._gvardefs = {}
-            xgv = self._xnode.find("global-var-definitions")
+            xgv = self._section("global-var-definitions")
             if xgv is not None:
                 for xv in xgv.findall("gvar"):
                     xivinfo = xv.get("ivinfo")
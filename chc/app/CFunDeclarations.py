@@ -53,7 +53,6 @@ class CFunDeclarations:
 
     def __init__(self, cfun: "CFunction", xnode: ET.Element) -> None:
         self._cfun = cfun
-        self.xnode = xnode
         self._varinfos: Dict[int, CVarInfo] = {}  # indexed by vid
         self.local_varinfo_table = IndexedTable("local-varinfo-table")
         self.initialize(xnode)
@@ -74,7 +74,7 @@ class CFunction:
     """Function implementation."""
 
     def __init__(self, cfile: "CFile", xnode: ET.Element, fname: str) -> None:
-        self.xnode = xnode
+        self._xnode: Optional[ET.Element] = xnode
         self._cfile = cfile
         self._name = fname
         self._cfundecls: Optional[CFunDeclarations] = None
@@ -122,6 +122,31 @@ class CFunction:
     def cfilename(self) -> str:
         return self.cfile.cfilename
 
+    @property
+    def xnode(self) -> ET.Element:
+        """Returns the function element, re-reading it if it was released."""
+
+        if self._xnode is None:
+            xnode = UF.get_cfun_xnode(
+                self.targetpath,
+                self.projectname,
+                self.cfilepath,
+                self.cfilename,
+                self.name)
+            if xnode is None:
+                raise UF.CHCError(self.xmsg("cfun file not found"))
+            self._xnode = xnode
+        return self._xnode
+
+    def _release_xnode(self) -> None:
+        """Drops the function element once all its parts are decoded."""
+
+        if (
+                self._svar is not None
+                and self._sbody is not None
+                and self._cfundecls is not None):
+            self._xnode = None
+
     @property
     def formals(self) -> Dict[int, "CVarInfo"]:
         if len(self._formals) == 0:
@@ -184,6 +209,7 @@ class CFunction:
                 xivinfo = xsvar.get("ivinfo")
                 if xivinfo is not None:
                     self._svar = self.cfiledecls.get_varinfo(int(xivinfo))
+                    self._release_xnode()
                 else:
                     raise UF.CHCError(
                         self.xmsg(
@@ -200,6 +226,7 @@ class CFunction:
             xsbody = self.xnode.find("sbody")
             if xsbody is not None:
                 self._sbody = CFunctionBody(self, xsbody)
+                self._release_xnode()
             else:
                 raise UF.CHCError(
                     self.xmsg("sbody element is missing from cfun file"))
@@ -211,6 +238,7 @@ class CFunction:
             dxnode = self.xnode.find("declarations")
             if dxnode is not None:
                 self._cfundecls = CFunDeclarations(self, dxnode)
+                self._release_xnode()
             else:
                 raise UF.CHCError(
                     self.xmsg("declarations are missing from cfun file"))
@@ -354,38 +382,78 @@ class CFunction:
                 return rs
         return None
 
+    def read_ppos_xnode(self) -> ET.Element:
+        """Reads the ppos element from the ppo file."""
+
+        xpponode = UF.get_ppo_xnode(
+            self.targetpath,
+            self.projectname,
+            self.cfilepath,
+            self.cfilename,
+            self.name)
+        if xpponode is None:
+            raise UF.CHCError(self.xmsg("ppo file is missing"))
+        xxpponode = xpponode.find("ppos")
+        if xxpponode is None:
+            raise UF.CHCError(self.xmsg("_ppo file has no ppos element"))
+        return xxpponode
+
+    def read_spos_xnode(self) -> ET.Element:
+        """Reads the spos element from the spo file."""
+
+        xsponode = UF.get_spo_xnode(
+            self.targetpath,
+            self.projectname,
+            self.cfilepath,
+            self.cfilename,
+            self.name)
+        if xsponode is None:
+            raise UF.CHCError(self.xmsg("spo file is missing"))
+        xxsponode = xsponode.find("spos")
+        if xxsponode is None:
+            raise UF.CHCError(self.xmsg("spo file has no spos element"))
+        return xxsponode
+
     @property
     def proofs(self) -> CFunctionProofs:
         if self._proofs is None:
-            xpponode = UF.get_ppo_xnode(
-                self.targetpath,
-                self.projectname,
-                self.cfilepath,
-                self.cfilename,
-                self.name)
-            if xpponode is None:
-                raise UF.CHCError(self.xmsg("ppo file is missing"))
-            xxpponode = xpponode.find("ppos")
-            if xxpponode is None:
-                raise UF.CHCError(self.xmsg("_ppo file has no ppos element"))
-            xsponode = UF.get_spo_xnode(
-                self.targetpath,
-                self.projectname,
-                self.cfilepath,
-                self.cfilename,
-                self.name)
-            if xsponode is None:
-                raise UF.CHCError(self.xmsg("spo file is missing"))
-            xxsponode = xsponode.find("spos")
-            if xxsponode is None:
-                raise UF.CHCError(self.xmsg("spo file has no spos element"))
-            self._proofs = CFunctionProofs(self, xxpponode, xxsponode)
+            self._proofs = CFunctionProofs(
+                self, self.read_ppos_xnode(), self.read_spos_xnode())
         return self._proofs
 
+    def loaded_dictionaries(self) -> Dict[str, Any]:
+        """Returns the dictionaries of this function that have been read.
+
+        No dictionaries are read by this method.
+        """
+        result: Dict[str, Any] = {}
+        if self._podictionary is not None:
+            result["podictionary"] = self._podictionary
+        if self._vard is not None:
+            result["vardictionary"] = self._vard
+            xd = self._vard.loaded_xd()
+            if xd is not None:
+                result["xprdictionary"] = xd
+        if self._invd is not None:
+            result["invdictionary"] = self._invd
+        return result
+
+    def loaded_proofs(self) -> Optional[CFunctionProofs]:
+        """Returns the proof obligations of this function if they have been read."""
+
+        return self._proofs
+
+    def loaded_invarianttable(self) -> Optional[CFunInvariantTable]:
+        """Returns the invariant table of this function if it has been read."""
+
+        return self._invarianttable
+
     def reinitialize_tables(self) -> None:
         self._api = None
         self._podictionary = None
-        self._vardictionary = None
+        self._vard = None
+        self._invd = None
+        self._invarianttable = None
         self._analysis_digests = None
         self._proofs = None
 
@@ -46,6 +46,8 @@ if TYPE_CHECKING:
 class CInitInfo(CDeclarationsRecord):
     """Global variable initializer."""
 
+    __slots__ = ()
+
     def __init__(self, decls: "CDeclarations", ixval: IT.IndexedTableValue):
         CDeclarationsRecord.__init__(self, decls, ixval)
 
@@ -71,6 +73,8 @@ class CSingleInitInfo(CInitInfo):
     - args[0]: index of initialization expression in cdictionary
     """
 
+    __slots__ = ()
+
     def __init__(self, decls: "CDeclarations", ixval: IT.IndexedTableValue):
         CInitInfo.__init__(self, decls, ixval)
 
@@ -95,6 +99,8 @@ class CCompoundInitInfo(CInitInfo):
     - args[0]: index of type of initializer in cdictionary
     """
 
+    __slots__ = ()
+
     def __init__(self, decls: "CDeclarations", ixval: IT.IndexedTableValue):
         CInitInfo.__init__(self, decls, ixval)
 
@@ -132,6 +138,8 @@ class COffsetInitInfo(CInitInfo):
     - args[1]: index of initinfo in cdeclarations
     """
 
+    __slots__ = ()
+
     def __init__(self, decls: "CDeclarations", ixval: IT.IndexedTableValue):
         CDeclarationsRecord.__init__(self, decls, ixval)
 
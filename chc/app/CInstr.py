@@ -45,12 +45,21 @@ if TYPE_CHECKING:
     from chc.app.CVisitor import CVisitor
 
 
+def get_int_o(xnode: ET.Element, tag: str) -> Optional[int]:
+    xvalue = xnode.get(tag)
+    return None if xvalue is None else int(xvalue)
+
+
 class CInstr:
-    """Base class for instructions."""
+    """Base class for instructions.
+
+    The attributes of the instruction are decoded from xnode on
+    construction; the element itself is not kept.
+    """
 
     def __init__(self, parent: "CStmt", xnode: ET.Element) -> None:
         self._parent = parent
-        self.xnode = xnode
+        self._iloc = get_int_o(xnode, "iloc")
 
     @property
     def parent(self) -> "CStmt":
@@ -66,7 +75,9 @@ class CInstr:
 
     @property
     def location(self) -> "CLocation":
-        return self.cfun.cfiledecls.read_xml_location(self.xnode)
+        if self._iloc is None:
+            raise UF.CHCError("iloc attribute missing from instruction")
+        return self.cfun.cfiledecls.get_location_or_unknown(self._iloc)
 
     @property
     def is_assign(self) -> bool:
@@ -96,6 +107,12 @@ class CCallInstr(CInstr):
 
     def __init__(self, parent: "CStmt", xnode: ET.Element) -> None:
         CInstr.__init__(self, parent, xnode)
+        self._ilval = get_int_o(xnode, "ilval")
+        self._iexp = get_int_o(xnode, "iexp")
+        xargs = xnode.find("args")
+        self._iargs: Optional[List[Optional[int]]] = (
+            None if xargs is None
+            else [get_int_o(a, "iexp") for a in xargs.findall("exp")])
         self._callee: Optional["CExp"] = None
         self._callargs: Optional[List["CExp"]] = None
 
@@ -105,18 +122,16 @@ class CCallInstr(CInstr):
 
     @property
     def lhs(self) -> Optional["CLval"]:
-        xlval = self.xnode.get("ilval")
-        if xlval is not None:
-            return self.cdictionary.get_lval(int(xlval))
+        if self._ilval is not None:
+            return self.cdictionary.get_lval(self._ilval)
         else:
             return None
 
     @property
     def callee(self) -> "CExp":
         if self._callee is None:
-            xexp = self.xnode.get("iexp")
-            if xexp is not None:
-                self._callee = self.cdictionary.get_exp(int(xexp))
+            if self._iexp is not None:
+                self._callee = self.cdictionary.get_exp(self._iexp)
             else:
                 raise UF.CHCError("call instruction does not hava a callee")
         return self._callee
@@ -125,14 +140,12 @@ class CCallInstr(CInstr):
     def callargs(self) -> List["CExp"]:
         if self._callargs is None:
             self._callargs = []
-            xargs = self.xnode.find("args")
-            if xargs is None:
+            if self._iargs is None:
                 raise UF.CHCError(
                     "Argument element missing from call instruction")
-            for a in xargs.findall("exp"):
-                xiexp = a.get("iexp")
-                if xiexp is not None:
-                    exp = self.cdictionary.get_exp(int(xiexp))
+            for iexp in self._iargs:
+                if iexp is not None:
+                    exp = self.cdictionary.get_exp(iexp)
                     self._callargs.append(exp)
                 else:
                     raise UF.CHCError(
@@ -144,7 +157,7 @@ class CCallInstr(CInstr):
         return sum([a.get_strings() for a in self.callargs], [])
 
     def has_lhs(self) -> bool:
-        return "ilval" in self.xnode.attrib
+        return self._ilval is not None
 
     def get_variable_uses(self, vid: int) -> int:
         if self.lhs is not None:
@@ -167,6 +180,8 @@ class CAssignInstr(CInstr):
 
     def __init__(self, parent: "CStmt", xnode: ET.Element) -> None:
         CInstr.__init__(self, parent, xnode)
+        self._ilval = get_int_o(xnode, "ilval")
+        self._iexp = get_int_o(xnode, "iexp")
         self._lhs: Optional["CLval"] = None
         self._rhs: Optional["CExp"] = None
 
@@ -177,9 +192,8 @@ class CAssignInstr(CInstr):
     @property
     def lhs(self) -> "CLval":
         if self._lhs is None:
-            xlval = self.xnode.get("ilval")
-            if xlval is not None:
-                self._lhs = self.cdictionary.get_lval(int(xlval))
+            if self._ilval is not None:
+                self._lhs = self.cdictionary.get_lval(self._ilval)
             else:
                 raise UF.CHCError(
                     "Lhs attribute missing from assign instruction")
@@ -188,9 +202,8 @@ class CAssignInstr(CInstr):
     @property
     def rhs(self) -> "CExp":
         if self._rhs is None:
-            xexp = self.xnode.get("iexp")
-            if xexp is not None:
-                self._rhs = self.cdictionary.get_exp(int(xexp))
+            if self._iexp is not None:
+                self._rhs = self.cdictionary.get_exp(self._iexp)
             else:
                 raise UF.CHCError(
                     "Rhs attribute missing from assign instruction")
@@ -217,8 +230,22 @@ class CAsmInstr(CInstr):
 
     def __init__(self, parent: "CStmt", xnode: ET.Element) -> None:
         CInstr.__init__(self, parent, xnode)
-        self._asminputs: Optional[List["CAsmInput"]] = None
-        self._asmoutputs: Optional[List["CAsmOutput"]] = None
+        self._asminputs: List["CAsmInput"] = []
+        xinputs = xnode.find("asminputs")
+        if xinputs is not None:
+            for inode in xinputs.findall("asminput"):
+                self._asminputs.append(CAsmInput(self, inode))
+        self._asmoutputs: List["CAsmOutput"] = []
+        xoutputs = xnode.find("asmoutputs")
+        if xoutputs is not None:
+            for inode in xoutputs.findall("asmoutput"):
+                self._asmoutputs.append(CAsmOutput(self, inode))
+        self._itemplates: List[int] = []
+        xtemplate = xnode.find("templates")
+        if xtemplate is not None:
+            xindices = xtemplate.get("str-indices")
+            if xindices is not None:
+                self._itemplates = [int(s) for s in xindices.split(",")]
         self._templates: Optional[List[str]] = None
 
     @property
@@ -227,35 +254,17 @@ class CAsmInstr(CInstr):
 
     @property
     def asminputs(self) -> List["CAsmInput"]:
-        if self._asminputs is None:
-            self._asminputs = []
-            xinputs = self.xnode.find("asminputs")
-            if xinputs is not None:
-                for inode in xinputs.findall("asminput"):
-                    self._asminputs.append(CAsmInput(self, inode))
         return self._asminputs
 
     @property
     def asmoutputs(self) -> List["CAsmOutput"]:
-        if self._asmoutputs is None:
-            self._asmoutputs = []
-            xoutputs = self.xnode.find("asmoutputs")
-            if xoutputs is not None:
-                for inode in xoutputs.findall("asmoutput"):
-                    self._asmoutputs.append(CAsmOutput(self, inode))
         return self._asmoutputs
 
     @property
     def templates(self) -> List[str]:
         if self._templates is None:
-            self._templates = []
-            xtemplate = self.xnode.find("templates")
-            if xtemplate is not None:
-                xindices = xtemplate.get("str-indices")
-                if xindices is not None:
-                    for s in xindices.split(","):
-                        ts = self.cdictionary.get_string(int(s))
-                        self._templates.append(ts)
+            self._templates = [
+                self.cdictionary.get_string(s) for s in self._itemplates]
         return self._templates
 
     def accept(self, visitor: "CVisitor") -> None:
@@ -276,7 +285,8 @@ class CAsmOutput:
 
     def __init__(self, parent: CAsmInstr, xnode: ET.Element) -> None:
         self._parent = parent
-        self.xnode = xnode
+        self._ilval = get_int_o(xnode, "ilval")
+        self._constraint = xnode.get("constraint", "none")
         self._lhs: Optional["CLval"] = None
 
     @property
@@ -286,16 +296,15 @@ class CAsmOutput:
     @property
     def lhs(self) -> "CLval":
         if self._lhs is None:
-            xlval = self.xnode.get("ilval")
-            if xlval is not None:
-                self._lhs = self.parent.cdictionary.get_lval(int(xlval))
+            if self._ilval is not None:
+                self._lhs = self.parent.cdictionary.get_lval(self._ilval)
             else:
                 raise UF.CHCError("ilval attribute missing from asm output")
         return self._lhs
 
     @property
     def constraint(self) -> str:
-        return self.xnode.get("constraint", "none")
+        return self._constraint
 
     def accept(self, visitor: "CVisitor") -> None:
         visitor.visit_asm_output(self)
@@ -308,7 +317,8 @@ class CAsmInput:
 
     def __init__(self, parent: CAsmInstr, xnode: ET.Element) -> None:
         self._parent = parent
-        self.xnode = xnode
+        self._iexp = get_int_o(xnode, "iexp")
+        self._constraint = xnode.get("constraint", "none")
         self._exp: Optional["CExp"] = None
 
     @property
@@ -318,16 +328,15 @@ class CAsmInput:
     @property
     def exp(self) -> "CExp":
         if self._exp is None:
-            xexp = self.xnode.get("iexp")
-            if xexp is not None:
-                self._exp = self.parent.cdictionary.get_exp(int(xexp))
+            if self._iexp is not None:
+                self._exp = self.parent.cdictionary.get_exp(self._iexp)
             else:
                 raise UF.CHCError("iexp attribute missing from asm input")
         return self._exp
 
     @property
     def constraint(self) -> str:
-        return self.xnode.get("constraint", "none")
+        return self._constraint
 
     def accept(self, visitor: "CVisitor") -> None:
         visitor.visit_asm_input(self)
@@ -44,6 +44,8 @@ if TYPE_CHECKING:
 class CLHost(CDictionaryRecord):
     """Base class for variable and dereference."""
 
+    __slots__ = ()
+
     def __init__(self, cd: "CDictionary", ixval: IT.IndexedTableValue) -> None:
         CDictionaryRecord.__init__(self, cd, ixval)
 
@@ -92,6 +94,8 @@ class CLHostVar(CLHost):
     - args[0]: vid (variable id)
     """
 
+    __slots__ = ()
+
     def __init__(self, cd: "CDictionary", ixval: IT.IndexedTableValue) -> None:
         CLHost.__init__(self, cd, ixval)
 
@@ -134,6 +138,8 @@ class CLHostMem(CLHost):
     - args[0]: index of address expression in cdictionary
     """
 
+    __slots__ = ()
+
     def __init__(self, cd: "CDictionary", ixval: IT.IndexedTableValue) -> None:
         CLHost.__init__(self, cd, ixval)
 
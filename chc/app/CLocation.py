@@ -50,6 +50,8 @@ class CLocation(CDeclarationsRecord):
     - args[2]: line number
     """
 
+    __slots__ = ()
+
     def __init__(self, decls: "CDeclarations", ixval: IT.IndexedTableValue):
         CDeclarationsRecord.__init__(self, decls, ixval)
 
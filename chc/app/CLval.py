@@ -48,6 +48,8 @@ class CLval(CDictionaryRecord):
     * args[1]: index of offset in cdictionary
     """
 
+    __slots__ = ()
+
     def __init__(self, cd: "CDictionary", ixval: IT.IndexedTableValue) -> None:
         CDictionaryRecord.__init__(self, cd, ixval)
 
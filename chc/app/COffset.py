@@ -44,6 +44,8 @@ if TYPE_CHECKING:
 class COffset(CDictionaryRecord):
     """Base class for an expression offset."""
 
+    __slots__ = ()
+
     def __init__(self, cd: "CDictionary", ixval: IT.IndexedTableValue) -> None:
         CDictionaryRecord.__init__(self, cd, ixval)
 
@@ -81,6 +83,8 @@ class COffset(CDictionaryRecord):
 @cdregistry.register_tag("n", COffset)
 class CNoOffset(COffset):
 
+    __slots__ = ()
+
     def __init__(self, cd: "CDictionary", ixval: IT.IndexedTableValue) -> None:
         COffset.__init__(self, cd, ixval)
 
@@ -111,6 +115,8 @@ class CFieldOffset(COffset):
     * args[1]: index of sub-offset in cdictionary
     """
 
+    __slots__ = ()
+
     def __init__(self, cd: "CDictionary", ixval: IT.IndexedTableValue) -> None:
         COffset.__init__(self, cd, ixval)
 
@@ -152,6 +158,9 @@ class CIndexOffset(COffset):
     * args[0]: index of base of index expression in cdictionary
     * args[1]: index of sub-offset in cdictionary
     """
+
+    __slots__ = ()
+
     def __init__(self, cd: "CDictionary", ixval: IT.IndexedTableValue) -> None:
         COffset.__init__(self, cd, ixval)
 
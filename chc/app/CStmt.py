@@ -58,6 +58,24 @@ stmt_constructors: Dict[str, Callable[["CStmt", ET.Element], "CStmt"]] = {
 }
 
 
+def get_int_list(xnode: ET.Element, tag: str) -> List[int]:
+    """Returns the comma-separated integers of the r attribute of child tag."""
+
+    xchild = xnode.find(tag)
+    if xchild is not None:
+        xr = xchild.get("r")
+        if xr is not None:
+            return [int(x) for x in str(xr).split(",")]
+    return []
+
+
+def get_int_o(xnode: Optional[ET.Element], tag: str) -> Optional[int]:
+    if xnode is None:
+        return None
+    xvalue = xnode.get(tag)
+    return None if xvalue is None else int(xvalue)
+
+
 def get_statement(parent: "CStmt", xnode: ET.Element) -> "CStmt":
     """Return the appropriate kind of CStmt dependent on the stmt kind."""
 
@@ -73,13 +91,22 @@ def get_statement(parent: "CStmt", xnode: ET.Element) -> "CStmt":
 
 
 class CStmt:
-    """Superclass of all control flow components in a function."""
+    """Superclass of all control flow components in a function.
+
+    The attributes of the statement are decoded from xnode on construction;
+    statements with nested statements or instructions hold only the element
+    of those until they are decoded, so that the xml of a function body is
+    released as its statements are decoded.
+    """
 
     def __init__(self, parent: Optional["CStmt"], xnode: ET.Element) -> None:
         self._parent = parent
-        self.xnode = xnode
-        self._succs: Optional[List[int]] = None
-        self._preds: Optional[List[int]] = None
+        xskind = xnode.find("skind")
+        self._sid = get_int_o(xnode, "sid")
+        self._kind = None if xskind is None else xskind.get("stag")
+        self._iloc = get_int_o(xskind, "iloc")
+        self._succs = get_int_list(xnode, "succs")
+        self._preds = get_int_list(xnode, "preds")
 
     @property
     def parent(self) -> Optional["CStmt"]:
@@ -106,56 +133,31 @@ class CStmt:
 
     @property
     def sid(self) -> int:
-        xsid = self.xnode.get("sid")
-        if xsid is not None:
-            return int(xsid)
+        if self._sid is not None:
+            return self._sid
         else:
             raise UF.CHCError("sid missing from stmt")
 
-    @property
-    def xskind(self) -> ET.Element:
-        xskind = self.xnode.find("skind")
-        if xskind is not None:
-            return xskind
-        else:
-            raise UF.CHCError("skind missing from stmt")
-
     @property
     def kind(self) -> str:
-        xkind = self.xskind.get("stag")
-        if xkind is not None:
-            return xkind
+        if self._kind is not None:
+            return self._kind
         else:
             raise UF.CHCError("stag missing from stmt")
 
     @property
     def location(self) -> "CLocation":
-        xiloc = self.xskind.get("iloc")
-        if xiloc is not None:
-            return self.declarations.get_location(int(xiloc))
+        if self._iloc is not None:
+            return self.declarations.get_location(self._iloc)
         else:
             raise UF.CHCError("No location found in statement " + str(self))
 
     @property
     def preds(self) -> List[int]:
-        if self._preds is None:
-            self._preds = []
-            xpreds = self.xnode.find("preds")
-            if xpreds is not None:
-                xpreds_r = xpreds.get("r")
-                if xpreds_r is not None:
-                    self._preds = [int(x) for x in str(xpreds_r).split(",")]
         return self._preds
 
     @property
     def succs(self) -> List[int]:
-        if self._succs is None:
-            self._succs = []
-            xsuccs = self.xnode.find("succs")
-            if xsuccs is not None:
-                xsuccs_r = xsuccs.get("r")
-                if xsuccs_r is not None:
-                    self._succs = [int(x) for x in str(xsuccs_r).split(",")]
         return self._succs
 
     @property
@@ -230,13 +232,15 @@ class CBlock(CStmt):
 
     def __init__(self, parent: Optional["CStmt"], xnode: ET.Element) -> None:
         CStmt.__init__(self, parent, xnode)
+        self._xbstmts: Optional[ET.Element] = xnode.find("bstmts")
         self._stmts: Optional[Dict[int, "CStmt"]] = None
 
     @property
     def stmts(self) -> Dict[int, "CStmt"]:
         if self._stmts is None:
             self._stmts = {}
-            bstmts = self.xnode.find("bstmts")
+            bstmts = self._xbstmts
+            self._xbstmts = None
             if bstmts is not None:
                 for s in bstmts.findall("stmt"):
                     stmt = get_statement(self, s)
@@ -279,45 +283,38 @@ class CIfStmt(CStmt):
 
     def __init__(self, parent: "CStmt", xnode: ET.Element) -> None:
         CStmt.__init__(self, parent, xnode)
+        xskind = xnode.find("skind")
+        xthen = None if xskind is None else xskind.find("thenblock")
+        xelse = None if xskind is None else xskind.find("elseblock")
+        self._iexp = get_int_o(xskind, "iexp")
+        self._thenblock = None if xthen is None else CBlock(self, xthen)
+        self._elseblock = None if xelse is None else CBlock(self, xelse)
         self._stmts: Optional[Dict[int, "CStmt"]] = None
 
     @property
     def stmts(self) -> Dict[int, "CStmt"]:
         if self._stmts is None:
             self._stmts = {}
-            xthen = self.xskind.find("thenblock")
-            if xthen is not None:
-                thenblock = CBlock(self, xthen)
-                for s in thenblock.stmts.values():
+            if self._thenblock is not None:
+                for s in self._thenblock.stmts.values():
                     self._stmts[s.sid] = s
-            xelse = self.xskind.find("elseblock")
-            if xelse is not None:
-                elseblock = CBlock(self, xelse)
-                for s in elseblock.stmts.values():
+            if self._elseblock is not None:
+                for s in self._elseblock.stmts.values():
                     self._stmts[s.sid] = s
         return self._stmts
 
     @property
     def ifstmt(self) -> Optional["CStmt"]:
-        xthen = self.xskind.find("thenblock")
-        if xthen is not None:
-            return CBlock(self, xthen)
-        else:
-            return None
+        return self._thenblock
 
     @property
     def elsestmt(self) -> Optional["CStmt"]:
-        xelse = self.xskind.find("elseblock")
-        if xelse is not None:
-            return CBlock(self, xelse)
-        else:
-            return None
+        return self._elseblock
 
     @property
     def condition(self) -> "CExp":
-        xiexp = self.xskind.get("iexp")
-        if xiexp is not None:
-            return self.cdictionary.get_exp(int(xiexp))
+        if self._iexp is not None:
+            return self.cdictionary.get_exp(self._iexp)
         else:
             raise UF.CHCError("iexp attribute is missing from if stmt")
 
@@ -345,16 +342,17 @@ class CLoopStmt(CStmt):
 
     def __init__(self, parent: "CStmt", xnode: ET.Element) -> None:
         CStmt.__init__(self, parent, xnode)
+        xskind = xnode.find("skind")
+        xblock = None if xskind is None else xskind.find("block")
+        self._block = None if xblock is None else CBlock(self, xblock)
         self._stmts: Optional[Dict[int, "CStmt"]] = None
 
     @property
     def stmts(self) -> Dict[int, "CStmt"]:
         if self._stmts is None:
             self._stmts = {}
-            xblock = self.xskind.find("block")
-            if xblock is not None:
-                loopblock = CBlock(self, xblock)
-                for s in loopblock.stmts.values():
+            if self._block is not None:
+                for s in self._block.stmts.values():
                     self._stmts[s.sid] = s
             else:
                 raise UF.CHCError("Loop stmt without nested block")
@@ -368,16 +366,17 @@ class CSwitchStmt(CStmt):
 
     def __init__(self, parent: "CStmt", xnode: ET.Element) -> None:
         CStmt.__init__(self, parent, xnode)
+        xskind = xnode.find("skind")
+        sblock = None if xskind is None else xskind.find("block")
+        self._block = None if sblock is None else CBlock(self, sblock)
         self._stmts: Optional[Dict[int, "CStmt"]] = None
 
     @property
     def stmts(self) -> Dict[int, "CStmt"]:
         if self._stmts is None:
             self._stmts = {}
-            sblock = self.xskind.find("block")
-            if sblock is not None:
-                switchblock = CBlock(self, sblock)
-                for s in switchblock.stmts.values():
+            if self._block is not None:
+                for s in self._block.stmts.values():
                     self._stmts[s.sid] = s
             else:
                 raise UF.CHCError("Switch stmt without nested block")
@@ -419,12 +418,12 @@ class CReturnStmt(CStmt):
 
     def __init__(self, parent: "CStmt", xnode: ET.Element) -> None:
         CStmt.__init__(self, parent, xnode)
+        self._iexp = get_int_o(xnode.find("skind"), "iexp")
 
     @property
     def exp(self) -> Optional["CExp"]:
-        xreturnval = self.xskind.get("iexp")
-        if xreturnval is not None:
-            return self.cdictionary.get_exp(int(xreturnval))
+        if self._iexp is not None:
+            return self.cdictionary.get_exp(self._iexp)
         else:
             return None
 
@@ -437,6 +436,8 @@ class CInstrsStmt(CStmt):
 
     def __init__(self, parent: "CStmt", xnode: ET.Element) -> None:
         CStmt.__init__(self, parent, xnode)
+        xskind = xnode.find("skind")
+        self._xinstrs = None if xskind is None else xskind.find("instrs")
         self._instrs: Optional[List[CInstr]] = None
 
     @property
@@ -447,7 +448,8 @@ class CInstrsStmt(CStmt):
     def instrs(self) -> List[CInstr]:
         if self._instrs is None:
             self._instrs = []
-            xinstrs = self.xskind.find("instrs")
+            xinstrs = self._xinstrs
+            self._xinstrs = None
             if xinstrs is None:
                 raise UF.CHCError("Instr stmt is missing instrs element")
             for xinode in xinstrs.findall("instr"):
@@ -81,6 +81,8 @@ attribute_index = {
 class CTyp(CDictionaryRecord):
     """Base class of all variable types."""
 
+    __slots__ = ()
+
     def __init__(self, cd: "CDictionary", ixval: IT.IndexedTableValue) -> None:
         CDictionaryRecord.__init__(self, cd, ixval)
 
@@ -221,6 +223,8 @@ class CTypVoid(CTyp):
     * args[0]: attributes
     """
 
+    __slots__ = ()
+
     def __init__(self, cd: "CDictionary", ixval: IT.IndexedTableValue) -> None:
         CTyp.__init__(self, cd, ixval)
 
@@ -250,6 +254,8 @@ class CTypInt(CTyp):
     * args[0]: index of attributes in cdictionary
     """
 
+    __slots__ = ()
+
     def __init__(self, cd: "CDictionary", ixval: IT.IndexedTableValue) -> None:
         CTyp.__init__(self, cd, ixval)
 
@@ -291,6 +297,8 @@ class CTypFloat(CTyp):
     * args[0]: attributes
     """
 
+    __slots__ = ()
+
     def __init__(self, cd: "CDictionary", ixval: IT.IndexedTableValue) -> None:
         CTyp.__init__(self, cd, ixval)
 
@@ -328,6 +336,8 @@ class CTypNamed(CTyp):
     * args[0]: attributes
     """
 
+    __slots__ = ()
+
     def __init__(self, cd: "CDictionary", ixval: IT.IndexedTableValue) -> None:
         CTyp.__init__(self, cd, ixval)
 
@@ -373,6 +383,8 @@ class CTypComp(CTyp):
     * args[1]: index of attributes in cdictionary
     """
 
+    __slots__ = ()
+
     def __init__(self, cd: "CDictionary", ixval: IT.IndexedTableValue) -> None:
         CTyp.__init__(self, cd, ixval)
 
@@ -435,6 +447,8 @@ class CTypEnum(CTyp):
     * args[0]: index of attributes in cdictionary
     """
 
+    __slots__ = ()
+
     def __init__(self, cd: "CDictionary", ixval: IT.IndexedTableValue) -> None:
         CTyp.__init__(self, cd, ixval)
 
@@ -473,6 +487,8 @@ class CTypBuiltinVaargs(CTyp):
     * args[0]: index of attributes in cdictionary
     """
 
+    __slots__ = ()
+
     def __init__(self, cd: "CDictionary", ixval: IT.IndexedTableValue) -> None:
         CTyp.__init__(self, cd, ixval)
 
@@ -501,6 +517,8 @@ class CTypPtr(CTyp):
     * args[1]: index of attributes in cdictionary
     """
 
+    __slots__ = ()
+
     def __init__(self, cd: "CDictionary", ixval: IT.IndexedTableValue) -> None:
         CTyp.__init__(self, cd, ixval)
 
@@ -545,6 +563,8 @@ class CTypArray(CTyp):
     * args[2]: index of attributes in cdictionary
     """
 
+    __slots__ = ()
+
     def __init__(self, cd: "CDictionary", ixval: IT.IndexedTableValue) -> None:
         CTyp.__init__(self, cd, ixval)
 
@@ -610,6 +630,8 @@ class CTypFun(CTyp):
     * args[3]: index of attributes in cdictionary
     """
 
+    __slots__ = ()
+
     def __init__(self, cd: "CDictionary", ixval: IT.IndexedTableValue) -> None:
         CTyp.__init__(self, cd, ixval)
 
@@ -688,6 +710,8 @@ class CFunArg(CDictionaryRecord):
     * args[1]: index of attributes in cdictionary
     """
 
+    __slots__ = ()
+
     def __init__(self, cd: "CDictionary", ixval: IT.IndexedTableValue) -> None:
         CDictionaryRecord.__init__(self, cd, ixval)
 
@@ -718,6 +742,8 @@ class CFunArgs(CDictionaryRecord):
     * args[0..]: indices of function arguments in cdictionary
     """
 
+    __slots__ = ()
+
     def __init__(self, cd: "CDictionary", ixval: IT.IndexedTableValue) -> None:
         CDictionaryRecord.__init__(self, cd, ixval)
 
@@ -47,6 +47,8 @@ class CTypeInfo(CDeclarationsRecord):
     - args[1]: index of type of type definition in cdictionary
     """
 
+    __slots__ = ()
+
     def __init__(
             self, cdecls: "CDeclarations", ixval: IT.IndexedTableValue) -> None:
         CDeclarationsRecord.__init__(self, cdecls, ixval)
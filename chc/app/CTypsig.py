@@ -44,6 +44,8 @@ if TYPE_CHECKING:
 
 class CTypsig(CDictionaryRecord):
 
+    __slots__ = ("_cfile",)
+
     def __init__(self, cd: "CDictionary", ixval: IT.IndexedTableValue) -> None:
         CDictionaryRecord.__init__(self, cd, ixval)
         self._cd = cd
@@ -66,6 +68,9 @@ class CTypsigArray(CTypsig):
     - args[0]: index of type signature of array base in cdictionary
     - args[1]: index of attributes in cdictionary
     """
+
+    __slots__ = ()
+
     def __init__(self, cd: "CDictionary", ixval: IT.IndexedTableValue) -> None:
         CTypsig.__init__(self, cd, ixval)
 
@@ -91,6 +96,9 @@ class CTypsigPtr(CTypsig):
 
     - args[0]: index of target type signature in cdictionary
     """
+
+    __slots__ = ()
+
     def __init__(self, cd: "CDictionary", ixval: IT.IndexedTableValue) -> None:
         CTypsig.__init__(self, cd, ixval)
 
@@ -108,6 +116,9 @@ class CTypsigComp(CTypsig):
 
     - tags[1]: name of struct
     """
+
+    __slots__ = ()
+
     def __init__(self, cd: "CDictionary", ixval: IT.IndexedTableValue) -> None:
         CTypsig.__init__(self, cd, ixval)
 
@@ -126,6 +137,9 @@ class CTypsigFun(CTypsig):
     - args[0]: index of return value type signature in cdictionary
     - args[1]: index of list of argument type signatures in cdictionary
     """
+
+    __slots__ = ()
+
     def __init__(self, cd: "CDictionary", ixval: IT.IndexedTableValue) -> None:
         CTypsig.__init__(self, cd, ixval)
 
@@ -152,6 +166,9 @@ class CTypsigEnum(CTypsig):
 
     - tags[1]: enum name
     """
+
+    __slots__ = ()
+
     def __init__(self, cd: "CDictionary", ixval: IT.IndexedTableValue) -> None:
         CTypsig.__init__(self, cd, ixval)
 
@@ -169,6 +186,9 @@ class CTypsigBase(CTypsig):
 
     - args[1]: index of type of base type signature in cdictionary.
     """
+
+    __slots__ = ()
+
     def __init__(self, cd: "CDictionary", ixval: IT.IndexedTableValue) -> None:
         CTypsig.__init__(self, cd, ixval)
 
@@ -182,6 +202,8 @@ class CTypsigBase(CTypsig):
 
 class CTypsigList(IT.IndexedTableValue):
 
+    __slots__ = ("cd", "cfile")
+
     def __init__(self, cd: "CDictionary", ixval: IT.IndexedTableValue) -> None:
         self.cd = cd
         self.cfile = self.cd.cfile
@@ -62,6 +62,8 @@ class CVarInfo(CDeclarationsRecord):
 
     """
 
+    __slots__ = ()
+
     def __init__(
             self, cdecls: "CDeclarations", ixval: IT.IndexedTableValue
     ) -> None:
@@ -39,6 +39,7 @@ from typing import List, Optional, Tuple, TYPE_CHECKING
 from chc.util.Config import Config
 import chc.util.fileutil as UF
 from chc.util.loggingutil import chklogger
+from chc.util.tracingutil import chktracer
 
 
 if TYPE_CHECKING:
@@ -259,6 +260,7 @@ class AnalysisManager:
             print(args)
             exit(1)
 
+    @chktracer.traced("create-primary-proofobligations")
     def create_app_primary_proofobligations(
             self,
             po_cmd: str = "undefined-behavior-primary",
@@ -365,23 +367,90 @@ class AnalysisManager:
     def generate_and_check_app(self, domains: str, iteration: int, processes: int = 1) -> None:
         """Generate invariants and check proof obligations for application."""
 
-        if processes > 1:
+        with chktracer.span(
+                "generate-and-check", iteration=iteration, domains=domains):
+            if processes > 1:
 
-            def f(cfile: "CFile") -> None:
-                cmd = self._generate_and_check_file_cmd_partial(
-                    cfile.cfilepath, domains, iteration)
-                cmd.append(cfile.cfilename)
-                self._execute_cmd(cmd)
+                def f(cfile: "CFile") -> None:
+                    cmd = self._generate_and_check_file_cmd_partial(
+                        cfile.cfilepath, domains, iteration)
+                    cmd.append(cfile.cfilename)
+                    self._execute_cmd(cmd)
 
-            self.capp.iter_files_parallel(f, processes)
-        else:
+                self.capp.iter_files_parallel(f, processes)
+            else:
 
-            def f(cfile: "CFile") -> None:
-                self.generate_and_check_file(
-                    cfile.cfilename, cfile.cfilepath, domains, iteration)
+                def f(cfile: "CFile") -> None:
+                    self.generate_and_check_file(
+                        cfile.cfilename, cfile.cfilepath, domains, iteration)
+
+                self.capp.iter_files(f)
+            self.capp.iter_files(self.reset_tables)
+
+    def generate_and_check_app_bottomup(
+            self, domains: str, iteration: int, processes: int = 1) -> None:
+        """Generate invariants and check proof obligations for application,
+        scheduling files bottom-up in the file callgraph.
+
+        Files are analyzed level by level over the strongly connected
+        components of the file callgraph, callees first. Before the files of
+        a level are checked, the postconditions of their callees are added
+        as assumptions at their call sites (collect_post_assumes and
+        distribute_post_guarantees) and the supporting proof obligations of
+        their call sites are updated with the api assumptions just produced
+        for their callees, so that within a single round callers are checked
+        against the current callee guarantees and apis rather than those of
+        the previous round.
+        Files within a level are independent and are analyzed in parallel
+        if processes > 1.
+        """
 
-            self.capp.iter_files(f)
-        self.capp.iter_files(self.reset_tables)
+        try:
+            schedule = self.capp.bottomup_file_schedule()
+        except UF.CHCError as e:
+            chklogger.logger.warning(
+                "Unable to construct file callgraph (%s); "
+                + "reverting to unordered schedule", str(e))
+            self.generate_and_check_app(domains, iteration, processes=processes)
+            return
+
+        chklogger.logger.info(
+            "Bottom-up schedule with %d levels for %d files",
+            len(schedule), len(list(self.capp.cfiles)))
+
+        for (levelnr, level) in enumerate(schedule):
+            with chktracer.span(
+                    "bottom-up-level", level=levelnr, iteration=iteration):
+                cfiles = [
+                    self.capp.get_file_by_index(fid) for scc in level for fid in scc]
+                chklogger.logger.info(
+                    "Bottom-up level %d: %s",
+                    levelnr, ", ".join(cfile.name for cfile in cfiles))
+
+                if levelnr > 0:
+                    for cfile in cfiles:
+                        cfile.collect_post_assumes()
+                        self.capp.distribute_file_post_guarantees(cfile)
+                        self.capp.update_file_spos(cfile)
+
+                if processes > 1 and len(cfiles) > 1:
+
+                    def f(cfile: "CFile") -> None:
+                        cmd = self._generate_and_check_file_cmd_partial(
+                            cfile.cfilepath, domains, iteration)
+                        cmd.append(cfile.cfilename)
+                        self._execute_cmd(cmd)
+
+                    self.capp.iter_files_parallel(f, processes, cfiles=cfiles)
+                else:
+                    for cfile in cfiles:
+                        with chktracer.span(cfile.name, cat="file"):
+                            self.generate_and_check_file(
+                                cfile.cfilename, cfile.cfilepath, domains,
+                                iteration)
+
+                for cfile in cfiles:
+                    self.reset_tables(cfile)
 
 
 if __name__ == "__main__":
@@ -648,7 +648,7 @@ def cfile_report_file(args: argparse.Namespace) -> NoReturn:
 
     if cfunctions is None:
         if cshowcode:
-            print(RP.file_code_tostring(
+            RP.write_lines(RP.file_code_lines(
                 cfile, pofilter=pofilter, showinvs=cshowinvariants))
 
         print(RP.file_proofobligation_stats_tostring(cfile))
@@ -670,7 +670,7 @@ def cfile_report_file(args: argparse.Namespace) -> NoReturn:
     for fnname in cfunctions:
         if cfile.has_function_by_name(fnname):
             cfun = cfile.get_function_by_name(fnname)
-            print(RP.function_code_tostring(cfun, pofilter=pofilter))
+            RP.write_lines(RP.function_code_lines(cfun, pofilter=pofilter))
 
     print(RP.file_proofobligation_stats_tostring(cfile))
     exit(0)
@@ -842,7 +842,7 @@ def cfile_run_file(args: argparse.Namespace) -> NoReturn:
             return True
 
     if cshowcode:
-        print(RP.file_code_tostring(
+        RP.write_lines(RP.file_code_lines(
             cfile, pofilter=pofilter, showinvs=cshowinvariants))
 
     print(RP.file_proofobligation_stats_tostring(cfile))
@@ -1096,7 +1096,7 @@ def cfile_testlibc_summary(args: argparse.Namespace) -> NoReturn:
             return True
 
     if cshowcode:
-        print(RP.file_code_tostring(cfile, pofilter=pofilter))
+        RP.write_lines(RP.file_code_lines(cfile, pofilter=pofilter))
 
     print(RP.file_proofobligation_stats_tostring(cfile))
 
@@ -0,0 +1,408 @@
+# ------------------------------------------------------------------------------
+# CodeHawk C Analyzer
+# Author: Henny Sipma
+# ------------------------------------------------------------------------------
+# The MIT License (MIT)
+#
+# Copyright (c) 2026 Aarno Labs LLC
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# ------------------------------------------------------------------------------
+"""Long-lived server that answers c-project commands for one project.
+
+The server loads the CApplication of a project once and answers command
+lines of the chkc c-project commands listed in servable_commands, sent as
+json requests over a Unix-domain socket. A request is a single json object
+terminated by the end of the connection:
+
+  {"argv": [<chkc arguments>], "cwd": <working directory of the client>}
+
+The response is a sequence of json objects, one per line. While the command
+runs, its standard output and standard error are sent as they are written,
+a line at a time:
+
+  {"stream": "stdout", "text": "..."}
+
+The last object holds the exit code of the command, or an error message:
+
+  {"status": "ok", "exitcode": 0}
+  {"status": "error", "msg": "..."}
+
+Commands are executed one at a time in the server process, with the warm
+application registered in served_applications, from which the command
+obtains it through get_capplication.
+
+Before each request the server checks the analysis artifacts on disk: if
+any of the global xml files changed the application is constructed again;
+if the artifacts of a loaded file changed, that file is reloaded. The number
+of loaded files is bounded: when it exceeds the maximum, the files that were
+loaded first are reloaded (that is, released) first.
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import socket
+import sys
+
+from typing import (
+    Any, Callable, Dict, List, NoReturn, Optional, Tuple)
+
+from chc.app.CApplication import CApplication
+
+import chc.util.fileutil as UF
+import chc.util.IndexedTable as IT
+from chc.util.loggingutil import chklogger
+from chc.util.tracingutil import chktracer
+
+
+# names of the command functions in cprojectutil that can be served
+servable_commands: List[str] = [
+    "cproject_report",
+    "cproject_report_file",
+    "cproject_investigate",
+    "cproject_query_invariants",
+    "cproject_query_variable",
+    "cproject_query_pos",
+    "cproject_make_callgraph"]
+
+
+# (targetpath, projectname) -> application kept warm by the server
+served_applications: Dict[Tuple[str, str], CApplication] = {}
+
+
+def get_capplication(
+        projectpath: str,
+        projectname: str,
+        targetpath: str,
+        contractpath: str) -> CApplication:
+    """Returns the served application, or a new application."""
+
+    key = (targetpath, projectname)
+    if key in served_applications:
+        return served_applications[key]
+    return CApplication(projectpath, projectname, targetpath, contractpath)
+
+
+def get_socketname(args: argparse.Namespace) -> str:
+    socketname: Optional[str] = args.socket
+    if socketname is not None:
+        return os.path.abspath(socketname)
+    return UF.get_server_socket_filename(
+        os.path.abspath(args.tgtpath), args.projectname)
+
+
+def send_request(
+        socketname: str,
+        request: Dict[str, Any],
+        output: Optional[Callable[[str, str], None]] = None) -> Dict[str, Any]:
+    """Sends a request and returns the final response of the server.
+
+    Output sent by the server before the final response is passed to output
+    (stream name, text) as it arrives.
+    """
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as s:
+        s.connect(socketname)
+        s.sendall(json.dumps(request).encode("utf-8"))
+        s.shutdown(socket.SHUT_WR)
+        with s.makefile("rb") as f:
+            for line in f:
+                message = json.loads(line.decode("utf-8"))
+                if "status" in message:
+                    return message
+                if output is not None:
+                    output(message["stream"], message["text"])
+    return {"status": "error", "msg": "connection closed by server"}
+
+
+def send_message(conn: socket.socket, message: Dict[str, Any]) -> None:
+    conn.sendall((json.dumps(message) + "\n").encode("utf-8"))
+
+
+def _receive_all(s: socket.socket) -> bytes:
+    chunks: List[bytes] = []
+    while True:
+        chunk = s.recv(65536)
+        if not chunk:
+            break
+        chunks.append(chunk)
+    return b"".join(chunks)
+
+
+def _write_output(stream: str, text: str) -> None:
+    f = sys.stderr if stream == "stderr" else sys.stdout
+    f.write(text)
+    f.flush()
+
+
+def forward_to_server(args: argparse.Namespace) -> NoReturn:
+    """Sends the command line to the server and replays its output."""
+
+    socketname = get_socketname(args)
+    request = {"argv": sys.argv[1:], "cwd": os.getcwd()}
+    try:
+        response = send_request(socketname, request, output=_write_output)
+    except OSError as e:
+        sys.stderr.write(
+            "Unable to connect to chkc server at " + socketname + ": "
+            + str(e) + "\n")
+        exit(1)
+    if response["status"] != "ok":
+        sys.stderr.write("Server error: " + response["msg"] + "\n")
+        exit(1)
+    exit(response["exitcode"])
+
+
+class StreamWriter(io.TextIOBase):
+    """Text stream that sends what is written to a client, a line at a time."""
+
+    def __init__(self, conn: socket.socket, stream: str) -> None:
+        self._conn = conn
+        self._stream = stream
+        self._pending: List[str] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, text: str) -> int:
+        self._pending.append(text)
+        if "\n" in text:
+            self.flush()
+        return len(text)
+
+    def flush(self) -> None:
+        if len(self._pending) > 0:
+            text = "".join(self._pending)
+            self._pending = []
+            send_message(self._conn, {"stream": self._stream, "text": text})
+
+
+def _files_signature(path: str, recursive: bool) -> Tuple[int, int]:
+    """Returns the number and latest modification time of the xml files."""
+
+    count = 0
+    latest = 0
+    if not os.path.isdir(path):
+        return (count, latest)
+    for entry in os.scandir(path):
+        if entry.is_dir():
+            if recursive:
+                (c, t) = _files_signature(entry.path, recursive)
+                count += c
+                latest = max(latest, t)
+        elif entry.name.endswith(".xml"):
+            count += 1
+            latest = max(latest, entry.stat().st_mtime_ns)
+    return (count, latest)
+
+
+class ProjectServer:
+    """Answers chkc c-project commands with a warm CApplication."""
+
+    def __init__(
+            self,
+            targetpath: str,
+            projectname: str,
+            contractpath: str,
+            socketname: str,
+            parse: Callable[[List[str]], argparse.Namespace],
+            maxfiles: int = 100) -> None:
+        self._targetpath = targetpath
+        self._projectname = projectname
+        self._contractpath = contractpath
+        self._socketname = socketname
+        self._parse = parse
+        self._maxfiles = maxfiles
+        self._capp: Optional[CApplication] = None
+        self._globalsignature: Tuple[int, int] = (0, 0)
+        # file index -> signature when loaded, in the order of loading
+        self._loaded: Dict[int, Tuple[int, int]] = {}
+        self._stopped = False
+
+    @property
+    def targetpath(self) -> str:
+        return self._targetpath
+
+    @property
+    def projectname(self) -> str:
+        return self._projectname
+
+    @property
+    def socketname(self) -> str:
+        return self._socketname
+
+    @property
+    def capp(self) -> CApplication:
+        if self._capp is None:
+            self._capp = CApplication(
+                self.targetpath,
+                self.projectname,
+                self.targetpath,
+                self.contractpath)
+            served_applications[(self.targetpath, self.projectname)] = self._capp
+            self._loaded = {}
+            chklogger.logger.info(
+                "Server loaded application %s", self.projectname)
+        return self._capp
+
+    @property
+    def contractpath(self) -> str:
+        return self._contractpath
+
+    def global_signature(self) -> Tuple[int, int]:
+        return _files_signature(
+            UF.get_analysisresults_path(self.targetpath, self.projectname),
+            False)
+
+    def file_signature(self, index: int) -> Tuple[int, int]:
+        cfile = self.capp.get_file_by_index(index)
+        return _files_signature(
+            UF.get_cfile_filepath(
+                self.targetpath,
+                self.projectname,
+                cfile.cfilepath,
+                cfile.cfilename),
+            True)
+
+    def refresh(self) -> None:
+        """Reloads the application or the files that changed on disk."""
+
+        signature = self.global_signature()
+        if signature != self._globalsignature:
+            if self._capp is not None:
+                chklogger.logger.info("Server: global artifacts changed")
+            self._capp = None
+            self._globalsignature = signature
+        for index in list(self._loaded):
+            if self.file_signature(index) != self._loaded[index]:
+                chklogger.logger.info("Server: file %d changed", index)
+                self.capp.reload_file(index)
+                self._loaded.pop(index)
+
+    def record_loaded_files(self) -> None:
+        """Records the files loaded by a request and enforces the bound."""
+
+        for (index, cfile) in self.capp.files.items():
+            if cfile.is_loaded and index not in self._loaded:
+                self._loaded[index] = self.file_signature(index)
+        while len(self._loaded) > self._maxfiles:
+            index = next(iter(self._loaded))
+            self.capp.reload_file(index)
+            self._loaded.pop(index)
+
+    def handle(
+            self, request: Dict[str, Any], conn: socket.socket) -> Dict[str, Any]:
+        """Runs the requested command, streaming its output to conn.
+
+        Returns the final response, to be sent after the output.
+        """
+
+        if request.get("stop", False):
+            self._stopped = True
+            return {"status": "ok", "exitcode": 0}
+
+        argv: List[str] = request["argv"]
+        cwd = os.getcwd()
+        stdout = StreamWriter(conn, "stdout")
+        stderr = StreamWriter(conn, "stderr")
+        exitcode = 0
+        try:
+            os.chdir(request.get("cwd", cwd))
+            args = self._parse(argv)
+            funcname = getattr(args.func, "__name__", "")
+            if funcname not in servable_commands:
+                return {
+                    "status": "error",
+                    "msg": "command cannot be served: " + " ".join(argv)}
+            if (os.path.abspath(args.tgtpath) != self.targetpath
+                    or args.projectname != self.projectname):
+                return {
+                    "status": "error",
+                    "msg": ("server is serving "
+                            + self.projectname + " in " + self.targetpath)}
+            args.server = False
+            self.load()
+            with contextlib.redirect_stdout(stdout):
+                with contextlib.redirect_stderr(stderr):
+                    try:
+                        args.func(args)
+                    except SystemExit as e:
+                        exitcode = e.code if isinstance(e.code, int) else 1
+                    finally:
+                        stdout.flush()
+                        stderr.flush()
+            self.record_loaded_files()
+        except SystemExit as e:
+            # argument parsing errors
+            return {"status": "error", "msg": "invalid command: " + str(e)}
+        except ConnectionError:
+            # the client went away; nothing more can be sent
+            raise
+        except Exception as e:
+            chklogger.logger.error("Server request failed: %s", str(e))
+            return {"status": "error", "msg": str(e)}
+        finally:
+            # a trace requested with --trace covers only this request
+            chktracer.stop()
+            os.chdir(cwd)
+            IT.stringpool.clear()
+        return {"status": "ok", "exitcode": exitcode}
+
+    def _answer(self, conn: socket.socket) -> None:
+        data = _receive_all(conn)
+        try:
+            request = json.loads(data.decode("utf-8"))
+            response = self.handle(request, conn)
+        except ValueError as e:
+            response = {"status": "error", "msg": "invalid request: " + str(e)}
+        send_message(conn, response)
+
+    def load(self) -> None:
+        """Checks the artifacts and constructs the application if needed."""
+
+        self.refresh()
+        # reading the files constructs the CFile objects of the application
+        # (not their contents), so that a request only loads file contents
+        nfiles = len(self.capp.files)
+        chklogger.logger.debug(
+            "Server: %d files in %s", nfiles, self.projectname)
+
+    def serve(self) -> None:
+        if os.path.exists(self.socketname):
+            os.remove(self.socketname)
+        self.load()
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as s:
+            s.bind(self.socketname)
+            s.listen()
+            chklogger.logger.info("Server listening on %s", self.socketname)
+            try:
+                while not self._stopped:
+                    (conn, _) = s.accept()
+                    with conn:
+                        try:
+                            self._answer(conn)
+                        except OSError as e:
+                            chklogger.logger.warning(
+                                "Server connection failed: %s", str(e))
+            finally:
+                if os.path.exists(self.socketname):
+                    os.remove(self.socketname)
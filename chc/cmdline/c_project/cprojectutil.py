@@ -31,14 +31,16 @@ import codecs
 import json
 import os
 import shutil
+import sqlite3
 import subprocess
 import sys
 import time
 
-from contextlib import contextmanager
+from contextlib import contextmanager, nullcontext
 
 from typing import (
-    Any, cast, Dict, Generator, List, Optional, NoReturn, Tuple, TYPE_CHECKING)
+    Any, Callable, cast, ContextManager, Dict, Generator, Iterator, List,
+    Optional, NoReturn, Tuple, TYPE_CHECKING)
 
 from chc.app.CApplication import CApplication
 from chc.app.CPrettyPrinter import CPrettyPrinter
@@ -47,13 +49,22 @@ from chc.cmdline.AnalysisManager import AnalysisManager
 from chc.cmdline.ParseManager import ParseManager
 import chc.cmdline.jsonresultutil as JU
 
+from chc.invariants.InvariantIndex import InvariantIndex, invariantkinds
+
 from chc.linker.CLinker import CLinker
 
+import chc.cmdline.c_project.cprojectserver as PS
+import chc.reporting.ParallelReports as PR
 import chc.reporting.ProofObligations as RP
+from chc.reporting.FunctionResultDigests import FunctionResultDigests
+import chc.reporting.PODatabase as PODB
+from chc.reporting.MemoryStats import MemoryStats
+from chc.reporting.POStatusIndex import POStatusIndex
 
 from chc.util.Config import Config
 import chc.util.fileutil as UF
 from chc.util.loggingutil import chklogger, LogLevel
+from chc.util.tracingutil import chktracer
 
 if TYPE_CHECKING:
     from chc.app.CAttributes import CAttributes
@@ -95,7 +106,8 @@ def set_logging(
 @contextmanager
 def timing(activity: str) -> Generator:
     t0 = time.time()
-    yield
+    with chktracer.span(activity):
+        yield
     print(
         "\n"
         + ("=" * 80)
@@ -490,10 +502,14 @@ def cproject_analyze_project(args: argparse.Namespace) -> NoReturn:
     analysisdomains: str = args.analysis_domains
     collectdiagnostics: bool = args.collect_diagnostics
     maxprocesses: int = args.maxprocesses
+    bottomup: bool = args.bottom_up
     verbose: bool = args.verbose
     loglevel: str = args.loglevel
     logfilename: Optional[str] = args.logfilename
     logfilemode: str = args.logfilemode
+    tracefilename: Optional[str] = args.trace
+    memstatsfilename: Optional[str] = args.memstats
+    maxloadedfiles: Optional[int] = args.max_loaded_files
     excludefiles: List[str] = args.exclude
 
     if excludefiles is None:
@@ -516,6 +532,17 @@ def cproject_analyze_project(args: argparse.Namespace) -> NoReturn:
         mode=logfilemode,
         msg="c-project analyze invoked")
 
+    if tracefilename is not None:
+        chktracer.start(os.path.abspath(tracefilename))
+
+    memstats: Optional[MemoryStats] = None
+    if memstatsfilename is not None:
+        memstats = MemoryStats(os.path.abspath(memstatsfilename))
+
+    def record_memory(phase: str) -> None:
+        if memstats is not None:
+            memstats.record(phase, capp)
+
     try:
         UF.check_cch_semantics(projectpath, projectname, deletesemantics=True)
     except UF.CHError as e:
@@ -539,6 +566,7 @@ def cproject_analyze_project(args: argparse.Namespace) -> NoReturn:
     linker.link_varinfos()
     capp.iter_files(save_xrefs)
     linker.save_global_compinfos()
+    record_memory("link")
 
     capp = CApplication(
         projectpath,
@@ -554,6 +582,11 @@ def cproject_analyze_project(args: argparse.Namespace) -> NoReturn:
         collectdiagnostics=collectdiagnostics,
         keep_system_includes=keep_system_includes)
 
+    def bounded() -> ContextManager[Any]:
+        if maxloadedfiles is None:
+            return nullcontext()
+        return capp.bounded_working_set(maxloadedfiles)
+
     exitcode = 0
 
     def check_continuation() -> int:
@@ -562,6 +595,14 @@ def cproject_analyze_project(args: argparse.Namespace) -> NoReturn:
                 return 166
         return 0
 
+    def generate_and_check(iteration: int) -> None:
+        if bottomup:
+            am.generate_and_check_app_bottomup(
+                analysisdomains, iteration, processes=maxprocesses)
+        else:
+            am.generate_and_check_app(
+                analysisdomains, iteration, processes=maxprocesses)
+
     with timing("analysis"):
 
         try:
@@ -572,27 +613,49 @@ def cproject_analyze_project(args: argparse.Namespace) -> NoReturn:
         except UF.CHError as e:
             print(str(e.wrap()))
             exit(1)
+        record_memory("primary-proofobligations")
 
         exitcode = check_continuation()
 
         if exitcode == 0:
             for i in range(1):
-                am.generate_and_check_app(analysisdomains, 0, processes=maxprocesses)
+                generate_and_check(0)
                 capp.reinitialize_tables()
-                capp.update_spos()
+                with bounded():
+                    capp.update_spos()
+                record_memory("iteration 0")
 
             exitcode = check_continuation()
 
         if exitcode == 0:
+            # in bottom-up mode callee guarantees reach callers within a
+            # round, so rounds stop once the proof obligation status no
+            # longer changes
+            with bounded():
+                postatus = capp.get_po_status_counts() if bottomup else None
             for i in range(5):
-                capp.update_spos()
-                am.generate_and_check_app(analysisdomains, i + 1, processes=maxprocesses)
+                with bounded():
+                    capp.update_spos()
+                generate_and_check(i + 1)
                 capp.reinitialize_tables()
+                record_memory("iteration " + str(i + 1))
 
                 exitcode = check_continuation()
                 if exitcode > 0:
                     break
 
+                if postatus is not None:
+                    with bounded():
+                        newpostatus = capp.get_po_status_counts()
+                    if newpostatus == postatus:
+                        chklogger.logger.info(
+                            "Proof obligation status unchanged after "
+                            + "iteration %d; stopping", i + 1)
+                        print_status_update(
+                            "Converged after iteration " + str(i + 1))
+                        break
+                    postatus = newpostatus
+
     if analysis == "outputparameters":
         presult = capp.outputparameters()
         vresult = capp.viable_outputparameters()
@@ -616,11 +679,22 @@ def cproject_analyze_project(args: argparse.Namespace) -> NoReturn:
 
     timestamp = os.stat(UF.get_cchpath(targetpath, projectname)).st_ctime
 
-    result = RP.project_proofobligation_stats_to_dict(capp)
+    digests = FunctionResultDigests.load(targetpath, projectname)
+    with bounded():
+        with chktracer.span("po-status-index"):
+            poindex = POStatusIndex.from_application(capp, digests=digests)
+            digests.save()
+            poindex.save(targetpath, projectname)
+        with chktracer.span("report-statistics"):
+            result = RP.project_proofobligation_stats_to_dict(
+                capp, poindex=poindex)
+    record_memory("report")
     result["timestamp"] = timestamp
     result["project"] = projectpath
     UF.save_project_summary_results(targetpath, projectname, result)
     UF.save_project_summary_results_as_xml(targetpath, projectname, result)
+    if memstats is not None:
+        memstats.stop()
 
     print_status_update("exitcode: " + str(exitcode))
     exit(exitcode)
@@ -629,6 +703,9 @@ def cproject_analyze_project(args: argparse.Namespace) -> NoReturn:
 def cproject_report(args: argparse.Namespace) -> NoReturn:
     """CLI command to output statistics on proof obligations for the project."""
 
+    if args.server:
+        PS.forward_to_server(args)
+
     # arguments
     tgtpath: str = args.tgtpath
     projectname: str = args.projectname
@@ -637,6 +714,9 @@ def cproject_report(args: argparse.Namespace) -> NoReturn:
     loglevel: str = args.loglevel
     logfilename: Optional[str] = args.logfilename
     logfilemode: str = args.logfilemode
+    maxloadedfiles: Optional[int] = args.max_loaded_files
+    tracefilename: Optional[str] = args.trace
+    memstatsfilename: Optional[str] = args.memstats
 
     targetpath = os.path.abspath(tgtpath)
     projectpath = targetpath
@@ -648,8 +728,16 @@ def cproject_report(args: argparse.Namespace) -> NoReturn:
         mode=logfilemode,
         msg="c-project report invoked")
 
+    if tracefilename is not None:
+        chktracer.start(os.path.abspath(tracefilename))
+
     if canalysis == "undefined-behavior":
-        statsresult = UF.read_project_summary_results(targetpath, projectname)
+        # with a bound on the loaded files or with memory accounting the
+        # statistics are computed again, rather than read from the summary
+        # saved by analyze
+        statsresult = (
+            UF.read_project_summary_results(targetpath, projectname)
+            if maxloadedfiles is None and memstatsfilename is None else None)
         if statsresult is not None:
             print(RP.project_proofobligation_stats_dict_to_string(statsresult))
             exit(0)
@@ -660,11 +748,39 @@ def cproject_report(args: argparse.Namespace) -> NoReturn:
             exit(1)
 
         contractpath = os.path.join(targetpath, "chc_contracts")
-        capp = CApplication(
+        capp = PS.get_capplication(
             projectpath, projectname, targetpath, contractpath)
 
+        memstats: Optional[MemoryStats] = None
+        if memstatsfilename is not None:
+            memstats = MemoryStats(os.path.abspath(memstatsfilename))
+
         timestamp = os.stat(UF.get_cchpath(targetpath, projectname)).st_ctime
-        fresult = RP.project_proofobligation_stats_to_dict(capp)
+        try:
+            with (nullcontext() if maxloadedfiles is None
+                  else capp.bounded_working_set(maxloadedfiles)):
+                with chktracer.span("po-status-index"):
+                    optpoindex = POStatusIndex.load_current(
+                        targetpath, projectname)
+                    if optpoindex is None:
+                        digests = FunctionResultDigests.load(
+                            targetpath, projectname)
+                        poindex = POStatusIndex.from_application(
+                            capp, digests=digests)
+                        digests.save()
+                        poindex.save(targetpath, projectname)
+                    else:
+                        poindex = optpoindex
+                if memstats is not None:
+                    memstats.record("po-status-index", capp)
+                with chktracer.span("report-statistics"):
+                    fresult = RP.project_proofobligation_stats_to_dict(
+                        capp, poindex=poindex)
+                if memstats is not None:
+                    memstats.record("report-statistics", capp)
+        finally:
+            if memstats is not None:
+                memstats.stop()
         fresult["timestamp"] = timestamp
         fresult["project"] = projectpath
         UF.save_project_summary_results(targetpath, projectname, fresult)
@@ -672,7 +788,7 @@ def cproject_report(args: argparse.Namespace) -> NoReturn:
         exit(0)
 
     contractpath = os.path.join(targetpath, "chc_contracts")
-    capp = CApplication(
+    capp = PS.get_capplication(
         projectpath, projectname, targetpath, contractpath)
 
     statsresult = UF.read_project_summary_results(targetpath, projectname)
@@ -705,6 +821,9 @@ def cproject_report(args: argparse.Namespace) -> NoReturn:
 def cproject_report_file(args: argparse.Namespace) -> NoReturn:
     """CLI command to output the results for a single file in a c project."""
 
+    if args.server:
+        PS.forward_to_server(args)
+
     # arguments
     tgtpath: str = args.tgtpath
     projectname: str = args.projectname
@@ -713,6 +832,7 @@ def cproject_report_file(args: argparse.Namespace) -> NoReturn:
     showcode: bool = args.showcode
     showopen: bool = args.open
     showinvariants: bool = args.showinvariants
+    maxprocesses: int = args.maxprocesses
 
     targetpath = os.path.abspath(tgtpath)
     projectpath = targetpath
@@ -726,7 +846,7 @@ def cproject_report_file(args: argparse.Namespace) -> NoReturn:
         exit(1)
 
     contractpath = os.path.join(targetpath, "chc_contracts")
-    capp = CApplication(
+    capp = PS.get_capplication(
         projectpath, projectname, targetpath, contractpath)
 
     if capp.has_file(filename[:-2]):
@@ -742,8 +862,16 @@ def cproject_report_file(args: argparse.Namespace) -> NoReturn:
             return True
 
     if showcode:
-        print(RP.file_code_tostring(
-            cfile, pofilter=pofilter, showinvs=showinvariants))
+        if maxprocesses > 1:
+            PR.file_code_report(
+                capp,
+                cfile,
+                maxprocesses,
+                showopen=showopen,
+                showinvariants=showinvariants)
+        else:
+            RP.write_lines(RP.file_code_lines(
+                cfile, pofilter=pofilter, showinvs=showinvariants))
 
     print(RP.file_proofobligation_stats_tostring(cfile))
 
@@ -764,10 +892,14 @@ def cproject_report_file(args: argparse.Namespace) -> NoReturn:
 
 def cproject_investigate(args: argparse.Namespace) -> NoReturn:
 
+    if args.server:
+        PS.forward_to_server(args)
+
     # arguments
     tgtpath: str = args.tgtpath
     projectname: str = args.projectname
     predicates: Optional[List[str]] = args.predicates
+    maxprocesses: int = args.maxprocesses
 
     targetpath = os.path.abspath(tgtpath)
     projectpath = targetpath
@@ -778,50 +910,29 @@ def cproject_investigate(args: argparse.Namespace) -> NoReturn:
             f"No analysis results found for {projectname} in {targetpath}")
         exit(1)
 
-    capp = CApplication(
+    capp = PS.get_capplication(
         projectpath, projectname, targetpath, contractpath)
 
-    def pofilter(po: "CFunctionPO") -> bool:
-        if predicates is not None:
-            return po.predicate_name in predicates
-        else:
-            return True
-
-    def header(s: str) -> str:
-        return (s + ":\n" + ("=" * 80))
-
-    lines: List[str] = []
-
-    for cfile in capp.cfiles:
-        openppos = cfile.get_open_ppos()
-        violations = cfile.get_ppos_violated()
-        delegated = cfile.get_ppos_delegated()
-
-        if len(openppos) + len(violations) + len(delegated) > 0:
-            lines.append("=" * 80)
-            lines.append(cfile.name)
-            lines.append("=" * 80)
-
-        if len(openppos) > 0:
-            lines.append(header("Open primary proof obligations obligations"))
-            lines.append(RP.tag_file_function_pos_tostring(openppos, pofilter=pofilter))
+    if maxprocesses > 1:
+        PR.investigate_report(capp, maxprocesses, predicates=predicates)
+        exit(0)
 
-        if len(violations) > 0:
-            lines.append(header("Primary proof obligations violated"))
-            lines.append(RP.tag_file_function_pos_tostring(
-                violations, pofilter=pofilter))
+    pofilter = PR.predicates_pofilter(predicates)
 
-        if len(delegated) > 0:
-            lines.append(header("Primary proof obligations delegated"))
-            lines.append(RP.tag_file_function_pos_tostring(delegated, pofilter=pofilter))
+    def investigate_lines() -> Iterator[str]:
+        for cfile in capp.cfiles:
+            yield from PR.investigate_file_lines(cfile, pofilter)
 
-    print("\n".join(lines))
+    RP.write_lines(investigate_lines())
 
     exit(0)
 
 
 def cproject_query_invariants(args: argparse.Namespace) -> NoReturn:
 
+    if args.server:
+        PS.forward_to_server(args)
+
     # arguments
     tgtpath: str = args.tgtpath
     projectname: str = args.projectname
@@ -841,7 +952,7 @@ def cproject_query_invariants(args: argparse.Namespace) -> NoReturn:
         exit(1)
 
     contractpath = os.path.join(targetpath, "chc_contracts")
-    capp = CApplication(
+    capp = PS.get_capplication(
         projectpath, projectname, targetpath, contractpath)
 
     if capp.has_file(filename[:-2]):
@@ -878,6 +989,182 @@ def cproject_query_invariants(args: argparse.Namespace) -> NoReturn:
     exit(0)
 
 
+def cproject_index_invariants(args: argparse.Namespace) -> NoReturn:
+    """CLI command to build the project-wide invariant index."""
+
+    # arguments
+    tgtpath: str = args.tgtpath
+    projectname: str = args.projectname
+
+    targetpath = os.path.abspath(tgtpath)
+    projectpath = targetpath
+
+    if not UF.has_analysisresults_path(targetpath, projectname):
+        print_error(
+            f"No analysis results found for {projectname} in {targetpath}")
+        exit(1)
+
+    contractpath = os.path.join(targetpath, "chc_contracts")
+    capp = CApplication(
+        projectpath, projectname, targetpath, contractpath)
+
+    t0 = time.time()
+    invindex = InvariantIndex.from_application(capp)
+    invindex.save(targetpath, projectname)
+    print(
+        "Indexed invariants of "
+        + str(len(invindex.variablenames))
+        + " variable names in "
+        + str(round(time.time() - t0, 2))
+        + "s")
+    exit(0)
+
+
+def cproject_query_variable(args: argparse.Namespace) -> NoReturn:
+    """CLI command to find the locations of invariants on a variable."""
+
+    if args.server:
+        PS.forward_to_server(args)
+
+    # arguments
+    tgtpath: str = args.tgtpath
+    projectname: str = args.projectname
+    variablename: str = args.variable
+    xkinds: Optional[List[str]] = args.kinds
+    xwithin: Optional[List[int]] = args.within
+    xmaybenull: bool = args.maybe_null
+    xfile: Optional[str] = args.file
+    xfunction: Optional[str] = args.function
+
+    targetpath = os.path.abspath(tgtpath)
+
+    invindex = InvariantIndex.load(targetpath, projectname)
+    if invindex is None:
+        print_error(
+            "No invariant index found for "
+            + projectname
+            + "\nRun chkc c-project index-invariants first")
+        exit(1)
+
+    kinds = invariantkinds if xkinds is None else xkinds
+    if xmaybenull:
+        kinds = ["baseoffset"]
+    postings = invindex.lookup(
+        variablename, kinds=kinds, filefilter=xfile, functionfilter=xfunction)
+    if xwithin is not None:
+        (lb, ub) = (xwithin[0], xwithin[1])
+        postings = [p for p in postings if p.is_within(lb, ub)]
+    if xmaybenull:
+        postings = [p for p in postings if p.canbenull]
+
+    for p in postings:
+        print(str(p))
+    print("\n" + str(len(postings)) + " locations")
+    exit(0)
+
+
+def cproject_export_db(args: argparse.Namespace) -> NoReturn:
+    """CLI command to write the proof obligations to a SQLite database."""
+
+    # arguments
+    tgtpath: str = args.tgtpath
+    projectname: str = args.projectname
+    xoutput: Optional[str] = args.output
+
+    targetpath = os.path.abspath(tgtpath)
+    projectpath = targetpath
+
+    if not UF.has_analysisresults_path(targetpath, projectname):
+        print_error(
+            f"No analysis results found for {projectname} in {targetpath}")
+        exit(1)
+
+    contractpath = os.path.join(targetpath, "chc_contracts")
+    capp = CApplication(
+        projectpath, projectname, targetpath, contractpath)
+
+    if xoutput is None:
+        dbfilename = UF.get_po_database_filename(targetpath, projectname)
+    else:
+        dbfilename = os.path.abspath(xoutput)
+
+    t0 = time.time()
+    counts = PODB.export_po_database(capp, dbfilename)
+    print("Exported to " + dbfilename + " in " + str(round(time.time() - t0, 2)) + "s")
+    for (name, count) in counts.items():
+        print("  " + name.ljust(12) + str(count).rjust(10))
+    exit(0)
+
+
+def cproject_query_pos(args: argparse.Namespace) -> NoReturn:
+    """CLI command to query the proof obligation database."""
+
+    if args.server:
+        PS.forward_to_server(args)
+
+    # arguments
+    tgtpath: str = args.tgtpath
+    projectname: str = args.projectname
+    xdatabase: Optional[str] = args.database
+    xpredicate: Optional[str] = args.predicate
+    xstatus: Optional[str] = args.status
+    xmethod: Optional[str] = args.method
+    xkind: Optional[str] = args.kind
+    xfile: Optional[str] = args.file
+    xfunction: Optional[str] = args.function
+    xcalledfrom: Optional[str] = args.called_from
+    xinvariant: Optional[int] = args.invariant
+    xgroupby: Optional[str] = args.groupby
+    xlimit: Optional[int] = args.limit
+    xsql: Optional[str] = args.sql
+
+    targetpath = os.path.abspath(tgtpath)
+    if xdatabase is None:
+        dbfilename = UF.get_po_database_filename(targetpath, projectname)
+    else:
+        dbfilename = os.path.abspath(xdatabase)
+
+    try:
+        conn = PODB.open_po_database(dbfilename)
+    except UF.CHCError as e:
+        print_error(str(e) + "\nRun chkc c-project export-db first")
+        exit(1)
+
+    try:
+        if xsql is not None:
+            cur = conn.execute(xsql)
+            header = [d[0] for d in cur.description or []]
+            rows = cur.fetchall()
+        else:
+            (header, rows) = PODB.query_pos_database(
+                conn,
+                predicate=xpredicate,
+                status=xstatus,
+                method=xmethod,
+                kind=xkind,
+                filename=xfile,
+                function=xfunction,
+                calledfrom=xcalledfrom,
+                invariant=xinvariant,
+                groupby=xgroupby,
+                limit=xlimit)
+    except (sqlite3.Error, UF.CHCError) as e:
+        print_error("Query failed: " + str(e))
+        exit(1)
+    finally:
+        conn.close()
+
+    widths = [len(h) for h in header]
+    for row in rows:
+        widths = [max(w, len(str(v))) for (w, v) in zip(widths, row)]
+    print("  ".join(h.ljust(w) for (h, w) in zip(header, widths)))
+    print("-" * (sum(widths) + 2 * (len(widths) - 1)))
+    for row in rows:
+        print("  ".join(str(v).ljust(w) for (v, w) in zip(row, widths)))
+    print("\n" + str(len(rows)) + " rows")
+    exit(0)
+
+
 def cproject_count_stmts(args: argparse.Namespace) -> NoReturn:
     """CLI command to output size statistics for a c project."""
 
@@ -1002,6 +1289,9 @@ def cproject_count_stmts(args: argparse.Namespace) -> NoReturn:
 def cproject_make_callgraph(args: argparse.Namespace) -> NoReturn:
     """CLI command to output (and optionally save) the callgraph."""
 
+    if args.server:
+        PS.forward_to_server(args)
+
     # arguments
     tgtpath: str = args.tgtpath
     projectname: str = args.projectname
@@ -1016,7 +1306,7 @@ def cproject_make_callgraph(args: argparse.Namespace) -> NoReturn:
             f"No analysis results found for {projectname} in {targetpath}")
         exit(1)
 
-    capp = CApplication(
+    capp = PS.get_capplication(
         projectpath, projectname, targetpath, contractpath)
 
     result: Dict[str, Dict[str, Dict[str, int]]] = {}
@@ -1212,3 +1502,57 @@ def cproject_create_header_file(args: argparse.Namespace) -> NoReturn:
             print(str(gfun.varinfo))
 
     exit(0)
+
+
+def cproject_serve(
+        args: argparse.Namespace,
+        parse: Callable[[List[str]], argparse.Namespace]) -> NoReturn:
+    """CLI command to serve c-project commands for a project over a socket."""
+
+    # arguments
+    tgtpath: str = args.tgtpath
+    projectname: str = args.projectname
+    maxfiles: int = args.max_files
+    stop: bool = args.stop
+    loglevel: str = args.loglevel
+    logfilename: Optional[str] = args.logfilename
+    logfilemode: str = args.logfilemode
+
+    targetpath = os.path.abspath(tgtpath)
+    contractpath = os.path.join(targetpath, "chc_contracts")
+    socketname = PS.get_socketname(args)
+
+    if stop:
+        try:
+            PS.send_request(socketname, {"stop": True})
+        except OSError as e:
+            print_error(f"No server running at {socketname}: {e}")
+            exit(1)
+        print_status_update(f"Server at {socketname} stopped")
+        exit(0)
+
+    if not UF.has_analysisresults_path(targetpath, projectname):
+        print_error(
+            f"No analysis results found for {projectname} in {targetpath}")
+        exit(1)
+
+    set_logging(
+        loglevel,
+        targetpath,
+        logfilename=logfilename,
+        mode=logfilemode,
+        msg="c-project serve invoked")
+
+    server = PS.ProjectServer(
+        targetpath,
+        projectname,
+        contractpath,
+        socketname,
+        parse,
+        maxfiles=maxfiles)
+    print_status_update(f"Serving {projectname} on {socketname}")
+    try:
+        server.serve()
+    except KeyboardInterrupt:
+        print_status_update("Server interrupted")
+    exit(0)
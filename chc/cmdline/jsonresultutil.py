@@ -92,7 +92,7 @@ def jsonfunctiondata(cfunction: "CFunction") -> Dict[str, str]:
 def csource_to_json_result(csrc: "CSrcFile") -> JSONResult:
     content: Dict[str, Any] = {}
     srclines: List[Tuple[int, str]] = []
-    for (i, line) in sorted(csrc.lines.items()):
+    for (i, line) in csrc.iter_lines():
         srclines.append((i, line))
     content["sourcelines"] = srclines
     return JSONResult("sourcelines", content, "ok")
@@ -28,13 +28,13 @@
 
 import argparse
 import json
+import logging
 import os
 import shutil
-import subprocess
 import time
 import sys
 
-from contextlib import contextmanager
+from contextlib import contextmanager, redirect_stderr, redirect_stdout
 from multiprocessing import Pool
 
 from typing import (
@@ -58,12 +58,17 @@ from chc.cmdline.juliet.JulietTestSetRef import JulietTestSetRef
 
 from chc.linker.CLinker import CLinker
 
+from chc.reporting.AggregatedSummaries import AggregatedSummaries
+from chc.reporting.FunctionResultDigests import FunctionResultDigests
+from chc.reporting.POStatusIndex import POStatusIndex
 import chc.reporting.ProofObligations as RP
 import chc.reporting.reportutil as UR
 
 from chc.util.Config import Config
 import chc.util.fileutil as UF
+import chc.util.IndexedTable as IT
 from chc.util.loggingutil import chklogger, LogLevel
+from chc.util.tracingutil import chktracer
 
 if TYPE_CHECKING:
     from chc.app.CFile import CFile
@@ -95,7 +100,8 @@ def set_logging(
 @contextmanager
 def timing(activity: str) -> Generator:
     t0 = time.time()
-    yield
+    with chktracer.span(activity):
+        yield
     print(
         "\n"
         + ("=" * 80)
@@ -109,6 +115,99 @@ def timing(activity: str) -> Generator:
     )
 
 
+@contextmanager
+def task_logging(
+        logfilename: str, level: str = LogLevel.warning.value) -> Generator:
+    """Sends log messages and standard output of a task to logfilename.
+
+    Used in long-lived worker processes that execute many tasks, so that the
+    output of each task is kept separately, as if run in its own process.
+    """
+    logger = logging.getLogger("chkc")
+    oldlevel = logger.level
+    handler = logging.FileHandler(logfilename, mode="w")
+    handler.setFormatter(logging.Formatter(
+        fmt="%(asctime)s:%(name)s:%(levelname)s:%(message)s"))
+    logger.addHandler(handler)
+    logger.setLevel(level)
+    previous = chklogger.set_logger(logger)
+    try:
+        with redirect_stdout(handler.stream), redirect_stderr(handler.stream):
+            yield
+    finally:
+        chklogger.set_logger(previous)
+        logger.removeHandler(handler)
+        logger.setLevel(oldlevel)
+        handler.close()
+
+
+class JulietTaskResult:
+    """Outcome of analyzing or scoring a juliet test in a worker process."""
+
+    def __init__(
+            self,
+            task: str,
+            cwe: str,
+            test: str,
+            ok: bool,
+            msg: str = "",
+            time: float = 0.0,
+            logfilename: Optional[str] = None) -> None:
+        self.task = task
+        self.cwe = cwe
+        self.test = test
+        self.ok = ok
+        self.msg = msg
+        self.time = time
+        self.logfilename = logfilename
+
+    def __str__(self) -> str:
+        status = "ok" if self.ok else "error: " + self.msg
+        return (
+            self.task + " " + self.cwe + " " + self.test + ": " + status
+            + " (" + str(round(self.time, 2)) + " secs)")
+
+
+def run_juliet_task(
+        task: str,
+        cwe: str,
+        test: str,
+        f: Callable[[], None]) -> JulietTaskResult:
+    """Runs f for a juliet test with its output redirected to a log file."""
+
+    t0 = time.time()
+    try:
+        projectpath = UF.get_juliet_testpath(cwe, test)
+    except UF.CHError as e:
+        return JulietTaskResult(task, cwe, test, False, str(e))
+    logfilename = os.path.join(
+        projectpath, cwe + "_" + test + "_" + task + "_log.txt")
+    try:
+        with task_logging(logfilename):
+            f()
+    except (Exception, SystemExit) as e:
+        return JulietTaskResult(
+            task, cwe, test, False, str(e), time.time() - t0, logfilename)
+    finally:
+        IT.stringpool.clear()
+    return JulietTaskResult(
+        task, cwe, test, True, "", time.time() - t0, logfilename)
+
+
+def print_task_results(
+        task: str, results: List[JulietTaskResult]) -> None:
+    print("\n" + ("=" * 80))
+    failed = [r for r in results if not r.ok]
+    if len(failed) == 0:
+        print("All Juliet tests cases " + task + " successfully.")
+    else:
+        for r in failed:
+            print(f"Error in testcase {r.cwe} {r.test}: {r.msg}")
+            if r.logfilename is not None:
+                print(f"    (see {r.logfilename})")
+    print("=" * 80)
+
+
 def juliet_check_config(args: argparse.Namespace) -> NoReturn:
 
     config = Config()
@@ -298,48 +397,27 @@ def juliet_convert(args: argparse.Namespace) -> NoReturn:
     exit(0)
 
 
-def juliet_analyze(args: argparse.Namespace) -> NoReturn:
-    """Analyzes a single juliet test."""
+def analyze_juliet_test(
+        cwe: str,
+        test: str,
+        maxprocesses: int = 1,
+        wordsize: int = 64,
+        contractpath: Optional[str] = None,
+        verbose: bool = False) -> Dict[str, Any]:
+    """Analyzes a single juliet test and saves the summary results.
 
-    # arguments
-    jcwe: str = args.cwe
-    jtest: str = args.test
-    jmaxproc: int = args.maxprocesses
-    jrounds: int = args.analysisrounds
-    jwordsize: int = args.wordsize
-    jcontractpath: Optional[str] = args.contractpath
-    verbose = args.verbose
-    loglevel: str = args.loglevel
-    logfilename: Optional[str] = args.logfilename
-    logfilemode: str = args.logfilemode
-
-    projectname = jcwe + "_" + jtest
-
-    try:
-        projectpath = UF.get_juliet_testpath(jcwe, jtest)
-    except UF.CHError as e:
-        print(str(e.wrap()))
-        exit(1)
+    Returns the proof obligation statistics saved; raises UF.CHError if the
+    test cannot be analyzed.
+    """
+    projectname = cwe + "_" + test
+    projectpath = UF.get_juliet_testpath(cwe, test)
 
-    if jcontractpath is None:
+    if contractpath is None:
         contractpath = os.path.join(projectpath, "cch_contracts")
-    else:
-        contractpath = jcontractpath
 
     excludefiles = ["io.c", "main_linux.c", "std_thread.c"]
 
-    set_logging(
-        loglevel,
-        projectpath,
-        logfilename=logfilename,
-        mode=logfilemode,
-        msg="juliet analyze invoked")
-
-    try:
-        UF.check_cch_semantics(projectpath, projectname, deletesemantics=True)
-    except UF.CHError as e:
-        print(str(e.wrap()))
-        exit(1)
+    UF.check_cch_semantics(projectpath, projectname, deletesemantics=True)
 
     capp = CApplication(
         projectpath,
@@ -369,25 +447,21 @@ def juliet_analyze(args: argparse.Namespace) -> NoReturn:
         capp,
         verbose=verbose,
         unreachability=True,
-        wordsize=jwordsize,
+        wordsize=wordsize,
         thirdpartysummaries=[UF.get_juliet_summaries()])
 
-    try:
-        am.create_app_primary_proofobligations(processes=jmaxproc)
-        capp.reinitialize_tables()
-        capp.collect_post_assumes()
-    except UF.CHError as e:
-        print(str(e.wrap()))
-        exit(1)
+    am.create_app_primary_proofobligations(processes=maxprocesses)
+    capp.reinitialize_tables()
+    capp.collect_post_assumes()
 
     for i in range(1):
-        am.generate_and_check_app("llrvisp", 0, processes=jmaxproc)
+        am.generate_and_check_app("llrvisp", 0, processes=maxprocesses)
         capp.reinitialize_tables()
         capp.update_spos()
 
     for i in range(5):
         capp.update_spos()
-        am.generate_and_check_app("llrvisp", i + 1, processes=jmaxproc)
+        am.generate_and_check_app("llrvisp", i + 1, processes=maxprocesses)
         capp.reinitialize_tables()
 
     def filefilter(filename: str) -> bool:
@@ -398,12 +472,62 @@ def juliet_analyze(args: argparse.Namespace) -> NoReturn:
         print(f" --> {len(contractviolations)} contraction violations")
 
     timestamp = os.stat(capp.targetpath).st_ctime
+    digests = FunctionResultDigests.load(capp.targetpath, projectname)
+    poindex = POStatusIndex.from_application(capp, digests=digests)
+    digests.save()
+    poindex.save(capp.targetpath, projectname)
+    result = RP.project_proofobligation_stats_to_dict(
+        capp, filefilter=filefilter, poindex=poindex)
+    result["timestamp"] = timestamp
+    result["path"] = capp.projectpath
+    UF.save_project_summary_results(capp.targetpath, "juliet", result)
+    AggregatedSummaries(UF.get_juliet_aggregated_summaries_filename()).append(
+        cwe + ":" + test,
+        "analysis",
+        UF.get_project_summary_results_filename(capp.targetpath, "juliet"),
+        result)
+    return result
+
+
+def juliet_analyze(args: argparse.Namespace) -> NoReturn:
+    """Analyzes a single juliet test."""
+
+    # arguments
+    jcwe: str = args.cwe
+    jtest: str = args.test
+    jmaxproc: int = args.maxprocesses
+    jrounds: int = args.analysisrounds
+    jwordsize: int = args.wordsize
+    jcontractpath: Optional[str] = args.contractpath
+    verbose = args.verbose
+    loglevel: str = args.loglevel
+    logfilename: Optional[str] = args.logfilename
+    logfilemode: str = args.logfilemode
+
+    try:
+        projectpath = UF.get_juliet_testpath(jcwe, jtest)
+    except UF.CHError as e:
+        print(str(e.wrap()))
+        exit(1)
+
+    set_logging(
+        loglevel,
+        projectpath,
+        logfilename=logfilename,
+        mode=logfilemode,
+        msg="juliet analyze invoked")
+
     try:
-        result = RP.project_proofobligation_stats_to_dict(
-            capp, filefilter=filefilter)
-        result["timestamp"] = timestamp
-        result["path"] = capp.projectpath
-        UF.save_project_summary_results(capp.targetpath, "juliet", result)
+        analyze_juliet_test(
+            jcwe,
+            jtest,
+            maxprocesses=jmaxproc,
+            wordsize=jwordsize,
+            contractpath=jcontractpath,
+            verbose=verbose)
+    except UF.CHError as e:
+        print(str(e.wrap()))
+        exit(1)
     except Exception as e:
         print(str(e))
         exit(1)
@@ -411,16 +535,18 @@ def juliet_analyze(args: argparse.Namespace) -> NoReturn:
     exit(0)
 
 
-def analyze_test(testdata: Tuple[str, str, int]) -> int:
-    """CLI command to run a juliet test case.
+def analyze_test(testdata: Tuple[str, str, int]) -> JulietTaskResult:
+    """Analyzes a juliet test case in a worker process.
 
     Note: this function needs to be global for multiprocessing to work.
     """
 
     (cwe, testcase, index) = testdata
-    cmd = ["chkc", "juliet", "analyze", cwe, testcase]
-    result = subprocess.call(cmd, stderr=subprocess.STDOUT)
-    return result
+
+    def f() -> None:
+        analyze_juliet_test(cwe, testcase)
+
+    return run_juliet_task("analyze", cwe, testcase, f)
 
 
 def juliet_analyze_sets(args: argparse.Namespace) -> NoReturn:
@@ -432,7 +558,6 @@ def juliet_analyze_sets(args: argparse.Namespace) -> NoReturn:
 
     maxptxt = "" if jmaxproc == 1 else f" (with {jmaxproc} processors)"
 
-    pool = Pool(jmaxproc)
     testcases = []
 
     def excluded(cwe: str) -> bool:
@@ -453,16 +578,10 @@ def juliet_analyze_sets(args: argparse.Namespace) -> NoReturn:
                     testcases.append((cwe, t, count))
                     count += 1
 
-        results = pool.map(analyze_test, testcases)
+        with Pool(jmaxproc) as pool:
+            results = pool.map(analyze_test, testcases)
 
-    print("\n" + ("=" * 80))
-    if len(results) == results.count(0):
-        print("All Juliet tests cases ran successfully.")
-    else:
-        for x in range(len(results)):
-            if results[x] != 0:
-                print(f"Error in testcase {testcases[x][0]}")
-    print("=" * 80)
+    print_task_results("ran", results)
 
     exit(0)
 
@@ -554,46 +673,31 @@ def juliet_report_file(args: argparse.Namespace) -> NoReturn:
 
     if jshowcode:
         if jopen:
-            print(RP.file_code_open_tostring(cfile, showinvs=jinvariants))
+            RP.write_lines(RP.file_code_open_lines(cfile, showinvs=jinvariants))
         else:
-            print(RP.file_code_tostring(cfile, showinvs=jinvariants))
+            RP.write_lines(RP.file_code_lines(cfile, showinvs=jinvariants))
 
     print(RP.file_proofobligation_stats_tostring(cfile))
 
     exit(0)
 
 
-def juliet_score(args: argparse.Namespace) -> NoReturn:
-    """Prints out (and saves) the score for a single juliet test."""
+def score_juliet_test(
+        cwe: str,
+        test: str) -> Tuple[str, Dict[str, Dict[str, Dict[str, int]]]]:
+    """Scores a single juliet test and saves the test summary.
 
-    # arguments
-    jcwe: str = args.cwe
-    jtest: str = args.test
-    loglevel: str = args.loglevel
-    logfilename: Optional[str] = args.logfilename
-    logfilemode: str = args.logfilemode
-
-    projectname = jcwe + "_" + jtest
-
-    try:
-        projectpath = UF.get_juliet_testpath(jcwe, jtest)
-    except UF.CHError as e:
-        print(str(e.wrap()))
-        exit(1)
-
-    set_logging(
-        loglevel,
-        projectpath,
-        logfilename=logfilename,
-        mode=logfilemode,
-        msg="juliet score invoked")
+    Returns the report on the scored proof obligations and the test summary.
+    """
+    projectname = cwe + "_" + test
+    projectpath = UF.get_juliet_testpath(cwe, test)
 
     targetpath = projectpath
     contractpath = os.path.join(projectpath, "cch_contracts")
 
     excludefiles = ["io.c", "main_linux.c", "std_thread.c"]
 
-    d = UF.get_juliet_scorekey(jcwe, jtest)
+    d = UF.get_juliet_scorekey(cwe, test)
 
     capp = CApplication(
         projectpath,
@@ -607,31 +711,69 @@ def juliet_score(args: argparse.Namespace) -> NoReturn:
     julietppos = JTS.get_julietppos(testset)
 
     ppopairs = JTS.get_ppo_pairs(julietppos, capp)
-    print(JTS.testppo_results_tostring(ppopairs, capp))
+    lines: List[str] = []
+    lines.append(JTS.testppo_results_tostring(ppopairs, capp))
 
     testsummary: Dict[str, Dict[str, Dict[str, int]]] = {}
     JTS.initialize_testsummary(testset, testsummary)
     JTS.fill_testsummary(ppopairs, testsummary, capp)
 
-    print(JTS.testsummary_tostring(testsummary))
+    lines.append(JTS.testsummary_tostring(testsummary))
 
     testsummary["total"] = JTS.get_testsummary_totals(testsummary)
 
-    UF.save_juliet_test_summary(jcwe, jtest, testsummary)
+    UF.save_juliet_test_summary(cwe, test, testsummary)
+    AggregatedSummaries(UF.get_juliet_aggregated_summaries_filename()).append(
+        cwe + ":" + test,
+        "score",
+        UF.get_juliet_test_summary_filename(cwe, test),
+        testsummary)
+
+    return ("\n".join(lines), testsummary)
+
+
+def juliet_score(args: argparse.Namespace) -> NoReturn:
+    """Prints out (and saves) the score for a single juliet test."""
+
+    # arguments
+    jcwe: str = args.cwe
+    jtest: str = args.test
+    loglevel: str = args.loglevel
+    logfilename: Optional[str] = args.logfilename
+    logfilemode: str = args.logfilemode
+
+    try:
+        projectpath = UF.get_juliet_testpath(jcwe, jtest)
+    except UF.CHError as e:
+        print(str(e.wrap()))
+        exit(1)
+
+    set_logging(
+        loglevel,
+        projectpath,
+        logfilename=logfilename,
+        mode=logfilemode,
+        msg="juliet score invoked")
+
+    (report, _) = score_juliet_test(jcwe, jtest)
+    print(report)
 
     exit(0)
 
 
-def score_test(testdata: Tuple[str, str, int]) -> int:
-    """CLI command to score a juliet test case.
+def score_test(testdata: Tuple[str, str, int]) -> JulietTaskResult:
+    """Scores a juliet test case in a worker process.
 
     Note: this function needs to be global for multiprocessing to work.
     """
 
     (cwe, testcase, index) = testdata
-    cmd = ["chkc", "juliet", "score", cwe, testcase]
-    result = subprocess.call(cmd, stderr=subprocess.STDOUT)
-    return result
+
+    def f() -> None:
+        (report, _) = score_juliet_test(cwe, testcase)
+        print(report)
+
+    return run_juliet_task("score", cwe, testcase, f)
 
 
 def juliet_score_sets(args: argparse.Namespace) -> NoReturn:
@@ -643,7 +785,6 @@ def juliet_score_sets(args: argparse.Namespace) -> NoReturn:
 
     maxptxt = "" if jmaxproc == 1 else f" (with {jmaxproc} processors)"
 
-    pool = Pool(jmaxproc)
     testcases = []
 
     def excluded(cwe: str) -> bool:
@@ -662,17 +803,12 @@ def juliet_score_sets(args: argparse.Namespace) -> NoReturn:
             for subdir in sorted(juliettests[cwe]):
                 for t in juliettests[cwe][subdir]:
                     testcases.append((cwe, t, count))
+                    count += 1
 
-        results = pool.map(score_test, testcases)
+        with Pool(jmaxproc) as pool:
+            results = pool.map(score_test, testcases)
 
-    print("\n" + ("=" * 80))
-    if len(results) == results.count(0):
-        print("All Juliet tests cases were scored successfully.")
-    else:
-        for x in range(len(results)):
-            if results[x] != 0:
-                print(f"Error in testcase {testcases[x][0]}")
-    print("=" * 80)
+    print_task_results("were scored", results)
 
     exit(0)
 
@@ -840,6 +976,8 @@ def juliet_dashboard(args: argparse.Namespace) -> NoReturn:
     try:
         testcases = UF.get_flattened_juliet_testcases()
         variants = UF.get_juliet_variant_descriptions()
+        summaries = AggregatedSummaries(
+            UF.get_juliet_aggregated_summaries_filename())
     except UF.CHError as e:
         print(str(e.wrap()))
         exit(1)
@@ -899,7 +1037,11 @@ def juliet_dashboard(args: argparse.Namespace) -> NoReturn:
             ctotals["sc"][c] = 0
 
         for cc in sorted(testcases[cwe]):
-            testtotals = UF.read_juliet_test_summary(cwe, cc)
+            testtotals = summaries.get(
+                cwe + ":" + cc,
+                "score",
+                UF.get_juliet_test_summary_filename(cwe, cc),
+                lambda: UF.read_juliet_test_summary(cwe, cc))
             if not (testtotals is None):
                 if optvariant is None:
                     totals = testtotals["total"]
@@ -980,10 +1122,32 @@ def juliet_dashboard(args: argparse.Namespace) -> NoReturn:
     lines.append("-" * 80)
 
     print("\n".join(lines))
+    summaries.compact()
 
     exit(0)
 
 
+def juliet_index_results(cwe: str, test: str) -> Optional[Dict[str, Any]]:
+    """Returns the tag results of a test from its saved po status index.
+
+    This is used for tests whose summary results are missing; returns None
+    if the test has no current po status index either.
+    """
+    path = UF.get_juliet_testpath(cwe, test)
+    poindex = POStatusIndex.load_current(path, cwe + "_" + test)
+    if poindex is None:
+        return None
+
+    def filefilter(filename: str) -> bool:
+        return not (filename in ["io", "main_linux", "std_thread"])
+
+    result: Dict[str, Any] = {}
+    result["tagresults"] = {
+        kind: poindex.group_method_counts("tag", kind, filefilter=filefilter)
+        for kind in ["ppos", "spos"]}
+    return result
+
+
 def juliet_project_dashboard(args: argparse.Namespace) -> NoReturn:
 
     # arguments
@@ -994,6 +1158,8 @@ def juliet_project_dashboard(args: argparse.Namespace) -> NoReturn:
     try:
         testcases = UF.get_flattened_juliet_testcases()
         variants = UF.get_juliet_variant_descriptions()
+        summaries = AggregatedSummaries(
+            UF.get_juliet_aggregated_summaries_filename())
     except UF.CHError as e:
         print(str(e.wrap()))
         exit(1)
@@ -1021,7 +1187,13 @@ def juliet_project_dashboard(args: argparse.Namespace) -> NoReturn:
         for test in testcases[cwe]:
             pname = f"{cwe}:{test}"
             path = UF.get_juliet_testpath(cwe, test)
-            results = UF.read_project_summary_results(path, "juliet")
+            results = summaries.get(
+                pname,
+                "analysis",
+                UF.get_project_summary_results_filename(path, "juliet"),
+                lambda: UF.read_project_summary_results(path, "juliet"))
+            if results is None:
+                results = juliet_index_results(cwe, test)
             if results is None:
                 nosummary.append(pname)
                 continue
@@ -1132,5 +1304,6 @@ def juliet_project_dashboard(args: argparse.Namespace) -> NoReturn:
                 ppo_project_totals, spo_project_totals, projectstats)))
 
     print("\n".join(lines))
+    summaries.compact()
 
     exit(0)
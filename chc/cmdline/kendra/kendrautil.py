@@ -41,6 +41,7 @@ from chc.cmdline.kendra.TestManager import AnalyzerMissingError
 from chc.cmdline.kendra.TestSetRef import TestSetRef
 from chc.cmdline.ParseManager import ParseManager
 
+from chc.reporting.AggregatedSummaries import AggregatedSummaries
 import chc.reporting.ProofObligations as RP
 
 import chc.util.fileutil as UF
@@ -261,7 +262,7 @@ def kendra_report_file(args: argparse.Namespace) -> NoReturn:
     capp.initialize_single_file(cfilename)
     cfile = capp.get_cfile()
 
-    print(RP.file_code_tostring(cfile, showinvs=showinvs))
+    RP.write_lines(RP.file_code_lines(cfile, showinvs=showinvs))
     print(RP.file_proofobligation_stats_tostring(cfile))
 
     exit(0)
@@ -485,32 +486,56 @@ def get_delegated_spo_perc(spec: Dict[str, Any], width: int) -> str:
     return get_perc(cnt, tgtcnt, width)
 
 
-def get_ppo_results(spec: Dict[str, Any]) -> str:
-    opencnt = get_open_ppo_count(spec)
+def get_ppo_summary(spec: Dict[str, Any]) -> Dict[str, Any]:
+    """Returns the ppo counts shown in the dashboard for the spec file."""
+    return {
+        "count": get_ppo_count(spec),
+        "safe": list(get_safe_ppo_counts(spec)),
+        "violation": list(get_violation_ppo_counts(spec)),
+        "delegated": list(get_delegated_ppo_counts(spec)),
+        "open": get_open_ppo_count(spec)}
+
+
+def get_spo_summary(spec: Dict[str, Any]) -> Dict[str, Any]:
+    """Returns the spo counts shown in the dashboard for the spec file."""
+    return {
+        "count": get_spo_count(spec),
+        "safe": list(get_safe_spo_counts(spec)),
+        "violation": list(get_violation_spo_counts(spec)),
+        "delegated": list(get_delegated_spo_counts(spec)),
+        "open": get_open_spo_count(spec)}
+
+
+def format_ppo_summary(summary: Dict[str, Any]) -> str:
+    opencnt = summary["open"]
     s_opencnt = "-" if opencnt == 0 else str(opencnt)
     return (
-        str(get_ppo_count(spec)).rjust(6)
-        + get_safe_ppo_perc(spec, 12)
-        + get_violation_ppo_perc(spec, 12)
-        + get_delegated_ppo_perc(spec, 12)
+        str(summary["count"]).rjust(6)
+        + get_perc(summary["safe"][0], summary["safe"][1], 12)
+        + get_perc(summary["violation"][0], summary["violation"][1], 12)
+        + get_perc(summary["delegated"][0], summary["delegated"][1], 12)
         + s_opencnt.rjust(10)
     )
 
 
-def get_spo_results(spec: Dict[str, Any]) -> str:
-    spocount = get_spo_count(spec)
-    s_spocount = "-" if spocount == 0 else str(spocount)
-    opencnt = get_open_spo_count(spec)
-    s_opencount = "-" if opencnt == 0 else str(opencnt)
+def format_spo_summary(summary: Dict[str, Any]) -> str:
     return (
-        str(spocount).rjust(6)
-        + get_safe_spo_perc(spec, 12)
-        + get_violation_spo_perc(spec, 12)
-        + get_delegated_spo_perc(spec, 12)
-        + str(opencnt).rjust(10)
+        str(summary["count"]).rjust(6)
+        + get_perc(summary["safe"][0], summary["safe"][1], 12)
+        + get_perc(summary["violation"][0], summary["violation"][1], 12)
+        + get_perc(summary["delegated"][0], summary["delegated"][1], 12)
+        + str(summary["open"]).rjust(10)
     )
 
 
+def get_ppo_results(spec: Dict[str, Any]) -> str:
+    return format_ppo_summary(get_ppo_summary(spec))
+
+
+def get_spo_results(spec: Dict[str, Any]) -> str:
+    return format_spo_summary(get_spo_summary(spec))
+
+
 def dashboard_header() -> str:
     lines: List[str] = []
     header = "testcase".ljust(9)
@@ -548,26 +573,42 @@ def kendra_dashboard(args: argparse.Namespace) -> NoReturn:
 
     kendrapath = UF.get_kendra_path()
     testcases = [(i, "id" + str(i) + "Q") for i in range(115, 394, 4)]
+    summaries = AggregatedSummaries(
+        UF.get_kendra_aggregated_summaries_filename())
 
     lines: List[str] = []
 
     lines.append(dashboard_header())
 
+    def dashboard_record(specfilename: str) -> Dict[str, Any]:
+        with open(specfilename) as fp:
+            spec = json.load(fp)
+        return {
+            "ppos": get_ppo_summary(spec),
+            "spos": get_spo_summary(spec),
+            "violations": sorted(get_violation_predicates(spec))}
+
     for (i, t) in testcases:
         if (i % 100) < 4:
             lines.append("-" * 120)
         specfilename = os.path.join(os.path.join(kendrapath, t), t + ".json")
-        with open(specfilename) as fp:
-            spec = json.load(fp)
+        record = summaries.get(
+            t,
+            "dashboard",
+            specfilename,
+            lambda: dashboard_record(specfilename))
+        if record is None:
+            raise UF.CHCFileNotFoundError(specfilename)
         lines.append(
             t.ljust(9)
-            + get_ppo_results(spec)
+            + format_ppo_summary(record["ppos"])
             + "  | "
-            + get_spo_results(spec)
+            + format_spo_summary(record["spos"])
             + " ".ljust(6)
-            + ",".join(get_violation_predicates(spec)))
+            + ",".join(record["violations"]))
     lines.append("-" * 150)
 
     print("\n".join(lines))
+    summaries.compact()
 
     exit(0)
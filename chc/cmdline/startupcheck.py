@@ -0,0 +1,121 @@
+# ------------------------------------------------------------------------------
+# CodeHawk C Analyzer
+# Author: Henny Sipma
+# ------------------------------------------------------------------------------
+# The MIT License (MIT)
+#
+# Copyright (c) 2026 Aarno Labs LLC
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# ------------------------------------------------------------------------------
+"""Regression check on the start-up cost of chkc.
+
+chkc imports the modules of a command only when the command is dispatched,
+so that parsing the command line and showing help are fast. This script
+runs chkc with python -X importtime for command lines that dispatch no
+command (help of the main parser and of some subparsers) and fails if any
+of chc.api, chc.invariants, or chc.proof is imported:
+
+  python chc/cmdline/startupcheck.py [--max-seconds N]
+
+The cumulative import time of each command line is printed; with
+--max-seconds the check also fails if it exceeds N seconds.
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+
+from typing import List, Tuple
+
+
+# packages that must not be imported to parse the command line (chc.app is
+# not included, as chkc imports chc.app.CHVersion for --version)
+excluded_packages: List[str] = ["chc.api", "chc.invariants", "chc.proof"]
+
+# command lines that parse arguments without dispatching a command
+checked_command_lines: List[List[str]] = [
+    ["--help"],
+    ["c-file", "--help"],
+    ["c-project", "--help"],
+    ["c-project", "report", "--help"],
+    ["juliet", "--help"],
+    ["kendra", "--help"]]
+
+
+def chkc_imports(argv: List[str]) -> Tuple[List[str], float]:
+    """Returns the modules imported by chkc argv and the total import time."""
+
+    cmdlinedir = os.path.dirname(os.path.abspath(__file__))
+    topdir = os.path.dirname(os.path.dirname(cmdlinedir))
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        [topdir] + [p for p in env.get("PYTHONPATH", "").split(os.pathsep) if p])
+    cmd = [sys.executable, "-X", "importtime", os.path.join(cmdlinedir, "chkc")]
+    proc = subprocess.run(
+        cmd + argv, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+        text=True)
+    modules: List[str] = []
+    total = 0
+    for line in proc.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue
+        module = fields[2].rstrip()
+        modules.append(module.strip())
+        if not module.startswith("  "):
+            # top-level import
+            total += int(fields[1])
+    return (modules, total / 1000000.0)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--max-seconds",
+        type=float,
+        help="fail if the imports of a command line take longer than this")
+    args = parser.parse_args()
+
+    failures: List[str] = []
+    for argv in checked_command_lines:
+        (modules, seconds) = chkc_imports(argv)
+        cmdline = "chkc " + " ".join(argv)
+        print(cmdline.ljust(36) + str(round(seconds, 3)).rjust(8) + " secs")
+        excluded = sorted(set(
+            m for m in modules
+            if any(m == p or m.startswith(p + ".") for p in excluded_packages)))
+        if len(excluded) > 0:
+            failures.append(cmdline + " imports " + ", ".join(excluded))
+        if args.max_seconds is not None and seconds > args.max_seconds:
+            failures.append(
+                cmdline + " takes " + str(round(seconds, 3)) + " secs")
+
+    for f in failures:
+        print("FAILED: " + f)
+    return 1 if len(failures) > 0 else 0
+
+
+if __name__ == "__main__":
+
+    exit(main())
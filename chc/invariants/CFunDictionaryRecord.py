@@ -44,6 +44,8 @@ if TYPE_CHECKING:
 class CFunXprDictionaryRecord(IndexedTableValue):
     """Base class for all objects kept in the CFunXprDictionary."""
 
+    __slots__ = ("_xd",)
+
     def __init__(
             self, xd: "CFunXprDictionary", ixval: IndexedTableValue) -> None:
         IndexedTableValue.__init__(self, ixval.index, ixval.tags, ixval.args)
@@ -61,6 +63,8 @@ class CFunXprDictionaryRecord(IndexedTableValue):
 class CFunVarDictionaryRecord(IndexedTableValue):
     """Base class for all objects kept in the CFunVarDictionary."""
 
+    __slots__ = ("_vd",)
+
     def __init__(
             self, vd: "CFunVarDictionary", ixval: IndexedTableValue) -> None:
         IndexedTableValue.__init__(self, ixval.index, ixval.tags, ixval.args)
@@ -90,6 +94,8 @@ class CFunVarDictionaryRecord(IndexedTableValue):
 class CFunInvDictionaryRecord(IndexedTableValue):
     """Base class for all objects kept in the CFunInvDictionary."""
 
+    __slots__ = ("_invd",)
+
     def __init__(
             self, invd: "CFunInvDictionary", ixval: IndexedTableValue) -> None:
         IndexedTableValue.__init__(self, ixval.index, ixval.tags, ixval.args)
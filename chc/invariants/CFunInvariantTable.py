@@ -30,7 +30,7 @@
 
 import xml.etree.ElementTree as ET
 
-from typing import cast, Dict, List, Tuple, TYPE_CHECKING
+from typing import cast, Dict, List, Optional, Tuple, TYPE_CHECKING
 
 from chc.invariants.CInvariantFact import CInvariantFact, CInvariantNRVFact
 from chc.invariants.CNonRelationalValue import (
@@ -50,13 +50,94 @@ if TYPE_CHECKING:
     from chc.invariants.CXVariable import CXVariable
 
 
+class CContextInvariants:
+    """Invariant facts at a single cfg context, presorted and partitioned.
+
+    The facts are partitioned and sorted once, so that the sorted invariants
+    and the invariants relevant to a particular proof obligation can be
+    returned without further computation:
+
+    - sorted_invariants: non-nrv facts followed by the nrv facts sorted by
+      variable
+    - po_invariants: unreachable facts followed by the non-region-set nrv
+      facts and, per variable, the smallest region set, sorted by variable;
+      facts on check variables are included only for the proof obligations
+      that created the check variable.
+
+    The lists returned are shared between callers and must not be modified.
+    """
+
+    def __init__(
+            self, vard: "CFunVarDictionary", facts: List[CInvariantFact]) -> None:
+        self._facts = facts
+        nrvinvs = [
+            cast(CInvariantNRVFact, inv) for inv in facts if inv.is_nrv_fact]
+        otherinvs = [inv for inv in facts if not inv.is_nrv_fact]
+        sortednrvinvs = sorted(nrvinvs, key=lambda i: str(i.variable))
+        self._sorted: List[CInvariantFact] = list(otherinvs)
+        self._sorted.extend(sortednrvinvs)
+
+        unrinvs = [inv for inv in facts if inv.is_unreachable_fact]
+        nonrsinvs: List[CInvariantNRVFact] = []
+        varsets: Dict[int, CInvariantNRVFact] = {}
+        for inv in nrvinvs:
+            if not inv.non_relational_value.is_region_set:
+                nonrsinvs.append(inv)
+                continue
+            seqnr = inv.variable.seqnr
+            if seqnr not in varsets:
+                varsets[seqnr] = inv
+            elif (
+                cast(CNRVRegionSet, inv.non_relational_value).size
+                < cast(CNRVRegionSet,
+                       varsets[seqnr].non_relational_value).size
+            ):
+                varsets[seqnr] = inv
+        candidates = sorted(
+            nonrsinvs + list(varsets.values()), key=lambda i: str(i.variable))
+
+        # check-variable facts are only shown with the po's that own them
+        checkpoids: List[Optional[List[int]]] = []
+        for inv in candidates:
+            cvar = vard.get_c_variable_denotation(inv.variable.seqnr)
+            if cvar.is_check_variable:
+                checkpoids.append(cast(CVCheckVariable, cvar).po_ids)
+            else:
+                checkpoids.append(None)
+
+        self._po_default: List[CInvariantFact] = (
+            unrinvs + [
+                inv for (inv, poids) in zip(candidates, checkpoids)
+                if poids is None])
+        self._po_invariants: Dict[int, List[CInvariantFact]] = {}
+        allpoids = set(
+            poid for poids in checkpoids if poids is not None for poid in poids)
+        for poid in allpoids:
+            self._po_invariants[poid] = unrinvs + [
+                inv for (inv, poids) in zip(candidates, checkpoids)
+                if poids is None or poid in poids]
+
+    @property
+    def invariants(self) -> List[CInvariantFact]:
+        return self._facts
+
+    @property
+    def sorted_invariants(self) -> List[CInvariantFact]:
+        return self._sorted
+
+    def po_invariants(self, poId: int) -> List[CInvariantFact]:
+        return self._po_invariants.get(poId, self._po_default)
+
+
 class CFunInvariantTable:
     """Function-level invariants."""
 
     def __init__(self, cfun: "CFunction", xnode: ET.Element):
         self._cfun = cfun
-        self.xnode = xnode
+        self.xnode: Optional[ET.Element] = xnode
         self._invariants: Dict[int, List[CInvariantFact]] = {}
+        # cfg context index -> invariants at that location
+        self._contextindex: Optional[Dict[int, CContextInvariants]] = None
 
         # self.invariants = {}  # context -> CInvariantFact list
 
@@ -80,9 +161,14 @@ class CFunInvariantTable:
     def vard(self) -> "CFunVarDictionary":
         return self.cfun.vardictionary
 
+    def loaded_invariants(self) -> Dict[int, List[CInvariantFact]]:
+        """Returns the invariants if they have been read (does not read them)."""
+
+        return self._invariants
+
     @property
     def invariants(self) -> Dict[int, List[CInvariantFact]]:
-        if len(self._invariants) == 0:
+        if self.xnode is not None:
             for xloc in self.xnode.findall("loc"):
                 xctxt = xloc.get("ictxt")
                 if xctxt is not None:
@@ -94,74 +180,44 @@ class CFunInvariantTable:
                         for findex in indices:
                             self._invariants[ictxt].append(
                                 self.invd.get_invariant_fact(findex))
+            self.xnode = None
         return self._invariants
 
+    @property
+    def contextindex(self) -> Dict[int, CContextInvariants]:
+        """Returns a map from cfg context index to the invariants there.
+
+        The invariants are recorded for the cfg projection of a context (the
+        cfg context with an empty expression context); keying the index on
+        the cfg context allows lookups without indexing the projection in
+        the context dictionary.
+        """
+        if self._contextindex is None:
+            self._contextindex = {}
+            for (ictxt, facts) in self.invariants.items():
+                cfgindex = self.ctxtd.get_program_context(ictxt).args[0]
+                self._contextindex[cfgindex] = CContextInvariants(
+                    self.vard, facts)
+        return self._contextindex
+
+    def _context_entry(
+            self, context: "ProgramContext") -> Optional[CContextInvariants]:
+        return self.contextindex.get(context.args[0])
+
     def context_invariants(
             self, context: "ProgramContext") -> List[CInvariantFact]:
-        ictxt = self.ctxtd.index_cfg_projection(context)
-        if ictxt in self.invariants:
-            return self.invariants[ictxt]
-        else:
-            return []
+        entry = self._context_entry(context)
+        return [] if entry is None else entry.invariants
 
     def get_sorted_invariants(
             self, context: "ProgramContext") -> List[CInvariantFact]:
-        invs = self.context_invariants(context)
-        nrvinvs = [inv for inv in invs if inv.is_nrv_fact]
-        otherinvs = [inv for inv in invs if not inv.is_nrv_fact]
-        nrvinvs = sorted(
-            nrvinvs, key=lambda i: str(cast(CInvariantNRVFact, i).variable))
-        return otherinvs + nrvinvs
+        entry = self._context_entry(context)
+        return [] if entry is None else entry.sorted_invariants
 
     def get_po_invariants(
             self, context: "ProgramContext", poId: int) -> List[CInvariantFact]:
-        invs = self.context_invariants(context)
-
-        def filter(inv: CInvariantFact) -> bool:
-            if inv.is_nrv_fact:
-                inv = cast(CInvariantNRVFact, inv)
-                var = inv.variable
-                cvar = self.vard.get_c_variable_denotation(var.seqnr)
-                if cvar.is_check_variable:
-                    cvar = cast(CVCheckVariable, cvar)
-                    return poId in cvar.po_ids
-                else:
-                    return True
-            else:
-                return True
-
-        invs = [inv for inv in invs if filter(inv)]
-        unrinvs = [inv for inv in invs if inv.is_unreachable_fact]
-        nonrsinvs = [
-            inv
-            for inv in invs
-            if inv.is_nrv_fact
-            and (not cast(CInvariantNRVFact, inv).non_relational_value.is_region_set)
-        ]
-        rsinvs: List[CInvariantNRVFact] = [
-            cast(CInvariantNRVFact, inv)
-            for inv in invs
-            if (inv.is_nrv_fact
-                and cast(CInvariantNRVFact, inv).non_relational_value.is_region_set)
-        ]
-        varsets: Dict[int, CInvariantNRVFact] = {}
-        for r in rsinvs:
-            cvar = r.variable
-            if cvar.seqnr not in varsets:
-                varsets[cvar.seqnr] = r
-            else:
-                if (
-                    cast(CNRVRegionSet, r.non_relational_value).size
-                    < cast(CNRVRegionSet,
-                           varsets[cvar.seqnr].non_relational_value).size
-                ):
-                    varsets[cvar.seqnr] = r
-        invs = unrinvs + sorted(
-            nonrsinvs
-            + list(varsets.values()),
-            key=lambda i: str(cast(CInvariantNRVFact, i).variable)
-        )
-        return invs
+        entry = self._context_entry(context)
+        return [] if entry is None else entry.po_invariants(poId)
 
     def __str__(self) -> str:
         contexts: List[Tuple[str, List[CInvariantFact]]] = []
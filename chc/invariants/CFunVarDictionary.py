@@ -35,7 +35,7 @@ import xml.etree.ElementTree as ET
 from typing import Callable, Dict, List, Mapping, Optional, TYPE_CHECKING
 
 import chc.util.fileutil as UF
-from chc.util.IndexedTable import IndexedTable, IndexedTableValue
+from chc.util.IndexedTable import InternedIndexedTable, IndexedTableValue
 
 from chc.invariants.CFunDictionaryRecord import varregistry
 
@@ -60,16 +60,19 @@ class CFunVarDictionary:
 
     def __init__(self, cfun: "CFunction", xnode: ET.Element) -> None:
         self._cfun = cfun
-        self.xnode = xnode
+        # only the xpr-dictionary element is retained, until it is decoded
+        self._xxprd: Optional[ET.Element] = xnode.find("xpr-dictionary")
         self._xd: Optional[CFunXprDictionary] = None
-        self.memory_base_table = IndexedTable("memory-base-table")
-        self.memory_reference_data_table = IndexedTable(
-            "memory-reference-data-table")
-        self.constant_value_variable_table = IndexedTable(
-            "constant-value-variable-table")
-        self.c_variable_denotation_table = IndexedTable(
-            "c-variable-denotation-table")
-        self.tables: List[IndexedTable] = [
+        pool = cfun.cfile.invariant_record_pool
+        self.memory_base_table = InternedIndexedTable(
+            "memory-base-table", pool)
+        self.memory_reference_data_table = InternedIndexedTable(
+            "memory-reference-data-table", pool)
+        self.constant_value_variable_table = InternedIndexedTable(
+            "constant-value-variable-table", pool)
+        self.c_variable_denotation_table = InternedIndexedTable(
+            "c-variable-denotation-table", pool)
+        self.tables: List[InternedIndexedTable] = [
             self.memory_base_table,
             self.memory_reference_data_table,
             self.constant_value_variable_table,
@@ -105,13 +108,19 @@ class CFunVarDictionary:
     @property
     def xd(self) -> CFunXprDictionary:
         if self._xd is None:
-            xprd = self.xnode.find("xpr-dictionary")
+            xprd = self._xxprd
             if xprd is None:
                 raise UF.CHCError(
                     "Xpr dictionary not found in variable dictionary for "
                     + "function " + self.cfun.name)
             else:
                 self._xd = CFunXprDictionary(self, xprd)
+                self._xxprd = None
+        return self._xd
+
+    def loaded_xd(self) -> Optional[CFunXprDictionary]:
+        """Returns the xpr dictionary if it has been read."""
+
         return self._xd
 
     # -------------------- Retrieve items from dictionary tables -------------
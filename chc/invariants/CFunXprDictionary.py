@@ -56,15 +56,22 @@ class CFunXprDictionary(object):
 
     def __init__(self, vd: "CFunVarDictionary", xnode: ET.Element) -> None:
         self._vd = vd
-        self.xnode = xnode
-        self.numerical_table = IT.IndexedTable("numerical-table")
-        self.symbol_table = IT.IndexedTable("symbol-table")
-        self.variable_table = IT.IndexedTable("variable-table")
-        self.xcst_table = IT.IndexedTable("xcst-table")
-        self.xpr_table = IT.IndexedTable("xpr-table")
-        self.xpr_list_table = IT.IndexedTable("xpr-list-table")
-        self.xpr_list_list_table = IT.IndexedTable("xpr-list-list-table")
-        self.tables: List[IT.IndexedTable] = [
+        pool = vd.cfile.invariant_record_pool
+        self.numerical_table = IT.InternedIndexedTable(
+            "numerical-table", pool)
+        self.symbol_table = IT.InternedIndexedTable(
+            "symbol-table", pool)
+        self.variable_table = IT.InternedIndexedTable(
+            "variable-table", pool)
+        self.xcst_table = IT.InternedIndexedTable(
+            "xcst-table", pool)
+        self.xpr_table = IT.InternedIndexedTable(
+            "xpr-table", pool)
+        self.xpr_list_table = IT.InternedIndexedTable(
+            "xpr-list-table", pool)
+        self.xpr_list_list_table = IT.InternedIndexedTable(
+            "xpr-list-list-table", pool)
+        self.tables: List[IT.InternedIndexedTable] = [
             self.numerical_table,
             self.symbol_table,
             self.variable_table,
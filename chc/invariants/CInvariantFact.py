@@ -46,6 +46,8 @@ if TYPE_CHECKING:
 
 class CInvariantFact(CFunInvDictionaryRecord):
 
+    __slots__ = ()
+
     def __init__(
             self, invd: "CFunInvDictionary", ixval: IndexedTableValue) -> None:
         CFunInvDictionaryRecord.__init__(self, invd, ixval)
@@ -70,6 +72,8 @@ class CInvariantFact(CFunInvDictionaryRecord):
 class CInvariantNRVFact(CInvariantFact):
     """Non-relational-value fact (relation with symbolic constants)."""
 
+    __slots__ = ()
+
     def __init__(
             self, invd: "CFunInvDictionary", ixval: IndexedTableValue) -> None:
         CInvariantFact.__init__(self, invd, ixval)
@@ -96,6 +100,8 @@ class CInvariantNRVFact(CInvariantFact):
 @invregistry.register_tag("pc", CInvariantFact)
 class CParameterConstraint(CInvariantFact):
 
+    __slots__ = ()
+
     def __init__(
             self, invd: "CFunInvDictionary", ixval: IndexedTableValue) -> None:
         CInvariantFact.__init__(self, invd, ixval)
@@ -116,6 +122,8 @@ class CParameterConstraint(CInvariantFact):
 class CUnreachableFact(CInvariantFact):
     """Domain that signals unreachability."""
 
+    __slots__ = ()
+
     def __init__(
             self, invd: "CFunInvDictionary", ixval: IndexedTableValue) -> None:
         CInvariantFact.__init__(self, invd, ixval)
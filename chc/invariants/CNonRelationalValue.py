@@ -53,6 +53,8 @@ if TYPE_CHECKING:
 class CNonRelationalValue(CFunInvDictionaryRecord):
     """Base class for all non-relational values."""
 
+    __slots__ = ()
+
     def __init__(
             self, invd: "CFunInvDictionary", ixval: IndexedTableValue) -> None:
         CFunInvDictionaryRecord.__init__(self, invd, ixval)
@@ -93,6 +95,8 @@ class CNonRelationalValue(CFunInvDictionaryRecord):
 class CNRVSymbolicExpr(CNonRelationalValue):
     """Symbolic expression (consisting of symbolic constants)."""
 
+    __slots__ = ()
+
     def __init__(
             self, invd: "CFunInvDictionary", ixval: IndexedTableValue) -> None:
         CNonRelationalValue.__init__(self, invd, ixval)
@@ -113,6 +117,8 @@ class CNRVSymbolicExpr(CNonRelationalValue):
 class CNRVSymbolicBound(CNonRelationalValue):
     """Bound expressed by symbolic values."""
 
+    __slots__ = ()
+
     def __init__(
             self, invd: "CFunInvDictionary", ixval: IndexedTableValue) -> None:
         CNonRelationalValue.__init__(self, invd, ixval)
@@ -137,6 +143,8 @@ class CNRVSymbolicBound(CNonRelationalValue):
 class CNRVIntervalValue(CNonRelationalValue):
     """Numerical interval value."""
 
+    __slots__ = ()
+
     def __init__(
             self, invd: "CFunInvDictionary", ixval: IndexedTableValue) -> None:
         CNonRelationalValue.__init__(self, invd, ixval)
@@ -191,6 +199,8 @@ class CNRVIntervalValue(CNonRelationalValue):
 class CNRVBaseOffsetValue(CNonRelationalValue):
     """Symbolic base with numerical offset (interval) value."""
 
+    __slots__ = ()
+
     def __init__(
             self, invd: "CFunInvDictionary", ixval: IndexedTableValue) -> None:
         CNonRelationalValue.__init__(self, invd, ixval)
@@ -261,6 +271,8 @@ class CNRVBaseOffsetValue(CNonRelationalValue):
 class CNRVRegionSet(CNonRelationalValue):
     """Set of symbolic memory regions."""
 
+    __slots__ = ()
+
     def __init__(
             self, invd: "CFunInvDictionary", ixval: IndexedTableValue) -> None:
         CNonRelationalValue.__init__(self, invd, ixval)
@@ -285,6 +297,8 @@ class CNRVRegionSet(CNonRelationalValue):
 class CNRVInitializedSet(CNonRelationalValue):
     """Set of initialized variables."""
 
+    __slots__ = ()
+
     def __init__(
             self, invd: "CFunInvDictionary", ixval: IndexedTableValue) -> None:
         CNonRelationalValue.__init__(self, invd, ixval)
@@ -305,6 +319,8 @@ class CNRVInitializedSet(CNonRelationalValue):
 class CNRVPolicyStateSet(CNonRelationalValue):
     """State machine (currently not used)."""
 
+    __slots__ = ()
+
     def __init__(
             self, invd: "CFunInvDictionary", ixval: IndexedTableValue) -> None:
         CNonRelationalValue.__init__(self, invd, ixval)
@@ -50,6 +50,8 @@ if TYPE_CHECKING:
 
 class CVConstantValueVariable(CFunVarDictionaryRecord):
 
+    __slots__ = ()
+
     def __init__(
             self, vd: "CFunVarDictionary", ixval: IndexedTableValue) -> None:
         CFunVarDictionaryRecord.__init__(self, vd, ixval)
@@ -98,6 +100,8 @@ class CVVInitialValue(CVConstantValueVariable):
     - args[1]: index of variable type in cdictionary
     """
 
+    __slots__ = ()
+
     def __init__(
             self, vd: "CFunVarDictionary", ixval: IndexedTableValue) -> None:
         CVConstantValueVariable.__init__(self, vd, ixval)
@@ -128,6 +132,8 @@ class CVVFunctionReturnValue(CVConstantValueVariable):
     - args[3..]: indices of argument expressions to the call in the xprdictionary
     """
 
+    __slots__ = ()
+
     def __init__(
             self, vd: "CFunVarDictionary", ixval: IndexedTableValue) -> None:
         CVConstantValueVariable.__init__(self, vd, ixval)
@@ -173,6 +179,8 @@ class CVVExpFunctionReturnValue(CVConstantValueVariable):
     - args[4..]: indices of argument expressions to the call in the xprdictionary
     """
 
+    __slots__ = ()
+
     def __init__(
             self, vd: "CFunVarDictionary", ixval: IndexedTableValue) -> None:
         CVConstantValueVariable.__init__(self, vd, ixval)
@@ -219,6 +227,8 @@ class CVVSideEffectValue(CVConstantValueVariable):
     - args[5..]: indices of the arguments passed to the call in xprdictionary
     """
 
+    __slots__ = ()
+
     def __init__(
             self, vd: "CFunVarDictionary", ixval: IndexedTableValue) -> None:
         CVConstantValueVariable.__init__(self, vd, ixval)
@@ -273,6 +283,8 @@ class CVVExpSideEffectValue(CVConstantValueVariable):
     - args[5..]: indices of the arguments passed to the call in xprdictionary
     """
 
+    __slots__ = ()
+
     def __init__(
             self, vd: "CFunVarDictionary", ixval: IndexedTableValue) -> None:
         CVConstantValueVariable.__init__(self, vd, ixval)
@@ -323,6 +335,8 @@ class CVVSymbolicValue(CVConstantValueVariable):
     - args[1]: index of the type of the expression in the cdictionary
     """
 
+    __slots__ = ()
+
     def __init__(
             self, vd: "CFunVarDictionary", ixval: IndexedTableValue) -> None:
         CVConstantValueVariable.__init__(self, vd, ixval)
@@ -353,6 +367,8 @@ class CVVTaintedValue(CVConstantValueVariable):
     - args[3]: index of the type of the variable in the cdictionary
     """
 
+    __slots__ = ()
+
     def __init__(
             self, vd: "CFunVarDictionary", ixval: IndexedTableValue) -> None:
         CVConstantValueVariable.__init__(self, vd, ixval)
@@ -396,6 +412,8 @@ class CVVTaintedValue(CVConstantValueVariable):
 @varregistry.register_tag("bs", CVConstantValueVariable)
 class CVVByteSequence(CVConstantValueVariable):
 
+    __slots__ = ()
+
     def __init__(
             self, vd: "CFunVarDictionary", ixval: IndexedTableValue) -> None:
         CVConstantValueVariable.__init__(self, vd, ixval)
@@ -430,6 +448,8 @@ class CVVMemoryAddress(CVConstantValueVariable):
     - args[1]: index of the offset in the cdictionary
     """
 
+    __slots__ = ()
+
     def __init__(
             self, vd: "CFunVarDictionary", ixval: IndexedTableValue) -> None:
         CVConstantValueVariable.__init__(self, vd, ixval)
@@ -44,6 +44,8 @@ if TYPE_CHECKING:
 
 class CVMemoryBase(CFunVarDictionaryRecord):
 
+    __slots__ = ()
+
     def __init__(
             self, vd: "CFunVarDictionary", ixval: IndexedTableValue) -> None:
         CFunVarDictionaryRecord.__init__(self, vd, ixval)
@@ -91,6 +93,8 @@ class CVMemoryBase(CFunVarDictionaryRecord):
 @varregistry.register_tag("null", CVMemoryBase)
 class CVMemoryBaseNull(CVMemoryBase):
 
+    __slots__ = ()
+
     def __init__(
             self, vd: "CFunVarDictionary", ixval: IndexedTableValue) -> None:
         CVMemoryBase.__init__(self, vd, ixval)
@@ -120,6 +124,8 @@ class CVMemoryBaseNull(CVMemoryBase):
 @varregistry.register_tag("sa", CVMemoryBase)
 class CVMemoryBaseStackAddress(CVMemoryBase):
 
+    __slots__ = ()
+
     def __init__(
             self, vd: "CFunVarDictionary", ixval: IndexedTableValue) -> None:
         CVMemoryBase.__init__(self, vd, ixval)
@@ -139,6 +145,8 @@ class CVMemoryBaseStackAddress(CVMemoryBase):
 @varregistry.register_tag("ga", CVMemoryBase)
 class CVMemoryBaseGlobalAddress(CVMemoryBase):
 
+    __slots__ = ()
+
     def __init__(
             self, vd: "CFunVarDictionary", ixval: IndexedTableValue) -> None:
         CVMemoryBase.__init__(self, vd, ixval)
@@ -158,6 +166,8 @@ class CVMemoryBaseGlobalAddress(CVMemoryBase):
 @varregistry.register_tag("saa", CVMemoryBase)
 class CVMemoryBaseAllocStackAddress(CVMemoryBase):
 
+    __slots__ = ()
+
     def __init__(
             self, vd: "CFunVarDictionary", ixval: IndexedTableValue) -> None:
         CVMemoryBase.__init__(self, vd, ixval)
@@ -177,6 +187,8 @@ class CVMemoryBaseAllocStackAddress(CVMemoryBase):
 @varregistry.register_tag("ha", CVMemoryBase)
 class CVMemoryBaseHeapAddress(CVMemoryBase):
 
+    __slots__ = ()
+
     def __init__(
             self, vd: "CFunVarDictionary", ixval: IndexedTableValue) -> None:
         CVMemoryBase.__init__(self, vd, ixval)
@@ -200,6 +212,8 @@ class CVMemoryBaseHeapAddress(CVMemoryBase):
 @varregistry.register_tag("bv", CVMemoryBase)
 class CVMemoryBaseBaseVar(CVMemoryBase):
 
+    __slots__ = ()
+
     def __init__(
             self, vd: "CFunVarDictionary", ixval: IndexedTableValue) -> None:
         CVMemoryBase.__init__(self, vd, ixval)
@@ -219,6 +233,8 @@ class CVMemoryBaseBaseVar(CVMemoryBase):
 @varregistry.register_tag("str", CVMemoryBase)
 class CVMemoryBaseStringLiteral(CVMemoryBase):
 
+    __slots__ = ()
+
     def __init__(
             self, vd: "CFunVarDictionary", ixval: IndexedTableValue) -> None:
         CVMemoryBase.__init__(self, vd, ixval)
@@ -238,6 +254,8 @@ class CVMemoryBaseStringLiteral(CVMemoryBase):
 @varregistry.register_tag("ui", CVMemoryBase)
 class CVMemoryBaseUninterpreted(CVMemoryBase):
 
+    __slots__ = ()
+
     def __init__(
             self, vd: "CFunVarDictionary", ixval: IndexedTableValue) -> None:
         CVMemoryBase.__init__(self, vd, ixval)
@@ -257,6 +275,8 @@ class CVMemoryBaseUninterpreted(CVMemoryBase):
 @varregistry.register_tag("fr", CVMemoryBase)
 class CVMemoryBaseFreed(CVMemoryBase):
 
+    __slots__ = ()
+
     def __init__(
             self, vd: "CFunVarDictionary", ixval: IndexedTableValue) -> None:
         CVMemoryBase.__init__(self, vd, ixval)
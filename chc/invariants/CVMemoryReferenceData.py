@@ -45,6 +45,8 @@ if TYPE_CHECKING:
 
 class CVMemoryReferenceData(CFunVarDictionaryRecord):
 
+    __slots__ = ()
+
     def __init__(
             self, vd: "CFunVarDictionary", ixval: IndexedTableValue) -> None:
         CFunVarDictionaryRecord.__init__(self, vd, ixval)
@@ -50,6 +50,8 @@ if TYPE_CHECKING:
 
 class CVariableDenotation(CFunVarDictionaryRecord):
 
+    __slots__ = ()
+
     def __init__(
             self, vd: "CFunVarDictionary", ixval: IndexedTableValue) -> None:
         CFunVarDictionaryRecord.__init__(self, vd, ixval)
@@ -97,6 +99,8 @@ class CVariableDenotation(CFunVarDictionaryRecord):
 @varregistry.register_tag("lv", CVariableDenotation)
 class CVLocalVariable(CVariableDenotation):
 
+    __slots__ = ()
+
     def __init__(
             self, vd: "CFunVarDictionary", ixval: IndexedTableValue) -> None:
         CVariableDenotation.__init__(self, vd, ixval)
@@ -120,6 +124,8 @@ class CVLocalVariable(CVariableDenotation):
 @varregistry.register_tag("gv", CVariableDenotation)
 class CVGlobalVariable(CVariableDenotation):
 
+    __slots__ = ()
+
     def __init__(
             self, vd: "CFunVarDictionary", ixval: IndexedTableValue) -> None:
         CVariableDenotation.__init__(self, vd, ixval)
@@ -139,6 +145,8 @@ class CVGlobalVariable(CVariableDenotation):
 @varregistry.register_tag("mv", CVariableDenotation)
 class CVMemoryVariable(CVariableDenotation):
 
+    __slots__ = ()
+
     def __init__(
             self, vd: "CFunVarDictionary", ixval: IndexedTableValue) -> None:
         CVariableDenotation.__init__(self, vd, ixval)
@@ -175,6 +183,8 @@ class CVMemoryVariable(CVariableDenotation):
 @varregistry.register_tag("mrv", CVariableDenotation)
 class CVMemoryRegionVariable(CVariableDenotation):
 
+    __slots__ = ()
+
     def __init__(
             self, vd: "CFunVarDictionary", ixval: IndexedTableValue) -> None:
         CVariableDenotation.__init__(self, vd, ixval)
@@ -203,6 +213,8 @@ class CVMemoryRegionVariable(CVariableDenotation):
 @varregistry.register_tag("rv", CVariableDenotation)
 class CVReturnVariable(CVariableDenotation):
 
+    __slots__ = ()
+
     def __init__(
             self, vd: "CFunVarDictionary", ixval: IndexedTableValue) -> None:
         CVariableDenotation.__init__(self, vd, ixval)
@@ -222,6 +234,8 @@ class CVReturnVariable(CVariableDenotation):
 @varregistry.register_tag("fv", CVariableDenotation)
 class CVFieldVariable(CVariableDenotation):
 
+    __slots__ = ()
+
     def __init__(
             self, vd: "CFunVarDictionary", ixval: IndexedTableValue) -> None:
         CVariableDenotation.__init__(self, vd, ixval)
@@ -245,6 +259,8 @@ class CVFieldVariable(CVariableDenotation):
 @varregistry.register_tag("cv", CVariableDenotation)
 class CVCheckVariable(CVariableDenotation):
 
+    __slots__ = ()
+
     def __init__(
             self, vd: "CFunVarDictionary", ixval: IndexedTableValue) -> None:
         CVariableDenotation.__init__(self, vd, ixval)
@@ -280,6 +296,8 @@ class CVCheckVariable(CVariableDenotation):
 @varregistry.register_tag("xv", CVariableDenotation)
 class CVAugmentationVariable(CVariableDenotation):
 
+    __slots__ = ()
+
     def __init__(
             self, vd: "CFunVarDictionary", ixval: IndexedTableValue) -> None:
         CVariableDenotation.__init__(self, vd, ixval)
@@ -299,6 +317,8 @@ class CVAugmentationVariable(CVariableDenotation):
 @varregistry.register_tag("av", CVariableDenotation)
 class CVAuxiliaryVariable(CVariableDenotation):
 
+    __slots__ = ()
+
     def __init__(
             self, vd: "CFunVarDictionary", ixval: IndexedTableValue) -> None:
         CVariableDenotation.__init__(self, vd, ixval)
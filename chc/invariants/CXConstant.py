@@ -45,6 +45,8 @@ if TYPE_CHECKING:
 
 class CXConstant(CFunXprDictionaryRecord):
 
+    __slots__ = ()
+
     def __init__(
             self, xd: "CFunXprDictionary", ixval: IndexedTableValue) -> None:
         CFunXprDictionaryRecord.__init__(self, xd, ixval)
@@ -80,6 +82,8 @@ class CXConstant(CFunXprDictionaryRecord):
 @xprregistry.register_tag("ss", CXConstant)
 class CXSymSet(CXConstant):
 
+    __slots__ = ()
+
     def __init__(
             self, xd: "CFunXprDictionary", ixval: IndexedTableValue) -> None:
         CXConstant.__init__(self, xd, ixval)
@@ -99,6 +103,8 @@ class CXSymSet(CXConstant):
 @xprregistry.register_tag("ic", CXConstant)
 class CXIntConst(CXConstant):
 
+    __slots__ = ()
+
     def __init__(
             self, xd: "CFunXprDictionary", ixval: IndexedTableValue) -> None:
         CFunXprDictionaryRecord.__init__(self, xd, ixval)
@@ -118,6 +124,8 @@ class CXIntConst(CXConstant):
 @xprregistry.register_tag("bc", CXConstant)
 class CXBoolConst(CXConstant):
 
+    __slots__ = ()
+
     def __init__(
             self, xd: "CFunXprDictionary", ixval: IndexedTableValue) -> None:
         CFunXprDictionaryRecord.__init__(self, xd, ixval)
@@ -141,6 +149,8 @@ class CXBoolConst(CXConstant):
 @xprregistry.register_tag("r", CXConstant)
 class CXRandom(CXConstant):
 
+    __slots__ = ()
+
     def __init__(
             self, xd: "CFunXprDictionary", ixval: IndexedTableValue) -> None:
         CFunXprDictionaryRecord.__init__(self, xd, ixval)
@@ -156,6 +166,8 @@ class CXRandom(CXConstant):
 @xprregistry.register_tag("ui", CXConstant)
 class CXUnknownInt(CXConstant):
 
+    __slots__ = ()
+
     def __init__(
             self, xd: "CFunXprDictionary", ixval: IndexedTableValue) -> None:
         CFunXprDictionaryRecord.__init__(self, xd, ixval)
@@ -171,6 +183,8 @@ class CXUnknownInt(CXConstant):
 @xprregistry.register_tag("us", CXConstant)
 class CXUnknownSet(CXConstant):
 
+    __slots__ = ()
+
     def __init__(
             self, xd: "CFunXprDictionary", ixval: IndexedTableValue) -> None:
         CFunXprDictionaryRecord.__init__(self, xd, ixval)
@@ -41,6 +41,8 @@ if TYPE_CHECKING:
 
 class CXSymbol(CFunXprDictionaryRecord):
 
+    __slots__ = ()
+
     def __init__(
             self, xd: "CFunXprDictionary", ixval: IndexedTableValue) -> None:
         CFunXprDictionaryRecord.__init__(self, xd, ixval)
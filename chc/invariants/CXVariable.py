@@ -44,6 +44,8 @@ if TYPE_CHECKING:
 
 class CXVariable(CFunXprDictionaryRecord):
 
+    __slots__ = ()
+
     def __init__(
             self, xd: "CFunXprDictionary", ixval: IndexedTableValue) -> None:
         CFunXprDictionaryRecord.__init__(self, xd, ixval)
@@ -55,6 +55,8 @@ xpr_operator_strings = {
 
 class CXXpr(CFunXprDictionaryRecord):
 
+    __slots__ = ()
+
     def __init__(
             self, xd: "CFunXprDictionary", ixval: IndexedTableValue) -> None:
         CFunXprDictionaryRecord.__init__(self, xd, ixval)
@@ -82,6 +84,8 @@ class CXXpr(CFunXprDictionaryRecord):
 @xprregistry.register_tag("v", CXXpr)
 class CXXVar(CXXpr):
 
+    __slots__ = ()
+
     def __init__(
             self, xd: "CFunXprDictionary", ixval: IndexedTableValue) -> None:
         CXXpr.__init__(self, xd, ixval)
@@ -101,6 +105,8 @@ class CXXVar(CXXpr):
 @xprregistry.register_tag("c", CXXpr)
 class CXXConst(CXXpr):
 
+    __slots__ = ()
+
     def __init__(
             self, xd: "CFunXprDictionary", ixval: IndexedTableValue) -> None:
         CXXpr.__init__(self, xd, ixval)
@@ -120,6 +126,8 @@ class CXXConst(CXXpr):
 @xprregistry.register_tag("x", CXXpr)
 class CXXOp(CXXpr):
 
+    __slots__ = ()
+
     def __init__(
             self, xd: "CFunXprDictionary", ixval: IndexedTableValue) -> None:
         CXXpr.__init__(self, xd, ixval)
@@ -162,6 +170,8 @@ class CXXOp(CXXpr):
 @xprregistry.register_tag("a", CXXpr)
 class CXXAttr(CXXpr):
 
+    __slots__ = ()
+
     def __init__(
             self, xd: "CFunXprDictionary", ixval: IndexedTableValue) -> None:
         CXXpr.__init__(self, xd, ixval)
@@ -184,6 +194,8 @@ class CXXAttr(CXXpr):
 
 class CXprList(CFunXprDictionaryRecord):
 
+    __slots__ = ()
+
     def __init__(
             self, xd: "CFunXprDictionary", ixval: IndexedTableValue) -> None:
         CFunXprDictionaryRecord.__init__(self, xd, ixval)
@@ -198,6 +210,8 @@ class CXprList(CFunXprDictionaryRecord):
 
 class CXprListList(CFunXprDictionaryRecord):
 
+    __slots__ = ()
+
     def __init__(
             self, xd: "CFunXprDictionary", ixval: IndexedTableValue) -> None:
         CFunXprDictionaryRecord.__init__(self, xd, ixval)
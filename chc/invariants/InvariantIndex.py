@@ -0,0 +1,273 @@
+# ------------------------------------------------------------------------------
+# CodeHawk C Analyzer
+# Author: Henny Sipma
+# ------------------------------------------------------------------------------
+# The MIT License (MIT)
+#
+# Copyright (c) 2026 Aarno Labs LLC
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# ------------------------------------------------------------------------------
+"""Project-wide inverted index of non-relational invariant facts.
+
+The index maps a variable name and a kind of non-relational value to a
+postings list of the locations (file, function, context) where a fact of
+that kind holds for a variable with that name. The kinds indexed are:
+
+- constant: interval with a single value
+- interval: interval with at least one bound
+- regionset: set of symbolic memory regions
+- baseoffset: symbolic base with a numerical offset interval
+
+Postings are stored columnwise as lists of integers that refer to shared
+tables of function names, context strings, and value strings, with the
+lower and upper bounds of constants, intervals, and base offsets (None if
+unbounded) and a flag that indicates whether a base offset may be null.
+Facts on check variables are not indexed.
+"""
+
+import json
+import os
+
+from typing import Any, cast, Dict, List, Optional, Tuple, TYPE_CHECKING
+
+from chc.invariants.CInvariantFact import CInvariantNRVFact
+from chc.invariants.CNonRelationalValue import (
+    CNRVBaseOffsetValue, CNRVIntervalValue)
+
+import chc.util.fileutil as UF
+from chc.util.loggingutil import chklogger
+
+if TYPE_CHECKING:
+    from chc.app.CApplication import CApplication
+    from chc.app.CFunction import CFunction
+    from chc.invariants.CNonRelationalValue import CNonRelationalValue
+
+
+indexversion = 1
+
+invariantkinds: List[str] = ["constant", "interval", "regionset", "baseoffset"]
+
+postingcolumns: List[str] = ["fn", "ctxt", "value", "lb", "ub", "null"]
+
+
+class InvariantPosting:
+    """Location and value of a single indexed fact."""
+
+    def __init__(
+            self,
+            filename: str,
+            functionname: str,
+            context: str,
+            value: str,
+            lowerbound: Optional[int],
+            upperbound: Optional[int],
+            canbenull: bool) -> None:
+        self.filename = filename
+        self.functionname = functionname
+        self.context = context
+        self.value = value
+        self.lowerbound = lowerbound
+        self.upperbound = upperbound
+        self.canbenull = canbenull
+
+    def is_within(self, lb: int, ub: int) -> bool:
+        """Returns true if the value is known to be in [lb, ub]."""
+
+        return (
+            self.lowerbound is not None
+            and self.upperbound is not None
+            and lb <= self.lowerbound
+            and self.upperbound <= ub)
+
+    def __str__(self) -> str:
+        return (
+            self.filename
+            + ":"
+            + self.functionname
+            + " "
+            + self.context
+            + " : "
+            + self.value)
+
+
+def nrv_kind_and_bounds(
+        nrv: "CNonRelationalValue"
+) -> Optional[Tuple[str, Optional[int], Optional[int], bool]]:
+    """Returns the index kind, bounds, and null flag of a value, if indexed."""
+
+    if nrv.is_interval_value:
+        iv = cast(CNRVIntervalValue, nrv)
+        lb = iv.lowerbound
+        ub = iv.upperbound
+        if lb is None and ub is None:
+            return None
+        kind = "constant" if iv.has_value() else "interval"
+        return (
+            kind,
+            None if lb is None else lb.value,
+            None if ub is None else ub.value,
+            False)
+    if nrv.is_base_offset_value:
+        bv = cast(CNRVBaseOffsetValue, nrv)
+        lb = bv.lowerbound
+        ub = bv.upperbound
+        return (
+            "baseoffset",
+            None if lb is None else lb.value,
+            None if ub is None else ub.value,
+            bv.canbenull)
+    if nrv.is_region_set:
+        return ("regionset", None, None, False)
+    return None
+
+
+class InvariantIndex:
+    """Inverted index from variable name and value kind to locations."""
+
+    def __init__(self) -> None:
+        self._files: List[str] = []
+        self._fileindex: Dict[str, int] = {}
+        self._functions: List[Tuple[int, str]] = []
+        self._strings: List[str] = []
+        self._stringindex: Dict[str, int] = {}
+        # variable name -> kind -> column name -> values
+        self._postings: Dict[str, Dict[str, Dict[str, List[Any]]]] = {}
+
+    @property
+    def variablenames(self) -> List[str]:
+        return sorted(self._postings.keys())
+
+    def _string_id(self, s: str) -> int:
+        if s not in self._stringindex:
+            self._stringindex[s] = len(self._strings)
+            self._strings.append(s)
+        return self._stringindex[s]
+
+    def add_function(self, cfun: "CFunction") -> None:
+        filename = cfun.cfile.name
+        if filename not in self._fileindex:
+            self._fileindex[filename] = len(self._files)
+            self._files.append(filename)
+        fnid = len(self._functions)
+        self._functions.append((self._fileindex[filename], cfun.name))
+        ctxtd = cfun.cfile.contextdictionary
+        vard = cfun.vardictionary
+        invtable = cfun.invarianttable
+        for (ictxt, facts) in invtable.invariants.items():
+            ctxtid: Optional[int] = None
+            for fact in facts:
+                if not fact.is_nrv_fact:
+                    continue
+                fact = cast(CInvariantNRVFact, fact)
+                var = fact.variable
+                if (var.has_denotation()
+                        and vard.get_c_variable_denotation(
+                            var.seqnr).is_check_variable):
+                    continue
+                nrv = fact.non_relational_value
+                kindbounds = nrv_kind_and_bounds(nrv)
+                if kindbounds is None:
+                    continue
+                (kind, lb, ub, canbenull) = kindbounds
+                if ctxtid is None:
+                    ctxt = ctxtd.get_program_context(ictxt)
+                    ctxtid = self._string_id(ctxt.cfg_context.reverse_repr)
+                columns = self._postings.setdefault(
+                    var.name, {}).setdefault(
+                        kind, {c: [] for c in postingcolumns})
+                columns["fn"].append(fnid)
+                columns["ctxt"].append(ctxtid)
+                columns["value"].append(self._string_id(str(nrv)))
+                columns["lb"].append(lb)
+                columns["ub"].append(ub)
+                columns["null"].append(1 if canbenull else 0)
+
+    @staticmethod
+    def from_application(capp: "CApplication") -> "InvariantIndex":
+        result = InvariantIndex()
+        capp.iter_functions(result.add_function)
+        chklogger.logger.info(
+            "Built invariant index for %d functions with %d variable names",
+            len(result._functions), len(result._postings))
+        return result
+
+    def lookup(
+            self,
+            variablename: str,
+            kinds: List[str] = invariantkinds,
+            filefilter: Optional[str] = None,
+            functionfilter: Optional[str] = None) -> List[InvariantPosting]:
+        """Returns the postings for a variable name, in index order."""
+
+        result: List[InvariantPosting] = []
+        for kind in kinds:
+            columns = self._postings.get(variablename, {}).get(kind)
+            if columns is None:
+                continue
+            for (fn, ctxt, value, lb, ub, null) in zip(
+                    *[columns[c] for c in postingcolumns]):
+                (fileid, fname) = self._functions[fn]
+                filename = self._files[fileid]
+                if filefilter is not None and filefilter != filename:
+                    continue
+                if functionfilter is not None and functionfilter != fname:
+                    continue
+                result.append(InvariantPosting(
+                    filename,
+                    fname,
+                    self._strings[ctxt],
+                    self._strings[value],
+                    lb,
+                    ub,
+                    null == 1))
+        return result
+
+    def save(self, targetpath: str, projectname: str) -> None:
+        filename = UF.get_invariantindex_filename(targetpath, projectname)
+        d: Dict[str, Any] = {}
+        d["version"] = indexversion
+        d["files"] = self._files
+        d["functions"] = [[fileid, fname] for (fileid, fname) in self._functions]
+        d["strings"] = self._strings
+        d["postings"] = self._postings
+        with open(filename, "w") as fp:
+            json.dump(d, fp, separators=(",", ":"))
+        chklogger.logger.info("Saved invariant index to %s", filename)
+
+    @staticmethod
+    def load(targetpath: str, projectname: str) -> Optional["InvariantIndex"]:
+        """Returns the saved index, or None if it is absent or outdated."""
+
+        filename = UF.get_invariantindex_filename(targetpath, projectname)
+        if not os.path.isfile(filename):
+            return None
+        with open(filename, "r") as fp:
+            d = json.load(fp)
+        if d.get("version") != indexversion:
+            chklogger.logger.warning(
+                "Invariant index %s has version %s; ignored",
+                filename, str(d.get("version")))
+            return None
+        result = InvariantIndex()
+        result._files = d["files"]
+        result._functions = [(fileid, fname) for [fileid, fname] in d["functions"]]
+        result._strings = d["strings"]
+        result._postings = d["postings"]
+        return result
@@ -41,6 +41,7 @@ from chc.linker.CompCompatibility import CompCompatibility
 
 import chc.util.fileutil as UF
 from chc.util.loggingutil import chklogger
+from chc.util.tracingutil import chktracer
 from chc.util.UnionFind import UnionFind
 import chc.util.xmlutil as UX
 
@@ -118,6 +119,7 @@ class CLinker:
         return self.sharedinstances
     """
 
+    @chktracer.traced("link-compinfos")
     def link_compinfos(self) -> None:
 
         chklogger.logger.info("Link compinfos")
@@ -190,6 +192,7 @@ class CLinker:
 
     """
 
+    @chktracer.traced("link-varinfos")
     def link_varinfos(self) -> None:
         def f(cfile: "CFile") -> None:
             varinfos = cfile.declarations.get_global_varinfos()
@@ -204,6 +207,7 @@ class CLinker:
                 filevar = FileVarReference(fid, vid)
                 self.indexmanager.add_vid2gvid(filevar, gvid)
 
+    @chktracer.traced("save-global-compinfos")
     def save_global_compinfos(self) -> None:
         path = self.capp.targetpath
         xroot = UX.get_xml_header("globals", "globals")
@@ -212,5 +216,4 @@ class CLinker:
         self.declarations.write_xml(xnode)
         filename = UF.get_global_definitions_filename(path, self.capp.projectname)
         chklogger.logger.info("Saving global compinfos to %s", filename)
-        with open(filename, "w") as fp:
-            fp.write(UX.doc_to_pretty(ET.ElementTree(xroot)))
+        UF.write_xml_file(filename, xroot)
@@ -45,6 +45,8 @@ if TYPE_CHECKING:
 class AssumptionType(CFunPODictionaryRecord):
     """Base class for assumption types."""
 
+    __slots__ = ()
+
     def __init__(
             self, pod: "CFunPODictionary", ixval: IndexedTableValue
     ) -> None:
@@ -85,6 +87,8 @@ class LocalAssumptionType(AssumptionType):
     * args[0]: index of predicate in predicate dictionary
     """
 
+    __slots__ = ()
+
     def __init__(
             self, pod: "CFunPODictionary", ixval: IndexedTableValue
     ) -> None:
@@ -114,6 +118,8 @@ class ApiAssumptionType(AssumptionType):
     * args[0]: index of predicate in predicate dictionary
     """
 
+    __slots__ = ()
+
     def __init__(
             self, pod: "CFunPODictionary", ixval: IndexedTableValue
     ) -> None:
@@ -148,6 +154,8 @@ class GlobalApiAssumptionType(AssumptionType):
     * args[0]: index of predicate in predicate dictionary
     """
 
+    __slots__ = ()
+
     def __init__(
             self, pod: "CFunPODictionary", ixval: IndexedTableValue
     ) -> None:
@@ -177,6 +185,8 @@ class PostconditionType(AssumptionType):
     * args[1]: index of xpredicate in interface dictionary
     """
 
+    __slots__ = ()
+
     def __init__(
             self, pod: "CFunPODictionary", ixval: IndexedTableValue
     ) -> None:
@@ -209,6 +219,8 @@ class GlobalAssumptionType(AssumptionType):
     * args[0]: index of xpredicate in interfacedictionary
     """
 
+    __slots__ = ()
+
     def __init__(
             self, pod: "CFunPODictionary", ixval: IndexedTableValue
     ) -> None:
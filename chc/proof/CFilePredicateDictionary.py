@@ -55,6 +55,45 @@ class CFilePredicateDictionary(object):
         self._objmaps: Dict[
             str, Callable[[], Mapping[int, IndexedTableValue]]] = {
                 "predicate": self.get_predicate_map}
+        # predicate class -> routine that indexes its arguments
+        self._predicate_indexers: Dict[
+            type, Callable[[Any, Dict[int, "CExp"]], List[int]]] = {
+                PO.CPONotNull: self._args_exp,
+                PO.CPONull: self._args_exp,
+                PO.CPOValidMem: self._args_exp,
+                PO.CPOInScope: self._args_exp,
+                PO.CPOStackAddressEscape: self._args_stack_address_escape,
+                PO.CPOAllocationBase: self._args_exp,
+                PO.CPOTypeAtOffset: self._args_typ_exp,
+                PO.CPOLowerBound: self._args_typ_exp,
+                PO.CPOUpperBound: self._args_typ_exp,
+                PO.CPOIndexLowerBound: self._args_exp,
+                PO.CPOIndexUpperBound: self._args_exp_bound,
+                PO.CPOInitialized: self._args_lval,
+                PO.CPOLocallyInitialized: self._args_lval,
+                PO.CPOInitializedRange: self._args_exp_size,
+                PO.CPOCast: self._args_cast,
+                PO.CPOPointerCast: self._args_cast,
+                PO.CPOSignedToSignedCastLB: self._args_exp,
+                PO.CPOSignedToSignedCastUB: self._args_exp,
+                PO.CPOSignedToUnsignedCastLB: self._args_exp,
+                PO.CPOSignedToUnsignedCastUB: self._args_exp,
+                PO.CPOUnsignedToSignedCast: self._args_exp,
+                PO.CPOUnsignedToUnsignedCast: self._args_exp,
+                PO.CPONotZero: self._args_exp,
+                PO.CPONonNegative: self._args_exp,
+                PO.CPONoOverlap: self._args_exp1_exp2,
+                PO.CPONullTerminated: self._args_exp,
+                PO.CPOIntUnderflow: self._args_exp1_exp2,
+                PO.CPOIntOverflow: self._args_exp1_exp2,
+                PO.CPOWidthOverflow: self._args_exp,
+                PO.CPOPtrLowerBound: self._args_typ_exp1_exp2,
+                PO.CPOPtrUpperBound: self._args_typ_exp1_exp2,
+                PO.CPOPtrUpperBoundDeref: self._args_typ_exp1_exp2,
+                PO.CPOValueConstraint: self._args_exp,
+                PO.CPOCommonBase: self._args_exp1_exp2,
+                PO.CPOBuffer: self._args_exp_size,
+                PO.CPORevBuffer: self._args_exp_size}
         self.initialize(xnode)
 
     @property
@@ -122,220 +161,63 @@ class CFilePredicateDictionary(object):
             itv = IndexedTableValue(index, tags, args)
             return pdregistry.mk_instance(self, itv, PO.CPOPredicate)
 
-        if p.is_not_null:
-            p = cast(PO.CPONotNull, p)
-            args = [self.dictionary.index_exp(p.exp, subst=subst)]
-
-        elif p.is_null:
-            p = cast(PO.CPONull, p)
-            args = [self.dictionary.index_exp(p.exp, subst=subst)]
-
-        elif p.is_valid_mem:
-            p = cast(PO.CPOValidMem, p)
-            args = [self.dictionary.index_exp(p.exp, subst=subst)]
-
-        elif p.is_in_scope:
-            p = cast(PO.CPOInScope, p)
-            args = [self.dictionary.index_exp(p.exp, subst=subst)]
-
-            '''
-        elif p.is_can_leave_scope:
-            p = cast(PO.CPOCanLeaveScope, p)
-            args = [self.dictionary.index_exp(p.exp, subst=subst)]
-            '''
-
-        elif p.is_stack_address_escape:
-            p = cast(PO.CPOStackAddressEscape, p)
-            if p.has_lval():
-                args = [
-                    self.dictionary.index_lval(p.lval, subst=subst),
-                    self.dictionary.index_exp(p.exp, subst=subst),
-                ]
-            else:
-                args = [-1, self.dictionary.index_exp(p.exp, subst=subst)]
-
-        elif p.is_allocation_base:
-            p = cast(PO.CPOAllocationBase, p)
-            args = [self.dictionary.index_exp(p.exp, subst=subst)]
-
-        elif p.is_type_at_offset:
-            p = cast(PO.CPOTypeAtOffset, p)
-            args = [
-                self.dictionary.index_typ(p.typ),
-                self.dictionary.index_exp(p.exp, subst=subst),
-            ]
-
-        elif p.is_lower_bound:
-            p = cast(PO.CPOLowerBound, p)
-            args = [
-                self.dictionary.index_typ(p.typ),
-                self.dictionary.index_exp(p.exp, subst=subst),
-            ]
-
-        elif p.is_upper_bound:
-            p = cast(PO.CPOUpperBound, p)
-            args = [
-                self.dictionary.index_typ(p.typ),
-                self.dictionary.index_exp(p.exp, subst=subst),
-            ]
-
-        elif p.is_index_lower_bound:
-            p = cast(PO.CPOIndexLowerBound, p)
-            args = [self.dictionary.index_exp(p.exp, subst=subst)]
-
-        elif p.is_index_upper_bound:
-            p = cast(PO.CPOIndexUpperBound, p)
-            args = [
-                self.dictionary.index_exp(p.exp, subst=subst),
-                self.dictionary.index_exp(p.bound, subst=subst),
-            ]
-
-        elif p.is_initialized:
-            p = cast(PO.CPOInitialized, p)
-            args = [self.dictionary.index_lval(p.lval, subst=subst)]
-
-        elif p.is_locally_initialized:
-            p = cast(PO.CPOLocallyInitialized, p)
-            args = [self.dictionary.index_lval(p.lval, subst=subst)]
-
-        elif p.is_initialized_range:
-            p = cast(PO.CPOInitializedRange, p)
-            args = [
-                self.dictionary.index_exp(p.exp, subst=subst),
-                self.dictionary.index_exp(p.size, subst=subst),
-            ]
-
-        elif p.is_cast:
-            p = cast(PO.CPOCast, p)
-            args = [
-                self.dictionary.index_typ(p.srctyp),
-                self.dictionary.index_typ(p.tgttyp),
-                self.dictionary.index_exp(p.exp, subst=subst),
-            ]
-
-        elif p.is_pointer_cast:
-            p = cast(PO.CPOPointerCast, p)
-            args = [
-                self.dictionary.index_typ(p.srctyp),
-                self.dictionary.index_typ(p.tgttyp),
-                self.dictionary.index_exp(p.exp, subst=subst),
-            ]
-
-        elif p.is_signed_to_signed_cast_lb:
-            p = cast(PO.CPOSignedToSignedCastLB, p)
-            args = [self.dictionary.index_exp(p.exp, subst=subst)]
-
-        elif p.is_signed_to_signed_cast_ub:
-            p = cast(PO.CPOSignedToSignedCastUB, p)
-            args = [self.dictionary.index_exp(p.exp, subst=subst)]
-
-        elif p.is_signed_to_unsigned_cast_lb:
-            p = cast(PO.CPOSignedToUnsignedCastLB, p)
-            args = [self.dictionary.index_exp(p.exp, subst=subst)]
-
-        elif p.is_signed_to_unsigned_cast_ub:
-            p = cast(PO.CPOSignedToUnsignedCastUB, p)
-            args = [self.dictionary.index_exp(p.exp, subst=subst)]
-
-        elif p.is_unsigned_to_signed_cast:
-            p = cast(PO.CPOUnsignedToSignedCast, p)
-            args = [self.dictionary.index_exp(p.exp, subst=subst)]
-
-        elif p.is_unsigned_to_unsigned_cast:
-            p = cast(PO.CPOUnsignedToSignedCast, p)
-            args = [self.dictionary.index_exp(p.exp, subst=subst)]
-
-        elif p.is_not_zero:
-            p = cast(PO.CPONotZero, p)
-            args = [self.dictionary.index_exp(p.exp, subst=subst)]
-
-        elif p.is_non_negative:
-            p = cast(PO.CPONonNegative, p)
-            args = [self.dictionary.index_exp(p.exp, subst=subst)]
-
-        elif p.is_no_overlap:
-            p = cast(PO.CPONoOverlap, p)
-            args = [
-                self.dictionary.index_exp(p.exp1, subst=subst),
-                self.dictionary.index_exp(p.exp2, subst=subst),
-            ]
-
-        elif p.is_null_terminated:
-            p = cast(PO.CPONullTerminated, p)
-            args = [self.dictionary.index_exp(p.exp, subst=subst)]
-
-        elif p.is_int_underflow:
-            p = cast(PO.CPOIntUnderflow, p)
-            args = [
-                self.dictionary.index_exp(p.exp1, subst=subst),
-                self.dictionary.index_exp(p.exp2, subst=subst),
-            ]
-
-        elif p.is_int_overflow:
-            p = cast(PO.CPOIntOverflow, p)
-            args = [
-                self.dictionary.index_exp(p.exp1, subst=subst),
-                self.dictionary.index_exp(p.exp2, subst=subst),
-            ]
-
-        elif p.is_width_overflow:
-            p = cast(PO.CPOWidthOverflow, p)
-            args = [self.dictionary.index_exp(p.exp, subst=subst)]
-
-        elif p.is_ptr_lower_bound:
-            p = cast(PO.CPOPtrLowerBound, p)
-            args = [
-                self.dictionary.index_typ(p.typ),
-                self.dictionary.index_exp(p.exp1, subst=subst),
-                self.dictionary.index_exp(p.exp2, subst=subst),
-            ]
-
-        elif p.is_ptr_upper_bound:
-            p = cast(PO.CPOPtrUpperBound, p)
-            args = [
-                self.dictionary.index_typ(p.typ),
-                self.dictionary.index_exp(p.exp1, subst=subst),
-                self.dictionary.index_exp(p.exp2, subst=subst),
-            ]
-
-        elif p.is_ptr_upper_bound_deref:
-            p = cast(PO.CPOPtrUpperBoundDeref, p)
-            args = [
-                self.dictionary.index_typ(p.typ),
-                self.dictionary.index_exp(p.exp1, subst=subst),
-                self.dictionary.index_exp(p.exp2, subst=subst),
-            ]
-
-        elif p.is_value_constraint:
-            p = cast(PO.CPOValueConstraint, p)
-            args = [self.dictionary.index_exp(p.exp, subst=subst)]
-
-        elif p.is_common_base:
-            p = cast(PO.CPOCommonBase, p)
-            args = [
-                self.dictionary.index_exp(p.exp1, subst=subst),
-                self.dictionary.index_exp(p.exp2, subst=subst),
-            ]
-
-        elif p.is_buffer:
-            p = cast(PO.CPOBuffer, p)
-            args = [
-                self.dictionary.index_exp(p.exp, subst=subst),
-                self.dictionary.index_exp(p.size, subst=subst),
-            ]
-
-        elif p.is_rev_buffer:
-            p = cast(PO.CPORevBuffer, p)
-            args = [
-                self.dictionary.index_exp(p.exp, subst=subst),
-                self.dictionary.index_exp(p.size, subst=subst),
-            ]
-
-        else:
+        indexer = self._predicate_indexers.get(type(p))
+        if indexer is None:
             raise UF.CHCError("**** Predicate without indexing: " + str(p))
-
+        args = indexer(p, subst)
         return self.po_predicate_table.add_tags_args(p.tags, args, f)
 
+    def _args_exp(self, p: Any, subst: Dict[int, "CExp"]) -> List[int]:
+        return [self.dictionary.index_exp(p.exp, subst=subst)]
+
+    def _args_lval(self, p: Any, subst: Dict[int, "CExp"]) -> List[int]:
+        return [self.dictionary.index_lval(p.lval, subst=subst)]
+
+    def _args_exp_size(self, p: Any, subst: Dict[int, "CExp"]) -> List[int]:
+        return [
+            self.dictionary.index_exp(p.exp, subst=subst),
+            self.dictionary.index_exp(p.size, subst=subst)]
+
+    def _args_exp_bound(
+            self, p: PO.CPOIndexUpperBound, subst: Dict[int, "CExp"]) -> List[int]:
+        return [
+            self.dictionary.index_exp(p.exp, subst=subst),
+            self.dictionary.index_exp(p.bound, subst=subst)]
+
+    def _args_exp1_exp2(self, p: Any, subst: Dict[int, "CExp"]) -> List[int]:
+        return [
+            self.dictionary.index_exp(p.exp1, subst=subst),
+            self.dictionary.index_exp(p.exp2, subst=subst)]
+
+    def _args_typ_exp(self, p: Any, subst: Dict[int, "CExp"]) -> List[int]:
+        return [
+            self.dictionary.index_typ(p.typ),
+            self.dictionary.index_exp(p.exp, subst=subst)]
+
+    def _args_typ_exp1_exp2(
+            self, p: Any, subst: Dict[int, "CExp"]) -> List[int]:
+        return [
+            self.dictionary.index_typ(p.typ),
+            self.dictionary.index_exp(p.exp1, subst=subst),
+            self.dictionary.index_exp(p.exp2, subst=subst)]
+
+    def _args_cast(self, p: Any, subst: Dict[int, "CExp"]) -> List[int]:
+        return [
+            self.dictionary.index_typ(p.srctyp),
+            self.dictionary.index_typ(p.tgttyp),
+            self.dictionary.index_exp(p.exp, subst=subst)]
+
+    def _args_stack_address_escape(
+            self,
+            p: PO.CPOStackAddressEscape,
+            subst: Dict[int, "CExp"]) -> List[int]:
+        if p.has_lval():
+            return [
+                self.dictionary.index_lval(p.lval, subst=subst),
+                self.dictionary.index_exp(p.exp, subst=subst)]
+        else:
+            return [-1, self.dictionary.index_exp(p.exp, subst=subst)]
+
     def read_xml_predicate(
             self, xnode: ET.Element, tag: str = "ipr") -> PO.CPOPredicate:
         xipr = xnode.get(tag)
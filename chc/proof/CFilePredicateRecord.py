@@ -44,6 +44,8 @@ if TYPE_CHECKING:
 class CFilePredicateRecord(IT.IndexedTableValue):
     """Base class for all objects in the the CFilePredicateDictionary."""
 
+    __slots__ = ("_pd",)
+
     def __init__(
             self,
             pd: "CFilePredicateDictionary",
@@ -48,6 +48,8 @@ if TYPE_CHECKING:
 
 class CFunPODictionaryRecord(IndexedTableValue):
 
+    __slots__ = ("_pod",)
+
     def __init__(self, pod: "CFunPODictionary", ixval: IndexedTableValue) -> None:
         IndexedTableValue.__init__(self, ixval.index, ixval.tags, ixval.args)
         self._pod = pod
@@ -94,6 +96,8 @@ class CFunPODictionaryRecord(IndexedTableValue):
 
 class CFunPOType(CFunPODictionaryRecord):
 
+    __slots__ = ()
+
     def __init__(self, pod: "CFunPODictionary", ixval: IndexedTableValue) -> None:
         CFunPODictionaryRecord.__init__(self, pod, ixval)
 
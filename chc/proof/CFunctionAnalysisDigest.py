@@ -47,7 +47,8 @@ if TYPE_CHECKING:
 class CFunctionAnalysisDigest:
 
     def __init__(self, cfun: "CFunction", xnode: ET.Element) -> None:
-        self.xnode = xnode   # analysis-digest node in adg file
+        # analysis-digest node in adg file; released once decoded
+        self.xnode: Optional[ET.Element] = xnode
         self._cfun = cfun
 
     @property
@@ -84,15 +85,24 @@ class CFunctionOutputParameterAnalysisDigest(CFunctionAnalysisDigest):
         self._callee_callsites: Optional[List[OutputParameterCalleeCallsite]] = None
         self._caller_callsites: Optional[List[OutputParameterCalleeCallsite]] = None
 
+    def _release_xnode(self) -> None:
+        if (
+                self._candidate_parameters is not None
+                and self._callee_callsites is not None):
+            self.xnode = None
+
     @property
     def parameters(self) -> List[CandidateOutputParameter]:
         if self._candidate_parameters is None:
             self._candidate_parameters = []
-            xparams = self.xnode.find("candidate-parameters")
+            xparams = (
+                None if self.xnode is None
+                else self.xnode.find("candidate-parameters"))
             if xparams is not None:
                 for xparam in xparams.findall("param"):
                     cparam = CandidateOutputParameter(self, xparam)
                     self._candidate_parameters.append(cparam)
+            self._release_xnode()
         return self._candidate_parameters
 
     def has_parameters(self) -> bool:
@@ -102,11 +112,14 @@ class CFunctionOutputParameterAnalysisDigest(CFunctionAnalysisDigest):
     def callee_callsites(self) -> List[OutputParameterCalleeCallsite]:
         if self._callee_callsites is None:
             self._callee_callsites = []
-            xsites = self.xnode.find("callee-callsites")
+            xsites = (
+                None if self.xnode is None
+                else self.xnode.find("callee-callsites"))
             if xsites is not None:
                 for xsite in xsites.findall("ccs"):
                     ccsite = OutputParameterCalleeCallsite(self, xsite)
                     self._callee_callsites.append(ccsite)
+            self._release_xnode()
         return self._callee_callsites
 
     @property
@@ -193,6 +206,7 @@ class CFunctionAnalysisDigests:
                         self._digests.append(digest)
             else:
                 chklogger.logger.warning("Adg xnode is None")
+            self.xnode = None
         return self._digests
 
     def outputparameters(self) -> List[CandidateOutputParameter]:
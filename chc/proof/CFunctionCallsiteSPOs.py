@@ -42,13 +42,12 @@ from chc.app.IndexManager import FileVarReference
 
 from chc.proof.CFunctionCallsiteSPO import CFunctionCallsiteSPO
 from chc.proof.CFunctionPO import po_status
-from chc.proof.CProofDependencies import CProofDependencies
-from chc.proof.CProofDiagnostic import CProofDiagnostic, SituatedMsg
 
 import chc.util.fileutil as UF
 from chc.util.loggingutil import chklogger
 
 if TYPE_CHECKING:
+    from chc.api.ApiAssumption import ApiAssumption
     from chc.app.CContext import ProgramContext, CfgContext
     from chc.app.CContextDictionary import CContextDictionary
     from chc.app.CExp import CExp
@@ -111,6 +110,44 @@ class CallsiteTarget:
             raise UF.CHCError("Call target does not have resolved callees")
 
 
+class CalleeApi:
+    """Callee data shared by all call sites of a function within a round.
+
+    Holds the resolved callee function, the number of its parameters, their
+    vids, and the api assumptions that are to be turned into supporting proof
+    obligations at its call sites (that is, excluding file-level
+    assumptions). Instances are cached by the application for the duration
+    of one call to update_spos.
+    """
+
+    def __init__(self, calleefun: "CFunction") -> None:
+        self._calleefun = calleefun
+        api = calleefun.api
+        self._assumptions = [
+            a for a in api.api_assumptions.values() if not a.isfile]
+        self._nparameters = 0
+        self._formal_vids: List[int] = []
+        if len(self._assumptions) > 0:
+            self._nparameters = len(api.parameters)
+            self._formal_vids = api.formal_vids
+
+    @property
+    def calleefun(self) -> "CFunction":
+        return self._calleefun
+
+    @property
+    def assumptions(self) -> List["ApiAssumption"]:
+        return self._assumptions
+
+    @property
+    def nparameters(self) -> int:
+        return self._nparameters
+
+    @property
+    def formal_vids(self) -> List[int]:
+        return self._formal_vids
+
+
 class CFunctionCallsiteSPOs:
     """Represents the supporting proof obligations associated with a call site."""
 
@@ -218,6 +255,23 @@ class CFunctionCallsiteSPOs:
     def contextdictionary(self) -> "CContextDictionary":
         return self.cfile.contextdictionary
 
+    def _release_xnode(self) -> None:
+        """Replaces the call site element by its attributes once its child
+        elements are decoded."""
+
+        if self._spos is not None and self._postassumes is not None:
+            xnode = ET.Element(self.xnode.tag, self.xnode.attrib)
+            self.xnode = xnode
+            if self._calltarget is not None:
+                self._calltarget.xnode = xnode
+
+    def loaded_spos(self) -> List[CFunctionCallsiteSPO]:
+        """Returns the spos if they have been read (does not read them)."""
+
+        if self._spos is None:
+            return []
+        return [spo for spos in self._spos.values() for spo in spos]
+
     @property
     def spos(self) -> Dict[int, List[CFunctionCallsiteSPO]]:
         if self._spos is None:
@@ -230,21 +284,11 @@ class CFunctionCallsiteSPOs:
                         self._spos[int(xapid)] = []
                         for xpo in p.findall("po"):
                             spotype = self.podictionary.read_xml_spo_type(xpo)
-                            deps = CProofDependencies(self.cproofs, xpo)
                             status = po_status[xpo.get("s", "o")]
-                            xexpl = xpo.find("e")
-                            expl = (
-                                None if xexpl is None
-                                else SituatedMsg(self.cfun.cdictionary, xexpl))
-                            diagnostic = CProofDiagnostic(self.cproofs, xpo.find("d"))
                             self._spos[int(xapid)].append(
                                 CFunctionCallsiteSPO(
-                                    self.cproofs,
-                                    spotype,
-                                    status,
-                                    deps,
-                                    expl,
-                                    diagnostic))
+                                    self.cproofs, spotype, status, deferred=True))
+            self._release_xnode()
         return self._spos
 
     @property
@@ -256,6 +300,7 @@ class CFunctionCallsiteSPOs:
                 xipcs = xpost.get("iipcs")
                 if xipcs is not None:
                     self._postassumes = [int(x) for x in xipcs.split(",")]
+            self._release_xnode()
         return self._postassumes
 
     @property
@@ -322,158 +367,156 @@ class CFunctionCallsiteSPOs:
             return
 
         filevar = FileVarReference(self.cfile.index, self.callee.vid)
-        calleefun = self.cfile.capp.resolve_vid_function(filevar)
-        if calleefun is None:
+        calleeapi = self.cfile.capp.get_callee_api(filevar)
+        if calleeapi is None:
             chklogger.logger.warning(
                 "missing external function in %s - %s: %s",
                 self.cfile.name, self.cfun.name, self.callee.vname)
             return
 
-        # retrieve callee's api assumptions and substitute parameters by
-        # arguments
-        api = calleefun.api
+        # skip the call site if all of the callee's api assumptions have
+        # already been handled in an earlier round
+        calleefun = calleeapi.calleefun
         calleefile = calleefun.cfile
-        if len(api.api_assumptions) > 0:
-            pars = api.parameters
-            vids = api.formal_vids
-            subst = {}
-            if len(pars) == len(self.call_arguments):
-                substitutions = zip(vids, self.call_arguments)
-                for (vid, arg) in substitutions:
-                    subst[vid] = arg
-            else:
-                chklogger.logger.warning(
-                    "number of arguments (%s) is not the same as the number "
-                    + "of parameters (%s) in call to %s in function %s "
-                    + "in file %s",
-                    str(len(self.call_arguments)),
-                    str(len(pars)),
-                    calleefun.name,
-                    self.cfun.name,
-                    self.cfile.name)
-                return
-            if len(api.api_assumptions) > 0:
-                '''
-                if (
-                    calleefile.has_file_contracts()
-                    and calleefile.index != self.cfile.index
-                ):
-                    gvarinfos = calleefile.contracts.globalvariables.values()
-                    for othergvar in gvarinfos:
-                        othervid = othergvar.gvinfo.vid
-                        thisvid = self.cfile.capp.convert_vid(
-                            calleefile.index, othervid, self.cfile.index
-                        )
-                        if thisvid is None:
-                            gvid = self.cfile.capp.indexmanager.get_gvid(
-                                calleefile.index, othervid
-                            )
-                            gvarinfo = self.cfile.capp.declarations.get_varinfo(gvid)
-                            gvarname = gvarinfo.vname + "__" + str(gvid) + "__"
-                            gvartyp = othergvar.gvinfo.vtype.get_opaque_type()
-                            thisvtypeix = self.cfile.declarations.dictionary.index_typ(
-                                gvartyp
-                            )
-                            thisvinfoix = (
-                                self.cfile.declarations.make_opaque_global_varinfo(
-                                    gvid, gvarname, thisvtypeix
-                                )
-                            )
-                            thisvinfo = self.cfile.declarations.get_varinfo(thisvinfoix)
-                            logging.warning(
-                                self.cfile.name
-                                + ": "
-                                + self.cfun.name
-                                + " call to "
-                                + calleefun.name
-                                + " ("
-                                + str(calleefun.cfile.name)
-                                + "): global api variable "
-                                + othergvar.gvinfo.vname
-                                + " (gvid:"
-                                + str(gvid)
-                                + ")"
-                                + " converted to opaque variable"
-                                + " (vinfo-ix:"
-                                + str(thisvinfoix)
-                                + ")"
-                            )
-                        else:
-                            thisvinfo = self.cfile.declarations.get_global_varinfo(
-                                thisvid
-                            )
-                            if thisvinfo is None:
-                                logging.warning(
-                                    self.cfile.name
-                                    + ": "
-                                    + self.cfun.name
-                                    + " call to "
-                                    + calleefun.name
-                                    + " ("
-                                    + str(calleefun.cfile.name)
-                                    + "): global api variable "
-                                    + othergvar.gvinfo.vname
-                                    + " not found"
-                                )
-                                return
-                        expindex = (
-                            self.cfile.declarations.dictionary.varinfo_to_exp_index(
-                                thisvinfo
-                            )
+        pending = [a for a in calleeapi.assumptions if a.id not in self.spos]
+        if len(pending) == 0:
+            return
+
+        # substitute parameters by arguments
+        if calleeapi.nparameters != len(self.call_arguments):
+            chklogger.logger.warning(
+                "number of arguments (%s) is not the same as the number "
+                + "of parameters (%s) in call to %s in function %s "
+                + "in file %s",
+                str(len(self.call_arguments)),
+                str(calleeapi.nparameters),
+                calleefun.name,
+                self.cfun.name,
+                self.cfile.name)
+            return
+        subst: Dict[int, "CExp"] = dict(
+            zip(calleeapi.formal_vids, self.call_arguments))
+        '''
+        if (
+            calleefile.has_file_contracts()
+            and calleefile.index != self.cfile.index
+        ):
+            gvarinfos = calleefile.contracts.globalvariables.values()
+            for othergvar in gvarinfos:
+                othervid = othergvar.gvinfo.vid
+                thisvid = self.cfile.capp.convert_vid(
+                    calleefile.index, othervid, self.cfile.index
+                )
+                if thisvid is None:
+                    gvid = self.cfile.capp.indexmanager.get_gvid(
+                        calleefile.index, othervid
+                    )
+                    gvarinfo = self.cfile.capp.declarations.get_varinfo(gvid)
+                    gvarname = gvarinfo.vname + "__" + str(gvid) + "__"
+                    gvartyp = othergvar.gvinfo.vtype.get_opaque_type()
+                    thisvtypeix = self.cfile.declarations.dictionary.index_typ(
+                        gvartyp
+                    )
+                    thisvinfoix = (
+                        self.cfile.declarations.make_opaque_global_varinfo(
+                            gvid, gvarname, thisvtypeix
                         )
-                        subst[othervid] = self.cfile.declarations.dictionary.get_exp(
-                            expindex
+                    )
+                    thisvinfo = self.cfile.declarations.get_varinfo(thisvinfoix)
+                    logging.warning(
+                        self.cfile.name
+                        + ": "
+                        + self.cfun.name
+                        + " call to "
+                        + calleefun.name
+                        + " ("
+                        + str(calleefun.cfile.name)
+                        + "): global api variable "
+                        + othergvar.gvinfo.vname
+                        + " (gvid:"
+                        + str(gvid)
+                        + ")"
+                        + " converted to opaque variable"
+                        + " (vinfo-ix:"
+                        + str(thisvinfoix)
+                        + ")"
+                    )
+                else:
+                    thisvinfo = self.cfile.declarations.get_global_varinfo(
+                        thisvid
+                    )
+                    if thisvinfo is None:
+                        logging.warning(
+                            self.cfile.name
+                            + ": "
+                            + self.cfun.name
+                            + " call to "
+                            + calleefun.name
+                            + " ("
+                            + str(calleefun.cfile.name)
+                            + "): global api variable "
+                            + othergvar.gvinfo.vname
+                            + " not found"
                         )
-                '''
-            for a in api.api_assumptions.values():
-                if a.id in self.spos:
-                    continue
-                if a.isfile:
-                    continue  # file_level assumption
-                try:
-                    pid = self.cfile.predicatedictionary.index_predicate(
-                        a.predicate, subst=subst
+                        return
+                expindex = (
+                    self.cfile.declarations.dictionary.varinfo_to_exp_index(
+                        thisvinfo
                     )
-                    apiid = a.id
-                    self.spos[apiid] = []
+                )
+                subst[othervid] = self.cfile.declarations.dictionary.get_exp(
+                    expindex
+                )
+        '''
+        ictxt: Optional[int] = None
+        iloc: Optional[int] = None
+        for a in pending:
+            try:
+                pid = self.cfile.predicatedictionary.index_predicate(
+                    a.predicate, subst=subst
+                )
+                apiid = a.id
+                self.spos[apiid] = []
+                if ictxt is None:
                     ictxt = self.contextdictionary.index_context(self.context)
+                if iloc is None:
                     iloc = self.cfile.declarations.index_location(self.location)
-                    ispotype = self.podictionary.index_spo_type(
-                        ["cs"], [iloc, ictxt, pid, apiid]
-                    )
-                    spotype = self.cfun.podictionary.get_spo_type(ispotype)
-                    self.spos[apiid].append(
-                        CFunctionCallsiteSPO(self.cproofs, spotype))
-                except CKeyLookupError as e:
-                    chklogger.logger.warning(
-                        "%s: %s call to %s (%s) request datastructure condition "
-                        + "for %s for key %s to handle assumption",
-                        self.cfile.name,
-                        self.cfun.name,
-                        calleefun.name,
-                        str(calleefun.cfile.name),
-                        str(a.predicate),
-                        str(e.ckey))
-                except LookupError as e:
-                    chklogger.logger.warning(
-                        "%s: %s call to %s (%s) request datastruction condition "
-                        + "for %s: %s to handle api assumption",
-                        self.cfile.name,
-                        self.cfun.name,
-                        calleefun.name,
-                        str(calleefun.cfile.name),
-                        str(a.predicate),
-                        str(e))
-                except Exception as e:
-                    chklogger.logger.warning(
-                        "%s: %s call to %s (%s): unable to create spo for "
-                        + "assumption %s: %s",
-                        self.cfile.name,
-                        self.cfun.name,
-                        calleefun.name,
-                        str(calleefun.cfile.name),
-                        str(a),
-                        str(e))
+                ispotype = self.podictionary.index_spo_type(
+                    ["cs"], [iloc, ictxt, pid, apiid]
+                )
+                spotype = self.cfun.podictionary.get_spo_type(ispotype)
+                self.spos[apiid].append(
+                    CFunctionCallsiteSPO(self.cproofs, spotype))
+            except CKeyLookupError as e:
+                chklogger.logger.warning(
+                    "%s: %s call to %s (%s) request datastructure condition "
+                    + "for %s for key %s to handle assumption",
+                    self.cfile.name,
+                    self.cfun.name,
+                    calleefun.name,
+                    str(calleefun.cfile.name),
+                    str(a.predicate),
+                    str(e.ckey))
+            except LookupError as e:
+                chklogger.logger.warning(
+                    "%s: %s call to %s (%s) request datastruction condition "
+                    + "for %s: %s to handle api assumption",
+                    self.cfile.name,
+                    self.cfun.name,
+                    calleefun.name,
+                    str(calleefun.cfile.name),
+                    str(a.predicate),
+                    str(e))
+            except Exception as e:
+                chklogger.logger.warning(
+                    "%s: %s call to %s (%s): unable to create spo for "
+                    + "assumption %s: %s",
+                    self.cfile.name,
+                    self.cfun.name,
+                    calleefun.name,
+                    str(calleefun.cfile.name),
+                    str(a),
+                    str(e))
 
     def distribute_post_guarantees(self) -> None:
         # TBD
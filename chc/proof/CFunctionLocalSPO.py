@@ -50,8 +50,10 @@ class CFunctionLocalSPO(CFunctionPO):
             status: str = "open",
             deps: Optional["CProofDependencies"] = None,
             expl: Optional["SituatedMsg"] = None,
-            diag: Optional["CProofDiagnostic"] = None) -> None:
-        CFunctionPO.__init__(self, cproofs, potype, status, deps, expl, diag)
+            diag: Optional["CProofDiagnostic"] = None,
+            deferred: bool = False) -> None:
+        CFunctionPO.__init__(
+            self, cproofs, potype, status, deps, expl, diag, deferred)
 
     def is_spo(self) -> bool:
         return True
@@ -33,6 +33,8 @@ import xml.etree.ElementTree as ET
 from typing import cast, Dict, List, Optional, TYPE_CHECKING
 
 from chc.proof.CFunPODictionaryRecord import CFunPOType
+from chc.proof.CProofDependencies import CProofDependencies
+from chc.proof.CProofDiagnostic import CProofDiagnostic, SituatedMsg
 from chc.proof.PPOType import PPOType
 
 import chc.util.fileutil as UF
@@ -46,8 +48,6 @@ if TYPE_CHECKING:
     from chc.proof.CFunctionProofs import CFunctionProofs
     from chc.proof.CFunPODictionary import CFunPODictionary
     from chc.proof.CPOPredicate import CPOPredicate
-    from chc.proof.CProofDependencies import CProofDependencies
-    from chc.proof.CProofDiagnostic import CProofDiagnostic, SituatedMsg
     from chc.proof.SPOType import SPOType
 
 
@@ -64,7 +64,14 @@ po_status_indicators = {v: k for (k, v) in po_status.items()}
 
 
 class CFunctionPO:
-    """Super class of primary and supporting proof obligations."""
+    """Super class of primary and supporting proof obligations.
+
+    If deferred is set, the dependencies, explanation, and diagnostic are
+    read from the proof obligation file on first access rather than on
+    construction, so that operations that only need the type and status
+    (e.g., status statistics) do not pay for reading or holding the proof
+    evidence.
+    """
 
     def __init__(
             self,
@@ -73,13 +80,35 @@ class CFunctionPO:
             status: str = "open",
             deps: Optional["CProofDependencies"] = None,
             expl: Optional["SituatedMsg"] = None,
-            diag: Optional["CProofDiagnostic"] = None) -> None:
+            diag: Optional["CProofDiagnostic"] = None,
+            deferred: bool = False) -> None:
         self._cproofs = cproofs
         self._potype = potype
         self._status = status
         self._dependencies = deps
         self._explanation = expl
         self._diagnostic = diag
+        self._deferred = deferred
+
+    @property
+    def is_deferred(self) -> bool:
+        """Returns true if the evidence has not yet been read."""
+
+        return self._deferred
+
+    def _decode_evidence(self) -> None:
+        if self._deferred:
+            self.cproofs.read_evidence(self)
+
+    def set_evidence(self, xnode: ET.Element) -> None:
+        """Decodes dependencies, explanation, and diagnostic from the xml."""
+
+        self._deferred = False
+        self._dependencies = CProofDependencies(self.cproofs, xnode)
+        xexpl = xnode.find("e")
+        if xexpl is not None:
+            self._explanation = SituatedMsg(self.cfun.cdictionary, xexpl)
+        self._diagnostic = CProofDiagnostic(self.cproofs, xnode.find("d"))
 
     @property
     def predicate_name(self) -> str:
@@ -173,16 +202,19 @@ class CFunctionPO:
 
     @property
     def dependencies(self) -> "CProofDependencies":
+        self._decode_evidence()
         if self._dependencies is not None:
             return self._dependencies
         else:
             raise UF.CHCError("Proof obligation has no dependencies")
 
     def has_dependencies(self) -> bool:
+        self._decode_evidence()
         return self._dependencies is not None
 
     @property
     def explanation(self) -> Optional["SituatedMsg"]:
+        self._decode_evidence()
         return self._explanation
 
     @property
@@ -196,16 +228,19 @@ class CFunctionPO:
             return None
 
     def has_explanation(self) -> bool:
+        self._decode_evidence()
         return self._explanation is not None
 
     @property
     def diagnostic(self) -> "CProofDiagnostic":
+        self._decode_evidence()
         if self._diagnostic is not None:
             return self._diagnostic
         else:
             raise UF.CHCError("Proof obligation does not have diagnostic")
 
     def has_diagnostic(self) -> bool:
+        self._decode_evidence()
         return self._diagnostic is not None
 
     def has_referral_diagnostic(self) -> bool:
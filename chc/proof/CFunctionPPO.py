@@ -51,8 +51,10 @@ class CFunctionPPO(CFunctionPO):
             status: str = "open",
             deps: Optional["CProofDependencies"] = None,
             expl: Optional["SituatedMsg"] = None,
-            diag: Optional["CProofDiagnostic"] = None) -> None:
-        CFunctionPO.__init__(self, cproofs, ppotype, status, deps, expl, diag)
+            diag: Optional["CProofDiagnostic"] = None,
+            deferred: bool = False) -> None:
+        CFunctionPO.__init__(
+            self, cproofs, ppotype, status, deps, expl, diag, deferred)
 
     def is_ppo(self) -> bool:
         return True
@@ -33,8 +33,6 @@ import xml.etree.ElementTree as ET
 from typing import Callable, Dict, List, Optional, TYPE_CHECKING
 
 from chc.proof.CFunctionPPO import CFunctionPPO
-from chc.proof.CProofDependencies import CProofDependencies
-from chc.proof.CProofDiagnostic import CProofDiagnostic, SituatedMsg
 
 import chc.util.fileutil as UF
 
@@ -56,7 +54,7 @@ class CFunctionPPOs:
     """
 
     def __init__(self, cproofs: "CFunctionProofs", xnode: ET.Element) -> None:
-        self.xnode = xnode
+        self.xnode: Optional[ET.Element] = xnode
         self._cproofs = cproofs
         self._ppos: Optional[Dict[int, CFunctionPPO]] = None  # ppoid -> CFunctionPPO
         # self._initialize()
@@ -85,25 +83,24 @@ class CFunctionPPOs:
     def ppos(self) -> Dict[int, CFunctionPPO]:
         if self._ppos is None:
             self._ppos = {}
-            for xp in self.xnode.findall("ppo"):
-                ppotype = self.podictionary.read_xml_ppo_type(xp)
-                id = ppotype.index
-                status = po_status[xp.get("s", "o")]
-                deps = CProofDependencies(self.cproofs, xp)
-                diagnostic = CProofDiagnostic(self.cproofs, xp.find("d"))
-
-                # get explanation
-                enode = xp.find("e")
-                if enode is not None:
-                    expl: Optional[SituatedMsg] = SituatedMsg(
-                        self.cfun.cdictionary, enode)
-                else:
-                    expl = None
-
-                self._ppos[id] = CFunctionPPO(
-                    self.cproofs, ppotype, status, deps, expl, diagnostic)
+            if self.xnode is not None:
+                for xp in self.xnode.findall("ppo"):
+                    ppotype = self.podictionary.read_xml_ppo_type(xp)
+                    status = po_status[xp.get("s", "o")]
+                    self._ppos[ppotype.index] = CFunctionPPO(
+                        self.cproofs, ppotype, status, deferred=True)
+            # the evidence of the ppos is read again from the ppo file when
+            # it is needed
+            self.xnode = None
         return self._ppos
 
+    def loaded_ppos(self) -> List[CFunctionPPO]:
+        """Returns the ppos if they have been read (does not read them)."""
+
+        if self._ppos is None:
+            return []
+        return list(self._ppos.values())
+
     def get_ppo(self, id: int) -> CFunctionPPO:
         if id in self.ppos:
             return self.ppos[id]
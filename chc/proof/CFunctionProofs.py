@@ -30,7 +30,7 @@
 
 import xml.etree.ElementTree as ET
 
-from typing import Callable, cast, List, Optional, TYPE_CHECKING
+from typing import Callable, cast, Dict, List, Optional, TYPE_CHECKING
 
 from chc.proof.CFunctionCallsiteSPOs import CFunctionCallsiteSPOs
 from chc.proof.CFunctionPO import CFunctionPO
@@ -76,8 +76,8 @@ class CFunctionProofs:
             xpponode: ET.Element,
             xsponode: ET.Element) -> None:
         self._cfun = cfun
-        self.xpponode = xpponode
-        self.xsponode = xsponode
+        self._xpponode: Optional[ET.Element] = xpponode
+        self._xsponode: Optional[ET.Element] = xsponode
         self._ppos: Optional[CFunctionPPOs] = None
         self._spos: Optional[CFunctionSPOs] = None
 
@@ -109,12 +109,74 @@ class CFunctionProofs:
     def capp(self) -> "CApplication":
         return self.cfile.capp
 
+    @property
+    def xpponode(self) -> ET.Element:
+        """Returns the ppos element, re-reading it if it was released."""
+
+        if self._xpponode is None:
+            return self.cfun.read_ppos_xnode()
+        return self._xpponode
+
+    @property
+    def xsponode(self) -> ET.Element:
+        """Returns the spos element, re-reading it if it was released."""
+
+        if self._xsponode is None:
+            return self.cfun.read_spos_xnode()
+        return self._xsponode
+
     @property
     def ppos(self) -> CFunctionPPOs:
         if self._ppos is None:
             self._ppos = CFunctionPPOs(self, self.xpponode)
+            self._xpponode = None
         return self._ppos
 
+    def read_evidence(self, po: CFunctionPO) -> None:
+        """Reads the evidence of po from the ppo or spo file.
+
+        Parsing the file is the main cost, so the evidence is decoded for all
+        loaded proof obligations of the same kind that do not have it yet.
+        """
+
+        if isinstance(po, CFunctionPPO):
+            xpos = self.xpponode.iter("ppo")
+            tag = "ippo"
+            pos: List[CFunctionPO] = list(self.loaded_ppos())
+        else:
+            xpos = self.xsponode.iter("po")
+            tag = "ispo"
+            pos = self.loaded_spos()
+        xevidence: Dict[int, ET.Element] = {}
+        for xpo in xpos:
+            xindex = xpo.get(tag)
+            if xindex is not None:
+                xevidence[int(xindex)] = xpo
+        for p in pos:
+            if p.is_deferred:
+                if p.po_index in xevidence:
+                    p.set_evidence(xevidence[p.po_index])
+                else:
+                    raise UF.CHCError(
+                        "Evidence for proof obligation "
+                        + str(p.po_index)
+                        + " not found for "
+                        + self.cfun.name)
+
+    def loaded_ppos(self) -> List[CFunctionPPO]:
+        """Returns the ppos that have been read (does not read any)."""
+
+        if self._ppos is None:
+            return []
+        return self._ppos.loaded_ppos()
+
+    def loaded_spos(self) -> List[CFunctionPO]:
+        """Returns the spos that have been read (does not read any)."""
+
+        if self._spos is None:
+            return []
+        return self._spos.loaded_spos()
+
     @property
     def ppolist(self) -> List[CFunctionPO]:
         return list(self.ppos.ppos.values())
@@ -135,6 +197,7 @@ class CFunctionProofs:
     def spos(self) -> CFunctionSPOs:
         if self._spos is None:
             self._spos = CFunctionSPOs(self, self.xsponode)
+            self._xsponode = None
         return self._spos
 
     @property
@@ -52,9 +52,10 @@ class CFunctionReturnsiteSPO(CFunctionPO):
             status: str = "open",
             deps: Optional["CProofDependencies"] = None,
             expl: Optional["SituatedMsg"] = None,
-            diag: Optional["CProofDiagnostic"] = None) -> None:
+            diag: Optional["CProofDiagnostic"] = None,
+            deferred: bool = False) -> None:
         CFunctionPO.__init__(
-            self, crspos.cproofs, potype, status, deps, expl, diag)
+            self, crspos.cproofs, potype, status, deps, expl, diag, deferred)
         self._crspos = crspos
 
     @property
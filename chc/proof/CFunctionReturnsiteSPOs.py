@@ -38,8 +38,6 @@ import chc.proof.CFunctionPO as PO
 from chc.app.CLocation import CLocation
 
 from chc.proof.CFunctionReturnsiteSPO import CFunctionReturnsiteSPO
-from chc.proof.CProofDependencies import CProofDependencies
-from chc.proof.CProofDiagnostic import CProofDiagnostic, SituatedMsg
 
 import chc.util.fileutil as UF
 
@@ -90,6 +88,13 @@ class CFunctionReturnsiteSPOs:
     def contextdictionary(self) -> "CContextDictionary":
         return self.cfile.contextdictionary
 
+    def loaded_spos(self) -> List[CFunctionReturnsiteSPO]:
+        """Returns the spos if they have been read (does not read them)."""
+
+        if self._spos is None:
+            return []
+        return [spo for spos in self._spos.values() for spo in spos]
+
     @property
     def spos(self) -> Dict[int, List[CFunctionReturnsiteSPO]]:
         if self._spos is None:
@@ -104,16 +109,13 @@ class CFunctionReturnsiteSPOs:
                     self._spos[ipc] = []
                     for xpo in p.findall("po"):
                         spotype = self.podictionary.read_xml_spo_type(xpo)
-                        deps = CProofDependencies(self.cproofs, xpo)
                         status = po_status[xpo.get("s", "o")]
-                        xexpl = xpo.find("e")
-                        expl = (
-                            None if xexpl is None
-                            else SituatedMsg(self.cfun.cdictionary, xexpl))
-                        diagnostic = CProofDiagnostic(self.cproofs, xpo.find("d"))
                         self._spos[ipc].append(
                             CFunctionReturnsiteSPO(
-                                self, spotype, status, deps, expl, diagnostic))
+                                self, spotype, status, deferred=True))
+            # only the attributes are needed after the post guarantees are
+            # decoded
+            self.xnode = ET.Element(self.xnode.tag, self.xnode.attrib)
         return self._spos
 
     @property
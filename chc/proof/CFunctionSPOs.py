@@ -39,8 +39,6 @@ from chc.proof.CFunctionLocalSPO import CFunctionLocalSPO
 
 from chc.proof.CFunctionPO import CFunctionPO
 from chc.proof.CFunctionPO import po_status
-from chc.proof.CProofDependencies import CProofDependencies
-from chc.proof.CProofDiagnostic import CProofDiagnostic, SituatedMsg
 
 from chc.util.loggingutil import chklogger
 
@@ -57,7 +55,7 @@ class CFunctionSPOs:
     """
 
     def __init__(self, cproofs: "CFunctionProofs", xnode: ET.Element) -> None:
-        self.xnode = xnode
+        self.xnode: Optional[ET.Element] = xnode
         self._cproofs = cproofs
         self.spocounter = 0
         self._localspos: Optional[Dict[int, CFunctionLocalSPO]] = None
@@ -80,6 +78,15 @@ class CFunctionSPOs:
     def podictionary(self) -> "CFunPODictionary":
         return self.cfun.podictionary
 
+    def _release_xnode(self) -> None:
+        """Drops the spos element once all its parts are decoded."""
+
+        if (
+                self._localspos is not None
+                and self._callsitespos is not None
+                and self._returnsitespos is not None):
+            self.xnode = None
+
     @property
     def spos(self) -> List[CFunctionPO]:
         result: List[CFunctionPO] = []
@@ -94,30 +101,39 @@ class CFunctionSPOs:
 
         return result
 
+    def loaded_spos(self) -> List[CFunctionPO]:
+        """Returns the spos that have been read (does not read any)."""
+
+        result: List[CFunctionPO] = []
+        if self._localspos is not None:
+            result.extend(self._localspos.values())
+        if self._callsitespos is not None:
+            for cspos in self._callsitespos.values():
+                result.extend(cspos.loaded_spos())
+        if self._returnsitespos is not None:
+            for rspos in self._returnsitespos.values():
+                result.extend(rspos.loaded_spos())
+        return result
+
     @property
     def local_spos(self) -> Dict[int, CFunctionLocalSPO]:
         if self._localspos is None:
             self._localspos = {}
-            xlspos = self.xnode.find("localspos")
+            xlspos = None if self.xnode is None else self.xnode.find("localspos")
             if xlspos is not None:
                 for xpo in xlspos.findall("po"):
                     spotype = self.podictionary.read_xml_spo_type(xpo)
-                    xexpl = xpo.find("e")
-                    expl = (
-                        None if xexpl is None
-                        else SituatedMsg(self.cfun.cdictionary, xexpl))
-                    deps = CProofDependencies(self.cproofs, xpo)
-                    diagnostic = CProofDiagnostic(self.cproofs, xpo.find("d"))
                     status = po_status[xpo.get("s", "o")]
                     self._localspos[spotype.po_index] = CFunctionLocalSPO(
-                        self.cproofs, spotype, status, deps, expl, diagnostic)
+                        self.cproofs, spotype, status, deferred=True)
+            self._release_xnode()
         return self._localspos
 
     @property
     def callsite_spos(self) -> Dict[str, CFunctionCallsiteSPOs]:
         if self._callsitespos is None:
             self._callsitespos = {}
-            xcss = self.xnode.find("callsites")
+            xcss = None if self.xnode is None else self.xnode.find("callsites")
             if xcss is not None:
                 xdcss = xcss.find("direct-calls")
                 if xdcss is not None:
@@ -131,18 +147,20 @@ class CFunctionSPOs:
                         cspo = CFunctionCallsiteSPOs(self.cproofs, cs)
                         cfgcontext = str(cspo.cfgcontext)
                         self._callsitespos[cfgcontext] = cspo
+            self._release_xnode()
         return self._callsitespos
 
     @property
     def returnsite_spos(self) -> Dict[str, CFunctionReturnsiteSPOs]:
         if self._returnsitespos is None:
             self._returnsitespos = {}
-            xrss = self.xnode.find("returnsites")
+            xrss = None if self.xnode is None else self.xnode.find("returnsites")
             if xrss is not None:
                 for rs in xrss.findall("rs"):
                     rsspos = CFunctionReturnsiteSPOs(self.cproofs, rs)
                     cfgctxt = str(rsspos.cfgcontext)
                     self._returnsitespos[cfgctxt] = rsspos
+            self._release_xnode()
         return self._returnsitespos
 
     def update(self) -> None:
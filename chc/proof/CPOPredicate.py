@@ -124,6 +124,8 @@ def get_predicate_name(tag: str) -> str:
 class CPOPredicate(CFilePredicateRecord):
     """Base class for all predicates."""
 
+    __slots__ = ()
+
     def __init__(
             self, pd: "CFilePredicateDictionary", ixval: IT.IndexedTableValue
     ) -> None:
@@ -356,6 +358,8 @@ class CPONotNull(CPOPredicate):
     args[0]: index of exp in cdictionary
     """
 
+    __slots__ = ()
+
     def __init__(
             self, pd: "CFilePredicateDictionary", ixval: IT.IndexedTableValue
     ) -> None:
@@ -393,6 +397,8 @@ class CPOGlobalAddress(CPOPredicate):
     - args[0]: index of exp in cdictionary
     """
 
+    __slots__ = ()
+
     def __init__(
             self, pd: "CFilePredicateDictionary", ixval: IT.IndexedTableValue
     ) -> None:
@@ -429,6 +435,8 @@ class CPOHeapAddress(CPOPredicate):
     - args[0]: index of exp in cdictionary
     """
 
+    __slots__ = ()
+
     def __init__(
             self, pd: "CFilePredicateDictionary", ixval: IT.IndexedTableValue
     ) -> None:
@@ -467,6 +475,8 @@ class CPODistinctRegion(CPOPredicate):
     - args[1]: memref index
     """
 
+    __slots__ = ()
+
     def __init__(
             self, pd: "CFilePredicateDictionary", ixval: IT.IndexedTableValue
     ) -> None:
@@ -507,6 +517,8 @@ class CPONull(CPOPredicate):
     - args[0]: exp
     """
 
+    __slots__ = ()
+
     def __init__(
             self, pd: "CFilePredicateDictionary", ixval: IT.IndexedTableValue
     ) -> None:
@@ -534,6 +546,8 @@ class CPOValidMem(CPOPredicate):
     - args[0]: index of exp in cdictionary
     """
 
+    __slots__ = ()
+
     def __init__(
             self, pd: "CFilePredicateDictionary", ixval: IT.IndexedTableValue
     ) -> None:
@@ -572,6 +586,8 @@ class CPOControlledResource(CPOPredicate):
     - args[0]: index of exp in cdictionary
     """
 
+    __slots__ = ()
+
     def __init__(
             self, pd: "CFilePredicateDictionary", ixval: IT.IndexedTableValue
     ) -> None:
@@ -614,6 +630,8 @@ class CPOStackAddressEscape(CPOPredicate):
     - args[1]: index exp in cdictionary
     """
 
+    __slots__ = ()
+
     def __init__(
             self, pd: "CFilePredicateDictionary", ixval: IT.IndexedTableValue
     ) -> None:
@@ -651,6 +669,8 @@ class CPOInScope(CPOPredicate):
     - args[0]: index of exp in cdictionary
     """
 
+    __slots__ = ()
+
     def __init__(
             self, pd: "CFilePredicateDictionary", ixval: IT.IndexedTableValue
     ) -> None:
@@ -678,6 +698,8 @@ class CPOAllocationBase(CPOPredicate):
     - args[0]: index of exp in cdictionary
     """
 
+    __slots__ = ()
+
     def __init__(
             self, pd: "CFilePredicateDictionary", ixval: IT.IndexedTableValue
     ) -> None:
@@ -705,6 +727,8 @@ class CPONewMemory(CPOPredicate):
     - args[0]: index of exp in cdictionary
     """
 
+    __slots__ = ()
+
     def __init__(
             self, pd: "CFilePredicateDictionary", ixval: IT.IndexedTableValue
     ) -> None:
@@ -733,6 +757,8 @@ class CPOBuffer(CPOPredicate):
     - args[1]: index of size in cdictionary
     """
 
+    __slots__ = ()
+
     def __init__(
             self, pd: "CFilePredicateDictionary", ixval: IT.IndexedTableValue
     ) -> None:
@@ -766,6 +792,8 @@ class CPORevBuffer(CPOPredicate):
     - args[1]: index of presize expression in cdictionary
     """
 
+    __slots__ = ()
+
     def __init__(
             self, pd: "CFilePredicateDictionary", ixval: IT.IndexedTableValue
     ) -> None:
@@ -798,6 +826,8 @@ class CPOTypeAtOffset(CPOPredicate):
     - args[1]: index of exp in cdictionary
     """
 
+    __slots__ = ()
+
     def __init__(
             self, pd: "CFilePredicateDictionary", ixval: IT.IndexedTableValue
     ) -> None:
@@ -830,6 +860,8 @@ class CPOLowerBound(CPOPredicate):
     - args[1]: index of exp in cdictionary
     """
 
+    __slots__ = ()
+
     def __init__(
             self, pd: "CFilePredicateDictionary", ixval: IT.IndexedTableValue
     ) -> None:
@@ -863,6 +895,8 @@ class CPOUpperBound(CPOPredicate):
     - args[1]: index of exp in cdictionary
     """
 
+    __slots__ = ()
+
     def __init__(
             self, pd: "CFilePredicateDictionary", ixval: IT.IndexedTableValue
     ) -> None:
@@ -895,6 +929,8 @@ class CPOIndexLowerBound(CPOPredicate):
     - args[0]: index of exp in cdictionary
     """
 
+    __slots__ = ()
+
     def __init__(
             self, pd: "CFilePredicateDictionary", ixval: IT.IndexedTableValue
     ) -> None:
@@ -924,6 +960,8 @@ class CPOIndexUpperBound(CPOPredicate):
     - args[1]: index of array size expression in cdictionary
     """
 
+    __slots__ = ()
+
     def __init__(
             self, pd: "CFilePredicateDictionary", ixval: IT.IndexedTableValue
     ) -> None:
@@ -961,6 +999,8 @@ class CPOInitialized(CPOPredicate):
     - args[0]: index of lval in cdictionary
     """
 
+    __slots__ = ()
+
     def __init__(
             self, pd: "CFilePredicateDictionary", ixval: IT.IndexedTableValue
     ) -> None:
@@ -994,6 +1034,8 @@ class CPOLocallyInitialized(CPOPredicate):
     - args[0]: index of lval in cdictionary
     """
 
+    __slots__ = ()
+
     def __init__(
             self, pd: "CFilePredicateDictionary", ixval: IT.IndexedTableValue
             ) -> None:
@@ -1038,6 +1080,8 @@ class CPOInitializedRange(CPOPredicate):
     - args[1]: index of size in cdictionary
     """
 
+    __slots__ = ()
+
     def __init__(
             self, pd: "CFilePredicateDictionary", ixval: IT.IndexedTableValue
     ) -> None:
@@ -1076,6 +1120,8 @@ class CPOCast(CPOPredicate):
     - args[2]: index of exp in cdictionary
     """
 
+    __slots__ = ()
+
     def __init__(
             self, pd: "CFilePredicateDictionary", ixval: IT.IndexedTableValue
     ) -> None:
@@ -1123,6 +1169,8 @@ class CPOFormatCast(CPOPredicate):
     - args[2]: index of exp in cdictionary
     """
 
+    __slots__ = ()
+
     def __init__(
             self, pd: "CFilePredicateDictionary", ixval: IT.IndexedTableValue
     ) -> None:
@@ -1169,6 +1217,8 @@ class CPOPointerCast(CPOPredicate):
     - args[2]: index of exp in cdictionary
     """
 
+    __slots__ = ()
+
     def __init__(
             self, pd: "CFilePredicateDictionary", ixval: IT.IndexedTableValue
     ) -> None:
@@ -1224,6 +1274,8 @@ class CPOSignedToUnsignedCastLB(CPOPredicate):
     - args[0]: index of exp in cdictionary
     """
 
+    __slots__ = ()
+
     def __init__(
             self, pd: "CFilePredicateDictionary", ixval: IT.IndexedTableValue
     ) -> None:
@@ -1271,6 +1323,8 @@ class CPOSignedToUnsignedCastUB(CPOPredicate):
     - args[0]: index of exp in cdictionary
     """
 
+    __slots__ = ()
+
     def __init__(
             self, pd: "CFilePredicateDictionary", ixval: IT.IndexedTableValue
     ) -> None:
@@ -1318,6 +1372,8 @@ class CPOUnsignedToSignedCast(CPOPredicate):
     - args[0]: index of exp in cdictionary
     """
 
+    __slots__ = ()
+
     def __init__(
             self, pd: "CFilePredicateDictionary", ixval: IT.IndexedTableValue
     ) -> None:
@@ -1365,6 +1421,8 @@ class CPOUnsignedToUnsignedCast(CPOPredicate):
     - args[0]: index of exp in cdictionary
     """
 
+    __slots__ = ()
+
     def __init__(
             self, pd: "CFilePredicateDictionary", ixval: IT.IndexedTableValue
     ) -> None:
@@ -1412,6 +1470,8 @@ class CPOSignedToSignedCastLB(CPOPredicate):
     - args[0]: index of exp in cdictionary
     """
 
+    __slots__ = ()
+
     def __init__(
             self, pd: "CFilePredicateDictionary", ixval: IT.IndexedTableValue
     ) -> None:
@@ -1459,6 +1519,8 @@ class CPOSignedToSignedCastUB(CPOPredicate):
     - args[0]: index of exp in cdictionary
     """
 
+    __slots__ = ()
+
     def __init__(
             self, pd: "CFilePredicateDictionary", ixval: IT.IndexedTableValue
     ) -> None:
@@ -1502,6 +1564,8 @@ class CPONotZero(CPOPredicate):
     - args[0]: index of exp in cdictionary
     """
 
+    __slots__ = ()
+
     def __init__(
             self, pd: "CFilePredicateDictionary", ixval: IT.IndexedTableValue
     ) -> None:
@@ -1529,6 +1593,8 @@ class CPONonNegative(CPOPredicate):
     - args[0]: index of exp in cdictionary
     """
 
+    __slots__ = ()
+
     def __init__(
             self, pd: "CFilePredicateDictionary", ixval: IT.IndexedTableValue
     ) -> None:
@@ -1556,6 +1622,8 @@ class CPONullTerminated(CPOPredicate):
     - args[0]: index of exp in cdictionary
     """
 
+    __slots__ = ()
+
     def __init__(
             self, pd: "CFilePredicateDictionary", ixval: IT.IndexedTableValue
     ) -> None:
@@ -1588,6 +1656,8 @@ class CPOIntUnderflow(CPOPredicate):
     - args[1]: index of exp2 in cdictionary
     """
 
+    __slots__ = ()
+
     def __init__(
             self, pd: "CFilePredicateDictionary", ixval: IT.IndexedTableValue
     ) -> None:
@@ -1641,6 +1711,8 @@ class CPOIntOverflow(CPOPredicate):
     - args[1]: index of exp2 in cdictionary
     """
 
+    __slots__ = ()
+
     def __init__(
             self, pd: "CFilePredicateDictionary", ixval: IT.IndexedTableValue
     ) -> None:
@@ -1697,6 +1769,8 @@ class CPOUIntUnderflow(CPOPredicate):
     - args[1]: index of exp2 in cdictionary
     """
 
+    __slots__ = ()
+
     def __init__(
             self, pd: "CFilePredicateDictionary", ixval: IT.IndexedTableValue
     ) -> None:
@@ -1753,6 +1827,8 @@ class CPOUIntOverflow(CPOPredicate):
     - args[1]: index of exp2 in cdictionary
     """
 
+    __slots__ = ()
+
     def __init__(
             self, pd: "CFilePredicateDictionary", ixval: IT.IndexedTableValue
     ) -> None:
@@ -1804,6 +1880,8 @@ class CPOWidthOverflow(CPOPredicate):
     - args[0]: exp
     """
 
+    __slots__ = ()
+
     def __init__(
             self, pd: "CFilePredicateDictionary", ixval: IT.IndexedTableValue
     ) -> None:
@@ -1840,6 +1918,8 @@ class CPOPtrLowerBound(CPOPredicate):
     - args[2]: exp2
     """
 
+    __slots__ = ()
+
     def __init__(
             self, pd: "CFilePredicateDictionary", ixval: IT.IndexedTableValue
     ) -> None:
@@ -1893,6 +1973,8 @@ class CPOPtrUpperBound(CPOPredicate):
     - args[2]: exp2
     """
 
+    __slots__ = ()
+
     def __init__(
             self, pd: "CFilePredicateDictionary", ixval: IT.IndexedTableValue
     ) -> None:
@@ -1946,6 +2028,8 @@ class CPOPtrUpperBoundDeref(CPOPredicate):
     - args[2]: exp2
     """
 
+    __slots__ = ()
+
     def __init__(
             self, pd: "CFilePredicateDictionary", ixval: IT.IndexedTableValue
     ) -> None:
@@ -1996,6 +2080,8 @@ class CPOCommonBase(CPOPredicate):
     - args[1]: index of exp2 in cdictionary
     """
 
+    __slots__ = ()
+
     def __init__(
             self, pd: "CFilePredicateDictionary", ixval: IT.IndexedTableValue
     ) -> None:
@@ -2029,6 +2115,8 @@ class CPOCommonBaseType(CPOPredicate):
     - args[1]: index of exp2 in cdictionary
     """
 
+    __slots__ = ()
+
     def __init__(
             self, pd: "CFilePredicateDictionary", ixval: IT.IndexedTableValue
     ) -> None:
@@ -2064,6 +2152,8 @@ class CPOFormatString(CPOPredicate):
     - args[0]: index exp in cdictionary
     """
 
+    __slots__ = ()
+
     def __init__(
             self, pd: "CFilePredicateDictionary", ixval: IT.IndexedTableValue
     ) -> None:
@@ -2098,6 +2188,8 @@ class CPOVarArgs(CPOPredicate):
       - 2..: indices of args in cdictionary
     """
 
+    __slots__ = ()
+
     def __init__(
             self, pd: "CFilePredicateDictionary", ixval: IT.IndexedTableValue
     ) -> None:
@@ -2134,6 +2226,8 @@ class CPONoOverlap(CPOPredicate):
     - args[1]: index of exp2 in cdictionary
     """
 
+    __slots__ = ()
+
     def __init__(
             self, pd: "CFilePredicateDictionary", ixval: IT.IndexedTableValue
     ) -> None:
@@ -2170,6 +2264,8 @@ class CPOValueConstraint(CPOPredicate):
     - args[0]: index of exp in cdictionary
     """
 
+    __slots__ = ()
+
     def __init__(
             self, pd: "CFilePredicateDictionary", ixval: IT.IndexedTableValue
     ) -> None:
@@ -2193,6 +2289,8 @@ class CPOValueConstraint(CPOPredicate):
 @pdregistry.register_tag("up", CPOPredicate)
 class CPOUniquePointer(CPOPredicate):
 
+    __slots__ = ()
+
     def __init__(
             self, pd: "CFilePredicateDictionary", ixval: IT.IndexedTableValue
     ) -> None:
@@ -2218,6 +2316,8 @@ class CPOPreservedAllMemory(CPOPredicate):
     """preserves-all-memory(): true of a function that does not free any memory.
     """
 
+    __slots__ = ()
+
     def __init__(
             self, pd: "CFilePredicateDictionary", ixval: IT.IndexedTableValue
     ) -> None:
@@ -2238,6 +2338,8 @@ class CPOPreservedValue(CPOPredicate):
     - args[0]: index of exp in cdictionary
     """
 
+    __slots__ = ()
+
     def __init__(
             self, pd: "CFilePredicateDictionary", ixval: IT.IndexedTableValue
     ) -> None:
@@ -2260,6 +2362,9 @@ class CPOOutputParameterInitialized(CPOPredicate):
 
     - args[0]: index of varinfo in cdecls
     """
+
+    __slots__ = ()
+
     def __init__(
             self, pd: "CFilePredicateDictionary", ixval: IT.IndexedTableValue
     ) -> None:
@@ -2295,6 +2400,9 @@ class CPOOutputParameterUnaltered(CPOPredicate):
 
     - args[0]: index of varinfo in cdecls
     """
+
+    __slots__ = ()
+
     def __init__(
             self, pd: "CFilePredicateDictionary", ixval: IT.IndexedTableValue
     ) -> None:
@@ -2327,6 +2435,8 @@ class CPOOutputParameterUnaltered(CPOPredicate):
 @pdregistry.register_tag("opa", CPOPredicate)
 class CPOOutputParameterArgument(CPOPredicate):
 
+    __slots__ = ()
+
     def __init__(
             self, pd: "CFilePredicateDictionary", ixval: IT.IndexedTableValue
     ) -> None:
@@ -2343,6 +2453,8 @@ class CPOOutputParameterArgument(CPOPredicate):
 @pdregistry.register_tag("ops", CPOPredicate)
 class CPOOutputParameterScalar(CPOPredicate):
 
+    __slots__ = ()
+
     def __init__(
             self, pd: "CFilePredicateDictionary", ixval: IT.IndexedTableValue
     ) -> None:
@@ -2366,6 +2478,8 @@ class CPOOutputParameterScalar(CPOPredicate):
 @pdregistry.register_tag("opne", CPOPredicate)
 class CPOOutputParameterNoEscape(CPOPredicate):
 
+    __slots__ = ()
+
     def __init__(
             self, pd: "CFilePredicateDictionary", ixval: IT.IndexedTableValue
     ) -> None:
@@ -42,6 +42,8 @@ if TYPE_CHECKING:
 
 class OutputParameterRejectionReason(CFunPODictionaryRecord):
 
+    __slots__ = ()
+
     def __init__(
             self, pod: "CFunPODictionary", ixval: IndexedTableValue
     ) -> None:
@@ -51,6 +53,8 @@ class OutputParameterRejectionReason(CFunPODictionaryRecord):
 @podregistry.register_tag("a", OutputParameterRejectionReason)
 class OutputParameterRejectionReasonArrayStruct(OutputParameterRejectionReason):
 
+    __slots__ = ()
+
     def __init__(
             self, pod: "CFunPODictionary", ixval: IndexedTableValue
     ) -> None:
@@ -67,6 +71,8 @@ class OutputParameterRejectionReasonArrayStruct(OutputParameterRejectionReason):
 @podregistry.register_tag("at", OutputParameterRejectionReason)
 class OutputParameterRejectionReasonArrayType(OutputParameterRejectionReason):
 
+    __slots__ = ()
+
     def __init__(
             self, pod: "CFunPODictionary", ixval: IndexedTableValue
     ) -> None:
@@ -83,6 +89,8 @@ class OutputParameterRejectionReasonArrayType(OutputParameterRejectionReason):
 @podregistry.register_tag("c", OutputParameterRejectionReason)
 class OutputParameterRejectionReasonConstQualifier(OutputParameterRejectionReason):
 
+    __slots__ = ()
+
     def __init__(
             self, pod: "CFunPODictionary", ixval: IndexedTableValue
     ) -> None:
@@ -99,6 +107,8 @@ class OutputParameterRejectionReasonConstQualifier(OutputParameterRejectionReaso
 @podregistry.register_tag("o", OutputParameterRejectionReason)
 class OutputParameterRejectionReasonOtherReason(OutputParameterRejectionReason):
 
+    __slots__ = ()
+
     def __init__(
             self, pod: "CFunPODictionary", ixval: IndexedTableValue
     ) -> None:
@@ -115,6 +125,8 @@ class OutputParameterRejectionReasonOtherReason(OutputParameterRejectionReason):
 @podregistry.register_tag("p", OutputParameterRejectionReason)
 class OutputParameterRejectionReasonPointerPointer(OutputParameterRejectionReason):
 
+    __slots__ = ()
+
     def __init__(
             self, pod: "CFunPODictionary", ixval: IndexedTableValue
     ) -> None:
@@ -131,6 +143,8 @@ class OutputParameterRejectionReasonPointerPointer(OutputParameterRejectionReaso
 @podregistry.register_tag("r", OutputParameterRejectionReason)
 class OutputParameterRejectionReasonParameterRead(OutputParameterRejectionReason):
 
+    __slots__ = ()
+
     def __init__(
             self, pod: "CFunPODictionary", ixval: IndexedTableValue
     ) -> None:
@@ -147,6 +161,8 @@ class OutputParameterRejectionReasonParameterRead(OutputParameterRejectionReason
 @podregistry.register_tag("s", OutputParameterRejectionReason)
 class OutputParameterRejectionReasonSystemStruct(OutputParameterRejectionReason):
 
+    __slots__ = ()
+
     def __init__(
             self, pod: "CFunPODictionary", ixval: IndexedTableValue
     ) -> None:
@@ -163,6 +179,8 @@ class OutputParameterRejectionReasonSystemStruct(OutputParameterRejectionReason)
 @podregistry.register_tag("v", OutputParameterRejectionReason)
 class OutputParameterRejectionReasonVoidPointer(OutputParameterRejectionReason):
 
+    __slots__ = ()
+
     def __init__(
             self, pod: "CFunPODictionary", ixval: IndexedTableValue
     ) -> None:
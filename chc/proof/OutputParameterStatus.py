@@ -41,6 +41,8 @@ if TYPE_CHECKING:
 
 class OutputParameterStatus(CFunPODictionaryRecord):
 
+    __slots__ = ()
+
     def __init__(
             self, pod: "CFunPODictionary", ixval: IndexedTableValue
     ) -> None:
@@ -70,6 +72,8 @@ class OutputParameterStatus(CFunPODictionaryRecord):
 @podregistry.register_tag("u", OutputParameterStatus)
 class OutputParameterStatusUnknown(OutputParameterStatus):
 
+    __slots__ = ()
+
     def __init__(
             self, pod: "CFunPODictionary", ixval: IndexedTableValue
     ) -> None:
@@ -86,6 +90,8 @@ class OutputParameterStatusUnknown(OutputParameterStatus):
 @podregistry.register_tag("v", OutputParameterStatus)
 class OutputParameterStatusViable(OutputParameterStatus):
 
+    __slots__ = ()
+
     def __init__(
             self, pod: "CFunPODictionary", ixval: IndexedTableValue
     ) -> None:
@@ -102,6 +108,8 @@ class OutputParameterStatusViable(OutputParameterStatus):
 @podregistry.register_tag("r", OutputParameterStatus)
 class OutputParameterStatusRejected(OutputParameterStatus):
 
+    __slots__ = ()
+
     def __init__(
             self, pod: "CFunPODictionary", ixval: IndexedTableValue
     ) -> None:
@@ -122,6 +130,8 @@ class OutputParameterStatusRejected(OutputParameterStatus):
 @podregistry.register_tag("w", OutputParameterStatus)
 class OutputParameterStatusWritten(OutputParameterStatus):
 
+    __slots__ = ()
+
     def __init__(
             self, pod: "CFunPODictionary", ixval: IndexedTableValue
     ) -> None:
@@ -138,6 +148,8 @@ class OutputParameterStatusWritten(OutputParameterStatus):
 @podregistry.register_tag("a", OutputParameterStatus)
 class OutputParameterStatusUnaltered(OutputParameterStatus):
 
+    __slots__ = ()
+
     def __init__(
             self, pod: "CFunPODictionary", ixval: IndexedTableValue
     ) -> None:
@@ -47,6 +47,8 @@ if TYPE_CHECKING:
 class PPOType(CFunPOType):
     """Base class for primary proof obligation types."""
 
+    __slots__ = ()
+
     def __init__(
             self, pod: "CFunPODictionary", ixval: IndexedTableValue
     ) -> None:
@@ -73,6 +75,8 @@ class ProgramPPOType(PPOType):
     * args[2]: index of predicate in predicate dictionary
     """
 
+    __slots__ = ()
+
     def __init__(
             self, pod: "CFunPODictionary", ixval: IndexedTableValue
     ) -> None:
@@ -116,6 +120,8 @@ class LibPPOType(PPOType):
     * args[3]: index of xpredicate in interface dictionary
     """
 
+    __slots__ = ()
+
     def __init__(
             self, pod: "CFunPODictionary", ixval: IndexedTableValue
     ) -> None:
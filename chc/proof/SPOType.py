@@ -48,6 +48,8 @@ if TYPE_CHECKING:
 class SPOType(CFunPOType):
     """Base class for supporting proof obligation types."""
 
+    __slots__ = ()
+
     def __init__(
             self, pod: "CFunPODictionary", ixval: IndexedTableValue
     ) -> None:
@@ -82,6 +84,8 @@ class LocalSPOType(SPOType):
     * args[2]: index of predicate in predicate dictionary
     """
 
+    __slots__ = ()
+
     def __init__(
             self, pod: "CFunPODictionary", ixval: IndexedTableValue
     ) -> None:
@@ -124,6 +128,8 @@ class CallsiteSPOType(SPOType):
     * args[3]: api-id
     """
 
+    __slots__ = ()
+
     def __init__(
             self, pod: "CFunPODictionary", ixval: IndexedTableValue
     ) -> None:
@@ -170,6 +176,8 @@ class ReturnsiteSPOType(SPOType):
     * args[3]: index of xpredicate in interface dictionary
     """
 
+    __slots__ = ()
+
     def __init__(
             self, pod: "CFunPODictionary", ixval: IndexedTableValue
     ) -> None:
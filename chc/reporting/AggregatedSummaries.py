@@ -0,0 +1,153 @@
+# ------------------------------------------------------------------------------
+# CodeHawk C Analyzer
+# Author: Henny Sipma
+# ------------------------------------------------------------------------------
+# The MIT License (MIT)
+#
+# Copyright (c) 2026 Aarno Labs LLC
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# ------------------------------------------------------------------------------
+"""Aggregated file of per-test summary records for dashboards.
+
+Each analysis or scoring step appends the summary it saved for a test as a
+single json line to the aggregated file:
+
+  {"id": <test id>, "kind": <kind of summary>, "timestamp": <mtime>,
+   "data": <summary>}
+
+where timestamp is the modification time (in ns) of the per-test file that
+holds the same summary. The last record for a given test id and kind is
+current as long as the per-test file was not modified after it was
+recorded; otherwise (or if there is no record) the per-test file is read and
+a new record is appended. Dashboards thus read a single file, and read
+per-test files only for tests with missing or stale records.
+
+Appending (rather than rewriting) allows worker processes to add records
+concurrently; the file is compacted to the current records by compact.
+"""
+
+import json
+import os
+
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from chc.util.loggingutil import chklogger
+
+
+class AggregatedSummaries:
+
+    def __init__(self, filename: str) -> None:
+        self._filename = filename
+        self._records: Optional[Dict[Tuple[str, str], Dict[str, Any]]] = None
+        self._linecount = 0
+
+    @property
+    def filename(self) -> str:
+        return self._filename
+
+    @property
+    def records(self) -> Dict[Tuple[str, str], Dict[str, Any]]:
+        if self._records is None:
+            self._records = {}
+            self._linecount = 0
+            if os.path.isfile(self.filename):
+                with open(self.filename, "r") as fp:
+                    for line in fp:
+                        self._linecount += 1
+                        try:
+                            record = json.loads(line)
+                            key = (record["id"], record["kind"])
+                        except (ValueError, KeyError, TypeError):
+                            # partially written line
+                            continue
+                        self._records[key] = record
+        return self._records
+
+    def append(
+            self,
+            testid: str,
+            kind: str,
+            sourcefile: str,
+            data: Dict[str, Any]) -> None:
+        """Records data for testid, as saved in sourcefile."""
+
+        record = {
+            "id": testid,
+            "kind": kind,
+            "timestamp": os.stat(sourcefile).st_mtime_ns,
+            "data": data}
+        line = json.dumps(record, sort_keys=True) + "\n"
+        try:
+            # single write in append mode, so that lines from concurrent
+            # writers are not interleaved
+            with open(self.filename, "a") as fp:
+                fp.write(line)
+        except OSError as e:
+            chklogger.logger.warning(
+                "Unable to append to %s: %s", self.filename, str(e))
+            return
+        if self._records is not None:
+            self._records[(testid, kind)] = record
+            self._linecount += 1
+
+    def get(
+            self,
+            testid: str,
+            kind: str,
+            sourcefile: str,
+            load: Callable[[], Optional[Dict[str, Any]]]
+    ) -> Optional[Dict[str, Any]]:
+        """Returns the current data for testid, or None if there is none.
+
+        If the record is missing or stale, the data is obtained from load
+        (which reads sourcefile) and recorded.
+        """
+        if not os.path.isfile(sourcefile):
+            return None
+        record = self.records.get((testid, kind))
+        if (record is not None
+                and record["timestamp"] == os.stat(sourcefile).st_mtime_ns):
+            return record["data"]
+        data = load()
+        if data is not None:
+            self.append(testid, kind, sourcefile, data)
+        return data
+
+    def compact(self, force: bool = False) -> None:
+        """Rewrites the file with only the current records.
+
+        Unless forced, the file is compacted only if at least half of its
+        lines are superseded records.
+        """
+        records = self.records
+        if not force and self._linecount < 2 * len(records):
+            return
+        lines: List[str] = [
+            json.dumps(r, sort_keys=True) + "\n" for r in records.values()]
+        tmpfilename = self.filename + ".tmp"
+        try:
+            with open(tmpfilename, "w") as fp:
+                fp.writelines(lines)
+            os.replace(tmpfilename, self.filename)
+        except OSError as e:
+            chklogger.logger.warning(
+                "Unable to compact %s: %s", self.filename, str(e))
+            return
+        self._linecount = len(lines)
@@ -0,0 +1,172 @@
+# ------------------------------------------------------------------------------
+# CodeHawk C Analyzer
+# Author: Henny Sipma
+# ------------------------------------------------------------------------------
+# The MIT License (MIT)
+#
+# Copyright (c) 2026 Aarno Labs LLC
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# ------------------------------------------------------------------------------
+"""Per-function summaries of proof obligation results.
+
+A digest records, for a single function, the number of proof obligations
+per (predicate, status, discharge method, kind) combination, together with
+a content hash of the function's proof obligation files (_pod, _ppo, and
+_spo). As long as the hash matches the files on disk, the counts can be
+used in place of parsing the proof obligations, so that a report after
+re-analysis only needs to parse the functions that changed.
+"""
+
+import hashlib
+import json
+import os
+
+from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
+
+import chc.util.fileutil as UF
+from chc.util.loggingutil import chklogger
+
+if TYPE_CHECKING:
+    from chc.app.CFunction import CFunction
+
+
+# (predicate name, status, discharge method, kind, count)
+DigestRow = Tuple[str, str, Optional[str], str, int]
+
+
+def function_results_hash(cfun: "CFunction") -> str:
+    """Returns a content hash of the proof obligation files of a function."""
+
+    return results_hash(
+        cfun.targetpath,
+        cfun.projectname,
+        cfun.cfilepath,
+        cfun.cfilename,
+        cfun.name)
+
+
+def results_hash(
+        targetpath: str,
+        projectname: str,
+        cfilepath: Optional[str],
+        cfilename: str,
+        fname: str) -> str:
+    """Returns a content hash of the proof obligation files of function fname."""
+
+    h = hashlib.sha256()
+    for getfilename in [
+            UF.get_pod_filename, UF.get_ppo_filename, UF.get_spo_filename]:
+        filename = getfilename(
+            targetpath, projectname, cfilepath, cfilename, fname)
+        if os.path.isfile(filename):
+            with open(filename, "rb") as fp:
+                content = fp.read()
+            h.update(str(len(content)).encode())
+            h.update(content)
+        else:
+            h.update(b"-")
+    return h.hexdigest()
+
+
+class FunctionResultDigests:
+    """Collection of function result digests of a project."""
+
+    def __init__(self, targetpath: str, projectname: str) -> None:
+        self._targetpath = targetpath
+        self._projectname = projectname
+        # digests loaded from the previous run
+        self._digests: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        # digests of the functions seen in this run (saved)
+        self._current: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self._reused = 0
+        self._computed = 0
+
+    @property
+    def targetpath(self) -> str:
+        return self._targetpath
+
+    @property
+    def projectname(self) -> str:
+        return self._projectname
+
+    @property
+    def reused(self) -> int:
+        """Returns the number of digests used in place of parsing."""
+
+        return self._reused
+
+    @property
+    def computed(self) -> int:
+        """Returns the number of digests (re)computed from the proof obligations."""
+
+        return self._computed
+
+    def get_rows(
+            self,
+            filename: str,
+            fname: str,
+            hash: str) -> Optional[List[DigestRow]]:
+        """Returns the saved counts if they are still valid for hash."""
+
+        d = self._digests.get(filename, {}).get(fname)
+        if d is None or d.get("hash") != hash:
+            return None
+        self._reused += 1
+        self._current.setdefault(filename, {})[fname] = d
+        return [
+            (tag, status, method, kind, count)
+            for (tag, status, method, kind, count) in d["rows"]]
+
+    def set_rows(
+            self,
+            filename: str,
+            fname: str,
+            hash: str,
+            rows: List[DigestRow]) -> None:
+        self._computed += 1
+        self._current.setdefault(filename, {})[fname] = {
+            "hash": hash, "rows": [list(r) for r in rows]}
+
+    def save(self) -> None:
+        """Saves the digests of the functions seen since loading."""
+
+        filename = UF.get_functiondigests_filename(
+            self.targetpath, self.projectname)
+        with open(filename, "w") as fp:
+            json.dump(self._current, fp)
+        chklogger.logger.info(
+            "Function result digests: %d reused, %d computed; saved to %s",
+            self.reused, self.computed, filename)
+
+    @staticmethod
+    def load(targetpath: str, projectname: str) -> "FunctionResultDigests":
+        """Returns the saved digests, or an empty collection if none exist."""
+
+        result = FunctionResultDigests(targetpath, projectname)
+        filename = UF.get_functiondigests_filename(targetpath, projectname)
+        if os.path.isfile(filename):
+            try:
+                with open(filename, "r") as fp:
+                    result._digests = json.load(fp)
+            except ValueError as e:
+                chklogger.logger.warning(
+                    "Function result digests %s not readable: %s; ignored",
+                    filename, str(e))
+        return result
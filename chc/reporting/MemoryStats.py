@@ -0,0 +1,237 @@
+# ------------------------------------------------------------------------------
+# CodeHawk C Analyzer
+# Author: Henny Sipma
+# ------------------------------------------------------------------------------
+# The MIT License (MIT)
+#
+# Copyright (c) 2026 Aarno Labs LLC
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# ------------------------------------------------------------------------------
+"""Approximate accounting of the memory held by an application.
+
+At each phase boundary a record is added with:
+
+- the memory traced by tracemalloc (current and peak), and the modules
+  that allocated most of it;
+- for every file with analysis artifacts in memory: the row count and
+  estimated size of every table of its dictionaries (CFileDictionary,
+  CFileDeclarations, CContextDictionary, CFilePredicateDictionary,
+  InterfaceDictionary), of its invariant record pool, and of the tables of
+  the proof obligation and invariant dictionaries of its functions;
+- for every function: the number and estimated size of its primary and
+  supporting proof obligations and of the facts in its invariant table
+  that have been read.
+
+Table sizes are estimated from the sizes of the containers and records
+of the table; strings shared through the string pool are not included.
+Proof obligations are estimated by the size of their objects and
+attributes only (not of the records they refer to, which are counted in
+the dictionaries).
+The records are written to a json file after every phase, so that the
+file is available also if the process runs out of memory later.
+"""
+
+import json
+import sys
+import tracemalloc
+
+from array import array
+
+from typing import Any, Dict, List, Optional, TYPE_CHECKING
+
+import chc.util.IndexedTable as IT
+from chc.util.StringIndexedTable import StringIndexedTable
+from chc.util.loggingutil import chklogger
+
+if TYPE_CHECKING:
+    from chc.app.CApplication import CApplication
+    from chc.app.CFile import CFile
+    from chc.app.CFunction import CFunction
+
+
+def record_size(v: IT.IndexedTableValue) -> int:
+    return sys.getsizeof(v) + sys.getsizeof(v.tags) + sys.getsizeof(v.args)
+
+
+def table_size(t: Any) -> int:
+    """Returns an estimate of the number of bytes held by table t."""
+
+    if isinstance(t, IT.IndexedTable):
+        result = sys.getsizeof(t.keytable) + sys.getsizeof(t.indextable)
+        for key in t.keytable:
+            result += (
+                sys.getsizeof(key)
+                + sys.getsizeof(key[0])
+                + sys.getsizeof(key[1]))
+        for v in t.indextable.values():
+            result += record_size(v)
+        return result
+    elif isinstance(t, IT.InternedIndexedTable):
+        return t.size() * array("i").itemsize
+    elif isinstance(t, StringIndexedTable):
+        result = sys.getsizeof(t.stringtable) + sys.getsizeof(t.indextable)
+        for s in t.stringtable:
+            result += sys.getsizeof(s)
+        return result
+    else:
+        return 0
+
+
+def object_size(o: Any) -> int:
+    """Returns the size of o and of its attribute dictionary."""
+
+    result = sys.getsizeof(o)
+    if hasattr(o, "__dict__"):
+        result += sys.getsizeof(o.__dict__)
+    return result
+
+
+def pool_size(pool: IT.RecordPool) -> int:
+    """Returns an estimate of the number of bytes held by the records of pool."""
+
+    result = 0
+    for id in range(pool.size()):
+        (tags, args) = pool.record(id)
+        result += sys.getsizeof(tags) + sys.getsizeof(args)
+    return result
+
+
+def dictionary_stats(d: Any) -> Dict[str, Any]:
+    """Returns the rows and estimated bytes of the tables of dictionary d."""
+
+    tables: List[Any] = list(d.tables)
+    for name in ["string_table", "filename_table"]:
+        if hasattr(d, name):
+            tables.append(getattr(d, name))
+    result: Dict[str, Any] = {}
+    for t in tables:
+        result[t.name] = {"rows": t.size(), "bytes": table_size(t)}
+    result["bytes"] = sum(
+        v["bytes"] for v in result.values() if isinstance(v, dict))
+    return result
+
+
+def function_stats(cfun: "CFunction") -> Dict[str, Any]:
+    result: Dict[str, Any] = {}
+    for (name, d) in cfun.loaded_dictionaries().items():
+        result[name] = dictionary_stats(d)
+    proofs = cfun.loaded_proofs()
+    if proofs is not None:
+        polists: Dict[str, List[Any]] = {
+            "ppos": proofs.loaded_ppos(), "spos": proofs.loaded_spos()}
+        for (name, pos) in polists.items():
+            if len(pos) > 0:
+                result[name] = {
+                    "rows": len(pos),
+                    "bytes": sum(object_size(po) for po in pos)}
+    invtable = cfun.loaded_invarianttable()
+    if invtable is not None:
+        invariants = invtable.loaded_invariants()
+        result["invariant-table"] = {
+            "rows": sum(len(facts) for facts in invariants.values()),
+            "bytes": (
+                sys.getsizeof(invariants)
+                + sum(sys.getsizeof(facts) for facts in invariants.values()))}
+    result["bytes"] = sum(v["bytes"] for v in result.values())
+    return result
+
+
+def file_stats(cfile: "CFile") -> Optional[Dict[str, Any]]:
+    """Returns the table statistics of cfile, or None if nothing is loaded."""
+
+    dictionaries = cfile.loaded_dictionaries()
+    functions = cfile.loaded_functions()
+    if len(dictionaries) == 0 and len(functions) == 0:
+        return None
+    result: Dict[str, Any] = {}
+    result["file"] = cfile.name
+    result["dictionaries"] = {
+        name: dictionary_stats(d) for (name, d) in dictionaries.items()}
+    pool = cfile.invariant_record_pool
+    result["invariant-record-pool"] = {
+        "rows": pool.size(), "bytes": pool_size(pool)}
+    fstats = {cfun.name: function_stats(cfun) for cfun in functions}
+    result["functions"] = {
+        name: s for (name, s) in fstats.items() if s["bytes"] > 0}
+    result["bytes"] = (
+        sum(d["bytes"] for d in result["dictionaries"].values())
+        + result["invariant-record-pool"]["bytes"]
+        + sum(s["bytes"] for s in fstats.values()))
+    return result
+
+
+class MemoryStats:
+    """Memory accounting of an application at phase boundaries."""
+
+    def __init__(self, filename: str, ntop: int = 20) -> None:
+        self._filename = filename
+        self._ntop = ntop
+        self._phases: List[Dict[str, Any]] = []
+        self._started = not tracemalloc.is_tracing()
+        if self._started:
+            tracemalloc.start()
+
+    @property
+    def filename(self) -> str:
+        return self._filename
+
+    @property
+    def phases(self) -> List[Dict[str, Any]]:
+        return self._phases
+
+    def record(self, phase: str, capp: "CApplication") -> None:
+        """Adds the memory statistics after phase and saves all records."""
+
+        (current, peak) = tracemalloc.get_traced_memory()
+        snapshot = tracemalloc.take_snapshot()
+        top = snapshot.statistics("filename")[:self._ntop]
+        files: List[Dict[str, Any]] = []
+        for cfile in capp.cfiles:
+            fstats = file_stats(cfile)
+            if fstats is not None:
+                files.append(fstats)
+        files.sort(key=lambda f: f["bytes"], reverse=True)
+
+        d: Dict[str, Any] = {}
+        d["phase"] = phase
+        d["traced"] = current
+        d["peak"] = peak
+        d["allocations"] = [
+            {"filename": s.traceback[0].filename, "size": s.size, "count": s.count}
+            for s in top]
+        d["stringpool"] = IT.stringpool.size()
+        d["tables"] = sum(f["bytes"] for f in files)
+        d["files"] = files
+        self._phases.append(d)
+        chklogger.logger.info(
+            "Memory after %s: %d bytes traced, %d bytes in tables of %d files",
+            phase, current, d["tables"], len(files))
+        self.save()
+
+    def stop(self) -> None:
+        """Stops tracing memory allocations, if started by this object."""
+
+        if self._started:
+            tracemalloc.stop()
+            self._started = False
+
+    def save(self) -> None:
+        with open(self.filename, "w") as fp:
+            json.dump({"phases": self.phases}, fp, indent=2)
@@ -0,0 +1,363 @@
+# ------------------------------------------------------------------------------
+# CodeHawk C Analyzer
+# Author: Henny Sipma
+# ------------------------------------------------------------------------------
+# The MIT License (MIT)
+#
+# Copyright (c) 2026 Aarno Labs LLC
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# ------------------------------------------------------------------------------
+"""SQLite database of the proof obligations of a project.
+
+The database is written once from the analysis results and can then be
+queried without loading the application. It has the following tables:
+
+- files(id, name)
+- functions(id, file_id, name)
+- callsites(id, function_id, line, context, indirect)
+- callsite_targets(callsite_id, callee)
+- pos(id, function_id, kind, spo_kind, po_index, line, predicate,
+  predicate_text, status, method, explanation, callsite_id)
+- po_invariants(po_id, source, arg, inv_id)
+- meta(key, value)
+
+kind is ppo or spo; spo_kind is local, callsite, or returnsite for
+supporting proof obligations. Callsite supporting proof obligations are
+linked to their call site via callsite_id. The invariants are those the
+proof depends on (source: dependency) and those recorded in the
+diagnostic for an argument of the predicate (source: diagnostic).
+"""
+
+import os
+import sqlite3
+import time
+
+from typing import (
+    Any, Dict, List, Optional, Sequence, Tuple, TYPE_CHECKING)
+
+from chc.reporting.POStatusIndex import get_dsmethod
+
+import chc.util.fileutil as UF
+from chc.util.loggingutil import chklogger
+
+if TYPE_CHECKING:
+    from chc.app.CApplication import CApplication
+    from chc.app.CFunction import CFunction
+    from chc.proof.CFunctionCallsiteSPOs import CFunctionCallsiteSPOs
+    from chc.proof.CFunctionPO import CFunctionPO
+
+
+schemaversion = "1"
+
+schema = """
+CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE files (id INTEGER PRIMARY KEY, name TEXT NOT NULL);
+CREATE TABLE functions (
+    id INTEGER PRIMARY KEY,
+    file_id INTEGER NOT NULL REFERENCES files(id),
+    name TEXT NOT NULL);
+CREATE TABLE callsites (
+    id INTEGER PRIMARY KEY,
+    function_id INTEGER NOT NULL REFERENCES functions(id),
+    line INTEGER,
+    context TEXT,
+    indirect INTEGER NOT NULL);
+CREATE TABLE callsite_targets (
+    callsite_id INTEGER NOT NULL REFERENCES callsites(id),
+    callee TEXT NOT NULL);
+CREATE TABLE pos (
+    id INTEGER PRIMARY KEY,
+    function_id INTEGER NOT NULL REFERENCES functions(id),
+    kind TEXT NOT NULL,
+    spo_kind TEXT,
+    po_index INTEGER NOT NULL,
+    line INTEGER,
+    predicate TEXT NOT NULL,
+    predicate_text TEXT NOT NULL,
+    status TEXT NOT NULL,
+    method TEXT,
+    explanation TEXT,
+    callsite_id INTEGER REFERENCES callsites(id));
+CREATE TABLE po_invariants (
+    po_id INTEGER NOT NULL REFERENCES pos(id),
+    source TEXT NOT NULL,
+    arg INTEGER,
+    inv_id INTEGER NOT NULL);
+"""
+
+indices = """
+CREATE INDEX functions_name ON functions(name);
+CREATE INDEX functions_file ON functions(file_id);
+CREATE INDEX callsites_function ON callsites(function_id);
+CREATE INDEX callsite_targets_callee ON callsite_targets(callee);
+CREATE INDEX callsite_targets_callsite ON callsite_targets(callsite_id);
+CREATE INDEX pos_function ON pos(function_id);
+CREATE INDEX pos_predicate_status ON pos(predicate, status);
+CREATE INDEX pos_status ON pos(status);
+CREATE INDEX pos_callsite ON pos(callsite_id);
+CREATE INDEX po_invariants_po ON po_invariants(po_id);
+CREATE INDEX po_invariants_inv ON po_invariants(inv_id);
+"""
+
+# columns returned for proof obligation queries
+pocolumns: List[Tuple[str, str]] = [
+    ("file", "files.name"),
+    ("function", "functions.name"),
+    ("line", "pos.line"),
+    ("kind", "pos.kind"),
+    ("id", "pos.po_index"),
+    ("predicate", "pos.predicate_text"),
+    ("status", "pos.status"),
+    ("method", "pos.method")]
+
+# group-by keys supported by query_pos_database
+groupbycolumns: Dict[str, str] = {
+    "file": "files.name",
+    "function": "functions.name",
+    "predicate": "pos.predicate",
+    "status": "pos.status",
+    "method": "pos.method",
+    "kind": "pos.kind"}
+
+
+class PODatabaseWriter:
+    """Writes the proof obligations of an application to a database."""
+
+    def __init__(self, conn: sqlite3.Connection) -> None:
+        self._conn = conn
+        self._fileids: Dict[str, int] = {}
+        self._counts: Dict[str, int] = {
+            "functions": 0, "ppos": 0, "spos": 0, "callsites": 0}
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        return self._conn
+
+    @property
+    def counts(self) -> Dict[str, int]:
+        return self._counts
+
+    def _file_id(self, filename: str) -> int:
+        if filename not in self._fileids:
+            cur = self.conn.execute(
+                "INSERT INTO files (name) VALUES (?)", (filename,))
+            self._fileids[filename] = int(cur.lastrowid or 0)
+        return self._fileids[filename]
+
+    def add_po(
+            self,
+            functionid: int,
+            po: "CFunctionPO",
+            kind: str,
+            spokind: Optional[str] = None,
+            callsiteid: Optional[int] = None) -> None:
+        cur = self.conn.execute(
+            "INSERT INTO pos (function_id, kind, spo_kind, po_index, line,"
+            + " predicate, predicate_text, status, method, explanation,"
+            + " callsite_id) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (functionid,
+             kind,
+             spokind,
+             po.po_index,
+             po.line,
+             po.predicate_name,
+             str(po.predicate),
+             po.status,
+             get_dsmethod(po),
+             po.explanation_txt,
+             callsiteid))
+        poid = cur.lastrowid
+        invs: List[Tuple[Any, str, Optional[int], int]] = []
+        if po.has_dependencies():
+            for inv in po.dependencies.invs:
+                invs.append((poid, "dependency", None, inv))
+        if po.has_diagnostic():
+            for (arg, invids) in po.diagnostic.invsmap.items():
+                for inv in invids:
+                    invs.append((poid, "diagnostic", arg, inv))
+        if len(invs) > 0:
+            self.conn.executemany(
+                "INSERT INTO po_invariants (po_id, source, arg, inv_id)"
+                + " VALUES (?, ?, ?, ?)",
+                invs)
+        self._counts[kind + "s"] += 1
+
+    def add_callsite(
+            self, functionid: int, cspos: "CFunctionCallsiteSPOs") -> None:
+        callees: List[str] = []
+        try:
+            if cspos.has_callee():
+                callees = [cspos.callee.vname]
+            else:
+                callees = [v.vname for v in cspos.callees]
+        except UF.CHCError as e:
+            chklogger.logger.warning(
+                "Unable to resolve callee at line %d: %s", cspos.line, str(e))
+        cur = self.conn.execute(
+            "INSERT INTO callsites (function_id, line, context, indirect)"
+            + " VALUES (?, ?, ?, ?)",
+            (functionid,
+             cspos.line,
+             str(cspos.cfgcontext),
+             0 if cspos.is_direct_call else 1))
+        callsiteid = int(cur.lastrowid or 0)
+        self.conn.executemany(
+            "INSERT INTO callsite_targets (callsite_id, callee) VALUES (?, ?)",
+            [(callsiteid, callee) for callee in callees])
+        for spos in cspos.spos.values():
+            for spo in spos:
+                self.add_po(
+                    functionid, spo, "spo",
+                    spokind="callsite", callsiteid=callsiteid)
+        self._counts["callsites"] += 1
+
+    def add_function(self, cfun: "CFunction") -> None:
+        fileid = self._file_id(cfun.cfile.name)
+        cur = self.conn.execute(
+            "INSERT INTO functions (file_id, name) VALUES (?, ?)",
+            (fileid, cfun.name))
+        functionid = int(cur.lastrowid or 0)
+        for ppo in cfun.get_ppos():
+            self.add_po(functionid, ppo, "ppo")
+        spos = cfun.proofs.spos
+        for spo in spos.local_spos.values():
+            self.add_po(functionid, spo, "spo", spokind="local")
+        for cspos in spos.callsite_spos.values():
+            self.add_callsite(functionid, cspos)
+        for rspos in spos.returnsite_spos.values():
+            for rspolist in rspos.spos.values():
+                for rspo in rspolist:
+                    self.add_po(functionid, rspo, "spo", spokind="returnsite")
+        self._counts["functions"] += 1
+
+
+def export_po_database(capp: "CApplication", filename: str) -> Dict[str, int]:
+    """Writes the proof obligations of capp to a new database file.
+
+    An existing file is replaced. Returns the number of functions, primary
+    and supporting proof obligations, and call sites written.
+    """
+    tmpfilename = filename + ".tmp"
+    if os.path.isfile(tmpfilename):
+        os.remove(tmpfilename)
+    conn = sqlite3.connect(tmpfilename)
+    try:
+        conn.executescript(schema)
+        writer = PODatabaseWriter(conn)
+        capp.iter_functions(writer.add_function)
+        conn.executescript(indices)
+        conn.executemany(
+            "INSERT INTO meta (key, value) VALUES (?, ?)",
+            [("schemaversion", schemaversion),
+             ("projectname", capp.projectname),
+             ("timestamp", str(int(time.time())))])
+        conn.commit()
+    finally:
+        conn.close()
+    os.replace(tmpfilename, filename)
+    chklogger.logger.info(
+        "Exported proof obligations to %s: %s", filename, str(writer.counts))
+    return writer.counts
+
+
+def open_po_database(filename: str) -> sqlite3.Connection:
+    """Opens an existing database read-only."""
+
+    if not os.path.isfile(filename):
+        raise UF.CHCError("Proof obligation database " + filename + " not found")
+    conn = sqlite3.connect("file:" + filename + "?mode=ro", uri=True)
+    row = conn.execute(
+        "SELECT value FROM meta WHERE key = 'schemaversion'").fetchone()
+    if row is None or row[0] != schemaversion:
+        conn.close()
+        raise UF.CHCError(
+            "Proof obligation database "
+            + filename
+            + " has an incompatible schema; please export it again")
+    return conn
+
+
+def query_pos_database(
+        conn: sqlite3.Connection,
+        predicate: Optional[str] = None,
+        status: Optional[str] = None,
+        method: Optional[str] = None,
+        kind: Optional[str] = None,
+        filename: Optional[str] = None,
+        function: Optional[str] = None,
+        calledfrom: Optional[str] = None,
+        invariant: Optional[int] = None,
+        groupby: Optional[str] = None,
+        limit: Optional[int] = None) -> Tuple[List[str], List[Sequence[Any]]]:
+    """Returns the header and rows of a proof obligation query.
+
+    Filters are combined with and; calledfrom selects the proof obligations
+    in functions that are called (directly or through a resolved indirect
+    call) from the given function. If groupby is given, the rows are the
+    groups with their proof obligation count, otherwise the matching proof
+    obligations.
+    """
+    conditions: List[str] = []
+    params: List[Any] = []
+    for (column, value) in [
+            ("pos.predicate", predicate),
+            ("pos.status", status),
+            ("pos.method", method),
+            ("pos.kind", kind),
+            ("files.name", filename),
+            ("functions.name", function)]:
+        if value is not None:
+            conditions.append(column + " = ?")
+            params.append(value)
+    if calledfrom is not None:
+        conditions.append(
+            "functions.name IN ("
+            + "SELECT ct.callee FROM callsite_targets ct"
+            + " JOIN callsites cs ON ct.callsite_id = cs.id"
+            + " JOIN functions caller ON cs.function_id = caller.id"
+            + " WHERE caller.name = ?)")
+        params.append(calledfrom)
+    if invariant is not None:
+        conditions.append(
+            "pos.id IN (SELECT po_id FROM po_invariants WHERE inv_id = ?)")
+        params.append(invariant)
+
+    tables = (
+        " FROM pos JOIN functions ON pos.function_id = functions.id"
+        + " JOIN files ON functions.file_id = files.id")
+    where = "" if len(conditions) == 0 else " WHERE " + " AND ".join(conditions)
+
+    if groupby is not None:
+        if groupby not in groupbycolumns:
+            raise UF.CHCError("Unable to group proof obligations by " + groupby)
+        column = groupbycolumns[groupby]
+        header = [groupby, "count"]
+        sql = (
+            "SELECT " + column + ", COUNT(*)" + tables + where
+            + " GROUP BY " + column + " ORDER BY COUNT(*) DESC")
+    else:
+        header = [name for (name, _) in pocolumns]
+        sql = (
+            "SELECT " + ", ".join(c for (_, c) in pocolumns) + tables + where
+            + " ORDER BY files.name, functions.name, pos.line")
+    if limit is not None:
+        sql += " LIMIT ?"
+        params.append(limit)
+    return (header, conn.execute(sql, params).fetchall())
@@ -0,0 +1,441 @@
+# ------------------------------------------------------------------------------
+# CodeHawk C Analyzer
+# Author: Henny Sipma
+# ------------------------------------------------------------------------------
+# The MIT License (MIT)
+#
+# Copyright (c) 2026 Aarno Labs LLC
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# ------------------------------------------------------------------------------
+"""Columnar index of the status of all proof obligations in a project.
+
+The index holds one row per proof obligation, stored as parallel integer
+columns:
+
+- file: index into the list of file names
+- function: index into the list of (file index, function name) pairs
+- tag: index into the list of predicate names
+- status: index into the list of proof obligation status names
+- method: index into the list of discharge methods (-1 if unclassified)
+- kind: 0 for primary, 1 for supporting proof obligations
+
+The index is built once from the proof obligations of an application and
+saved in the analysis results directory; statistics tables are computed as
+group-by counts over the columns rather than by traversing the proof
+obligation objects. The columns are reduced once per grouping to counts of
+distinct (group, file, status, method, kind) rows, which all statistics
+for that grouping are computed from. When the index is built with function result digests,
+the content hashes of the proof obligation files of all functions are
+saved with it; the saved index is used in place of the proof obligations
+as long as these hashes (and the parse timestamp of the project) are
+unchanged.
+"""
+
+import json
+import os
+import sys
+
+from array import array
+from collections import Counter
+
+from typing import (
+    Any, Callable, Dict, List, Optional, Tuple, TYPE_CHECKING)
+
+from chc.proof.CFunctionPO import po_status
+from chc.reporting.FunctionResultDigests import (
+    FunctionResultDigests, function_results_hash, results_hash)
+
+import chc.util.fileutil as UF
+from chc.util.loggingutil import chklogger
+
+if TYPE_CHECKING:
+    from chc.app.CApplication import CApplication
+    from chc.app.CFunction import CFunction
+    from chc.proof.CFunctionPO import CFunctionPO
+
+
+postatuses: List[str] = sorted(set(po_status.values()))
+
+pomethods: List[str] = ["stmt", "local", "api", "contract", "open"]
+
+pokinds: List[str] = ["ppos", "spos"]
+
+columnnames: List[str] = ["file", "function", "tag", "status", "method", "kind"]
+
+
+def get_dsmethod(po: "CFunctionPO") -> Optional[str]:
+    """Returns the discharge method of a proof obligation.
+
+    Returns None if a closed proof obligation cannot be classified.
+    """
+    if po.is_closed:
+        deps = po.dependencies
+        if deps.has_external_dependencies():
+            return po.get_assumptions_type()
+        elif deps.is_stmt:
+            return "stmt"
+        elif deps.is_local or deps.is_deadcode:
+            return "local"
+        else:
+            return None
+    else:
+        return "open"
+
+
+def parse_timestamp(targetpath: str, projectname: str) -> Optional[float]:
+    """Returns the time the project was last parsed (None if not parsed)."""
+
+    cchpath = UF.get_cchpath(targetpath, projectname)
+    if os.path.exists(cchpath):
+        return os.stat(cchpath).st_ctime
+    return None
+
+
+class POStatusIndex:
+    """Columnar representation of proof obligation status and discharge."""
+
+    def __init__(self) -> None:
+        self._filenames: List[str] = []
+        self._fileindex: Dict[str, int] = {}
+        self._functions: List[Tuple[int, str]] = []
+        self._functionindex: Dict[Tuple[int, str], int] = {}
+        self._tags: List[str] = []
+        self._tagindex: Dict[str, int] = {}
+        self._columns: Dict[str, array] = {}
+        for name in columnnames:
+            self._columns[name] = array("i")
+        # (cfilepath, cfilename, function name) -> hash of result files
+        self._hashes: Dict[Tuple[Optional[str], str, str], str] = {}
+        # parse timestamp of the project when the index was saved
+        self._timestamp: Optional[float] = None
+        # groupby -> (group, file, status, method, kind) -> number of rows
+        self._groupcounts: Dict[str, Counter[Tuple[int, ...]]] = {}
+
+    @property
+    def filenames(self) -> List[str]:
+        return self._filenames
+
+    @property
+    def functions(self) -> List[Tuple[int, str]]:
+        return self._functions
+
+    @property
+    def tags(self) -> List[str]:
+        return self._tags
+
+    @property
+    def columns(self) -> Dict[str, array]:
+        return self._columns
+
+    def column(self, name: str) -> array:
+        if name in self.columns:
+            return self.columns[name]
+        else:
+            raise UF.CHCError("No column " + name + " in po status index")
+
+    def __len__(self) -> int:
+        return len(self.column("kind"))
+
+    def _file_id(self, filename: str) -> int:
+        if filename not in self._fileindex:
+            self._fileindex[filename] = len(self._filenames)
+            self._filenames.append(filename)
+        return self._fileindex[filename]
+
+    def _function_id(self, fileid: int, fname: str) -> int:
+        key = (fileid, fname)
+        if key not in self._functionindex:
+            self._functionindex[key] = len(self._functions)
+            self._functions.append(key)
+        return self._functionindex[key]
+
+    def _tag_id(self, tag: str) -> int:
+        if tag not in self._tagindex:
+            self._tagindex[tag] = len(self._tags)
+            self._tags.append(tag)
+        return self._tagindex[tag]
+
+    def add_row(
+            self,
+            filename: str,
+            fname: str,
+            tag: str,
+            status: str,
+            method: Optional[str],
+            kind: str,
+            count: int = 1) -> None:
+        """Adds count identical rows to the index."""
+
+        fileid = self._file_id(filename)
+        row = [
+            fileid,
+            self._function_id(fileid, fname),
+            self._tag_id(tag),
+            postatuses.index(status),
+            -1 if method is None else pomethods.index(method),
+            pokinds.index(kind)]
+        for (name, value) in zip(columnnames, row):
+            self._columns[name].extend([value] * count)
+        self._groupcounts.clear()
+
+    def add_po(self, po: "CFunctionPO", kind: str) -> None:
+        method = get_dsmethod(po)
+        if method is None:
+            chklogger.logger.warning("Unable to classify %s", str(po))
+        self.add_row(
+            po.cfile.name, po.cfun.name, po.predicate_name, po.status, method, kind)
+
+    def add_function(
+            self,
+            cfun: "CFunction",
+            digests: Optional["FunctionResultDigests"] = None) -> None:
+        """Adds the rows for the proof obligations of cfun.
+
+        If digests are given and hold a digest for cfun whose hash matches its
+        current proof obligation files, the rows are taken from the digest
+        and the proof obligations are not parsed; otherwise the digest is
+        updated with the rows obtained from the proof obligations.
+        """
+        if digests is None:
+            for po in cfun.get_ppos():
+                self.add_po(po, "ppos")
+            for po in cfun.get_spos():
+                self.add_po(po, "spos")
+            return
+
+        filename = cfun.cfile.name
+        hash = function_results_hash(cfun)
+        self._hashes[(cfun.cfilepath, cfun.cfilename, cfun.name)] = hash
+        rows = digests.get_rows(filename, cfun.name, hash)
+        if rows is not None:
+            for (tag, status, method, kind, count) in rows:
+                self.add_row(filename, cfun.name, tag, status, method, kind, count)
+            return
+
+        start = len(self)
+        self.add_function(cfun)
+        counts: Dict[Tuple[int, int, int, int], int] = {}
+        for r in zip(
+                self.column("tag")[start:],
+                self.column("status")[start:],
+                self.column("method")[start:],
+                self.column("kind")[start:]):
+            counts[r] = counts.get(r, 0) + 1
+        digests.set_rows(
+            filename,
+            cfun.name,
+            hash,
+            [(self.tags[t],
+              postatuses[s],
+              None if m < 0 else pomethods[m],
+              pokinds[k],
+              count) for ((t, s, m, k), count) in counts.items()])
+
+    @staticmethod
+    def from_application(
+            capp: "CApplication",
+            digests: Optional["FunctionResultDigests"] = None
+    ) -> "POStatusIndex":
+        """Builds the index from the proof obligations of all functions.
+
+        If digests are given, functions whose proof obligation files did not
+        change since the digests were computed are not parsed.
+        """
+        result = POStatusIndex()
+
+        def f(cfun: "CFunction") -> None:
+            result.add_function(cfun, digests=digests)
+
+        capp.iter_functions(f)
+        chklogger.logger.info(
+            "Built po status index with %d proof obligations", len(result))
+        return result
+
+    def group_counts(self, groupby: str) -> Counter[Tuple[int, ...]]:
+        """Returns the number of rows per (group, file, status, method, kind).
+
+        The counts are computed once per grouping (by Counter, without a
+        loop over the rows in Python) and kept until rows are added.
+        """
+        if groupby not in self._groupcounts:
+            self._groupcounts[groupby] = Counter(zip(
+                self.column(groupby),
+                self.column("file"),
+                self.column("status"),
+                self.column("method"),
+                self.column("kind")))
+        return self._groupcounts[groupby]
+
+    def group_method_counts(
+            self,
+            groupby: str,
+            kind: str,
+            filefilter: Callable[[str], bool] = lambda f: True,
+            extradsmethods: List[str] = []) -> Dict[str, Dict[str, int]]:
+        """Returns discharge method counts grouped by file, function, or tag.
+
+        The result has the same structure as the dictionaries produced by
+        get_file_method_count, get_function_method_count, and
+        get_tag_method_count in chc.reporting.ProofObligations: a violated
+        proof obligation is counted both under its discharge method and under
+        violated.
+        """
+        if groupby == "file":
+            names = self.filenames
+        elif groupby == "function":
+            names = [fname for (_, fname) in self.functions]
+        elif groupby == "tag":
+            names = self.tags
+        else:
+            raise UF.CHCError("Po status index cannot group by " + groupby)
+
+        kindid = pokinds.index(kind)
+        violatedid = postatuses.index("violation")
+        included = [filefilter(f) for f in self.filenames]
+        nmethods = len(pomethods)
+
+        # counts[g * (nmethods + 1) + m]; the last slot of each group
+        # holds the violated count
+        counts = array("i", [0] * (len(names) * (nmethods + 1)))
+        present = array("b", [0] * len(names))
+        for ((g, f, s, m, k), n) in self.group_counts(groupby).items():
+            if k != kindid or not included[f]:
+                continue
+            present[g] = 1
+            base = g * (nmethods + 1)
+            if m >= 0:
+                counts[base + m] += n
+            if s == violatedid:
+                counts[base + nmethods] += n
+
+        result: Dict[str, Dict[str, int]] = {}
+        for (g, name) in enumerate(names):
+            if not present[g]:
+                continue
+            base = g * (nmethods + 1)
+            groupcounts = result.setdefault(name, {})
+            for dm in extradsmethods:
+                groupcounts.setdefault(dm, 0)
+            for (i, dm) in enumerate(pomethods):
+                groupcounts[dm] = groupcounts.get(dm, 0) + counts[base + i]
+            groupcounts["violated"] = (
+                groupcounts.get("violated", 0) + counts[base + nmethods])
+        return result
+
+    def save(self, targetpath: str, projectname: str) -> None:
+        filename = UF.get_postatusindex_filename(targetpath, projectname)
+        d: Dict[str, Any] = {}
+        d["byteorder"] = sys.byteorder
+        d["itemsize"] = array("i").itemsize
+        d["rows"] = len(self)
+        d["filenames"] = self.filenames
+        d["functions"] = [[fid, fname] for (fid, fname) in self.functions]
+        d["tags"] = self.tags
+        d["statuses"] = postatuses
+        d["methods"] = pomethods
+        d["kinds"] = pokinds
+        d["columns"] = columnnames
+        d["timestamp"] = parse_timestamp(targetpath, projectname)
+        d["hashes"] = [
+            [cfilepath, cfilename, fname, hash]
+            for ((cfilepath, cfilename, fname), hash) in self._hashes.items()]
+        with open(filename + ".json", "w") as fp:
+            json.dump(d, fp)
+        with open(filename + ".bin", "wb") as fb:
+            for name in columnnames:
+                self.column(name).tofile(fb)
+        chklogger.logger.info(
+            "Saved po status index with %d rows to %s", len(self), filename)
+
+    @staticmethod
+    def load(targetpath: str, projectname: str) -> Optional["POStatusIndex"]:
+        """Returns the saved index, or None if it is absent or incompatible."""
+
+        filename = UF.get_postatusindex_filename(targetpath, projectname)
+        if not (os.path.isfile(filename + ".json")
+                and os.path.isfile(filename + ".bin")):
+            return None
+        with open(filename + ".json", "r") as fp:
+            d = json.load(fp)
+        if (d.get("statuses") != postatuses
+                or d.get("methods") != pomethods
+                or d.get("kinds") != pokinds
+                or d.get("columns") != columnnames
+                or d.get("itemsize") != array("i").itemsize):
+            chklogger.logger.warning(
+                "Po status index %s is incompatible; ignored", filename)
+            return None
+        result = POStatusIndex()
+        for f in d["filenames"]:
+            result._file_id(f)
+        for (fid, fname) in d["functions"]:
+            result._function_id(fid, fname)
+        for t in d["tags"]:
+            result._tag_id(t)
+        for (cfilepath, cfilename, fname, hash) in d.get("hashes", []):
+            result._hashes[(cfilepath, cfilename, fname)] = hash
+        result._timestamp = d.get("timestamp")
+        rows: int = d["rows"]
+        with open(filename + ".bin", "rb") as fb:
+            for name in columnnames:
+                col = array("i")
+                try:
+                    col.fromfile(fb, rows)
+                except EOFError:
+                    chklogger.logger.warning(
+                        "Po status index %s is truncated; ignored", filename)
+                    return None
+                if d["byteorder"] != sys.byteorder:
+                    col.byteswap()
+                result._columns[name] = col
+        return result
+
+    def is_current(self, targetpath: str, projectname: str) -> bool:
+        """Returns true if the proof obligation files did not change.
+
+        This is the case if the index was built with function result
+        digests, the project was not parsed again since, and the files of
+        all functions still have the hashes recorded in the index.
+        """
+        if len(self._hashes) == 0:
+            return False
+        if self._timestamp != parse_timestamp(targetpath, projectname):
+            return False
+        for ((cfilepath, cfilename, fname), hash) in self._hashes.items():
+            if results_hash(
+                    targetpath, projectname, cfilepath, cfilename, fname) != hash:
+                return False
+        return True
+
+    @staticmethod
+    def load_current(
+            targetpath: str, projectname: str) -> Optional["POStatusIndex"]:
+        """Returns the saved index if it is still valid, and None otherwise."""
+
+        result = POStatusIndex.load(targetpath, projectname)
+        if result is None:
+            return None
+        if not result.is_current(targetpath, projectname):
+            chklogger.logger.info(
+                "Po status index for %s is out of date", projectname)
+            return None
+        chklogger.logger.info(
+            "Using saved po status index with %d rows", len(result))
+        return result
@@ -0,0 +1,255 @@
+# ------------------------------------------------------------------------------
+# CodeHawk C Analyzer
+# Author: Henny Sipma
+# ------------------------------------------------------------------------------
+# The MIT License (MIT)
+#
+# Copyright (c) 2026 Aarno Labs LLC
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# ------------------------------------------------------------------------------
+"""Parallel rendering of annotated proof obligation reports.
+
+The report for each unit of work (a function for report-file, a file for
+investigate) is rendered by a worker process into a temporary chunk file.
+The chunks are merged into the output in the order of the units, so the
+result is identical to the report rendered in a single process.
+
+Worker functions need to be global for multiprocessing to work. Each worker
+process constructs its own CApplication (once per process) from the paths
+and the file selection (keep_system_includes, excludefiles) of the
+application in the parent.
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+
+from multiprocessing import Pool
+
+from typing import (
+    Callable, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple,
+    TYPE_CHECKING)
+
+from chc.app.CApplication import CApplication
+
+import chc.reporting.ProofObligations as RP
+
+import chc.util.fileutil as UF
+from chc.util.loggingutil import chklogger
+
+if TYPE_CHECKING:
+    from chc.app.CFile import CFile
+    from chc.proof.CFunctionPO import CFunctionPO
+
+
+# (projectpath, projectname, targetpath, contractpath,
+#  keep_system_includes, excludefiles)
+AppKey = Tuple[str, str, str, str, bool, Tuple[str, ...]]
+
+
+_worker_capps: Dict[AppKey, CApplication] = {}
+
+
+def _app_key(capp: CApplication) -> AppKey:
+    return (
+        capp.projectpath,
+        capp.projectname,
+        capp.targetpath,
+        capp.contractpath,
+        capp.keep_system_includes,
+        tuple(capp.excludefiles))
+
+
+def _worker_capp(key: AppKey) -> CApplication:
+    if key not in _worker_capps:
+        (projectpath,
+         projectname,
+         targetpath,
+         contractpath,
+         keep_system_includes,
+         excludefiles) = key
+        _worker_capps[key] = CApplication(
+            projectpath,
+            projectname,
+            targetpath,
+            contractpath,
+            keep_system_includes=keep_system_includes,
+            excludefiles=list(excludefiles))
+    return _worker_capps[key]
+
+
+def write_chunk(lines: Iterable[str], chunkfile: str) -> int:
+    """Writes lines separated by newlines to chunkfile; returns the count."""
+
+    count = 0
+    with open(chunkfile, "w") as fp:
+        for line in lines:
+            if count > 0:
+                fp.write("\n")
+            fp.write(line)
+            count += 1
+    return count
+
+
+def merge_chunks(
+        chunks: Iterable[Tuple[str, int]], fp: Optional[TextIO] = None) -> None:
+    """Copies the chunks in order to fp (default stdout) and removes them.
+
+    The output is the same as RP.write_lines applied to the concatenation of
+    the lines of the chunks; chunks without lines are skipped.
+    """
+    out = sys.stdout if fp is None else fp
+    first = True
+    for (chunkfile, count) in chunks:
+        if count > 0:
+            if not first:
+                out.write("\n")
+            with open(chunkfile, "r") as fc:
+                shutil.copyfileobj(fc, out)
+            first = False
+        if os.path.isfile(chunkfile):
+            os.remove(chunkfile)
+    out.write("\n")
+
+
+def open_pofilter(showopen: bool) -> Callable[["CFunctionPO"], bool]:
+
+    def pofilter(po: "CFunctionPO") -> bool:
+        if showopen:
+            return not po.is_closed
+        else:
+            return True
+
+    return pofilter
+
+
+def predicates_pofilter(
+        predicates: Optional[List[str]]) -> Callable[["CFunctionPO"], bool]:
+
+    def pofilter(po: "CFunctionPO") -> bool:
+        if predicates is not None:
+            return po.predicate_name in predicates
+        else:
+            return True
+
+    return pofilter
+
+
+def investigate_file_lines(
+        cfile: "CFile",
+        pofilter: Callable[["CFunctionPO"], bool]) -> Iterator[str]:
+    """Yields the open, violated, and delegated primary proof obligations."""
+
+    def header(s: str) -> str:
+        return (s + ":\n" + ("=" * 80))
+
+    openppos = cfile.get_open_ppos()
+    violations = cfile.get_ppos_violated()
+    delegated = cfile.get_ppos_delegated()
+
+    if len(openppos) + len(violations) + len(delegated) > 0:
+        yield "=" * 80
+        yield cfile.name
+        yield "=" * 80
+
+    if len(openppos) > 0:
+        yield header("Open primary proof obligations obligations")
+        yield from RP.as_block(
+            RP.tag_file_function_pos_lines(openppos, pofilter=pofilter))
+
+    if len(violations) > 0:
+        yield header("Primary proof obligations violated")
+        yield from RP.as_block(
+            RP.tag_file_function_pos_lines(violations, pofilter=pofilter))
+
+    if len(delegated) > 0:
+        yield header("Primary proof obligations delegated")
+        yield from RP.as_block(
+            RP.tag_file_function_pos_lines(delegated, pofilter=pofilter))
+
+
+def function_code_chunk(
+        task: Tuple[AppKey, str, str, bool, bool, str]) -> Tuple[str, int]:
+    """Renders the annotated code of one function into a chunk file."""
+
+    (key, filename, fname, showopen, showinvariants, chunkfile) = task
+    capp = _worker_capp(key)
+    try:
+        cfun = capp.get_file(filename).get_function_by_name(fname)
+        lines = RP.function_code_lines(
+            cfun, pofilter=open_pofilter(showopen), showinvs=showinvariants)
+        return (chunkfile, write_chunk(lines, chunkfile))
+    except UF.CHCError as e:
+        chklogger.logger.error(str(e))
+        return (chunkfile, 0)
+
+
+def investigate_chunk(
+        task: Tuple[AppKey, str, Optional[List[str]], str]) -> Tuple[str, int]:
+    """Renders the investigate report of one file into a chunk file."""
+
+    (key, filename, predicates, chunkfile) = task
+    capp = _worker_capp(key)
+    cfile = capp.get_file(filename)
+    lines = investigate_file_lines(cfile, predicates_pofilter(predicates))
+    return (chunkfile, write_chunk(lines, chunkfile))
+
+
+def file_code_report(
+        capp: CApplication,
+        cfile: "CFile",
+        maxprocesses: int,
+        showopen: bool = False,
+        showinvariants: bool = False,
+        fp: Optional[TextIO] = None) -> None:
+    """Writes the annotated code of cfile, rendering functions in parallel."""
+
+    key = _app_key(capp)
+    chunkdir = tempfile.mkdtemp(prefix="chc_report_")
+    try:
+        tasks = [
+            (key, cfile.name, fn.name, showopen, showinvariants,
+             os.path.join(chunkdir, "chunk_" + str(i)))
+            for (i, fn) in enumerate(cfile.get_functions())]
+        with Pool(maxprocesses) as pool:
+            merge_chunks(pool.imap(function_code_chunk, tasks), fp=fp)
+    finally:
+        shutil.rmtree(chunkdir, ignore_errors=True)
+
+
+def investigate_report(
+        capp: CApplication,
+        maxprocesses: int,
+        predicates: Optional[List[str]] = None,
+        fp: Optional[TextIO] = None) -> None:
+    """Writes the investigate report of all files, rendered in parallel."""
+
+    key = _app_key(capp)
+    chunkdir = tempfile.mkdtemp(prefix="chc_investigate_")
+    try:
+        tasks = [
+            (key, cfile.name, predicates,
+             os.path.join(chunkdir, "chunk_" + str(i)))
+            for (i, cfile) in enumerate(capp.cfiles)]
+        with Pool(maxprocesses) as pool:
+            merge_chunks(pool.imap(investigate_chunk, tasks), fp=fp)
+    finally:
+        shutil.rmtree(chunkdir, ignore_errors=True)
@@ -27,12 +27,17 @@
 # SOFTWARE.
 # ------------------------------------------------------------------------------
 
+import sys
 import time
 
 from typing import (
-    Any, Callable, cast, Dict, List, Sequence, Set, Tuple, TYPE_CHECKING)
+    Any, Callable, cast, Dict, Iterable, Iterator, List, Optional, Sequence,
+    Set, TextIO, Tuple, TYPE_CHECKING)
+
+from chc.reporting.POStatusIndex import get_dsmethod, POStatusIndex
 
 import chc.util.fileutil as UF
+from chc.util.loggingutil import chklogger
 
 if TYPE_CHECKING:
     from chc.app.CApplication import CApplication
@@ -79,21 +84,13 @@ def classifypo(po: "CFunctionPO", d: Dict[str, int]) -> None:
       po: proof obligation (CFunctionPO)
       d: dictionary, with discharge methods initialized (is updated)
     """
-    if po.is_closed:
-        if po.is_violated:
-            d["violated"] += 1
-        deps = po.dependencies
-        if deps.has_external_dependencies():
-            deptype = po.get_assumptions_type()
-            d[deptype] += 1
-        elif deps.is_stmt:
-            d["stmt"] += 1
-        elif deps.is_local or deps.is_deadcode:
-            d["local"] += 1
-        else:
-            print("Unable to classify " + str(po))
+    if po.is_violated:
+        d["violated"] += 1
+    dsmethod = get_dsmethod(po)
+    if dsmethod is None:
+        print("Unable to classify " + str(po))
     else:
-        d["open"] += 1
+        d[dsmethod] += 1
 
 
 def get_method_count(
@@ -251,6 +248,36 @@ def row_method_count_tostring(
     return "\n".join(lines)
 
 
+def write_lines(lines: Iterable[str], fp: Optional[TextIO] = None) -> None:
+    """Writes lines separated by newlines to fp (default stdout).
+
+    The output is the same as print("\\n".join(lines), file=fp), without
+    holding the joined string in memory.
+    """
+    out = sys.stdout if fp is None else fp
+    first = True
+    for line in lines:
+        if not first:
+            out.write("\n")
+        out.write(line)
+        first = False
+    out.write("\n")
+
+
+def as_block(lines: Iterable[str]) -> Iterator[str]:
+    """Yields lines, or a single empty line if there are none.
+
+    A nested generator yields the same output as "\\n".join of its lines
+    appended as a single element.
+    """
+    empty = True
+    for line in lines:
+        empty = False
+        yield line
+    if empty:
+        yield ""
+
+
 class FunctionDisplay:
 
     def __init__(
@@ -284,7 +311,7 @@ class FunctionDisplay:
     def get_source_line(self, line: int) -> str:
         srcline = self.cfile.get_source_line(line)
         if srcline is not None:
-            return self.cfile.get_source_line(line).strip()
+            return srcline.strip()
         return "?"
 
     def pos_no_code_to_string(
@@ -338,47 +365,46 @@ class FunctionDisplay:
                     lines.append((" " * indent) + "---> no diagnostic found")
         return "\n".join(lines)
 
-    def pos_on_code_tostring(
+    def pos_on_code_lines(
             self,
             pos: Sequence["CFunctionPO"],
             pofilter: Callable[["CFunctionPO"], bool] = lambda po: True,
-            showinvs: bool = False) -> str:
-        lines: List[str] = []
+            showinvs: bool = False) -> Iterator[str]:
         contexts: Set["ProgramContext"] = set([])
         for po in sorted(pos, key=lambda po: po.line):
             if not pofilter(po):
                 if po.line >= self._currentline:
                     if self.sourcecodeavailable:
                         for n in range(self._currentline, po.line + 1):
-                            lines.append(self.get_source_line(n))
+                            yield self.get_source_line(n)
                 self._currentline = po.line + 1
                 continue
             line = po.line
             indent: int = 18 if po.is_ppo else 24
             if line >= self._currentline:
                 if len(contexts) > 0 and showinvs:
-                    lines.append(
+                    yield (
                         "\n"
                         + (" " * indent)
                         + "-------- context invariants --------")
                     for c in contexts:
-                        lines.append((" " * indent) + str(c))
-                        lines.append((" " * indent) + ("-" * len(str(c))))
-                        lines.append(str(self._get_context_invariants(c)))
-                        lines.append(" ")
-                lines.append("-" * 80)
+                        yield (" " * indent) + str(c)
+                        yield (" " * indent) + ("-" * len(str(c)))
+                        yield str(self._get_context_invariants(c))
+                        yield " "
+                yield "-" * 80
                 if self.sourcecodeavailable:
                     for n in range(self._currentline, line + 1):
-                        lines.append(self.get_source_line(n))
+                        yield self.get_source_line(n)
                 else:
                     if self._currentline == line:
-                        lines.append("source line " + str(line))
+                        yield "source line " + str(line)
                     else:
-                        lines.append(
+                        yield (
                             "source lines "
                             + str(self._currentline)
                             + " - " + str(line))
-                lines.append("-" * 80)
+                yield "-" * 80
                 contexts = set([])
             self._currentline = line + 1
             delegated = ""
@@ -387,31 +413,31 @@ class FunctionDisplay:
                 # contexts.add(po.context)    (uncomment to see all invariants)
                 expl = po.explanation
                 prefix = po.get_display_prefix()
-                lines.append(prefix + " " + str(po))
-                lines.append((" " * indent) + str(expl))
+                yield prefix + " " + str(po)
+                yield (" " * indent) + str(expl)
                 deps = po.dependencies.invs
-                lines.append(
+                yield (
                     ("\n" + " " * indent).join(str(
                         self.cfunction.invdictionary.get_invariant_fact(i))
                                                for i in deps))
             else:
                 contexts.add(po.context)
-                lines.append("\n<?> " + str(po))
+                yield "\n<?> " + str(po)
                 if po.has_diagnostic():
                     amsgs = po.diagnostic.argument_msgs
                     if len(amsgs) > 0:
                         for arg in sorted(amsgs):
                             for amsg in amsgs[arg]:
-                                lines.append((" " * indent) + str(amsg))
+                                yield (" " * indent) + str(amsg)
                     kmsgs = po.diagnostic.keyword_msgs
                     if len(kmsgs) > 0:
                         for key in sorted(kmsgs):
                             for s in sorted(kmsgs[key]):
-                                lines.append((" " * indent) + key + ": " + s)
+                                yield (" " * indent) + key + ": " + s
                     msgs = po.diagnostic.msgs
                     if len(msgs) > 0:
                         for m in msgs:
-                            lines.append((" " * indent) + str(m))
+                            yield (" " * indent) + str(m)
                     keys = po.diagnostic.argument_indices
                     for k in sorted(keys):
                         invids = po.diagnostic.get_invariant_ids(k)
@@ -420,26 +446,33 @@ class FunctionDisplay:
                             if inv.is_nrv_fact:
                                 inv = cast("CInvariantNRVFact", inv)
                                 nrv = inv.non_relational_value
-                                lines.append(
+                                yield (
                                     (" " * indent) + str(k) + ": " + str(nrv))
                 else:
-                    lines.append((" " * indent) + "---> no diagnostic found")
-                lines.append(" ")
+                    yield (" " * indent) + "---> no diagnostic found"
+                yield " "
 
                 if showinvs and (not po.has_diagnostic()):
-                    lines.append((" " * 18) + "--")
-                    lines.append(self._get_po_invariants(po.context, po.po_index))
+                    yield (" " * 18) + "--"
+                    yield self._get_po_invariants(po.context, po.po_index)
 
         if len(contexts) > 0 and showinvs:
-            lines.append(
+            yield (
                 "\n" + (" " * indent) + "-------- context invariants --------")
             for c in contexts:
-                lines.append((" " * indent) + "=== " + str(c) + " ===")
-                lines.append(str(self._get_context_invariants(c)))
-                lines.append(" ")
+                yield (" " * indent) + "=== " + str(c) + " ==="
+                yield str(self._get_context_invariants(c))
+                yield " "
 
         self._currentline = self.fline + 1
-        return "\n".join(lines)
+
+    def pos_on_code_tostring(
+            self,
+            pos: Sequence["CFunctionPO"],
+            pofilter: Callable[["CFunctionPO"], bool] = lambda po: True,
+            showinvs: bool = False) -> str:
+        return "\n".join(
+            self.pos_on_code_lines(pos, pofilter=pofilter, showinvs=showinvs))
 
     def _get_po_invariants(self, context: "ProgramContext", poId: int) -> str:
         lines: List[str] = []
@@ -471,24 +504,23 @@ def function_pos_to_string(
     return "\n".join(lines)
 
 
-def function_code_tostring(
+def function_code_lines(
         fn: "CFunction",
         pofilter: Callable[["CFunctionPO"], bool] = lambda po: True,
         showinvs: bool = False,
-        showpreamble: bool = True) -> str:
-    lines: List[str] = []
+        showpreamble: bool = True) -> Iterator[str]:
     ppos = fn.get_ppos()
     # ppos = [x for x in ppos if pofilter(x)]
     spos = fn.get_spos()
     if fn.has_line_number():
         fnstartlinenr = fn.get_line_number()
         fnstartline = fn.cfile.get_source_line(fnstartlinenr)
-        lines.append("\nFunction " + fn.name)
-        lines.append("-" * 80)
-        lines.append(fnstartline.strip())
+        yield "\nFunction " + fn.name
+        yield "-" * 80
+        yield fnstartline.strip()
         fd = FunctionDisplay(fn, True)
     else:
-        lines.append(
+        yield (
             "\nFunction "
             + fn.name
             + " (source code not available, included from "
@@ -498,22 +530,28 @@ def function_code_tostring(
         fd = FunctionDisplay(fn, False)
 
     if showpreamble:
-        lines.append("-" * 80)
-        lines.append(str(fn.api))
-        lines.append("-" * 80)
+        yield "-" * 80
+        yield str(fn.api)
+        yield "-" * 80
     if len(ppos) > 0:
-        lines.append("Primary Proof Obligations:")
-        lines.append(
-            fd.pos_on_code_tostring(ppos, pofilter=pofilter, showinvs=showinvs)
-        )
-        lines.append("-" * 80)
+        yield "Primary Proof Obligations:"
+        yield from as_block(
+            fd.pos_on_code_lines(ppos, pofilter=pofilter, showinvs=showinvs))
+        yield "-" * 80
     if len(spos) > 0:
-        lines.append("Supporting Proof Obligations:")
-        lines.append(
-            fd.pos_on_code_tostring(spos, pofilter=pofilter, showinvs=showinvs)
-        )
-        lines.append("-" * 80)
-    return "\n".join(lines)
+        yield "Supporting Proof Obligations:"
+        yield from as_block(
+            fd.pos_on_code_lines(spos, pofilter=pofilter, showinvs=showinvs))
+        yield "-" * 80
+
+
+def function_code_tostring(
+        fn: "CFunction",
+        pofilter: Callable[["CFunctionPO"], bool] = lambda po: True,
+        showinvs: bool = False,
+        showpreamble: bool = True) -> str:
+    return "\n".join(function_code_lines(
+        fn, pofilter=pofilter, showinvs=showinvs, showpreamble=showpreamble))
 
 
 def function_code_open_tostring(
@@ -556,26 +594,38 @@ def file_pos_violations_to_string(cfile: "CFile") -> str:
     return "\n".join(lines)
 
 
-def file_code_tostring(
+def file_code_lines(
         cfile: "CFile",
         pofilter: Callable[["CFunctionPO"], bool] = lambda po: True,
-        showinvs: bool = False) -> str:
-    lines: List[str] = []
+        showinvs: bool = False) -> Iterator[str]:
+    for fn in cfile.get_functions():
+        try:
+            yield from as_block(
+                function_code_lines(fn, pofilter=pofilter, showinvs=showinvs))
+        except UF.CHCError as e:
+            chklogger.logger.error(str(e))
+            continue
 
-    def f(fn: "CFunction") -> None:
-        lines.append(
-            function_code_tostring(fn, pofilter=pofilter, showinvs=showinvs))
 
-    cfile.iter_functions(f)
-    return "\n".join(lines)
+def file_code_tostring(
+        cfile: "CFile",
+        pofilter: Callable[["CFunctionPO"], bool] = lambda po: True,
+        showinvs: bool = False) -> str:
+    return "\n".join(
+        file_code_lines(cfile, pofilter=pofilter, showinvs=showinvs))
 
 
-def file_code_open_tostring(cfile: "CFile", showinvs: bool = False) -> str:
+def file_code_open_lines(
+        cfile: "CFile", showinvs: bool = False) -> Iterator[str]:
 
     def pofilter(po: "CFunctionPO") -> bool:
         return po.is_violated or (not po.is_closed)
 
-    return file_code_tostring(cfile, pofilter=pofilter, showinvs=showinvs)
+    return file_code_lines(cfile, pofilter=pofilter, showinvs=showinvs)
+
+
+def file_code_open_tostring(cfile: "CFile", showinvs: bool = False) -> str:
+    return "\n".join(file_code_open_lines(cfile, showinvs=showinvs))
 
 
 def proofobligation_stats_tostring(
@@ -600,14 +650,15 @@ def proofobligation_stats_tostring(
 def project_proofobligation_stats_tostring(
         capp: "CApplication",
         filefilter: Callable[[str], bool] = lambda f: True,
-        extradsmethods: List[str] = []) -> str:
+        extradsmethods: List[str] = [],
+        poindex: Optional[POStatusIndex] = None) -> str:
     lines: List[str] = []
-    ppos = capp.get_ppos()
-    spos = capp.get_spos()
-    pporesults = get_file_method_count(
-        ppos, extradsmethods=extradsmethods, filefilter=filefilter)
-    sporesults = get_file_method_count(
-        spos, extradsmethods=extradsmethods, filefilter=filefilter)
+    if poindex is None:
+        poindex = POStatusIndex.from_application(capp)
+    pporesults = poindex.group_method_counts(
+        "file", "ppos", extradsmethods=extradsmethods, filefilter=filefilter)
+    sporesults = poindex.group_method_counts(
+        "file", "spos", extradsmethods=extradsmethods, filefilter=filefilter)
 
     rhlen = capp.get_max_filename_length() + 3
     lines.append(
@@ -617,10 +668,10 @@ def project_proofobligation_stats_tostring(
             rhlen=rhlen,
             header1="c files",
             extradsmethods=extradsmethods))
-    tagpporesults = get_tag_method_count(
-        ppos, filefilter=filefilter, extradsmethods=extradsmethods)
-    tagsporesults = get_tag_method_count(
-        spos, filefilter=filefilter, extradsmethods=extradsmethods)
+    tagpporesults = poindex.group_method_counts(
+        "tag", "ppos", filefilter=filefilter, extradsmethods=extradsmethods)
+    tagsporesults = poindex.group_method_counts(
+        "tag", "spos", filefilter=filefilter, extradsmethods=extradsmethods)
 
     lines.append("\n\nProof Obligation Statistics")
     lines.append("~" * 80)
@@ -633,17 +684,23 @@ def project_proofobligation_stats_tostring(
 def project_proofobligation_stats_to_dict(
         capp: "CApplication",
         filefilter: Callable[[str], bool] = lambda f: True,
-        extradsmethods: List[str] = []) -> Dict[str, Any]:
-    ppos = capp.get_ppos()
-    spos = capp.get_spos()
-    pporesults = get_file_method_count(
-        ppos, extradsmethods=extradsmethods, filefilter=filefilter)
-    sporesults = get_file_method_count(
-        spos, extradsmethods=extradsmethods, filefilter=filefilter)
-    tagpporesults = get_tag_method_count(
-        ppos, filefilter=filefilter, extradsmethods=extradsmethods)
-    tagsporesults = get_tag_method_count(
-        spos, filefilter=filefilter, extradsmethods=extradsmethods)
+        extradsmethods: List[str] = [],
+        poindex: Optional[POStatusIndex] = None) -> Dict[str, Any]:
+    """Returns file and predicate statistics of all proof obligations.
+
+    If no po status index is given, one is built from the proof obligations
+    of the application.
+    """
+    if poindex is None:
+        poindex = POStatusIndex.from_application(capp)
+    pporesults = poindex.group_method_counts(
+        "file", "ppos", extradsmethods=extradsmethods, filefilter=filefilter)
+    sporesults = poindex.group_method_counts(
+        "file", "spos", extradsmethods=extradsmethods, filefilter=filefilter)
+    tagpporesults = poindex.group_method_counts(
+        "tag", "ppos", filefilter=filefilter, extradsmethods=extradsmethods)
+    tagsporesults = poindex.group_method_counts(
+        "tag", "spos", filefilter=filefilter, extradsmethods=extradsmethods)
 
     result: Dict[str, Any] = {}
     result["tagresults"] = {}
@@ -684,18 +741,22 @@ def project_proofobligation_stats_dict_to_string(
 def file_proofobligation_stats_tostring(
         cfile: "CFile", extradsmethods: List[str] = []) -> str:
     lines: List[str] = []
-    ppos = cfile.get_ppos()
-    spos = cfile.get_spos()
-    pporesults = get_function_method_count(ppos, extradsmethods=extradsmethods)
-    sporesults = get_function_method_count(spos, extradsmethods=extradsmethods)
+    poindex = POStatusIndex()
+    cfile.iter_functions(poindex.add_function)
+    pporesults = poindex.group_method_counts(
+        "function", "ppos", extradsmethods=extradsmethods)
+    sporesults = poindex.group_method_counts(
+        "function", "spos", extradsmethods=extradsmethods)
 
     rhlen = cfile.get_max_functionname_length() + 3
     lines.append(
         proofobligation_stats_tostring(
             pporesults, sporesults, rhlen=rhlen, header1="functions"))
 
-    tagpporesults = get_tag_method_count(ppos, extradsmethods=extradsmethods)
-    tagsporesults = get_tag_method_count(spos, extradsmethods=extradsmethods)
+    tagpporesults = poindex.group_method_counts(
+        "tag", "ppos", extradsmethods=extradsmethods)
+    tagsporesults = poindex.group_method_counts(
+        "tag", "spos", extradsmethods=extradsmethods)
 
     lines.append("\n\nProof Obligation Statistics for file " + cfile.name)
     lines.append("~" * 80)
@@ -794,36 +855,36 @@ def make_po_file_function_dict(
     return result
 
 
-def tag_file_function_pos_tostring(
+def tag_file_function_pos_lines(
         pos: List["CFunctionPO"],
         filefilter: Callable[[str], bool] = lambda f: True,
-        pofilter: Callable[["CFunctionPO"], bool] = lambda po: True) -> str:
-    lines: List[str] = []
+        pofilter: Callable[["CFunctionPO"], bool] = lambda po: True
+) -> Iterator[str]:
     tagdict = make_po_tag_dict(pos, pofilter=pofilter)
     for tag in sorted(tagdict):
         fundict = make_po_file_function_dict(tagdict[tag], filefilter=filefilter)
-        lines.append("\n\n" + tag + "\n" + ("-" * 80))
+        yield "\n\n" + tag + "\n" + ("-" * 80)
         for f in sorted(fundict):
-            lines.append("\n  File: " + f)
+            yield "\n  File: " + f
             for ff in sorted(fundict[f]):
-                lines.append("    Function: " + ff)
+                yield "    Function: " + ff
                 for po in sorted(fundict[f][ff], key=lambda po: po.line):
-                    lines.append((" " * 6) + str(po))
+                    yield (" " * 6) + str(po)
                     if po.is_closed:
-                        lines.append((" " * 14) + str(po.explanation))
+                        yield (" " * 14) + str(po.explanation)
 
                     if po.has_diagnostic():
                         amsgs = po.diagnostic.argument_msgs
                         if len(amsgs) > 0:
                             for arg in sorted(amsgs):
                                 for amsg in amsgs[arg]:
-                                    lines.append((" " * 14) + str(amsg))
+                                    yield (" " * 14) + str(amsg)
                         msgs = po.diagnostic.msgs
                         if len(msgs) > 0:
-                            lines.append((" " * 8) + " ---> " + str(msgs[0]))
+                            yield (" " * 8) + " ---> " + str(msgs[0])
                             for msg in msgs[1:]:
-                                lines.append((" " * 14) + str(msg))
-                            lines.append(" ")
+                                yield (" " * 14) + str(msg)
+                            yield " "
                         keys = po.diagnostic.argument_indices
                         try:
                             invd = po.cfun.invdictionary
@@ -834,7 +895,7 @@ def tag_file_function_pos_tostring(
                                     if inv.is_nrv_fact:
                                         inv = cast("CInvariantNRVFact", inv)
                                         nrv = inv.non_relational_value
-                                        lines.append(
+                                        yield (
                                             (" " * 14)
                                             + str(k)
                                             + ": "
@@ -842,9 +903,15 @@ def tag_file_function_pos_tostring(
                         except UF.CHCError:
                             pass
 
-                        lines.append(" ")
+                        yield " "
 
-    return "\n".join(lines)
+
+def tag_file_function_pos_tostring(
+        pos: List["CFunctionPO"],
+        filefilter: Callable[[str], bool] = lambda f: True,
+        pofilter: Callable[["CFunctionPO"], bool] = lambda po: True) -> str:
+    return "\n".join(tag_file_function_pos_lines(
+        pos, filefilter=filefilter, pofilter=pofilter))
 
 
 def get_totals_from_tagtotals(
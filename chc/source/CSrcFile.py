@@ -27,8 +27,19 @@
 # SOFTWARE.
 # ------------------------------------------------------------------------------
 
+"""Line-indexed access to the saved C source file of a CFile.
+
+The source file is memory-mapped and an array of line-start offsets is built
+once; only the lines requested are sliced from the map and decoded. The
+offset index can be cached on disk next to the source file, keyed by the
+size and modification time of the source file.
+"""
+
+import mmap
 import os
-from typing import Dict, TYPE_CHECKING, Optional
+
+from array import array
+from typing import Dict, Iterator, TYPE_CHECKING, Optional, Tuple
 
 import chc.util.fileutil as UF
 from chc.util.loggingutil import chklogger
@@ -40,10 +51,18 @@ if TYPE_CHECKING:
 class CSrcFile:
     """Represents the text file that holds the C source code."""
 
-    def __init__(self, capp: "CApplication", fname: str) -> None:
+    def __init__(
+            self,
+            capp: "CApplication",
+            fname: str,
+            encoding: str = "utf-8",
+            cachelineindex: bool = False) -> None:
         self._capp = capp
         self._fname = fname
-        self._lines: Optional[Dict[int, str]] = None
+        self._encoding = encoding
+        self._cachelineindex = cachelineindex
+        self._map: Optional[mmap.mmap] = None
+        self._offsets: Optional[array] = None  # line-start offsets + file size
 
     @property
     def capp(self) -> "CApplication":
@@ -56,24 +75,105 @@ class CSrcFile:
         return self._fname
 
     @property
-    def lines(self) -> Dict[int, str]:
-        if self._lines is None:
-            self._lines = {}
+    def encoding(self) -> str:
+        return self._encoding
+
+    @property
+    def lineindexfilename(self) -> str:
+        return self.fname + ".lineindex"
+
+    @property
+    def offsets(self) -> array:
+        """Returns the start offsets of all lines followed by the file size."""
+
+        if self._offsets is None:
+            self._offsets = array("q", [0])
             if os.path.isfile(self.fname):
-                n: int = 1
-                with open(self.fname) as fp:
-                    for line in fp:
-                        self._lines[n] = line
-                        n += 1
+                self._open()
             else:
                 chklogger.logger.warning(
                     "Source file %s not found", self.fname)
-        return self._lines
+        return self._offsets
+
+    def _open(self) -> None:
+        stat = os.stat(self.fname)
+        if stat.st_size == 0:
+            return
+        with open(self.fname, "rb") as fp:
+            self._map = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+        key = (stat.st_size, stat.st_mtime_ns)
+        offsets = self._load_lineindex(key) if self._cachelineindex else None
+        if offsets is None:
+            offsets = self._build_lineindex()
+            if self._cachelineindex:
+                self._save_lineindex(key, offsets)
+        self._offsets = offsets
+
+    def _build_lineindex(self) -> array:
+        if self._map is None:
+            return array("q", [0])
+        size = len(self._map)
+        offsets = array("q", [0])
+        pos = self._map.find(b"\n")
+        while pos >= 0 and pos + 1 < size:
+            offsets.append(pos + 1)
+            pos = self._map.find(b"\n", pos + 1)
+        offsets.append(size)
+        return offsets
+
+    def _load_lineindex(self, key: Tuple[int, int]) -> Optional[array]:
+        if not os.path.isfile(self.lineindexfilename):
+            return None
+        result = array("q")
+        try:
+            with open(self.lineindexfilename, "rb") as fp:
+                result.frombytes(fp.read())
+        except (OSError, ValueError) as e:
+            chklogger.logger.warning(
+                "Unable to read line index %s: %s", self.lineindexfilename, e)
+            return None
+        if len(result) < 3 or (result[0], result[1]) != key:
+            return None
+        return result[2:]
+
+    def _save_lineindex(self, key: Tuple[int, int], offsets: array) -> None:
+        try:
+            with open(self.lineindexfilename, "wb") as fp:
+                array("q", key).tofile(fp)
+                offsets.tofile(fp)
+        except OSError as e:
+            chklogger.logger.warning(
+                "Unable to save line index %s: %s", self.lineindexfilename, e)
+
+    def _decode(self, n: int) -> str:
+        if self._map is None:
+            return ""
+        offsets = self.offsets
+        data = self._map[offsets[n - 1]:offsets[n]]
+        return data.decode(self.encoding, errors="replace")
 
     def get_line_count(self) -> int:
-        return len(self.lines)
+        return len(self.offsets) - 1
+
+    def get_line_text(self, n: int) -> Optional[str]:
+        """Returns the text of line n (1-based), including the newline."""
+
+        if 0 < n <= self.get_line_count():
+            return self._decode(n)
+        return None
+
+    def iter_lines(self) -> Iterator[Tuple[int, str]]:
+        for n in range(1, self.get_line_count() + 1):
+            yield (n, self._decode(n))
+
+    @property
+    def lines(self) -> Dict[int, str]:
+        """Returns all lines; prefer get_line_text or iter_lines."""
+
+        return dict(self.iter_lines())
 
     def get_line(self, n: int) -> Optional[str]:
-        if self.get_line_count() > n:
-            return str(n) + "  " + self.lines[n]
+        line = self.get_line_text(n)
+        if line is not None:
+            return str(n) + "  " + line
         return None
@@ -76,6 +76,12 @@ class Config(object):
         self.kendradir = os.path.join(self.testdir, "kendra")
         self.libcsummarytestdir = os.path.join(self.testdir, "libcsummaries")
 
+        # cache for data derived from the tests (e.g., dashboard records)
+        self.cachedir = os.path.join(
+            os.environ.get(
+                "XDG_CACHE_HOME", os.path.join(os.path.expanduser("~"), ".cache")),
+            "codehawk-c")
+
         # analysis targets
         self.name_separator = ":"
         self.targets: Dict[str, str] = {}
@@ -27,11 +27,14 @@
 # SOFTWARE.
 # ------------------------------------------------------------------------------
 
+import sys
 import xml.etree.ElementTree as ET
 
+from array import array
+
 import chc.util.fileutil as UF
 
-from typing import Callable, Dict, List, Generic, Optional, Tuple, TypeVar
+from typing import Any, Callable, Dict, List, Generic, Optional, Tuple, TypeVar
 
 
 class IndexedTableError(UF.CHCError):
@@ -83,6 +86,54 @@ class IndexedTableValueMismatchError(UF.CHCError):
             + str(actargcount))
 
 
+class StringPool:
+    """Pool of strings shared by all dictionaries of a process.
+
+    Names and other strings read from the xml files (variable and field
+    names, string literals, constants) are repeated across the files and
+    functions of an application; the pool holds one copy of each, so equal
+    strings read from different files are the same object. Strings longer
+    than maxlength (e.g., long string literals) are not pooled.
+
+    The pool keeps its strings alive: it is cleared at the end of a bounded
+    working set (CApplication.bounded_working_set), when a file is reloaded
+    (CApplication.reload_file), and after each request of the server and
+    each task of a worker, so that long-lived processes do not retain the
+    strings of released files. Within a bounded working set the pool is
+    kept, so that names are shared across the files processed.
+    """
+
+    def __init__(self, maxlength: int = 256) -> None:
+        self._maxlength = maxlength
+        self._strings: Dict[str, str] = {}
+
+    def share(self, s: str) -> str:
+        if len(s) > self._maxlength:
+            return s
+        return self._strings.setdefault(s, s)
+
+    def size(self) -> int:
+        return len(self._strings)
+
+    def clear(self) -> None:
+        self._strings = {}
+
+
+stringpool = StringPool()
+
+
+def share_tags(tags: List[str]) -> List[str]:
+    """Returns tags with shared string objects.
+
+    The first tag identifies the kind of record and is drawn from a small
+    vocabulary; it is interned, so that equal tags are the same object in
+    all records. The remaining tags are taken from the string pool.
+    """
+    if len(tags) == 0:
+        return tags
+    return [sys.intern(tags[0])] + [stringpool.share(t) for t in tags[1:]]
+
+
 def get_attribute_int_list(node: ET.Element, attr: str) -> List[int]:
     """Return list of integers in attr if attr is present or [] otherwise."""
 
@@ -100,7 +151,7 @@ def get_rep(node: ET.Element) -> Tuple[int, List[str], List[int]]:
         if tags is None:
             taglist = []
         else:
-            taglist = tags.split(",")
+            taglist = share_tags(tags.split(","))
         if args is None or args == "":
             arglist = []
         else:
@@ -122,6 +173,22 @@ def get_key(tags: List[str], args: List[int]) -> Tuple[str, str]:
 
 
 class IndexedTableValue:
+    """Base class of all dictionary records.
+
+    Records are created in large numbers, so they do not have an instance
+    dictionary: every subclass must declare __slots__ (listing the
+    attributes it adds, or empty); this is checked when the subclass is
+    defined.
+    """
+
+    __slots__ = ("_index", "_tags", "_args")
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        if "__slots__" not in cls.__dict__:
+            raise TypeError(
+                "Dictionary record class " + cls.__name__
+                + " does not declare __slots__")
 
     def __init__(
             self,
@@ -279,7 +346,7 @@ class IndexedTable(IndexedTableSuperclass):
             return self.keytable[key]
         else:
             index = self.next
-            obj = f(index, tags, args)
+            obj = f(index, share_tags(tags), args)
             self.keytable[key] = index
             self.indextable[index] = obj
             self.next += 1
@@ -397,3 +464,119 @@ class IndexedTable(IndexedTableSuperclass):
         if self.checkpoint is not None:
             lines.append("Checkpoint: " + str(self.checkpoint))
         return "\n".join(lines)
+
+
+class RecordPool:
+    """Pool of interned (tags, args) records shared by several tables.
+
+    Structurally identical records (same tags and args) that appear in the
+    tables of different functions are stored only once; the tables hold the
+    integer id of the record in the pool. Records are never removed, so ids
+    remain valid for the lifetime of the pool.
+    """
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self._keys: Dict[Tuple[str, str], int] = {}
+        self._records: List[Tuple[List[str], List[int]]] = []
+
+    def intern(
+            self, key: Tuple[str, str], tags: List[str], args: List[int]) -> int:
+        if key in self._keys:
+            return self._keys[key]
+        id = len(self._records)
+        self._keys[key] = id
+        self._records.append((tags, args))
+        return id
+
+    def record(self, id: int) -> Tuple[List[str], List[int]]:
+        return self._records[id]
+
+    def size(self) -> int:
+        return len(self._records)
+
+
+class InternedIndexedTable(IndexedTableSuperclass):
+    """Read-only indexed table whose records are held in a RecordPool.
+
+    The table only maps indices to record ids in the pool; the
+    IndexedTableValue for an index is created on retrieval. Entries are
+    added only by read_xml.
+    """
+
+    def __init__(self, name: str, pool: RecordPool) -> None:
+        IndexedTableSuperclass.__init__(self, name)
+        self._pool = pool
+        self._ids: array = array("i")  # index - 1 -> record id (-1 if absent)
+
+    @property
+    def pool(self) -> RecordPool:
+        return self._pool
+
+    def reset(self) -> None:
+        self._ids = array("i")
+
+    def size(self) -> int:
+        return len(self._ids)
+
+    def has_index(self, index: int) -> bool:
+        return 0 < index <= len(self._ids) and self._ids[index - 1] >= 0
+
+    def retrieve(self, index: int) -> IndexedTableValue:
+        if self.has_index(index):
+            (tags, args) = self.pool.record(self._ids[index - 1])
+            return IndexedTableValue(index, tags, args)
+        else:
+            msg = (
+                "Unable to retrieve item "
+                + str(index)
+                + " from table "
+                + self.name
+                + " (size: "
+                + str(self.size())
+                + ")"
+            )
+            raise IndexedTableError(
+                msg + "\n" + self.name + ", size: " + str(self.size())
+            )
+
+    def items(self) -> List[Tuple[int, IndexedTableValue]]:
+        return [
+            (i, self.retrieve(i))
+            for i in range(1, len(self._ids) + 1) if self.has_index(i)]
+
+    def values(self) -> List[IndexedTableValue]:
+        return [v for (_, v) in self.items()]
+
+    def iter(self, f: Callable[[int, IndexedTableValue], None]) -> None:
+        for (i, v) in self.items():
+            f(i, v)
+
+    def read_xml(self, node: Optional[ET.Element], tag: str) -> None:
+        if node is None:
+            print("Xml node not present in " + self.name)
+            raise IndexedTableError(self.name)
+        for snode in node.findall(tag):
+            (index, tags, args) = get_rep(snode)
+            if index > len(self._ids):
+                self._ids.extend([-1] * (index - len(self._ids)))
+            self._ids[index - 1] = self.pool.intern(
+                get_key(tags, args), tags, args)
+
+    def objectmap(
+            self,
+            p: Callable[[int], IndexedTableValue]) -> Dict[int, IndexedTableValue]:
+        result: Dict[int, IndexedTableValue] = {}
+
+        def f(ix: int, v: IndexedTableValue) -> None:
+            result[ix] = p(ix)
+
+        self.iter(f)
+        return result
+
+    def __str__(self) -> str:
+        lines: List[str] = []
+        lines.append("\n" + self.name)
+        for (ix, v) in self.items():
+            lines.append(str(ix).rjust(4) + "  " + str(v))
+        return "\n".join(lines)
@@ -34,12 +34,12 @@ import chc.util.IndexedTable as IT
 
 
 def has_control_characters(s: str) -> bool:
-    for c in s:
-        if ord(c) < 32 or ord(c) > 126:
-            return True
+    """Returns true if s has a character outside the printable ascii range.
 
-    else:
-        return False
+    For ascii strings isprintable is false exactly for the characters below
+    32 and for 127.
+    """
+    return not (s.isascii() and s.isprintable())
 
 
 def byte_to_string(b: int) -> str:
@@ -51,21 +51,26 @@ def value_from_hex(s: str) -> int:
 
 
 def hexstring(s: str) -> str:
-    result = ""
-    for c in s:
-        result += byte_to_string(ord(c))
-    return result
+    """Returns the hex encoding of the character codes of s.
+
+    Strings read from the analyzer have character codes below 256, which
+    are encoded with latin-1 as one byte each; other characters are encoded
+    with their full code, as before.
+    """
+    try:
+        return s.encode("latin-1").hex()
+    except UnicodeEncodeError:
+        return "".join(byte_to_string(ord(c)) for c in s)
 
 
 def dehexstring(h: str) -> str:
-    h = h[:]
-    result = ""
+    """Returns the string whose character codes are the bytes encoded in h.
+
+    A trailing odd digit is ignored.
+    """
     try:
-        for i in range(int(len(h) / 2)):
-            result += chr(int(h[:2], 16))
-            h = h[2:]
-        return result
-    except BaseException:
+        return bytes.fromhex(h[:len(h) - (len(h) % 2)]).decode("latin-1")
+    except ValueError:
         print("Error in dehexing string: " + h)
         exit(1)
 
@@ -110,6 +115,7 @@ class StringIndexedTable:
         if s in self.stringtable:
             return self.stringtable[s]
         else:
+            s = IT.stringpool.share(s)
             index = self.next
             self.stringtable[s] = index
             self.indextable[index] = s
@@ -149,7 +155,7 @@ class StringIndexedTable:
             xml_v = snode.get("v")
             if xml_v is None:
                 raise IndexedTableError("`v` missing from element")
-            s = decode(ishex, xml_v)
+            s = IT.stringpool.share(decode(ishex, xml_v))
             self.stringtable[s] = index
             self.indextable[index] = s
             if index >= self.next:
@@ -174,6 +180,16 @@ class StringIndexedTable:
 
 if __name__ == "__main__":
 
+    import random
+
+    for n in [0, 1, 2, 255, 4096]:
+        data = bytes(random.randrange(256) for _ in range(n))
+        sdata = data.decode("latin-1")
+        assert dehexstring(hexstring(sdata)) == sdata
+        assert hexstring(sdata) == "".join(byte_to_string(b) for b in data)
+        assert decode(*encode(sdata)) == sdata
+        assert has_control_characters(sdata) == any(b < 32 or b > 126 for b in data)
+
     print(str(has_control_characters("\n")))
     print(str(has_control_characters("string")))
 
@@ -129,6 +129,7 @@ import chc.util.xmlutil as UX
 
 from chc.util.Config import Config
 from chc.util.loggingutil import chklogger
+from chc.util.tracingutil import chktracer
 
 if TYPE_CHECKING:
     from chc.app.CFile import CFile
@@ -453,7 +454,8 @@ def get_xnode(
 ) -> Optional[ET.Element]:
     if os.path.isfile(filename):
         try:
-            tree = ET.parse(filename)
+            with chktracer.span("read-xml", cat="io", file=filename):
+                tree = ET.parse(filename)
             root = tree.getroot()
             return root.find(rootnode)
         except ET.ParseError as e:
@@ -466,6 +468,14 @@ def get_xnode(
         return None
 
 
+def write_xml_file(filename: str, root: ET.Element) -> None:
+    """Writes the xml document with root element root to filename."""
+
+    with chktracer.span("write-xml", cat="io", file=filename):
+        with open(filename, "w") as fp:
+            fp.write(UX.doc_to_pretty(ET.ElementTree(root)))
+
+
 def create_backup_file(filename: str) -> None:
     if os.path.isfile(filename):
         timestamp = calendar.timegm(time.gmtime())
@@ -725,6 +735,33 @@ def get_targetfiles_list(
     return result
 
 
+def get_postatusindex_filename(targetpath: str, projectname: str) -> str:
+    """Returns the base name (without extension) of the po status index files."""
+
+    path = get_analysisresults_path(targetpath, projectname)
+    return os.path.join(path, projectname + "_postatusindex")
+
+
+def get_functiondigests_filename(targetpath: str, projectname: str) -> str:
+    path = get_analysisresults_path(targetpath, projectname)
+    return os.path.join(path, projectname + "_functiondigests.json")
+
+
+def get_po_database_filename(targetpath: str, projectname: str) -> str:
+    path = get_analysisresults_path(targetpath, projectname)
+    return os.path.join(path, projectname + "_pos.db")
+
+
+def get_server_socket_filename(targetpath: str, projectname: str) -> str:
+    path = get_cchpath(targetpath, projectname)
+    return os.path.join(path, projectname + "_chkc.sock")
+
+
+def get_invariantindex_filename(targetpath: str, projectname: str) -> str:
+    path = get_analysisresults_path(targetpath, projectname)
+    return os.path.join(path, projectname + "_invariantindex.json")
+
+
 def get_global_definitions_filename(targetpath: str, projectname: str) -> str:
     path = get_analysisresults_path(targetpath, projectname)
     return os.path.join(path, "globaldefinitions.xml")
@@ -747,11 +784,15 @@ def archive_project_summary_results(path: str, projectname: str) -> None:
                     json.dump(d, fp)
 
 
+def get_project_summary_results_filename(path: str, projectname: str) -> str:
+    projectsummary = projectname + "_summaryresults"
+    return os.path.join(path, projectsummary + ".json")
+
+
 def save_project_summary_results(
         path: str, projectname: str, d: Dict[str, Any]) -> None:
     archive_project_summary_results(path, projectname)
-    projectsummary = projectname + "_summaryresults"
-    with open(os.path.join(path, projectsummary + ".json"), "w") as fp:
+    with open(get_project_summary_results_filename(path, projectname), "w") as fp:
         json.dump(d, fp)
 
 
@@ -1017,8 +1058,7 @@ def save_cfile_interface_dictionary(
         targetpath, projectname, cfilepath, cfilename)
     header = UX.get_xml_header(filename, "interfacedictionary")
     header.append(xnode)
-    with open(filename, "w") as fp:
-        fp.write(UX.doc_to_pretty(ET.ElementTree(header)))
+    write_xml_file(filename, header)
 
 
 def get_cfile_contexttablename(
@@ -1207,8 +1247,7 @@ def save_api(
         targetpath, projectname, cfilepath, cfilename, fnname)
     header = UX.get_xml_header(filename, "api")
     header.append(xnode)
-    with open(filename, "w") as fp:
-        fp.write(UX.doc_to_pretty(ET.ElementTree(header)))
+    write_xml_file(filename, header)
 
 
 def get_vars_filename(
@@ -1376,8 +1415,7 @@ def save_spo_file(
         targetpath, projectname, cfilepath, cfilename, fnname)
     header = UX.get_xml_header(cfilename, "spos")
     header.append(cnode)
-    with open(filename, "w") as fp:
-        fp.write(UX.doc_to_pretty(ET.ElementTree(header)))
+    write_xml_file(filename, header)
     chklogger.logger.info("Saved spo file: %s", filename)
 
 
@@ -1392,8 +1430,7 @@ def save_pod_file(
         targetpath, projectname, cfilepath, cfilename, fnname)
     header = UX.get_xml_header(filename, "pod")
     header.append(cnode)
-    with open(filename, "w") as fp:
-        fp.write(UX.doc_to_pretty(ET.ElementTree(header)))
+    write_xml_file(filename, header)
     chklogger.logger.info("Saved pod file: %s", filename)
 
 
@@ -1465,8 +1502,7 @@ def _save_contracts_file_aux(path: str, filename: str, cnode: ET.Element) -> Non
         os.makedirs(filedir)
     root = UX.get_xml_header("cfile", "cfile")
     root.append(cnode)
-    with open(filename, "w") as fp:
-        fp.write(UX.doc_to_pretty(ET.ElementTree(root)))
+    write_xml_file(filename, root)
 
 
 def save_contracts_file(path: str, cfilename: str, cnode: ET.Element) -> None:
@@ -1480,8 +1516,7 @@ def save_global_xml_contract(path: str, cnode: ET.Element) -> None:
     root.append(cnode)
     if os.path.isfile(filename):
         create_backup_file(filename)
-    with open(filename, "w") as fp:
-        fp.write(UX.doc_to_pretty(ET.ElementTree(root)))
+    write_xml_file(filename, root)
 
 
 def save_candidate_contracts_file(path: str, cfilename: str, cnode: ET.Element) -> None:
@@ -1549,6 +1584,25 @@ def get_kendra_path() -> str:
     return Config().kendradir
 
 
+def get_chc_cache_path() -> str:
+    """Returns the cache directory (outside the source tree), creating it."""
+
+    cachedir = Config().cachedir
+    if not os.path.isdir(cachedir):
+        try:
+            os.makedirs(cachedir, exist_ok=True)
+        except OSError as e:
+            chklogger.logger.warning(
+                "Unable to create cache directory %s: %s", cachedir, str(e))
+    return cachedir
+
+
+def get_kendra_aggregated_summaries_filename() -> str:
+    """Returns the name of the file that aggregates the kendra test records."""
+
+    return os.path.join(get_chc_cache_path(), "kendra_summaries.jsonl")
+
+
 def get_kendra_testpath(testname: str) -> str:
     dirname = os.path.join(get_kendra_path(), testname)
     if not os.path.isdir(dirname):
@@ -1685,16 +1739,26 @@ def get_juliet_testpath(cwe: str, test: str) -> str:
     raise CHCJulietTestNotFoundError(cwe, test, tests)
 
 
-def save_juliet_test_summary(cwe: str, test: str, d: Dict[str, Any]) -> None:
+def get_juliet_test_summary_filename(cwe: str, test: str) -> str:
     path = get_juliet_testpath(cwe, test)
-    with open(os.path.join(path, "jsummaryresults.json"), "w") as fp:
+    return os.path.join(path, "jsummaryresults.json")
+
+
+def get_juliet_aggregated_summaries_filename() -> str:
+    """Returns the name of the file that aggregates all juliet summaries."""
+
+    return os.path.join(get_juliet_path(), "juliet_summaries.jsonl")
+
+
+def save_juliet_test_summary(cwe: str, test: str, d: Dict[str, Any]) -> None:
+    with open(get_juliet_test_summary_filename(cwe, test), "w") as fp:
         json.dump(d, fp, sort_keys=True)
 
 
 def read_juliet_test_summary(cwe: str, test: str) -> Optional[Dict[str, Any]]:
     path = get_juliet_testpath(cwe, test)
     if os.path.isdir(path):
-        filename = os.path.join(path, "jsummaryresults.json")
+        filename = get_juliet_test_summary_filename(cwe, test)
         if os.path.isfile(filename):
             with open(filename) as fp:
                 d = json.load(fp)
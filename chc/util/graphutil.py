@@ -0,0 +1,127 @@
+# ------------------------------------------------------------------------------
+# CodeHawk C Analyzer
+# Author: Henny Sipma
+# ------------------------------------------------------------------------------
+# The MIT License (MIT)
+#
+# Copyright (c) 2026 Aarno Labs LLC
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# ------------------------------------------------------------------------------
+"""Utilities for directed graphs represented as adjacency dictionaries.
+
+A graph is a dictionary that maps each node to the set of its successors.
+Successors that do not appear as a key are treated as nodes without
+outgoing edges.
+"""
+
+from typing import Dict, Hashable, Iterable, List, Set, Tuple, TypeVar
+
+
+T = TypeVar("T", bound=Hashable)
+
+
+def strongly_connected_components(graph: Dict[T, Set[T]]) -> List[List[T]]:
+    """Returns the strongly connected components of graph (Tarjan).
+
+    The components are returned in reverse topological order, that is, a
+    component is listed only after all components reachable from it have
+    been listed. For a call graph with edges from caller to callee this is
+    the bottom-up order (callees before callers).
+
+    The implementation is iterative, so the depth of the graph is not
+    limited by the python recursion limit.
+    """
+    index: Dict[T, int] = {}
+    lowlink: Dict[T, int] = {}
+    onstack: Set[T] = set([])
+    stack: List[T] = []
+    result: List[List[T]] = []
+    counter = 0
+
+    def successors(n: T) -> Iterable[T]:
+        return graph.get(n, set([]))
+
+    for root in graph:
+        if root in index:
+            continue
+        index[root] = lowlink[root] = counter
+        counter += 1
+        stack.append(root)
+        onstack.add(root)
+        work: List[Tuple[T, Iterable[T]]] = [(root, iter(successors(root)))]
+        while len(work) > 0:
+            (node, succs) = work[-1]
+            descended = False
+            for s in succs:
+                if s not in index:
+                    index[s] = lowlink[s] = counter
+                    counter += 1
+                    stack.append(s)
+                    onstack.add(s)
+                    work.append((s, iter(successors(s))))
+                    descended = True
+                    break
+                elif s in onstack:
+                    lowlink[node] = min(lowlink[node], index[s])
+            if descended:
+                continue
+            work.pop()
+            if len(work) > 0:
+                parent = work[-1][0]
+                lowlink[parent] = min(lowlink[parent], lowlink[node])
+            if lowlink[node] == index[node]:
+                component: List[T] = []
+                while True:
+                    m = stack.pop()
+                    onstack.discard(m)
+                    component.append(m)
+                    if m == node:
+                        break
+                result.append(component)
+    return result
+
+
+def bottom_up_levels(graph: Dict[T, Set[T]]) -> List[List[List[T]]]:
+    """Returns the strongly connected components of graph grouped by level.
+
+    Components at level 0 have no successors outside themselves; components
+    at level n have at least one successor component at level n - 1 and none
+    at level n or higher. Components at the same level are independent of
+    each other and can be processed in parallel, once all lower levels have
+    been processed.
+    """
+    sccs = strongly_connected_components(graph)
+    sccindex: Dict[T, int] = {}
+    levels: List[int] = []
+    for (i, scc) in enumerate(sccs):
+        for n in scc:
+            sccindex[n] = i
+        level = 0
+        for n in scc:
+            for s in graph.get(n, set([])):
+                j = sccindex[s]
+                if j != i:
+                    level = max(level, levels[j] + 1)
+        levels.append(level)
+
+    result: List[List[List[T]]] = [[] for _ in range(max(levels, default=-1) + 1)]
+    for (scc, level) in zip(sccs, levels):
+        result[level].append(scc)
+    return result
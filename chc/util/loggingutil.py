@@ -62,6 +62,13 @@ class CHKLogger:
     def logger(self) -> logging.Logger:
         return self._logger
 
+    def set_logger(self, logger: logging.Logger) -> logging.Logger:
+        """Sets the logger to use and returns the logger used before."""
+
+        previous = self._logger
+        self._logger = logger
+        return previous
+
     def set_chkc_logger(
             self,
             initmsg: str = "",
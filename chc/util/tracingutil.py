@@ -0,0 +1,223 @@
+# ------------------------------------------------------------------------------
+# CodeHawk C Analyzer
+# Author: Henny Sipma
+# ------------------------------------------------------------------------------
+# The MIT License (MIT)
+#
+# Copyright (c) 2026 Aarno Labs LLC
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# ------------------------------------------------------------------------------
+"""Tracing of the phases of an analysis run as nested spans.
+
+Spans are recorded as complete events in the Chrome trace-event format,
+which can be opened in a trace viewer (chrome://tracing, Perfetto):
+
+    with chktracer.span("update-spos"):
+        ...
+    with chktracer.span("read-xml", cat="io", file=filename):
+        ...
+
+    @chktracer.traced("link-varinfos")
+    def link_varinfos(self) -> None:
+        ...
+
+Tracing is disabled by default; span then returns a shared no-op context
+manager, and traced functions are called directly, so instrumented code
+pays only for a call and a test. Tracing is enabled
+with start, which registers the trace file to be written when the process
+exits, and disabled with stop, which writes the trace file right away (the
+c-project server stops tracing at the end of every request, so that each
+request writes its own trace). Spans opened in processes forked by
+iter_files_parallel are not recorded.
+"""
+
+import atexit
+import functools
+import json
+import os
+import threading
+import time
+
+from types import TracebackType
+from typing import (
+    Any, Callable, cast, ContextManager, Dict, List, Optional, Type, TypeVar)
+
+from chc.util.loggingutil import chklogger
+
+
+class NoSpan:
+    """Context manager used when tracing is disabled."""
+
+    def __enter__(self) -> "NoSpan":
+        return self
+
+    def __exit__(
+            self,
+            exc_type: Optional[Type[BaseException]],
+            exc: Optional[BaseException],
+            tb: Optional[TracebackType]) -> None:
+        return None
+
+
+nospan = NoSpan()
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+class Span:
+    """Records a complete event from entry to exit of the context."""
+
+    def __init__(
+            self,
+            tracer: "CHKTracer",
+            name: str,
+            cat: str,
+            args: Dict[str, Any]) -> None:
+        self._tracer = tracer
+        self._name = name
+        self._cat = cat
+        self._args = args
+        self._t0 = 0
+
+    def __enter__(self) -> "Span":
+        self._t0 = time.perf_counter_ns()
+        return self
+
+    def __exit__(
+            self,
+            exc_type: Optional[Type[BaseException]],
+            exc: Optional[BaseException],
+            tb: Optional[TracebackType]) -> None:
+        t1 = time.perf_counter_ns()
+        if exc_type is not None:
+            self._args["exception"] = exc_type.__name__
+        self._tracer.add_event(self._name, self._cat, self._t0, t1, self._args)
+        return None
+
+
+class CHKTracer:
+
+    def __init__(self) -> None:
+        self._events: Optional[List[Dict[str, Any]]] = None
+        self._filename: Optional[str] = None
+        self._pid = 0
+        self._t0 = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self._events is not None
+
+    def start(self, filename: str) -> None:
+        """Enables tracing; the trace is saved in filename on exit."""
+
+        if self.enabled:
+            return
+        self._events = []
+        self._filename = filename
+        self._pid = os.getpid()
+        self._t0 = time.perf_counter_ns()
+        self.add_metadata("process_name", {"name": "chkc"})
+        atexit.register(self.save)
+        chklogger.logger.info("Tracing enabled; trace will be saved in %s", filename)
+
+    def stop(self) -> None:
+        """Saves the trace and disables tracing."""
+
+        if not self.enabled:
+            return
+        self.save()
+        atexit.unregister(self.save)
+        self._events = None
+        self._filename = None
+
+    def span(
+            self, name: str, cat: str = "chc", **args: Any) -> ContextManager[Any]:
+        """Returns a context manager that records a span named name.
+
+        The keyword arguments are shown as attributes of the span (e.g.,
+        file, function, iteration).
+        """
+        if self._events is None:
+            return nospan
+        return Span(self, name, cat, args)
+
+    def traced(self, name: str, cat: str = "chc") -> Callable[[F], F]:
+        """Returns a decorator that records every call of a function as a span."""
+
+        def decorator(f: F) -> F:
+
+            @functools.wraps(f)
+            def wrapper(*args: Any, **kwargs: Any) -> Any:
+                if self._events is None:
+                    return f(*args, **kwargs)
+                with Span(self, name, cat, {}):
+                    return f(*args, **kwargs)
+
+            return cast(F, wrapper)
+
+        return decorator
+
+    def add_event(
+            self,
+            name: str,
+            cat: str,
+            t0: int,
+            t1: int,
+            args: Dict[str, Any]) -> None:
+        if self._events is None:
+            return
+        self._events.append({
+            "name": name,
+            "cat": cat,
+            "ph": "X",
+            "ts": (t0 - self._t0) / 1000.0,
+            "dur": (t1 - t0) / 1000.0,
+            "pid": os.getpid(),
+            "tid": threading.get_native_id(),
+            "args": {k: str(v) for (k, v) in args.items()}})
+
+    def add_metadata(self, name: str, args: Dict[str, Any]) -> None:
+        if self._events is None:
+            return
+        self._events.append({
+            "name": name,
+            "ph": "M",
+            "pid": os.getpid(),
+            "tid": threading.get_native_id(),
+            "args": args})
+
+    def save(self) -> None:
+        """Writes the events recorded so far to the trace file."""
+
+        if self._events is None or self._filename is None:
+            return
+        if os.getpid() != self._pid:
+            # forked worker process
+            return
+        d: Dict[str, Any] = {}
+        d["traceEvents"] = self._events
+        d["displayTimeUnit"] = "ms"
+        with open(self._filename, "w") as fp:
+            json.dump(d, fp)
+        chklogger.logger.info(
+            "Saved %d trace events to %s", len(self._events), self._filename)
+
+
+chktracer = CHKTracer()